@@ -0,0 +1,103 @@
+"""Backtest replay throughput on a synthetic month of events.
+
+Usage::
+
+    python -m benchmarks.bench_backtest [--events 200000] [--wallets 500] [--sweep 4] [--workers 4]
+
+Generates a deterministic event stream spread over 30 days, replays it once
+in-process, then runs ``--sweep`` parameter sets through ``run_sweep`` to
+show how the parallel sweep scales.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Dict, List
+
+from packages.scoring.models import TradeSnapshot, WalletStats
+from services.api.llm.trigger import TriggerThresholds
+from services.api.risk.config_loader import load_risk_config
+from services.backtest import BacktestEvent, BacktestParams, BacktestRunner, run_sweep
+
+MONTH_SECONDS = 30 * 86_400
+EVENT_TYPES = ["transfer", "swap", "deposit_cex", "withdraw_cex", "bridge"]
+ASSETS = ["BTC", "ETH", "SOL", "ARB", "OP"]
+
+
+def synthetic_events(count: int, wallets: int, seed: int = 1) -> List[BacktestEvent]:
+    rng = random.Random(seed)
+    start = 1_700_000_000.0
+    step = MONTH_SECONDS / count
+    return [
+        BacktestEvent(
+            timestamp=start + index * step,
+            wallet_id=f"w{rng.randrange(wallets)}",
+            tx_hash=f"0x{index:064x}",
+            event_type=rng.choice(EVENT_TYPES),
+            asset=rng.choice(ASSETS),
+            notional_usd=rng.lognormvariate(10.5, 1.2),
+            size_fraction=rng.betavariate(1.2, 6.0),
+        )
+        for index in range(count)
+    ]
+
+
+def synthetic_wallets(wallets: int, seed: int = 2) -> Dict[str, WalletStats]:
+    rng = random.Random(seed)
+    result = {}
+    for index in range(wallets):
+        trades = [
+            TradeSnapshot(
+                pnl=rng.gauss(5.0, 40.0),
+                entry_timestamp=n * 3600.0,
+                exit_timestamp=n * 3600.0 + 1800,
+                duration_minutes=rng.uniform(5, 600),
+            )
+            for n in range(rng.randrange(1, 20))
+        ]
+        result[f"w{index}"] = WalletStats(
+            wallet_id=f"w{index}",
+            trades=trades,
+            recent_events=rng.randrange(1, 50),
+            avg_size_usd=rng.uniform(10_000, 1_000_000),
+            liquidity_utilization=rng.random(),
+        )
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--wallets", type=int, default=500)
+    parser.add_argument("--sweep", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    events = synthetic_events(args.events, args.wallets)
+    wallets = synthetic_wallets(args.wallets)
+    config = load_risk_config()
+
+    report = BacktestRunner(BacktestParams(), wallet_stats=wallets, risk_config=config).run(events)
+    print(
+        f"single run: {report.events} events in {report.wall_seconds:.2f}s "
+        f"({report.events / report.wall_seconds:,.0f} events/s, "
+        f"{report.simulated_seconds / report.wall_seconds:,.0f}x real time), "
+        f"{report.triggered} triggered, {report.orders} orders"
+    )
+
+    params = [
+        BacktestParams(name=f"min_size_{frac:.2f}", thresholds=TriggerThresholds(min_size_frac=frac))
+        for frac in [0.05 + 0.05 * index for index in range(args.sweep)]
+    ]
+    started = time.perf_counter()
+    reports = run_sweep(events, params, wallet_stats=wallets, risk_config=config, workers=args.workers)
+    elapsed = time.perf_counter() - started
+    print(f"sweep: {len(reports)} runs in {elapsed:.2f}s")
+    for item in reports:
+        print(f"  {item.name:<16}{item.triggered:>8} triggered{item.orders:>6} orders")
+
+
+if __name__ == "__main__":
+    main()
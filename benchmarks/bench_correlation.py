@@ -0,0 +1,57 @@
+"""Cost of correlation-aware pre-trade checks.
+
+Usage::
+
+    python -m benchmarks.bench_correlation [--assets 10 50] [--window 240] [--checks 20000]
+
+Warms a :class:`CorrelationRiskEngine` with a full window of synthetic
+returns, then times ``update_returns`` (one observation for every asset) and
+``check`` (one candidate trade against the current book).
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from services.api.risk.config_loader import load_risk_config
+from services.api.risk.correlation import CorrelationRiskEngine
+from services.api.risk.policy import ProposedTrade
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--assets", type=int, nargs="+", default=[10, 50])
+    parser.add_argument("--window", type=int, default=240)
+    parser.add_argument("--checks", type=int, default=20_000)
+    args = parser.parse_args()
+
+    config = load_risk_config()
+    rng = np.random.default_rng(7)
+    print(f"{'assets':>8}{'update us':>12}{'check us':>12}{'checks/s':>12}")
+    for count in args.assets:
+        names = ["BTC", "ETH"] + [f"A{index}" for index in range(count - 2)]
+        engine = CorrelationRiskEngine(config, window=args.window)
+        engine.set_exposures({name: 0.01 for name in names})
+        rows = rng.normal(0, 0.01, (args.window * 2, count))
+        start = time.perf_counter()
+        for row in rows:
+            engine.update_returns(dict(zip(names, row)))
+        update_us = (time.perf_counter() - start) / len(rows) * 1e6
+
+        trades = [
+            ProposedTrade("demo", names[index % count], "buy" if index % 2 else "sell", 0.05, 2, 2.0, 6.0)
+            for index in range(64)
+        ]
+        engine.check(trades[0])  # materialise the correlation matrix
+        start = time.perf_counter()
+        for index in range(args.checks):
+            engine.check(trades[index % 64])
+        elapsed = time.perf_counter() - start
+        print(f"{count:>8}{update_us:>12.1f}{elapsed / args.checks * 1e6:>12.1f}{args.checks / elapsed:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Recording and exposition cost of the MetricsRegistry metric types.
+
+Usage::
+
+    python -m benchmarks.bench_metrics [--observations 200000] [--children 50]
+
+Times one observation into a pre-resolved handle of each metric type,
+the same observation when the labeled child is looked up every time, and
+a full ``export`` / ``render_prometheus`` / cached ``snapshot`` over
+``--children`` labeled series of each type.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Callable
+
+from services.api.monitoring.metrics import MetricsRegistry
+
+
+def _per_call(label: str, calls: int, body: Callable[[], None]) -> None:
+    started = time.perf_counter()
+    body()
+    elapsed = time.perf_counter() - started
+    print(f"{label:>32}{elapsed / calls * 1e9:>12.0f} ns")
+
+
+def bench(observations: int, children: int) -> None:
+    registry = MetricsRegistry()
+    values = [random.lognormvariate(-4, 1.5) for _ in range(observations)]
+    counter = registry.counter_family("requests_total", ("model",)).labels("a")
+    histogram = registry.histogram_family("latency_seconds", ("endpoint",)).labels("/v1/bias")
+    hdr_family = registry.hdr_histogram_family("llm_latency_seconds", ("model",))
+    hdr = hdr_family.labels("a")
+
+    def count() -> None:
+        inc = counter.inc
+        for _ in values:
+            inc()
+
+    def fixed() -> None:
+        observe = histogram.observe
+        for value in values:
+            observe(value)
+
+    def hdr_observe() -> None:
+        observe = hdr.observe
+        for value in values:
+            observe(value)
+
+    def hdr_lookup() -> None:
+        for value in values:
+            hdr_family.labels("a").observe(value)
+
+    print(f"{'operation':>32}{'per call':>15}")
+    _per_call("counter.inc", observations, count)
+    _per_call("histogram.observe", observations, fixed)
+    _per_call("hdr.observe", observations, hdr_observe)
+    _per_call("labels(...).observe (hdr)", observations, hdr_lookup)
+
+    for index in range(children):
+        registry.counter_family("requests_total", ("model",)).labels(f"m{index}").inc()
+        registry.histogram_family("latency_seconds", ("endpoint",)).labels(f"/e{index}").observe(values[index])
+        hdr_family.labels(f"m{index}").observe(values[index])
+    rounds = 20
+    _per_call("export", rounds, lambda: [registry.export() for _ in range(rounds)])
+    _per_call("render_prometheus", rounds, lambda: [registry.render_prometheus() for _ in range(rounds)])
+    _per_call("snapshot (cached)", rounds, lambda: [registry.snapshot() for _ in range(rounds)])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--observations", type=int, default=200_000)
+    parser.add_argument("--children", type=int, default=50)
+    args = parser.parse_args()
+    bench(args.observations, args.children)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Signed OKX requests per second: per-request HMAC setup vs SigningContext.
+
+Usage::
+
+    python -m benchmarks.bench_okx_signing [--requests 200000]
+
+``legacy`` reproduces the old ``_post`` preparation: encode the secret, build
+a new ``hmac.new`` object, format ``time.time()`` and assemble every header.
+``context`` is the current path: a ``copy()`` of the keyed HMAC template,
+pre-built constant headers and the cached-prefix ISO timestamp.
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import hashlib
+import hmac
+import json
+import time
+from typing import Callable, Dict
+
+from services.order_manager.okx_client import ORDER_PATH, OKXClient, OKXCredentials
+
+CREDS = OKXCredentials(api_key="0" * 36, secret_key="F" * 32, passphrase="passphrase")
+PAYLOAD = {"clOrdId": "b" + "0" * 31, "instId": "BTC-USDT-SWAP", "tdMode": "cross", "side": "buy", "ordType": "market", "sz": "1"}
+
+
+def legacy_prepare(body: str) -> Dict[str, str]:
+    timestamp = f"{time.time():.0f}"
+    message = f"{timestamp}POST{ORDER_PATH}{body}".encode()
+    digest = hmac.new(CREDS.secret_key.encode(), message, hashlib.sha256).digest()
+    headers = {
+        "OK-ACCESS-KEY": CREDS.api_key,
+        "OK-ACCESS-PASSPHRASE": CREDS.passphrase,
+        "OK-ACCESS-SIGN": base64.b64encode(digest).decode(),
+        "OK-ACCESS-TIMESTAMP": timestamp,
+    }
+    headers["x-simulated-trading"] = "1"
+    return headers
+
+
+def context_prepare(client: OKXClient) -> Callable[[str], Dict[str, str]]:
+    signing = client._signing
+
+    def prepare(body: str) -> Dict[str, str]:
+        timestamp = client._timestamp()
+        return signing.headers(timestamp, signing.sign(timestamp, "POST", ORDER_PATH, body))
+
+    return prepare
+
+
+def _rate(prepare: Callable[[str], Dict[str, str]], body: str, requests: int) -> float:
+    start = time.perf_counter()
+    for _ in range(requests):
+        prepare(body)
+    return requests / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200_000)
+    args = parser.parse_args()
+
+    body = json.dumps(PAYLOAD, separators=(",", ":"))
+    client = OKXClient(CREDS)
+    legacy = _rate(legacy_prepare, body, args.requests)
+    current = _rate(context_prepare(client), body, args.requests)
+    print(f"{'path':>10}{'signed req/s':>16}")
+    print(f"{'legacy':>10}{legacy:>16,.0f}")
+    print(f"{'context':>10}{current:>16,.0f}  ({current / legacy:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""End-to-end order execution against the local OKX simulator.
+
+Usage::
+
+    python -m benchmarks.bench_okx_simulator [--orders 600] [--instruments 8] [--latency-ms 2] [--in-process]
+
+Drives ``OrderManager`` -> ``OKXClient`` -> ``HTTPTransport`` -> simulator
+over loopback HTTP (or the simulator as an in-process transport with
+``--in-process``), so signing, the connection pool and the simulator's
+signature checks are all on the path. Compares serial ``submit_order``,
+the per-instrument ``OrderPipeline``, and the pipeline with a coalescing
+window that merges concurrent orders into ``batch-orders`` requests.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any, Awaitable, Callable, List, Optional
+
+from services.api.risk.monitor import RiskMonitor
+from services.api.risk.policy import PolicyEngine, PortfolioState
+from services.order_manager.http_transport import HTTPTransport
+from services.order_manager.killswitch import KillSwitch
+from services.order_manager.okx_client import OKXClient, OKXCredentials, Transport
+from services.order_manager.pipeline import OrderPipeline
+from services.order_manager.service import OrderManager, TradeSignal
+from services.order_manager.testing import OKXSimulator, SimulatorConfig
+
+CREDS = OKXCredentials(api_key="bench-key", secret_key="bench-secret", passphrase="bench-pass")
+CONFIG = {
+    "single_position": {"max_size_percent": 0.25, "max_leverage": 3, "min_rr_ratio": 1.5},
+    "portfolio": {"max_open_positions": 100_000, "max_daily_trades": 100_000, "max_total_risk": 100_000.0},
+}
+
+
+def _manager(transport: Transport, coalesce_window: Optional[float] = None) -> OrderManager:
+    return OrderManager(
+        OKXClient(CREDS, transport=transport),
+        PolicyEngine(CONFIG),
+        RiskMonitor({}, 100_000.0, 100_000.0),
+        KillSwitch(),
+        coalesce_window=coalesce_window,
+    )
+
+
+def _signals(orders: int, instruments: int) -> List[TradeSignal]:
+    return [
+        TradeSignal("demo", f"A{index % instruments}-USDT", "buy", 0.01, 1.0, 2.0, 5.0, 1.0, signal_id=f"s{index}")
+        for index in range(orders)
+    ]
+
+
+def _portfolio() -> PortfolioState:
+    return PortfolioState(0, 0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+
+async def _timed(call: Callable[[], Awaitable[Any]], latencies: List[float]) -> None:
+    started = time.perf_counter()
+    result = await call()
+    assert result["success"], result
+    latencies.append(time.perf_counter() - started)
+
+
+async def _serial(manager: OrderManager, signals: List[TradeSignal], latencies: List[float]) -> None:
+    for signal in signals:
+        await _timed(lambda: manager.submit_order(signal, _portfolio(), {}), latencies)
+
+
+async def _pipelined(manager: OrderManager, signals: List[TradeSignal], latencies: List[float]) -> None:
+    async with OrderPipeline(manager, max_in_flight=64) as pipeline:
+        await asyncio.gather(
+            *(_timed(lambda signal=signal: pipeline.submit(signal, _portfolio(), {}), latencies) for signal in signals)
+        )
+
+
+async def bench(orders: int, instruments: int, latency: float, in_process: bool) -> None:
+    print(f"{'mode':>20}{'orders/s':>12}{'p50 ms':>10}{'p99 ms':>10}{'requests':>10}")
+    for name, runner, window in (
+        ("serial", _serial, None),
+        ("pipeline", _pipelined, None),
+        ("pipeline+coalesce", _pipelined, 0.002),
+    ):
+        simulator = OKXSimulator(
+            CREDS,
+            prices={f"A{index}-USDT": 100.0 for index in range(instruments)},
+            config=SimulatorConfig(latency=latency, rate_limit=orders),
+        )
+        latencies: List[float] = []
+        started = time.perf_counter()
+        if in_process:
+            await runner(_manager(simulator, window), _signals(orders, instruments), latencies)
+        else:
+            async with simulator.serve() as server:
+                async with HTTPTransport(server.url, max_connections=64, warm_connections=8) as transport:
+                    await runner(_manager(transport, window), _signals(orders, instruments), latencies)
+        elapsed = time.perf_counter() - started
+        ordered = sorted(latencies)
+        p50 = statistics.median(ordered) * 1e3
+        p99 = ordered[max(0, int(len(ordered) * 0.99) - 1)] * 1e3
+        print(f"{name:>20}{orders / elapsed:>12.0f}{p50:>10.2f}{p99:>10.2f}{simulator.requests:>10}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=600)
+    parser.add_argument("--instruments", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    parser.add_argument("--in-process", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(bench(args.orders, args.instruments, args.latency_ms / 1000, args.in_process))
+
+
+if __name__ == "__main__":
+    main()
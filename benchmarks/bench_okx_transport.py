@@ -0,0 +1,99 @@
+"""Order round-trip latency: connection per request vs the pooled HTTPTransport.
+
+Usage::
+
+    python -m benchmarks.bench_okx_transport [--orders 500] [--concurrency 1 8]
+
+Runs signed ``create_order`` calls against a local :class:`StubOKXServer`.
+The cold transport opens a fresh client (and TCP connection) per order; the
+pooled one reuses warm keep-alive connections. Loopback has no TLS, so the
+gap here understates the saving against the real exchange. Per-phase means
+come from the pooled transport's histograms.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any, Dict, List
+
+import httpx
+
+from services.api.monitoring.metrics import MetricsRegistry
+from services.order_manager.http_transport import PHASES, HTTPTransport, OKXLatencyMetrics
+from services.order_manager.okx_client import OKXClient, OKXCredentials
+from services.order_manager.testing import StubOKXServer
+
+CREDS = OKXCredentials(api_key="key", secret_key="secret", passphrase="pass")
+PAYLOAD = {"instId": "BTC-USDT-SWAP", "tdMode": "cross", "side": "buy", "ordType": "market", "sz": "1"}
+
+
+class ConnectionPerRequestTransport:
+    """What a naive transport does: a new client, and connection, for every order."""
+
+    def __init__(self, base_url: str) -> None:
+        self.base_url = base_url
+
+    async def post(self, path: str, headers: Dict[str, str], body: str) -> Dict[str, Any]:
+        async with httpx.AsyncClient(base_url=self.base_url) as client:
+            response = await client.post(path, content=body, headers=headers)
+            return response.json()
+
+
+async def _run(client: OKXClient, orders: int, concurrency: int) -> List[float]:
+    latencies: List[float] = []
+    queue = iter(range(orders))
+
+    async def worker() -> None:
+        for _ in queue:
+            started = time.perf_counter()
+            await client.create_order(PAYLOAD)
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies
+
+
+def _summary(latencies: List[float]) -> str:
+    ordered = sorted(latencies)
+    p50 = statistics.median(ordered) * 1e6
+    p99 = ordered[int(len(ordered) * 0.99) - 1] * 1e6
+    return f"{p50:>10.0f}{p99:>10.0f}"
+
+
+async def bench(orders: int, concurrencies: List[int]) -> None:
+    async with StubOKXServer() as server:
+        print(f"{'transport':>10}{'conc':>6}{'p50 us':>10}{'p99 us':>10}{'conns':>7}")
+        for concurrency in concurrencies:
+            before = server.connections
+            cold = OKXClient(CREDS, transport=ConnectionPerRequestTransport(server.url))
+            latencies = await _run(cold, orders, concurrency)
+            print(f"{'cold':>10}{concurrency:>6}{_summary(latencies)}{server.connections - before:>7}")
+
+            registry = MetricsRegistry()
+            before = server.connections
+            async with HTTPTransport(
+                server.url, warm_connections=concurrency, metrics=OKXLatencyMetrics(registry)
+            ) as transport:
+                latencies = await _run(OKXClient(CREDS, transport=transport), orders, concurrency)
+            print(f"{'pooled':>10}{concurrency:>6}{_summary(latencies)}{server.connections - before:>7}")
+            exported = registry.export()
+            means = "  ".join(
+                f"{phase}={exported[f'okx_request_{phase}_seconds_sum'] / max(1, exported[f'okx_request_{phase}_seconds_count']) * 1e6:.0f}us"
+                for phase in PHASES
+            )
+            print(f"{'':>16}{means}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8])
+    args = parser.parse_args()
+    asyncio.run(bench(args.orders, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Order throughput: serial ``submit_order`` vs the per-instrument OrderPipeline.
+
+Usage::
+
+    python -m benchmarks.bench_order_pipeline [--orders 400] [--instruments 1 4 16] [--latency-ms 5]
+
+Each order waits ``--latency-ms`` for a simulated exchange ack. Serial
+submission pays that once per order; the pipeline overlaps instruments and
+only serialises orders on the same one, so throughput scales with the
+number of instruments up to ``max_in_flight``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import Any, Dict
+
+from services.api.monitoring.metrics import MetricsRegistry
+from services.api.risk.monitor import RiskMonitor
+from services.api.risk.policy import PolicyEngine, PortfolioState
+from services.order_manager.killswitch import KillSwitch
+from services.order_manager.okx_client import OKXClient, OKXCredentials
+from services.order_manager.pipeline import OrderPipeline, PipelineMetrics
+from services.order_manager.service import OrderManager, TradeSignal
+
+CONFIG = {
+    "single_position": {"max_size_percent": 0.25, "max_leverage": 3, "min_rr_ratio": 1.5},
+    "portfolio": {"max_open_positions": 1000, "max_daily_trades": 100000, "max_total_risk": 1000.0},
+}
+
+
+class AckAfterTransport:
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+
+    async def post(self, path: str, headers: Dict[str, str], body: str) -> Dict[str, Any]:
+        await asyncio.sleep(self.delay)
+        return {"code": "0", "data": [{"sCode": "0"}]}
+
+
+def _manager(latency: float) -> OrderManager:
+    client = OKXClient(OKXCredentials("key", "secret", "pass"), transport=AckAfterTransport(latency))
+    return OrderManager(client, PolicyEngine(CONFIG), RiskMonitor({}, 1000.0, 1000.0), KillSwitch())
+
+
+def _signal(index: int, instruments: int) -> TradeSignal:
+    return TradeSignal("demo", f"A{index % instruments}-USDT", "buy", 0.01, 1.0, 2.0, 5.0, 1.0)
+
+
+def _portfolio() -> PortfolioState:
+    return PortfolioState(0, 0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+
+async def bench(orders: int, instruments: int, latency: float) -> None:
+    manager = _manager(latency)
+    started = time.perf_counter()
+    for index in range(orders):
+        await manager.submit_order(_signal(index, instruments), _portfolio(), {})
+    serial = time.perf_counter() - started
+
+    registry = MetricsRegistry()
+    started = time.perf_counter()
+    async with OrderPipeline(_manager(latency), metrics=PipelineMetrics(registry)) as pipeline:
+        await asyncio.gather(*(pipeline.submit(_signal(index, instruments), _portfolio(), {}) for index in range(orders)))
+    pipelined = time.perf_counter() - started
+    exported = registry.export()
+    mean_ms = exported["order_pipeline_signal_to_ack_seconds_sum"] / exported["order_pipeline_signal_to_ack_seconds_count"] * 1e3
+    print(f"{instruments:>12}{orders / serial:>14.0f}{orders / pipelined:>16.0f}{mean_ms:>16.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=400)
+    parser.add_argument("--instruments", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    print(f"{'instruments':>12}{'serial ord/s':>14}{'pipeline ord/s':>16}{'mean ack ms':>16}")
+    for instruments in args.instruments:
+        asyncio.run(bench(args.orders, instruments, args.latency_ms / 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""PolicyEngine validations per second: compiled limits vs the original dict/lambda version.
+
+Usage::
+
+    python -m benchmarks.bench_policy [--trades 20000] [--repeat 5]
+
+Both engines see the same randomized trades and portfolios (roughly half
+rejected); the run aborts if any decision or reason differs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any, Callable, List
+
+from services.api.risk.config_loader import load_risk_config
+from services.api.risk.policy import PolicyEngine
+from services.api.risk.testing import Case, LegacyPolicyEngine, random_cases
+
+
+def _rate(validate: Callable[..., Any], cases: List[Case], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for trade, portfolio, exposures in cases:
+            validate(trade, portfolio, exposures)
+        best = min(best, time.perf_counter() - start)
+    return len(cases) / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trades", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    config = load_risk_config()
+    legacy = LegacyPolicyEngine(config)
+    compiled = PolicyEngine(config)
+    cases = random_cases(args.trades)
+    for trade, portfolio, exposures in cases:
+        if legacy.validate(trade, portfolio, exposures) != compiled.validate(trade, portfolio, exposures):
+            raise SystemExit(f"decision mismatch for {trade} / {portfolio}")
+    rejected = sum(1 for case in cases if not compiled.allows(*case))
+
+    print(f"{len(cases)} trades, {rejected / len(cases):.0%} rejected")
+    baseline = _rate(legacy.validate, cases, args.repeat)
+    print(f"{'legacy validate':<28}{baseline:>12,.0f}/s")
+    for label, method in (
+        ("compiled validate", compiled.validate),
+        ("compiled first_failure", compiled.first_failure),
+        ("compiled allows", compiled.allows),
+    ):
+        rate = _rate(method, cases, args.repeat)
+        print(f"{label:<28}{rate:>12,.0f}/s{rate / baseline:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Per-query Python overhead of ad-hoc ``select()`` constructs vs prebuilt statements.
+
+Usage::
+
+    python -m benchmarks.bench_query_overhead [--calls 2000] [--repeat 5]
+
+Each case returns a handful of rows from a throwaway SQLite database so that
+statement construction, cache-key generation and result handling dominate.
+"Adhoc" rebuilds the statement per call the way the repositories used to;
+"prebuilt" goes through the current repository methods.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, List, Tuple
+
+from sqlalchemy import desc, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from packages.db import apply_migrations
+from packages.db.models import BiasSnapshot, Event, Wallet
+from services.api.bias.repository import BiasRepository
+from services.api.repositories import EventRepository, WalletRepository
+
+Query = Callable[[AsyncSession], Awaitable[Any]]
+
+
+async def _seed(factory: async_sessionmaker[AsyncSession]) -> None:
+    now = datetime.utcnow()
+    async with factory() as session:
+        await session.execute(insert(Wallet.__table__), [{"id": "w1", "address": "0x01", "chain": "ethereum"}])
+        await session.execute(
+            insert(Event.__table__),
+            [
+                {
+                    "id": f"e{index}",
+                    "timestamp": now - timedelta(minutes=index),
+                    "wallet_id": "w1",
+                    "tx_hash": f"0x{index:064x}",
+                    "event_type": "transfer",
+                    "asset": "ETH",
+                }
+                for index in range(5)
+            ],
+        )
+        await session.execute(
+            insert(BiasSnapshot.__table__),
+            [
+                {"timestamp": now, "asset": asset, "timeframe": "1h", "value": 0.1, "components": {}, "confidence": 0.5}
+                for asset in ("BTC", "ETH", "SOL")
+            ],
+        )
+        await session.commit()
+
+
+async def _adhoc_recent(session: AsyncSession) -> Any:
+    window = datetime.utcnow() - timedelta(minutes=60)
+    stmt = select(Event).where(Event.wallet_id == "w1", Event.timestamp >= window).order_by(desc(Event.timestamp))
+    return (await session.execute(stmt)).scalars().all()
+
+
+async def _adhoc_get(session: AsyncSession) -> Any:
+    return (await session.execute(select(Wallet).filter_by(address="0x01", chain="ethereum"))).scalar_one_or_none()
+
+
+async def _adhoc_latest(session: AsyncSession) -> Any:
+    table = BiasSnapshot.__table__
+    stmt = (
+        select(table.c.asset, table.c.timeframe, table.c.value, table.c.confidence, table.c.timestamp)
+        .order_by(table.c.asset, table.c.timeframe, table.c.timestamp.desc())
+        .where(table.c.asset.in_(["BTC", "ETH"]))
+    )
+    return (await session.execute(stmt)).all()
+
+
+async def _time(factory: async_sessionmaker[AsyncSession], query: Query, calls: int, repeat: int) -> float:
+    best = float("inf")
+    async with factory() as session:
+        await query(session)
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(calls):
+                await query(session)
+            best = min(best, time.perf_counter() - start)
+    return best / calls * 1e6
+
+
+async def run(calls: int, repeat: int) -> List[Tuple[str, float, float]]:
+    cases: List[Tuple[str, Query, Query]] = [
+        ("recent_for_wallet", _adhoc_recent, lambda s: EventRepository(s).recent_for_wallet("w1")),
+        ("get", _adhoc_get, lambda s: WalletRepository(s).get(address="0x01", chain="ethereum")),
+        (
+            "bias latest",
+            _adhoc_latest,
+            lambda s: BiasRepository(s).latest(["BTC", "ETH"], include_components=False),
+        ),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}")
+        factory = async_sessionmaker(engine, expire_on_commit=False)
+        try:
+            await apply_migrations(engine)
+            await _seed(factory)
+            results = []
+            for label, adhoc, prebuilt in cases:
+                before = await _time(factory, adhoc, calls, repeat)
+                after = await _time(factory, prebuilt, calls, repeat)
+                results.append((label, before, after))
+            return results
+        finally:
+            await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.calls, args.repeat))
+    print(f"{'query':<20}{'adhoc us':>10}{'prebuilt us':>13}{'saved':>8}")
+    for label, before, after in results:
+        print(f"{label:<20}{before:>10.1f}{after:>13.1f}{(1 - after / before):>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
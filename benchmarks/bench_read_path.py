@@ -0,0 +1,128 @@
+"""Compare ORM hydration against column-projected rows for hot repository reads.
+
+Usage::
+
+    python -m benchmarks.bench_read_path [--events 5000] [--wallets 2000] [--repeat 5]
+
+Reports objects/sec (best of ``--repeat`` runs) and retained bytes per row
+measured with ``tracemalloc`` against a throwaway SQLite database.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, List, Sequence, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from packages.db import apply_migrations
+from packages.db.models import Event, Wallet
+from services.api.repositories import EventRepository, WalletRepository
+
+RAW_PAYLOAD = {"log": "x" * 512, "topics": ["0x" + "ab" * 32] * 4, "block": 19_000_000}
+
+
+async def _seed(factory: async_sessionmaker[AsyncSession], events: int, wallets: int) -> str:
+    now = datetime.utcnow()
+    wallet_rows = [
+        {"id": f"w{index:06d}", "address": f"0x{index:040x}", "chain": "ethereum", "tags": ["smart"]}
+        for index in range(wallets)
+    ]
+    event_rows = [
+        {
+            "id": f"e{index:08d}",
+            "timestamp": now - timedelta(seconds=index),
+            "wallet_id": "w000000",
+            "tx_hash": f"0x{index:064x}",
+            "event_type": "transfer",
+            "asset": "ETH",
+            "amount": 1.5,
+            "notional_usd": 4200.0,
+            "raw_data": RAW_PAYLOAD,
+        }
+        for index in range(events)
+    ]
+    async with factory() as session:
+        await session.execute(insert(Wallet.__table__), wallet_rows)
+        await session.execute(insert(Event.__table__), event_rows)
+        await session.commit()
+    return "w000000"
+
+
+async def _measure(
+    factory: async_sessionmaker[AsyncSession],
+    query: Callable[[AsyncSession], Awaitable[Sequence[Any]]],
+    repeat: int,
+) -> Tuple[float, float, int]:
+    best = float("inf")
+    count = 0
+    for _ in range(repeat):
+        async with factory() as session:
+            start = time.perf_counter()
+            rows = await query(session)
+            best = min(best, time.perf_counter() - start)
+            count = len(rows)
+
+    async with factory() as session:
+        gc.collect()
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        rows = await query(session)
+        retained = tracemalloc.get_traced_memory()[0] - baseline
+        tracemalloc.stop()
+        del rows
+    return count / best, retained / max(count, 1), count
+
+
+async def run(events: int, wallets: int, repeat: int) -> List[Tuple[str, float, float, int]]:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}")
+        factory = async_sessionmaker(engine, expire_on_commit=False)
+        try:
+            await apply_migrations(engine)
+            wallet_id = await _seed(factory, events, wallets)
+            window = 24 * 60
+            cases: List[Tuple[str, Callable[[AsyncSession], Awaitable[Sequence[Any]]]]] = [
+                ("events orm", lambda s: EventRepository(s).recent_for_wallet(wallet_id, since_minutes=window)),
+                ("events rows", lambda s: EventRepository(s).recent_for_wallet_rows(wallet_id, since_minutes=window)),
+                (
+                    "events rows+raw",
+                    lambda s: EventRepository(s).recent_for_wallet_rows(
+                        wallet_id, since_minutes=window, include_raw=True
+                    ),
+                ),
+                ("wallets orm", lambda s: WalletRepository(s).list_active()),
+                ("wallets rows", lambda s: WalletRepository(s).list_active_rows()),
+            ]
+            results = []
+            for label, query in cases:
+                rate, per_row, count = await _measure(factory, query, repeat)
+                results.append((label, rate, per_row, count))
+            return results
+        finally:
+            await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--wallets", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.events, args.wallets, args.repeat))
+    print(f"{'case':<18}{'rows':>8}{'objects/sec':>14}{'bytes/row':>12}")
+    for label, rate, per_row, count in results:
+        print(f"{label:<18}{count:>8}{rate:>14,.0f}{per_row:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Risk metrics cost per order: batch ``get_metrics`` vs the incremental monitor.
+
+Usage::
+
+    python -m benchmarks.bench_risk_monitor [--positions 50 500 5000] [--reads 2000]
+
+For each book size, times one metrics read with ``RiskMonitor.get_metrics``
+(full rescan) and with ``IncrementalRiskMonitor.metrics``, plus the cost of
+one position update on the incremental book.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Callable, Dict, List
+
+from services.api.risk.monitor import IncrementalRiskMonitor, PositionSnapshot, RiskMonitor
+
+LIMITS = {"drawdown_limits": {"daily": 3.0}, "correlation_limit": 0.7, "risk_limit": 1.0}
+
+
+def random_book(count: int, seed: int = 3) -> Dict[str, PositionSnapshot]:
+    rng = random.Random(seed)
+    return {
+        f"p{index}": PositionSnapshot(
+            asset=f"A{index % 40}",
+            side=rng.choice(["long", "short"]),
+            size=rng.uniform(0.0, 0.01),
+            risk=rng.uniform(0.0, 0.001),
+            pnl=0.0,
+            drawdown=rng.uniform(0.0, 2.0),
+            correlation_bucket=f"b{index % 12}",
+        )
+        for index in range(count)
+    }
+
+
+def _per_call_us(call: Callable[[], object], calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        call()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--positions", type=int, nargs="+", default=[50, 500, 5000])
+    parser.add_argument("--reads", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'positions':>10}{'batch us':>12}{'incremental us':>16}{'update us':>12}")
+    for count in args.positions:
+        book = random_book(count)
+        batch = RiskMonitor(**LIMITS)
+        monitor = IncrementalRiskMonitor(**LIMITS)
+        monitor.sync(book)
+        assert monitor.metrics() == batch.get_metrics(book.values())
+
+        ids: List[str] = list(book)
+        rng = random.Random(5)
+
+        def update() -> None:
+            position_id = rng.choice(ids)
+            position = book[position_id]
+            monitor.update_position(
+                position_id,
+                PositionSnapshot(
+                    asset=position.asset,
+                    side=position.side,
+                    size=position.size,
+                    risk=position.risk,
+                    pnl=0.0,
+                    drawdown=rng.uniform(0, 2),
+                    correlation_bucket=position.correlation_bucket,
+                ),
+            )
+
+        reads = max(10, args.reads * 50 // max(count, 50))
+        batch_us = _per_call_us(lambda: batch.get_metrics(book.values()), reads)
+        incremental_us = _per_call_us(monitor.metrics, args.reads)
+        update_us = _per_call_us(update, args.reads)
+        print(f"{count:>10}{batch_us:>12.1f}{incremental_us:>16.2f}{update_us:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+"""Columnar archive of historical tables for offline scoring and backtests."""
+
+from .offline import wallet_stats_from_archive
+from .reader import ArchivePartition, ArchiveReader
+from .schema import ARCHIVE_TABLES, ArchiveColumn, ArchiveTable
+from .writer import ArchiveWriter
+
+__all__ = [
+    "ARCHIVE_TABLES",
+    "ArchiveColumn",
+    "ArchiveTable",
+    "ArchiveWriter",
+    "ArchiveReader",
+    "ArchivePartition",
+    "wallet_stats_from_archive",
+]
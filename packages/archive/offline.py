@@ -0,0 +1,95 @@
+"""Build scoring inputs straight from archived columns."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from packages.scoring.models import TradeSnapshot, WalletStats
+
+from .reader import ArchiveReader
+
+_US_PER_SECOND = 1_000_000
+
+
+def wallet_stats_from_archive(
+    reader: ArchiveReader,
+    *,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    assets: Optional[Iterable[str]] = None,
+) -> List[WalletStats]:
+    """Per-wallet :class:`WalletStats` from archived positions and events.
+
+    Trades are closed positions attributed via ``signal_wallet_id``; the false
+    signal rate is the share of losing trades. Event activity supplies
+    ``recent_events``, ``avg_size_usd`` (mean notional) and
+    ``liquidity_utilization`` (mean ``size_fraction``, clipped to [0, 1]).
+    Wallets are returned sorted by id so offline runs are deterministic.
+    """
+
+    asset_filter = list(assets) if assets is not None else None
+    stats: Dict[str, WalletStats] = {}
+
+    positions = reader.read(
+        "positions",
+        ["signal_wallet_id", "opened_at", "closed_at", "realized_pnl"],
+        start=start,
+        end=end,
+        assets=asset_filter,
+    )
+    closed = ~np.isnat(positions["closed_at"]) & ~np.isnan(positions["realized_pnl"])
+    closed &= positions["signal_wallet_id"] != None  # noqa: E711 - elementwise on object array
+    if closed.any():
+        wallets = positions["signal_wallet_id"][closed]
+        opened = positions["opened_at"][closed].astype(np.int64) / _US_PER_SECOND
+        closed_at = positions["closed_at"][closed].astype(np.int64) / _US_PER_SECOND
+        pnl = positions["realized_pnl"][closed]
+        order = np.lexsort((opened, wallets.astype(str)))
+        for index in order:
+            wallet_id = wallets[index]
+            entry = stats.setdefault(wallet_id, WalletStats(wallet_id=wallet_id))
+            entry.trades.append(
+                TradeSnapshot(
+                    pnl=float(pnl[index]),
+                    entry_timestamp=float(opened[index]),
+                    exit_timestamp=float(closed_at[index]),
+                    duration_minutes=float((closed_at[index] - opened[index]) / 60),
+                )
+            )
+        for entry in stats.values():
+            losing = sum(1 for trade in entry.trades if trade.pnl < 0)
+            entry.false_signal_rate = losing / len(entry.trades)
+
+    events = reader.read(
+        "events",
+        ["wallet_id", "notional_usd", "size_fraction"],
+        start=start,
+        end=end,
+        assets=asset_filter,
+    )
+    attributed = events["wallet_id"] != None  # noqa: E711 - elementwise on object array
+    if attributed.any():
+        ids, inverse = np.unique(events["wallet_id"][attributed].astype(str), return_inverse=True)
+        counts = np.bincount(inverse, minlength=len(ids))
+        avg_size = _group_nanmean(inverse, events["notional_usd"][attributed], len(ids))
+        utilization = _group_nanmean(inverse, events["size_fraction"][attributed], len(ids))
+        for index, wallet_id in enumerate(ids.tolist()):
+            entry = stats.setdefault(wallet_id, WalletStats(wallet_id=wallet_id))
+            entry.recent_events = int(counts[index])
+            entry.avg_size_usd = float(avg_size[index])
+            entry.liquidity_utilization = float(min(1.0, max(0.0, utilization[index])))
+
+    return [stats[wallet_id] for wallet_id in sorted(stats)]
+
+
+def _group_nanmean(groups: np.ndarray, values: np.ndarray, size: int) -> np.ndarray:
+    present = ~np.isnan(values)
+    totals = np.bincount(groups[present], weights=values[present], minlength=size)
+    counts = np.bincount(groups[present], minlength=size)
+    return np.divide(totals, counts, out=np.zeros(size), where=counts > 0)
+
+
+__all__ = ["wallet_stats_from_archive"]
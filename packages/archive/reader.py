@@ -0,0 +1,138 @@
+"""Memory-mapped readers for archived column partitions."""
+
+from __future__ import annotations
+
+import json
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+from .schema import ARCHIVE_TABLES, ArchiveTable
+from .writer import COMPRESSED_FILE, META_FILE, NULL_ASSET, to_micros
+
+
+class ArchivePartition:
+    """One ``date=/asset=`` directory; column arrays are loaded lazily."""
+
+    def __init__(self, path: Path, spec: ArchiveTable, day: date, asset: Optional[str], *, mmap: bool = True) -> None:
+        self.path = path
+        self.spec = spec
+        self.day = day
+        self.asset = asset
+        self.mmap = mmap
+        self.meta = json.loads((path / META_FILE).read_text())
+        self._arrays: Dict[str, np.ndarray] = {}
+
+    @property
+    def rows(self) -> int:
+        return int(self.meta["rows"])
+
+    def column(self, name: str) -> np.ndarray:
+        """Stored representation (codes for dictionary columns), memory-mapped when possible."""
+
+        array = self._arrays.get(name)
+        if array is None:
+            if self.meta.get("compressed"):
+                with np.load(self.path / COMPRESSED_FILE) as bundle:
+                    array = bundle[name]
+            else:
+                array = np.load(self.path / f"{name}.npy", mmap_mode="r" if self.mmap else None)
+            self._arrays[name] = array
+        return array
+
+    def values(self, name: str) -> np.ndarray:
+        """Decoded column: objects for dictionary columns, ``datetime64[us]`` for times."""
+
+        kind = self.spec.kind(name)
+        array = self.column(name)
+        if kind == "code":
+            lookup = np.array(self.meta["dictionaries"][name] + [None], dtype=object)
+            return lookup[array]  # -1 (NULL) indexes the trailing None
+        if kind == "time":
+            return array.view("datetime64[us]")  # NULL_TIME is NaT
+        return array
+
+
+class ArchiveReader:
+    """Locates partitions by table, day range and asset."""
+
+    def __init__(self, root: Union[str, Path], *, mmap: bool = True) -> None:
+        self.root = Path(root)
+        self.mmap = mmap
+
+    def partitions(
+        self,
+        table_name: str,
+        *,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        assets: Optional[Iterable[str]] = None,
+    ) -> List[ArchivePartition]:
+        spec = ARCHIVE_TABLES[table_name]
+        wanted = set(assets) if assets is not None else None
+        first_day = start.date() if start is not None else None
+        last_day = end.date() if end is not None else None
+        found = []
+        for day_dir in sorted((self.root / spec.name).glob("date=*")):
+            day = date.fromisoformat(day_dir.name.split("=", 1)[1])
+            if (first_day and day < first_day) or (last_day and day > last_day):
+                continue
+            for asset_dir in sorted(day_dir.glob("asset=*")):
+                if asset_dir.suffix == ".tmp" or not (asset_dir / META_FILE).exists():
+                    continue  # interrupted write or foreign file
+                raw_asset = asset_dir.name.split("=", 1)[1]
+                asset = None if raw_asset == NULL_ASSET else raw_asset
+                if wanted is not None and asset not in wanted:
+                    continue
+                found.append(ArchivePartition(asset_dir, spec, day, asset, mmap=self.mmap))
+        return found
+
+    def iter_partitions(self, table_name: str, **filters) -> Iterator[ArchivePartition]:
+        yield from self.partitions(table_name, **filters)
+
+    def read(
+        self,
+        table_name: str,
+        columns: Optional[Sequence[str]] = None,
+        *,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        assets: Optional[Iterable[str]] = None,
+    ) -> Dict[str, np.ndarray]:
+        """Decoded columns concatenated across matching partitions, in (day, asset) order.
+
+        ``start`` is inclusive and ``end`` exclusive on the table's time column.
+        """
+
+        spec = ARCHIVE_TABLES[table_name]
+        names = list(columns or spec.column_names)
+        chunks: Dict[str, List[np.ndarray]] = {name: [] for name in names}
+        low = to_micros(start) if start is not None else None
+        high = to_micros(end) if end is not None else None
+        for partition in self.partitions(table_name, start=start, end=end, assets=assets):
+            mask = None
+            if low is not None or high is not None:
+                times = partition.column(spec.time_column)
+                mask = np.ones(partition.rows, dtype=bool)
+                if low is not None:
+                    mask &= times >= low
+                if high is not None:
+                    mask &= times < high
+                if not mask.any():
+                    continue
+            for name in names:
+                values = partition.values(name)
+                chunks[name].append(values[mask] if mask is not None else values)
+        return {name: _concat(parts, spec.kind(name)) for name, parts in chunks.items()}
+
+
+def _concat(parts: List[np.ndarray], kind: str) -> np.ndarray:
+    if parts:
+        return np.concatenate(parts)
+    dtypes = {"time": "datetime64[us]", "float": np.float64, "bool": np.int8, "code": object, "text": "<U1"}
+    return np.empty(0, dtype=dtypes[kind])
+
+
+__all__ = ["ArchivePartition", "ArchiveReader"]
@@ -0,0 +1,119 @@
+"""Column layouts for archived tables."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+# Stored kinds:
+#   time  -> int64 microseconds since the epoch (UTC), NULL_TIME for NULL
+#   float -> float64, NaN for NULL
+#   bool  -> int8 (0/1), -1 for NULL
+#   code  -> int32 index into the partition dictionary, -1 for NULL
+#   text  -> fixed-width unicode, "" for NULL (high-cardinality ids/hashes)
+KINDS = ("time", "float", "bool", "code", "text")
+NULL_TIME = np.iinfo(np.int64).min
+
+
+@dataclass(frozen=True)
+class ArchiveColumn:
+    name: str
+    kind: str
+
+    def __post_init__(self) -> None:
+        if self.kind not in KINDS:
+            raise ValueError(f"Unsupported archive column kind '{self.kind}'. Supported: {', '.join(KINDS)}.")
+
+
+@dataclass(frozen=True)
+class ArchiveTable:
+    """Archive layout for one table, partitioned by day of ``time_column`` and ``asset_column``."""
+
+    name: str
+    time_column: str
+    columns: Tuple[ArchiveColumn, ...]
+    asset_column: Optional[str] = "asset"
+
+    @property
+    def column_names(self) -> Tuple[str, ...]:
+        return tuple(column.name for column in self.columns)
+
+    def kind(self, name: str) -> str:
+        for column in self.columns:
+            if column.name == name:
+                return column.kind
+        raise KeyError(f"{self.name} archive has no column '{name}'")
+
+
+def _columns(**kinds: str) -> Tuple[ArchiveColumn, ...]:
+    return tuple(ArchiveColumn(name, kind) for name, kind in kinds.items())
+
+
+# JSON payload columns (events.raw_data, bias.components) are deliberately not
+# archived; offline scoring does not use them and they dominate row size.
+EVENTS = ArchiveTable(
+    name="events",
+    time_column="timestamp",
+    columns=_columns(
+        id="text",
+        timestamp="time",
+        wallet_id="code",
+        tx_hash="text",
+        event_type="code",
+        asset="code",
+        amount="float",
+        notional_usd="float",
+        size_fraction="float",
+        venue="code",
+        is_first_since_watch="bool",
+    ),
+)
+
+BIAS = ArchiveTable(
+    name="bias",
+    time_column="timestamp",
+    columns=_columns(
+        timestamp="time",
+        asset="code",
+        timeframe="code",
+        value="float",
+        confidence="float",
+    ),
+)
+
+POSITIONS = ArchiveTable(
+    name="positions",
+    time_column="opened_at",
+    columns=_columns(
+        id="text",
+        opened_at="time",
+        closed_at="time",
+        trading_mode="code",
+        asset="code",
+        side="code",
+        entry_price="float",
+        exit_price="float",
+        size="float",
+        leverage="float",
+        realized_pnl="float",
+        fees_paid="float",
+        holding_time="float",
+        signal_wallet_id="code",
+    ),
+)
+
+ARCHIVE_TABLES: Dict[str, ArchiveTable] = {table.name: table for table in (EVENTS, BIAS, POSITIONS)}
+
+
+__all__ = [
+    "ARCHIVE_TABLES",
+    "ArchiveColumn",
+    "ArchiveTable",
+    "BIAS",
+    "EVENTS",
+    "KINDS",
+    "NULL_TIME",
+    "POSITIONS",
+]
@@ -0,0 +1,228 @@
+"""Stream tables from the database into day/asset partitioned column files."""
+
+from __future__ import annotations
+
+import json
+import shutil
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from sqlalchemy import column, select, table
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from packages.db.migrations import PARTITIONED_TABLES
+
+from .schema import ARCHIVE_TABLES, NULL_TIME, ArchiveTable
+
+FORMAT_VERSION = 1
+META_FILE = "_meta.json"
+COMPRESSED_FILE = "columns.npz"
+NULL_ASSET = "__null__"
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_PARTITIONED = {spec.table: spec.view for spec in PARTITIONED_TABLES}
+
+PartitionKey = Tuple[date, str]
+
+
+def to_micros(value: Any) -> int:
+    """Epoch microseconds for a datetime (naive values are UTC) or ISO string."""
+
+    if value is None:
+        return int(NULL_TIME)
+    if not isinstance(value, datetime):
+        value = datetime.fromisoformat(str(value))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    delta = value - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def partition_path(root: Path, table_name: str, day: date, asset: str) -> Path:
+    return root / table_name / f"date={day.isoformat()}" / f"asset={asset}"
+
+
+def encode_columns(spec: ArchiveTable, rows: Sequence[Sequence[Any]]) -> Tuple[Dict[str, np.ndarray], Dict[str, List[str]]]:
+    """Encode row tuples (in ``spec.columns`` order) into typed column arrays."""
+
+    arrays: Dict[str, np.ndarray] = {}
+    dictionaries: Dict[str, List[str]] = {}
+    for index, col in enumerate(spec.columns):
+        values = [row[index] for row in rows]
+        if col.kind == "time":
+            arrays[col.name] = np.fromiter((to_micros(v) for v in values), dtype=np.int64, count=len(values))
+        elif col.kind == "float":
+            arrays[col.name] = np.array(
+                [np.nan if v is None else float(v) for v in values], dtype=np.float64
+            )
+        elif col.kind == "bool":
+            arrays[col.name] = np.array([-1 if v is None else int(bool(v)) for v in values], dtype=np.int8)
+        elif col.kind == "code":
+            vocabulary: Dict[str, int] = {}
+            codes = np.fromiter(
+                (-1 if v is None else vocabulary.setdefault(str(v), len(vocabulary)) for v in values),
+                dtype=np.int32,
+                count=len(values),
+            )
+            arrays[col.name] = codes
+            dictionaries[col.name] = list(vocabulary)
+        else:
+            texts = ["" if v is None else str(v) for v in values]
+            width = max((len(text) for text in texts), default=1) or 1
+            arrays[col.name] = np.array(texts, dtype=f"<U{width}")
+    return arrays, dictionaries
+
+
+def write_partition(
+    path: Path,
+    spec: ArchiveTable,
+    rows: Sequence[Sequence[Any]],
+    *,
+    compress: bool = False,
+) -> int:
+    """Atomically (re)write one partition directory; returns rows written.
+
+    Uncompressed partitions are one ``.npy`` per column so readers can
+    ``mmap`` them; ``compress=True`` trades that for a single ``columns.npz``.
+    """
+
+    arrays, dictionaries = encode_columns(spec, rows)
+    staging = path.with_name(path.name + ".tmp")
+    if staging.exists():
+        shutil.rmtree(staging)
+    staging.mkdir(parents=True)
+    if compress:
+        np.savez_compressed(staging / COMPRESSED_FILE, **arrays)
+    else:
+        for name, array in arrays.items():
+            np.save(staging / f"{name}.npy", array, allow_pickle=False)
+    meta = {
+        "format": FORMAT_VERSION,
+        "table": spec.name,
+        "rows": len(rows),
+        "compressed": compress,
+        "columns": {col.name: col.kind for col in spec.columns},
+        "dictionaries": dictionaries,
+    }
+    (staging / META_FILE).write_text(json.dumps(meta))
+    if path.exists():
+        shutil.rmtree(path)
+    staging.rename(path)
+    return len(rows)
+
+
+class ArchiveWriter:
+    """Exports archive tables partition by partition without loading whole tables."""
+
+    def __init__(self, root: Union[str, Path], *, compress: bool = False) -> None:
+        self.root = Path(root)
+        self.compress = compress
+
+    async def export(
+        self,
+        engine: AsyncEngine,
+        table_name: str,
+        *,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        chunk_size: int = 10_000,
+    ) -> int:
+        """Stream ``table_name`` rows in time order into partitions; returns rows exported.
+
+        Partitions are rewritten whole, so ``since`` and ``until`` are floored to
+        midnight UTC and a day is either exported completely or left alone.
+        Asset partitions of an exported day that no longer have rows are removed.
+        Rows without a timestamp are skipped.
+        """
+
+        spec = ARCHIVE_TABLES[table_name]
+        source_name = _PARTITIONED.get(spec.name) if engine.dialect.name == "sqlite" else None
+        source = table(source_name or spec.name, *(column(name) for name in spec.column_names))
+        time_col = source.c[spec.time_column]
+        stmt = select(*source.c).where(time_col.is_not(None)).order_by(time_col)
+        if since is not None:
+            stmt = stmt.where(time_col >= _bound(engine, _floor_day(since)))
+        if until is not None:
+            stmt = stmt.where(time_col < _bound(engine, _floor_day(until)))
+
+        time_index = spec.column_names.index(spec.time_column)
+        asset_index = spec.column_names.index(spec.asset_column) if spec.asset_column else None
+        buffers: Dict[PartitionKey, List[Sequence[Any]]] = defaultdict(list)
+        exported = 0
+        async with engine.connect() as conn:
+            result = await conn.stream(stmt.execution_options(yield_per=chunk_size))
+            async for chunk in result.partitions(chunk_size):
+                for row in chunk:
+                    day = _day_of(row[time_index])
+                    asset = NULL_ASSET
+                    if asset_index is not None and row[asset_index] is not None:
+                        asset = str(row[asset_index])
+                    buffers[(day, asset)].append(tuple(row))
+                # Rows arrive in time order: every day before the newest is complete.
+                newest = max(day for day, _ in buffers) if buffers else None
+                exported += self._flush(spec, buffers, lambda key: key[0] < newest)
+        exported += self._flush(spec, buffers, lambda key: True)
+        return exported
+
+    async def export_all(
+        self,
+        engine: AsyncEngine,
+        tables: Iterable[str] = tuple(ARCHIVE_TABLES),
+        **kwargs: Any,
+    ) -> Dict[str, int]:
+        return {name: await self.export(engine, name, **kwargs) for name in tables}
+
+    def _flush(self, spec: ArchiveTable, buffers: Dict[PartitionKey, List[Sequence[Any]]], ready) -> int:
+        # Rows arrive in time order, so every asset of a ready day is flushed in the same call.
+        written = 0
+        days: Dict[date, List[str]] = defaultdict(list)
+        for key in [key for key in buffers if ready(key)]:
+            day, asset = key
+            written += write_partition(
+                partition_path(self.root, spec.name, day, asset),
+                spec,
+                buffers.pop(key),
+                compress=self.compress,
+            )
+            days[day].append(asset)
+        for day, assets in days.items():
+            self._prune(spec, day, assets)
+        return written
+
+    def _prune(self, spec: ArchiveTable, day: date, assets: Sequence[str]) -> None:
+        keep = {partition_path(self.root, spec.name, day, asset).name for asset in assets}
+        for path in partition_path(self.root, spec.name, day, NULL_ASSET).parent.iterdir():
+            if path.is_dir() and path.name.startswith("asset=") and path.name not in keep:
+                shutil.rmtree(path)
+
+
+def _day_of(value: Any) -> date:
+    micros = to_micros(value)
+    return (_EPOCH + timedelta(microseconds=micros)).date()
+
+
+def _floor_day(value: datetime) -> datetime:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _bound(engine: AsyncEngine, value: datetime) -> Any:
+    if engine.dialect.name != "sqlite":
+        return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+    # SQLite stores text; compare against the same lexical format.
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.strftime("%Y-%m-%d %H:%M:%S")
+
+
+__all__ = [
+    "ArchiveWriter",
+    "FORMAT_VERSION",
+    "encode_columns",
+    "partition_path",
+    "to_micros",
+    "write_partition",
+]
@@ -14,19 +14,20 @@ class CacheEntry:
 
 
 class TTLCache:
-    def __init__(self, default_ttl: float = 3600.0) -> None:
+    def __init__(self, default_ttl: float = 3600.0, *, clock: Callable[[], float] = time.time) -> None:
         self.default_ttl = default_ttl
+        self.clock = clock
         self._store: Dict[str, CacheEntry] = {}
 
     def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
-        expires = time.time() + (ttl if ttl is not None else self.default_ttl)
+        expires = self.clock() + (ttl if ttl is not None else self.default_ttl)
         self._store[key] = CacheEntry(value=value, expires_at=expires)
 
     def get(self, key: str) -> Optional[Any]:
         entry = self._store.get(key)
         if not entry:
             return None
-        if entry.expires_at < time.time():
+        if entry.expires_at < self.clock():
             self._store.pop(key, None)
             return None
         return entry.value
@@ -1,23 +1,34 @@
 """Shared database toolkit for services."""
 
 from .settings import (
+    POOL_PROFILES,
     DatabaseSettings,
     DatabaseURLValidationError,
+    PoolProfile,
     get_database_settings,
     reset_database_settings_cache,
 )
 from .migrations import MIGRATIONS, apply_migrations, rollback_last
+from .pool import PoolInstrumentation
+from .routing import mark_write, read_session_for, recently_wrote
 from .session import (
     check_database_health,
     dispose_engine,
+    get_read_session,
     get_session,
+    has_read_replica,
     init_engine,
+    init_read_engine,
+    init_read_sessionmaker,
     init_sessionmaker,
 )
 
 __all__ = [
     "DatabaseSettings",
     "DatabaseURLValidationError",
+    "PoolProfile",
+    "POOL_PROFILES",
+    "PoolInstrumentation",
     "get_database_settings",
     "reset_database_settings_cache",
     "apply_migrations",
@@ -26,6 +37,13 @@ __all__ = [
     "init_engine",
     "init_sessionmaker",
     "get_session",
+    "init_read_engine",
+    "init_read_sessionmaker",
+    "get_read_session",
+    "has_read_replica",
+    "mark_write",
+    "read_session_for",
+    "recently_wrote",
     "check_database_health",
     "dispose_engine",
 ]
@@ -8,9 +8,12 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 from .models import Migration
+from .partitioning import PARTITIONED_TABLES, PartitionManager, PartitionSpec, partition_view
 from .v0001_initial import migration as migration_0001
+from .v0002_partitions import migration as migration_0002
+from .v0003_wallet_address_case import migration as migration_0003
 
-MIGRATIONS: List[Migration] = [migration_0001]
+MIGRATIONS: List[Migration] = [migration_0001, migration_0002, migration_0003]
 
 
 async def _ensure_versions_table(engine: AsyncEngine) -> None:
@@ -79,7 +82,7 @@ async def rollback_last(engine: AsyncEngine) -> None:
             text(
                 """
                 SELECT id FROM schema_migrations
-                ORDER BY applied_at DESC
+                ORDER BY applied_at DESC, id DESC
                 LIMIT 1
                 """
             )
@@ -97,4 +100,12 @@ async def rollback_last(engine: AsyncEngine) -> None:
     await _remove_applied(engine, migration)
 
 
-__all__ = ["apply_migrations", "rollback_last", "MIGRATIONS"]
+__all__ = [
+    "apply_migrations",
+    "rollback_last",
+    "MIGRATIONS",
+    "PARTITIONED_TABLES",
+    "PartitionManager",
+    "PartitionSpec",
+    "partition_view",
+]
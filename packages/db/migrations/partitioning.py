@@ -0,0 +1,525 @@
+"""Declarative time partitioning for append-mostly tables.
+
+Postgres uses native ``PARTITION BY RANGE`` with one partition per period plus a
+default partition. SQLite has no partitioning, so the base table stays the hot
+partition (ORM writes, row counts and constraints behave as before), closed
+periods are moved into ``<table>_p<period>`` tables by :meth:`PartitionManager.rotate`
+and ``<table>_all`` is a ``UNION ALL`` view over the base and period tables.
+On both dialects ``<table>_all`` spans every live partition and retention is a
+single ``DROP TABLE`` (or detach/rename when archiving) per expired period.
+
+Neither layout can enforce a unique column across partitions, so a spec with
+``unique_key`` records every inserted key in ``key_table`` (one primary-key row
+per value, written by an insert trigger). Keys are released when their period
+is retired. Foreign keys pointing at a partitioned table are dropped on
+Postgres (see :func:`convert_to_partitioned`).
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import Table, column, text
+from sqlalchemy import table as table_clause
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.schema import AddConstraint, CreateIndex, ForeignKeyConstraint, UniqueConstraint
+from sqlalchemy.sql.expression import TableClause
+
+INTERVALS = ("day", "month")
+_SUFFIX_FORMATS = {"day": "%Y%m%d", "month": "%Y%m"}
+
+
+@dataclass(frozen=True)
+class PartitionSpec:
+    """Partitioning rule for one table.
+
+    ``premake`` periods are created ahead of the current one. ``retention`` is
+    the number of whole periods kept before the current one (``None`` keeps
+    everything); expired periods are dropped, or renamed to
+    ``<partition>_archived`` (and detached on Postgres) when ``archive`` is set.
+    ``hot_periods`` closed periods stay in the SQLite base table so "latest"
+    style reads do not have to touch the view. ``unique_key`` names a column
+    kept unique across every partition through ``key_table``.
+    """
+
+    table: str
+    column: str
+    interval: str = "month"
+    premake: int = 2
+    retention: Optional[int] = None
+    archive: bool = False
+    hot_periods: int = 1
+    unique_key: Optional[str] = None
+    key_table: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if self.interval not in INTERVALS:
+            raise ValueError(f"Unsupported partition interval '{self.interval}'. Supported: {', '.join(INTERVALS)}.")
+        if self.retention is not None and self.retention <= self.hot_periods:
+            raise ValueError("retention must exceed hot_periods so expired rows are never still in the base table")
+        if (self.unique_key is None) != (self.key_table is None):
+            raise ValueError("unique_key and key_table must be set together")
+
+    @property
+    def view(self) -> str:
+        return f"{self.table}_all"
+
+    def partition_name(self, start: datetime) -> str:
+        return f"{self.table}_p{start.strftime(_SUFFIX_FORMATS[self.interval])}"
+
+    def parse_partition(self, name: str) -> Optional[datetime]:
+        """Period start encoded in ``name``, or ``None`` if it is not one of ours."""
+
+        digits = 8 if self.interval == "day" else 6
+        match = re.fullmatch(rf"{re.escape(self.table)}_p(\d{{{digits}}})", name)
+        if match is None:
+            return None
+        return datetime.strptime(match.group(1), _SUFFIX_FORMATS[self.interval])
+
+
+PARTITIONED_TABLES: tuple[PartitionSpec, ...] = (
+    PartitionSpec("events", "timestamp", retention=12, unique_key="tx_hash", key_table="event_tx_hashes"),
+    PartitionSpec("bias", "timestamp", retention=6),
+    PartitionSpec("audit_logs", "timestamp", retention=24, archive=True),
+)
+
+
+def period_start(value: datetime, interval: str) -> datetime:
+    """Naive UTC start of the period containing ``value``."""
+
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    if interval == "day":
+        return value.replace(hour=0, minute=0, second=0, microsecond=0)
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def shift_period(start: datetime, interval: str, periods: int) -> datetime:
+    if interval == "day":
+        return datetime.fromordinal(start.toordinal() + periods)
+    month_index = start.year * 12 + start.month - 1 + periods
+    return start.replace(year=month_index // 12, month=month_index % 12 + 1, day=1)
+
+
+def _coerce_datetime(value: Any) -> Optional[datetime]:
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(str(value))
+
+
+def partition_names(conn: Connection, spec: PartitionSpec) -> List[str]:
+    """Live period partitions of ``spec.table`` (excludes default/archived), oldest first."""
+
+    if conn.dialect.name == "postgresql":
+        rows = conn.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "JOIN pg_class p ON p.oid = i.inhparent "
+                "WHERE p.relname = :table"
+            ),
+            {"table": spec.table},
+        )
+    else:
+        rows = conn.execute(
+            text("SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE :pattern"),
+            {"pattern": f"{spec.table}_p%"},
+        )
+    return sorted(name for (name,) in rows if spec.parse_partition(name) is not None)
+
+
+class PartitionManager:
+    """Creates, rotates and expires period partitions for ``specs``."""
+
+    def __init__(self, engine: AsyncEngine, specs: Sequence[PartitionSpec] = PARTITIONED_TABLES) -> None:
+        self.engine = engine
+        self.specs = tuple(specs)
+
+    @property
+    def is_postgres(self) -> bool:
+        return self.engine.dialect.name == "postgresql"
+
+    async def list_partitions(self, spec: PartitionSpec) -> List[str]:
+        async with self.engine.connect() as conn:
+            return await conn.run_sync(partition_names, spec)
+
+    async def ensure_partitions(self, *, now: Optional[datetime] = None) -> List[str]:
+        """Create the current and ``premake`` upcoming partitions; returns new names."""
+
+        current = now or datetime.now(timezone.utc)
+        created: List[str] = []
+        async with self.engine.begin() as conn:
+            for spec in self.specs:
+                start = period_start(current, spec.interval)
+                periods = [shift_period(start, spec.interval, offset) for offset in range(spec.premake + 1)]
+                created.extend(await conn.run_sync(self._create_partitions, spec, periods))
+        return created
+
+    async def rotate(self, *, now: Optional[datetime] = None) -> int:
+        """SQLite: move closed periods out of the base table; returns rows moved.
+
+        Postgres routes rows natively, so this is a no-op there.
+        """
+
+        if self.is_postgres:
+            return 0
+        current = now or datetime.now(timezone.utc)
+        moved = 0
+        for spec in self.specs:
+            async with self.engine.begin() as conn:
+                moved += await conn.run_sync(self._rotate_sqlite, spec, current)
+        return moved
+
+    async def apply_retention(self, *, now: Optional[datetime] = None) -> List[str]:
+        """Drop (or archive) partitions older than each spec's retention."""
+
+        current = now or datetime.now(timezone.utc)
+        retired: List[str] = []
+        for spec in self.specs:
+            if spec.retention is None:
+                continue
+            cutoff = shift_period(period_start(current, spec.interval), spec.interval, -spec.retention)
+            async with self.engine.begin() as conn:
+                retired.extend(await conn.run_sync(self._retire, spec, cutoff))
+        return retired
+
+    # Synchronous helpers executed through ``run_sync`` -------------------
+
+    def _quote(self, conn: Connection, name: str) -> str:
+        return conn.dialect.identifier_preparer.quote(name)
+
+    def _create_partitions(self, conn: Connection, spec: PartitionSpec, periods: Iterable[datetime]) -> List[str]:
+        existing = set(partition_names(conn, spec))
+        created = []
+        for start in periods:
+            name = spec.partition_name(start)
+            if name in existing:
+                continue
+            self._create_partition(conn, spec, start)
+            created.append(name)
+        self._refresh_view(conn, spec)
+        return created
+
+    def _create_partition(self, conn: Connection, spec: PartitionSpec, start: datetime) -> None:
+        if conn.dialect.name == "postgresql":
+            self._attach_postgres_partition(conn, spec, start)
+            return
+        partition = spec.partition_name(start)
+        # Same DDL as the base table so period tables keep its PK, UNIQUE and CHECK constraints.
+        ddl = conn.execute(
+            text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": spec.table},
+        ).scalar_one()
+        conn.execute(text(_retarget_table_ddl(ddl, spec.table, self._quote(conn, partition))))
+        indexes = conn.execute(
+            text("SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = :name AND sql IS NOT NULL"),
+            {"name": spec.table},
+        ).all()
+        suffix = partition[len(spec.table) + 1 :]
+        for index, index_ddl in indexes:
+            copy = self._quote(conn, f"{index}_{suffix}")
+            conn.execute(text(_retarget_index_ddl(index_ddl, index, copy, spec.table, self._quote(conn, partition))))
+        column = self._quote(conn, spec.column)
+        index = self._quote(conn, f"idx_{partition}_{spec.column}")
+        conn.execute(text(f"CREATE INDEX IF NOT EXISTS {index} ON {self._quote(conn, partition)} ({column})"))
+
+    def _attach_postgres_partition(self, conn: Connection, spec: PartitionSpec, start: datetime) -> None:
+        """Create the period table, move its rows out of the default partition, then attach it.
+
+        ``CREATE TABLE ... PARTITION OF`` fails once the default partition holds
+        rows for the period, so the rows are moved into a standalone table first.
+        """
+
+        name = self._quote(conn, spec.partition_name(start))
+        table = self._quote(conn, spec.table)
+        default = self._quote(conn, f"{spec.table}_default")
+        column = self._quote(conn, spec.column)
+        end = shift_period(start, spec.interval, 1)
+        bounds = {"lo": start.replace(tzinfo=timezone.utc), "hi": end.replace(tzinfo=timezone.utc)}
+        where = f"{column} >= :lo AND {column} < :hi"
+        conn.execute(text(f"CREATE TABLE IF NOT EXISTS {name} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+        conn.execute(text(f"INSERT INTO {name} SELECT * FROM {default} WHERE {where}"), bounds)
+        conn.execute(text(f"DELETE FROM {default} WHERE {where}"), bounds)
+        conn.execute(
+            text(
+                f"ALTER TABLE {table} ATTACH PARTITION {name} "
+                f"FOR VALUES FROM ('{start.isoformat(sep=' ')}+00') TO ('{end.isoformat(sep=' ')}+00')"
+            )
+        )
+
+    def _refresh_view(self, conn: Connection, spec: PartitionSpec) -> None:
+        view = self._quote(conn, spec.view)
+        table = self._quote(conn, spec.table)
+        if conn.dialect.name == "postgresql":
+            conn.execute(text(f"CREATE OR REPLACE VIEW {view} AS SELECT * FROM {table}"))
+            return
+        selects = [f"SELECT * FROM {table}"]
+        selects.extend(f"SELECT * FROM {self._quote(conn, name)}" for name in partition_names(conn, spec))
+        conn.execute(text(f"DROP VIEW IF EXISTS {view}"))
+        conn.execute(text(f"CREATE VIEW {view} AS " + " UNION ALL ".join(selects)))
+
+    def _rotate_sqlite(self, conn: Connection, spec: PartitionSpec, now: datetime) -> int:
+        table = self._quote(conn, spec.table)
+        column = self._quote(conn, spec.column)
+        boundary = shift_period(period_start(now, spec.interval), spec.interval, -spec.hot_periods)
+        oldest = _coerce_datetime(
+            conn.execute(
+                text(f"SELECT MIN({column}) FROM {table} WHERE {column} < :boundary"),
+                {"boundary": _sqlite_bound(boundary)},
+            ).scalar()
+        )
+        if oldest is None:
+            return 0
+
+        moved = 0
+        existing = set(partition_names(conn, spec))
+        start = period_start(oldest, spec.interval)
+        while start < boundary:
+            end = shift_period(start, spec.interval, 1)
+            if spec.partition_name(start) not in existing:
+                self._create_partition(conn, spec, start)
+            bounds = {"lo": _sqlite_bound(start), "hi": _sqlite_bound(end)}
+            where = f"{column} >= :lo AND {column} < :hi"
+            partition = self._quote(conn, spec.partition_name(start))
+            conn.execute(text(f"INSERT INTO {partition} SELECT * FROM {table} WHERE {where}"), bounds)
+            moved += conn.execute(text(f"DELETE FROM {table} WHERE {where}"), bounds).rowcount or 0
+            start = end
+        self._refresh_view(conn, spec)
+        return moved
+
+    def _retire(self, conn: Connection, spec: PartitionSpec, cutoff: datetime) -> List[str]:
+        expired = [
+            name
+            for name in partition_names(conn, spec)
+            if shift_period(spec.parse_partition(name), spec.interval, 1) <= cutoff  # type: ignore[arg-type]
+        ]
+        if not expired:
+            return []
+        postgres = conn.dialect.name == "postgresql"
+        if not postgres:
+            # The view references every partition; drop it before touching them.
+            conn.execute(text(f"DROP VIEW IF EXISTS {self._quote(conn, spec.view)}"))
+        for name in expired:
+            quoted = self._quote(conn, name)
+            if not spec.archive:
+                conn.execute(text(f"DROP TABLE {quoted}"))
+                continue
+            if postgres:
+                conn.execute(text(f"ALTER TABLE {self._quote(conn, spec.table)} DETACH PARTITION {quoted}"))
+            conn.execute(text(f"ALTER TABLE {quoted} RENAME TO {self._quote(conn, f'{name}_archived')}"))
+        if not postgres:
+            self._refresh_view(conn, spec)
+        if spec.key_table is not None:
+            conn.execute(
+                text(f"DELETE FROM {self._quote(conn, spec.key_table)} WHERE {self._quote(conn, spec.column)} < :cutoff"),
+                {"cutoff": cutoff.replace(tzinfo=timezone.utc) if postgres else _sqlite_bound(cutoff)},
+            )
+        return expired
+
+
+# Postgres conversion used by the partitioning migration ----------------------
+
+
+def convert_to_partitioned(
+    conn: Connection, table: Table, spec: PartitionSpec, periods: Sequence[datetime]
+) -> List[str]:
+    """Rebuild ``table`` as a range-partitioned table keeping its rows (Postgres only).
+
+    The primary key and unique constraints gain the partition column, as Postgres
+    requires; a column that must stay globally unique is covered by
+    ``spec.unique_key`` instead (see :func:`create_key_table`).
+
+    Foreign keys pointing *at* the table (e.g. ``orders.signal_event_id``) would
+    need a unique target without the partition column, and retention would
+    violate them anyway, so they are dropped and not recreated; the
+    ``"<table>.<constraint>"`` names dropped are returned. The downgrade restores
+    them from the model metadata.
+    """
+
+    prep = conn.dialect.identifier_preparer
+    name = prep.quote(table.name)
+    staging = prep.quote(f"{table.name}_partitioned")
+    column = prep.quote(spec.column)
+
+    conn.execute(text(f"CREATE TABLE {staging} (LIKE {name} INCLUDING DEFAULTS) PARTITION BY RANGE ({column})"))
+    key = [col.name for col in table.primary_key.columns]
+    if spec.column not in key:
+        key.append(spec.column)
+    conn.execute(
+        text(
+            f"ALTER TABLE {staging} ADD CONSTRAINT {prep.quote(f'{table.name}_part_pkey')} "
+            f"PRIMARY KEY ({', '.join(prep.quote(col) for col in key)})"
+        )
+    )
+    for columns in _unique_column_sets(table):
+        if spec.column not in columns:
+            columns = columns + [spec.column]
+        conn.execute(
+            text(
+                f"ALTER TABLE {staging} ADD CONSTRAINT {prep.quote(f'{table.name}_part_{columns[0]}_key')} "
+                f"UNIQUE ({', '.join(prep.quote(col) for col in columns)})"
+            )
+        )
+
+    for start in periods:
+        end = shift_period(start, spec.interval, 1)
+        conn.execute(
+            text(
+                f"CREATE TABLE {prep.quote(spec.partition_name(start))} PARTITION OF {staging} "
+                f"FOR VALUES FROM ('{start.isoformat(sep=' ')}+00') TO ('{end.isoformat(sep=' ')}+00')"
+            )
+        )
+    conn.execute(text(f"CREATE TABLE {prep.quote(f'{table.name}_default')} PARTITION OF {staging} DEFAULT"))
+
+    conn.execute(text(f"UPDATE {name} SET {column} = now() WHERE {column} IS NULL"))
+    conn.execute(text(f"INSERT INTO {staging} SELECT * FROM {name}"))
+    referencing = conn.execute(
+        text(
+            "SELECT conrelid::regclass::text, conname FROM pg_constraint "
+            "WHERE contype = 'f' AND confrelid = CAST(:table AS regclass) AND conrelid <> confrelid"
+        ),
+        {"table": name},
+    ).all()
+    for owner, constraint in referencing:
+        conn.execute(text(f"ALTER TABLE {owner} DROP CONSTRAINT {prep.quote(constraint)}"))
+    # No CASCADE: anything else still depending on the table should fail the migration.
+    conn.execute(text(f"DROP TABLE {name}"))
+    conn.execute(text(f"ALTER TABLE {staging} RENAME TO {name}"))
+    for index in table.indexes:
+        conn.execute(CreateIndex(index))
+    for constraint in table.foreign_key_constraints:
+        conn.execute(AddConstraint(constraint))
+    return [f"{owner}.{constraint}" for owner, constraint in referencing]
+
+
+def convert_to_plain(conn: Connection, table: Table, referencing: Iterable[ForeignKeyConstraint]) -> None:
+    """Inverse of :func:`convert_to_partitioned` (Postgres only)."""
+
+    prep = conn.dialect.identifier_preparer
+    name = prep.quote(table.name)
+    staging = prep.quote(f"{table.name}_partitioned")
+    conn.execute(text(f"ALTER TABLE {name} RENAME TO {staging}"))
+    for index in table.indexes:
+        conn.execute(text(f"DROP INDEX IF EXISTS {prep.quote(index.name)}"))
+    table.create(conn)
+    conn.execute(text(f"INSERT INTO {name} SELECT * FROM {staging}"))
+    conn.execute(text(f"DROP TABLE {staging} CASCADE"))
+    for constraint in referencing:
+        conn.execute(AddConstraint(constraint))
+
+
+def create_key_table(conn: Connection, spec: PartitionSpec) -> None:
+    """Create ``spec.key_table`` with an insert trigger on ``spec.table`` and fill it.
+
+    The key table has the key as its primary key, so inserting a row whose key
+    already exists in any partition fails with an integrity error. Existing keys
+    are copied in from ``<table>_all``.
+    """
+
+    if spec.unique_key is None or spec.key_table is None:
+        return
+    prep = conn.dialect.identifier_preparer
+    keys, table = prep.quote(spec.key_table), prep.quote(spec.table)
+    key, column = prep.quote(spec.unique_key), prep.quote(spec.column)
+    trigger = prep.quote(f"{spec.table}_{spec.unique_key}_key")
+    conn.execute(
+        text(
+            f"CREATE TABLE IF NOT EXISTS {keys} "
+            f"({key} VARCHAR(255) NOT NULL PRIMARY KEY, {column} TIMESTAMP WITH TIME ZONE)"
+        )
+    )
+    index = prep.quote(f"idx_{spec.key_table}_{spec.column}")
+    conn.execute(text(f"CREATE INDEX IF NOT EXISTS {index} ON {keys} ({column})"))
+    source = prep.quote(spec.view) if conn.dialect.name != "postgresql" else table
+    conn.execute(text(f"INSERT INTO {keys} ({key}, {column}) SELECT {key}, {column} FROM {source}"))
+    if conn.dialect.name == "postgresql":
+        function = prep.quote(f"{spec.table}_record_{spec.unique_key}")
+        conn.execute(
+            text(
+                f"CREATE OR REPLACE FUNCTION {function}() RETURNS trigger LANGUAGE plpgsql AS $$ "
+                f"BEGIN INSERT INTO {keys} ({key}, {column}) VALUES (NEW.{key}, NEW.{column}); RETURN NEW; END $$"
+            )
+        )
+        conn.execute(text(f"CREATE TRIGGER {trigger} AFTER INSERT ON {table} FOR EACH ROW EXECUTE FUNCTION {function}()"))
+        return
+    conn.execute(
+        text(
+            f"CREATE TRIGGER IF NOT EXISTS {trigger} AFTER INSERT ON {table} "
+            f"BEGIN INSERT INTO {keys} ({key}, {column}) VALUES (NEW.{key}, NEW.{column}); END"
+        )
+    )
+
+
+def drop_key_table(conn: Connection, spec: PartitionSpec) -> None:
+    """Inverse of :func:`create_key_table`."""
+
+    if spec.unique_key is None or spec.key_table is None:
+        return
+    prep = conn.dialect.identifier_preparer
+    trigger = prep.quote(f"{spec.table}_{spec.unique_key}_key")
+    if conn.dialect.name == "postgresql":
+        conn.execute(text(f"DROP TRIGGER IF EXISTS {trigger} ON {prep.quote(spec.table)}"))
+        conn.execute(text(f"DROP FUNCTION IF EXISTS {prep.quote(f'{spec.table}_record_{spec.unique_key}')}()"))
+    else:
+        conn.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+    conn.execute(text(f"DROP TABLE IF EXISTS {prep.quote(spec.key_table)}"))
+
+
+def partition_view(table: Table) -> TableClause:
+    """Selectable over ``<table>_all`` with ``table``'s columns and types, for reads spanning every period."""
+
+    return table_clause(f"{table.name}_all", *(column(col.name, col.type) for col in table.columns))
+
+
+def _retarget_table_ddl(ddl: str, table: str, target: str) -> str:
+    pattern = rf'^CREATE TABLE\s+(?:"{re.escape(table)}"|{re.escape(table)})\s*\('
+    return re.sub(pattern, lambda _: f"CREATE TABLE IF NOT EXISTS {target} (", ddl, count=1)
+
+
+def _retarget_index_ddl(ddl: str, index: str, target_index: str, table: str, target: str) -> str:
+    pattern = (
+        rf'^CREATE (UNIQUE )?INDEX\s+(?:"{re.escape(index)}"|{re.escape(index)})\s+'
+        rf'ON\s+(?:"{re.escape(table)}"|{re.escape(table)})\s*\('
+    )
+    return re.sub(
+        pattern,
+        lambda match: f"CREATE {match.group(1) or ''}INDEX IF NOT EXISTS {target_index} ON {target} (",
+        ddl,
+        count=1,
+    )
+
+
+def _unique_column_sets(table: Table) -> List[List[str]]:
+    sets = [
+        [col.name for col in constraint.columns]
+        for constraint in table.constraints
+        if isinstance(constraint, UniqueConstraint)
+    ]
+    sets.extend([col.name] for col in table.columns if col.unique)
+    unique: Dict[tuple[str, ...], List[str]] = {tuple(columns): columns for columns in sets}
+    return list(unique.values())
+
+
+def _sqlite_bound(value: datetime) -> str:
+    # Matches both CURRENT_TIMESTAMP and SQLAlchemy's microsecond storage format.
+    return value.strftime("%Y-%m-%d %H:%M:%S")
+
+
+__all__ = [
+    "INTERVALS",
+    "PARTITIONED_TABLES",
+    "PartitionManager",
+    "PartitionSpec",
+    "convert_to_partitioned",
+    "convert_to_plain",
+    "create_key_table",
+    "drop_key_table",
+    "partition_names",
+    "partition_view",
+    "period_start",
+    "shift_period",
+]
@@ -0,0 +1,107 @@
+"""Time partitioning for events, bias and audit_logs."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .models import Migration
+from .partitioning import (
+    PARTITIONED_TABLES,
+    PartitionManager,
+    PartitionSpec,
+    convert_to_partitioned,
+    convert_to_plain,
+    create_key_table,
+    drop_key_table,
+    partition_names,
+    period_start,
+    shift_period,
+)
+from .v0001_initial import _create_views, _drop_views, metadata
+
+
+def _periods_to_cover(conn: Connection, spec: PartitionSpec, now: datetime) -> List[datetime]:
+    prep = conn.dialect.identifier_preparer
+    oldest = conn.execute(
+        text(f"SELECT MIN({prep.quote(spec.column)}) FROM {prep.quote(spec.table)}")
+    ).scalar()
+    current = period_start(now, spec.interval)
+    start = period_start(oldest, spec.interval) if oldest is not None else current
+    periods = []
+    while start <= shift_period(current, spec.interval, spec.premake):
+        periods.append(start)
+        start = shift_period(start, spec.interval, 1)
+    return periods
+
+
+def _partition_postgres(conn: Connection) -> None:
+    now = datetime.now(timezone.utc)
+    for spec in PARTITIONED_TABLES:
+        periods = _periods_to_cover(conn, spec, now)
+        # Foreign keys into events/bias/audit_logs are dropped here; the downgrade restores them.
+        convert_to_partitioned(conn, metadata.tables[spec.table], spec, periods)
+
+
+def _create_key_tables(conn: Connection) -> None:
+    for spec in PARTITIONED_TABLES:
+        create_key_table(conn, spec)
+
+
+def _unpartition_postgres(conn: Connection) -> None:
+    for spec in PARTITIONED_TABLES:
+        drop_key_table(conn, spec)
+        conn.execute(text(f"DROP VIEW IF EXISTS {conn.dialect.identifier_preparer.quote(spec.view)}"))
+        table = metadata.tables[spec.table]
+        referencing = [
+            fk.constraint
+            for other in metadata.tables.values()
+            for fk in other.foreign_keys
+            if fk.column.table is table
+        ]
+        convert_to_plain(conn, table, referencing)
+
+
+def _fold_sqlite_partitions(conn: Connection) -> None:
+    prep = conn.dialect.identifier_preparer
+    for spec in PARTITIONED_TABLES:
+        drop_key_table(conn, spec)
+        conn.execute(text(f"DROP VIEW IF EXISTS {prep.quote(spec.view)}"))
+        for name in partition_names(conn, spec):
+            conn.execute(text(f"INSERT INTO {prep.quote(spec.table)} SELECT * FROM {prep.quote(name)}"))
+            conn.execute(text(f"DROP TABLE {prep.quote(name)}"))
+
+
+async def upgrade(engine: AsyncEngine) -> None:
+    if engine.dialect.name == "postgresql":
+        # Rebuilding bias drops the dependent view; recreate it afterwards.
+        await _drop_views(engine)
+        async with engine.begin() as conn:
+            await conn.run_sync(_partition_postgres)
+        await _create_views(engine)
+    await PartitionManager(engine).ensure_partitions()
+    async with engine.begin() as conn:
+        await conn.run_sync(_create_key_tables)
+
+
+async def downgrade(engine: AsyncEngine) -> None:
+    if engine.dialect.name == "postgresql":
+        await _drop_views(engine)
+        async with engine.begin() as conn:
+            await conn.run_sync(_unpartition_postgres)
+        await _create_views(engine)
+        return
+    async with engine.begin() as conn:
+        await conn.run_sync(_fold_sqlite_partitions)
+
+
+migration = Migration(
+    id="0002_time_partitions",
+    name="time_partitions",
+    upgrade=upgrade,
+    downgrade=downgrade,
+)
@@ -0,0 +1,28 @@
+"""Store wallet addresses lower-cased so lookups can use the unique index directly."""
+
+from __future__ import annotations
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .models import Migration
+
+
+async def upgrade(engine: AsyncEngine) -> None:
+    # Two rows differing only in case violate the unique index here; that is
+    # a duplicate wallet and has to be merged by hand before upgrading.
+    async with engine.begin() as conn:
+        await conn.execute(text("UPDATE wallets SET address = lower(address) WHERE address <> lower(address)"))
+
+
+async def downgrade(engine: AsyncEngine) -> None:
+    # The original checksum casing is not recoverable; lower-cased addresses stay valid.
+    return None
+
+
+migration = Migration(
+    id="0003_wallet_address_case",
+    name="wallet_address_case",
+    upgrade=upgrade,
+    downgrade=downgrade,
+)
@@ -8,7 +8,7 @@ from uuid import uuid4
 
 from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, Numeric, String, Text
 from sqlalchemy import Index, func, text
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 from sqlalchemy.types import JSON
 
 from .base import Base
@@ -54,6 +54,11 @@ class Wallet(Base):
     events: Mapped[List[Event]] = relationship("Event", back_populates="wallet")
     signal_positions: Mapped[List[Position]] = relationship("Position", back_populates="signal_wallet")
 
+    @validates("address")
+    def _normalise_address(self, _key: str, address: str) -> str:
+        # Stored lower-cased so case-insensitive lookups compare the indexed column as-is.
+        return address.lower()
+
 
 class WalletScore(Base):
     __tablename__ = "wallet_scores"
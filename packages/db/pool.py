@@ -0,0 +1,109 @@
+"""Connection pool instrumentation for the shared async engine."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Dict, Optional, Type
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import Pool
+
+if TYPE_CHECKING:  # services.api imports this package at startup
+    from services.api.monitoring.metrics import MetricsSink
+
+CHECKOUT_BUCKETS: tuple[float, ...] = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+
+
+class _TimedCheckoutMixin:
+    """Times ``Pool.connect`` (queue wait + connect) and counts pool timeouts.
+
+    Only the public ``connect`` entry point is wrapped; occupancy is published
+    from the pool's ``checkout``/``checkin`` events registered by ``attach``.
+    """
+
+    _instrumentation: "PoolInstrumentation"
+
+    def connect(self):  # type: ignore[override]
+        started = time.perf_counter()
+        try:
+            connection = super().connect()  # type: ignore[misc]
+        except PoolTimeoutError:
+            self._instrumentation.timeouts.inc()
+            raise
+        self._instrumentation.checkout_seconds.observe(time.perf_counter() - started)
+        return connection
+
+
+class PoolInstrumentation:
+    """Publishes pool wait time, occupancy and connection churn to a metrics registry.
+
+    ``pool_class(url)`` returns the dialect's default pool class with checkout
+    timing mixed in; pass it as ``poolclass=`` when creating the engine and call
+    ``attach(engine)`` afterwards to publish occupancy and count connection churn.
+    """
+
+    def __init__(self, registry: MetricsSink, *, prefix: str = "db_pool") -> None:
+        self.registry = registry
+        self.prefix = prefix
+        self.checkout_seconds = registry.histogram(f"{prefix}_checkout_seconds", CHECKOUT_BUCKETS)
+        self.timeouts = registry.counter(f"{prefix}_timeouts_total")
+        self.opened = registry.counter(f"{prefix}_connections_opened_total")
+        self.closed = registry.counter(f"{prefix}_connections_closed_total")
+        self.invalidated = registry.counter(f"{prefix}_connections_invalidated_total")
+        self._pool_classes: Dict[Type[Pool], Type[Pool]] = {}
+
+    def pool_class(self, url: str) -> Type[Pool]:
+        """Instrumented subclass of the pool SQLAlchemy would pick for ``url``."""
+
+        parsed = make_url(url)
+        base = parsed.get_dialect(_is_async=True).get_pool_class(parsed)
+        cls = self._pool_classes.get(base)
+        if cls is None:
+            cls = type(f"Instrumented{base.__name__}", (_TimedCheckoutMixin, base), {"_instrumentation": self})
+            self._pool_classes[base] = cls
+        return cls
+
+    def attach(self, engine: AsyncEngine) -> AsyncEngine:
+        """Register pool event listeners on ``engine``; returns the engine."""
+
+        pool = engine.sync_engine.pool
+        event.listen(pool, "checkout", lambda *_: self.publish(pool))
+        # ``checkin`` fires before the connection is back in the queue.
+        event.listen(pool, "checkin", lambda *_: self.publish(pool, returning=1))
+        event.listen(pool, "connect", lambda *_: self.opened.inc())
+        event.listen(pool, "close", lambda *_: self.closed.inc())
+        event.listen(pool, "invalidate", lambda *_: self.invalidated.inc())
+        self.publish(pool)
+        return engine
+
+    def publish(self, pool: Pool, *, returning: int = 0) -> None:
+        """Refresh occupancy gauges from a queue-style pool (no-op for others).
+
+        ``returning`` connections are being checked in and no longer count as in use.
+        """
+
+        checkedout = getattr(pool, "checkedout", None)
+        if checkedout is None:
+            return
+        self.registry.gauge(f"{self.prefix}_in_use", max(0, checkedout() - returning))
+        self.registry.gauge(f"{self.prefix}_size", pool.size())  # type: ignore[attr-defined]
+        self.registry.gauge(f"{self.prefix}_overflow", max(0, pool.overflow()))  # type: ignore[attr-defined]
+
+    def snapshot(self) -> Dict[str, Optional[float]]:
+        """Counters and checkout totals, handy for health endpoints and tests."""
+
+        histogram = self.checkout_seconds
+        return {
+            "checkouts": getattr(histogram, "count", None),
+            "checkout_seconds_sum": getattr(histogram, "sum", None),
+            "timeouts": getattr(self.timeouts, "value", None),
+            "opened": getattr(self.opened, "value", None),
+            "closed": getattr(self.closed, "value", None),
+            "invalidated": getattr(self.invalidated, "value", None),
+        }
+
+
+__all__ = ["CHECKOUT_BUCKETS", "PoolInstrumentation"]
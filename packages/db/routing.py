@@ -0,0 +1,65 @@
+"""Read-your-writes guard for routing reads between primary and replica."""
+
+from __future__ import annotations
+
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+DEFAULT_STALENESS_SECONDS = 5.0
+
+# Monotonic time of the last write issued from the current task/request.
+_last_write_at: ContextVar[Optional[float]] = ContextVar("db_last_write_at", default=None)
+_staleness_seconds = DEFAULT_STALENESS_SECONDS
+
+
+def configure_staleness(seconds: float) -> None:
+    """Set how long after a write the same context keeps reading from the primary."""
+
+    global _staleness_seconds
+    _staleness_seconds = max(0.0, seconds)
+
+
+def mark_write() -> None:
+    _last_write_at.set(time.monotonic())
+
+
+def clear_write_marker() -> None:
+    _last_write_at.set(None)
+
+
+def recently_wrote(staleness_seconds: Optional[float] = None) -> bool:
+    """True when this context wrote within the replica staleness window."""
+
+    written = _last_write_at.get()
+    if written is None:
+        return False
+    window = _staleness_seconds if staleness_seconds is None else staleness_seconds
+    return time.monotonic() - written < window
+
+
+def read_session_for(primary: AsyncSession, replica: Optional[AsyncSession]) -> AsyncSession:
+    """Pick the session a read-only query should use.
+
+    Falls back to ``primary`` when no replica is configured, when the primary
+    session holds unflushed changes, or when this context wrote recently and the
+    replica may not have caught up yet.
+    """
+
+    if replica is None or replica is primary:
+        return primary
+    if primary.new or primary.dirty or primary.deleted or recently_wrote():
+        return primary
+    return replica
+
+
+__all__ = [
+    "DEFAULT_STALENESS_SECONDS",
+    "clear_write_marker",
+    "configure_staleness",
+    "mark_write",
+    "read_session_for",
+    "recently_wrote",
+]
@@ -13,15 +13,28 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
+from .pool import PoolInstrumentation
+from .routing import configure_staleness
 from .settings import DatabaseSettings, get_database_settings
 
 
 _engine: Optional[AsyncEngine] = None
 _session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+_read_engine: Optional[AsyncEngine] = None
+_read_session_factory: Optional[async_sessionmaker[AsyncSession]] = None
 
 
-def init_engine(settings: Optional[DatabaseSettings] = None, *, force: bool = False) -> AsyncEngine:
-    """Initialise (or return existing) async SQLAlchemy engine."""
+def init_engine(
+    settings: Optional[DatabaseSettings] = None,
+    *,
+    force: bool = False,
+    instrumentation: Optional[PoolInstrumentation] = None,
+) -> AsyncEngine:
+    """Initialise (or return existing) async SQLAlchemy engine.
+
+    When ``instrumentation`` is given the engine uses its instrumented pool class
+    and publishes checkout latency and occupancy to the associated registry.
+    """
 
     global _engine
     if _engine is not None and not force:
@@ -30,7 +43,12 @@ def init_engine(settings: Optional[DatabaseSettings] = None, *, force: bool = Fa
     settings = settings or get_database_settings()
     # Debugging hook helpful during testing; consider structured logging later.
     # print(f"init_engine using URL: {settings.database_url}")
-    _engine = create_async_engine(settings.database_url, **settings.sqlalchemy_options)
+    options = settings.sqlalchemy_options
+    if instrumentation is not None:
+        options["poolclass"] = instrumentation.pool_class(settings.database_url)
+    _engine = create_async_engine(settings.database_url, **options)
+    if instrumentation is not None:
+        instrumentation.attach(_engine)
     return _engine
 
 
@@ -50,6 +68,46 @@ def init_sessionmaker(
     return _session_factory
 
 
+def init_read_engine(settings: Optional[DatabaseSettings] = None, *, force: bool = False) -> AsyncEngine:
+    """Initialise the read replica engine; falls back to the primary engine.
+
+    Also applies ``replica_staleness_seconds`` to the read-your-writes guard.
+    """
+
+    global _read_engine
+    if _read_engine is not None and not force:
+        return _read_engine
+
+    settings = settings or get_database_settings()
+    configure_staleness(settings.replica_staleness_seconds)
+    replica = settings.replica_settings()
+    if replica is None:
+        _read_engine = init_engine(settings)
+    else:
+        _read_engine = create_async_engine(replica.database_url, **replica.sqlalchemy_options)
+    return _read_engine
+
+
+def init_read_sessionmaker(
+    engine: Optional[AsyncEngine] = None,
+    *,
+    force: bool = False,
+) -> async_sessionmaker[AsyncSession]:
+    """Initialise session factory bound to the read engine."""
+
+    global _read_session_factory
+    if _read_session_factory is not None and not force:
+        return _read_session_factory
+
+    engine = engine or init_read_engine()
+    _read_session_factory = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
+    return _read_session_factory
+
+
+def has_read_replica() -> bool:
+    return _read_engine is not None and _read_engine is not _engine
+
+
 @asynccontextmanager
 async def get_session(
     session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
@@ -68,6 +126,21 @@ async def get_session(
         await session.close()
 
 
+@asynccontextmanager
+async def get_read_session(
+    session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
+) -> AsyncIterator[AsyncSession]:
+    """Yield a session for read-only queries; never commits."""
+
+    factory = session_factory or init_read_sessionmaker()
+    session = factory()
+    try:
+        yield session
+    finally:
+        await session.rollback()
+        await session.close()
+
+
 async def check_database_health(engine: Optional[AsyncEngine] = None) -> bool:
     """Execute a trivial query to confirm connectivity."""
 
@@ -81,8 +154,12 @@ async def check_database_health(engine: Optional[AsyncEngine] = None) -> bool:
 async def dispose_engine() -> None:
     """Dispose engine and reset cached factories (primarily for tests)."""
 
-    global _engine, _session_factory
+    global _engine, _session_factory, _read_engine, _read_session_factory
     _session_factory = None
+    _read_session_factory = None
+    if _read_engine is not None and _read_engine is not _engine:
+        await _read_engine.dispose()
+    _read_engine = None
     if _engine is not None:
         await _engine.dispose()
         _engine = None
@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import os
 from functools import lru_cache
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, Field, ValidationError, field_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -22,6 +22,28 @@ class DatabaseURLValidationError(ValueError):
     """Raised when the configured DATABASE_URL does not meet requirements."""
 
 
+class PoolProfile(BaseModel):
+    """Named pool sizing applied to server databases unless overridden by env."""
+
+    model_config = ConfigDict(frozen=True)
+
+    pool_size: int
+    max_overflow: int
+    pool_timeout: int
+    pool_recycle: int
+
+
+POOL_PROFILES: Dict[str, PoolProfile] = {
+    # Request handlers: fail fast instead of queueing behind a saturated pool.
+    "api": PoolProfile(pool_size=10, max_overflow=10, pool_timeout=5, pool_recycle=1800),
+    # Queue consumers: steady concurrency, tolerate short waits.
+    "worker": PoolProfile(pool_size=5, max_overflow=5, pool_timeout=30, pool_recycle=1800),
+    # Long-running bulk jobs: few long-lived connections, no overflow churn.
+    "backfill": PoolProfile(pool_size=2, max_overflow=0, pool_timeout=120, pool_recycle=3600),
+}
+POOL_FIELDS = ("pool_size", "max_overflow", "pool_timeout", "pool_recycle")
+
+
 class EngineTuning(BaseModel):
     echo: bool = Field(False, alias="DATABASE_ECHO")
     pool_size: int = Field(5, alias="DATABASE_POOL_SIZE")
@@ -65,10 +87,38 @@ class DatabaseSettings(BaseSettings):
     max_overflow: int = Field(5, alias="DATABASE_MAX_OVERFLOW")
     pool_timeout: int = Field(30, alias="DATABASE_POOL_TIMEOUT")
     pool_recycle: int = Field(1800, alias="DATABASE_POOL_RECYCLE")
+    pool_profile: Optional[str] = Field(
+        default=None,
+        alias="DATABASE_POOL_PROFILE",
+        description="Named pool sizing from POOL_PROFILES; explicit pool env vars still win.",
+    )
+    pool_instrumentation: bool = Field(False, alias="DATABASE_POOL_INSTRUMENTATION")
+    query_cache_size: int = Field(
+        500,
+        alias="DATABASE_QUERY_CACHE_SIZE",
+        description="SQLAlchemy compiled statement cache entries per engine.",
+    )
+    statement_cache_size: int = Field(
+        100,
+        alias="DATABASE_STATEMENT_CACHE_SIZE",
+        description="asyncpg prepared statement cache per connection; 0 disables (e.g. behind pgbouncer).",
+    )
+    read_replica_url: Optional[str] = Field(
+        default=None,
+        alias="DATABASE_READ_REPLICA_URL",
+        description="Optional async connection string for read-only queries.",
+    )
+    replica_staleness_seconds: float = Field(
+        5.0,
+        alias="DATABASE_REPLICA_STALENESS_SECONDS",
+        description="After a write, reads from the same context stay on the primary this long.",
+    )
 
-    @field_validator("database_url")
+    @field_validator("database_url", "read_replica_url")
     @classmethod
-    def _validate_url(cls, value: str) -> str:
+    def _validate_url(cls, value: Optional[str]) -> Optional[str]:
+        if value is None:
+            return value
         scheme = value.split(":", 1)[0]
         if scheme not in SUPPORTED_SCHEMES:
             raise DatabaseURLValidationError(
@@ -76,6 +126,39 @@ class DatabaseSettings(BaseSettings):
             )
         return value
 
+    @field_validator("pool_profile")
+    @classmethod
+    def _validate_profile(cls, value: Optional[str]) -> Optional[str]:
+        if value is not None and value not in POOL_PROFILES:
+            raise ValueError(f"Unknown pool profile '{value}'. Available: {', '.join(sorted(POOL_PROFILES))}.")
+        return value
+
+    def with_profile(self, profile: str) -> "DatabaseSettings":
+        """Copy of these settings using another named pool profile."""
+
+        if profile not in POOL_PROFILES:
+            raise ValueError(f"Unknown pool profile '{profile}'. Available: {', '.join(sorted(POOL_PROFILES))}.")
+        return self.model_copy(update={"pool_profile": profile})
+
+    def replica_settings(self) -> Optional["DatabaseSettings"]:
+        """Settings for the read replica engine, or ``None`` when not configured."""
+
+        if not self.read_replica_url:
+            return None
+        return self.model_copy(update={"database_url": self.read_replica_url, "read_replica_url": None})
+
+    def pool_options(self) -> Dict[str, int]:
+        """Effective pool sizing: explicit settings, then the profile, then defaults."""
+
+        profile = POOL_PROFILES.get(self.pool_profile) if self.pool_profile else None
+        options: Dict[str, int] = {}
+        for name in POOL_FIELDS:
+            if profile is not None and name not in self.model_fields_set:
+                options[name] = getattr(profile, name)
+            else:
+                options[name] = getattr(self, name)
+        return options
+
     @property
     def sqlalchemy_options(self) -> Dict[str, Any]:
         """Keyword arguments forwarded to SQLAlchemy engine factory."""
@@ -83,16 +166,18 @@ class DatabaseSettings(BaseSettings):
         base_options: Dict[str, Any] = {
             "echo": self.echo,
             "pool_pre_ping": True,
+            "query_cache_size": self.query_cache_size,
         }
         if self.database_url.startswith("sqlite+"):
             return base_options
-        return {
-            **base_options,
-            "pool_size": self.pool_size,
-            "max_overflow": self.max_overflow,
-            "pool_timeout": self.pool_timeout,
-            "pool_recycle": self.pool_recycle,
-        }
+        options = {**base_options, **self.pool_options()}
+        if self.database_url.startswith("postgresql+asyncpg"):
+            # SQLAlchemy's adapter keeps its own prepared statement LRU on top of asyncpg's.
+            options["connect_args"] = {
+                "prepared_statement_cache_size": self.statement_cache_size,
+                "statement_cache_size": self.statement_cache_size,
+            }
+        return options
 
 
 @lru_cache(maxsize=1)
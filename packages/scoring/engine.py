@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import datetime
 from statistics import mean, pstdev
-from typing import Dict, Iterable, List, Sequence
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence
+
+from packages.telemetry.tracing import traced
 
 from .models import ScoreComponents, TradeSnapshot, WalletStats
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from packages.archive import ArchiveReader
+
 DEFAULT_WEIGHTS: Dict[str, float] = {
     "historical_performance": 0.35,
     "trading_sophistication": 0.25,
@@ -30,6 +36,7 @@ class WalletScoringEngine:
     def __init__(self, weights: Dict[str, float] | None = None) -> None:
         self.weights = weights or DEFAULT_WEIGHTS
 
+    @traced("scoring.score_wallet")
     def score_wallet(self, stats: WalletStats) -> ScoringResult:
         components = ScoreComponents(
             historical_performance=_score_historical(stats.trades),
@@ -41,6 +48,22 @@ class WalletScoringEngine:
         credibility = components.weighted_sum(self.weights)
         return ScoringResult(wallet_id=stats.wallet_id, credibility=float(round(credibility, 2)), components=components)
 
+    def score_archive(
+        self,
+        reader: ArchiveReader,
+        *,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        assets: Optional[Iterable[str]] = None,
+    ) -> List[ScoringResult]:
+        """Score every wallet found in a columnar archive (offline re-scoring)."""
+
+        # Imported lazily: the archive package needs numpy, scoring itself does not.
+        from packages.archive import wallet_stats_from_archive
+
+        stats = wallet_stats_from_archive(reader, start=start, end=end, assets=assets)
+        return [self.score_wallet(entry) for entry in stats]
+
 
 class CredibilityUpdater:
     """Bayesian-style credibility updater using EWMA."""
@@ -1,12 +1,20 @@
-"""Trace context helper."""
+"""Trace context helper and lightweight in-process spans."""
 
 from __future__ import annotations
 
 import contextvars
+import functools
+import inspect
+import random
+import time
 import uuid
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Tuple, TypeVar, Union
 
 trace_id_var: contextvars.ContextVar[str] = contextvars.ContextVar("trace_id", default="")
 
+F = TypeVar("F", bound=Callable[..., Any])
+
 
 def generate_trace_id() -> str:
     trace = uuid.uuid4().hex
@@ -21,4 +29,221 @@ def get_trace_id() -> str:
     return value
 
 
-__all__ = ["generate_trace_id", "get_trace_id"]
+@dataclass(slots=True)
+class SpanRecord:
+    name: str
+    trace_id: str
+    span_id: int
+    parent_id: Optional[int]
+    start_ns: int  # time.monotonic_ns()
+    end_ns: int
+    error: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e9
+
+
+# (name, trace id, span id, parent id, start ns, end ns, error type); a SpanRecord once read.
+_Record = Tuple[str, str, int, Optional[int], int, int, Optional[str]]
+
+
+class SpanBuffer:
+    """Fixed-capacity ring of finished spans for this process.
+
+    Recording stores a tuple in a preallocated slot; once ``capacity``
+    spans are waiting, the oldest is overwritten and counted in ``dropped``.
+    Read with :meth:`snapshot` or hand off with :meth:`drain`.
+    """
+
+    def __init__(self, capacity: int = 8192) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.dropped = 0
+        self._slots: List[Optional[_Record]] = [None] * capacity
+        self._written = 0
+        self._start = 0
+
+    def __len__(self) -> int:
+        return self._written - self._start
+
+    def append(self, record: _Record) -> None:
+        if self._written - self._start >= self.capacity:
+            self._start += 1
+            self.dropped += 1
+        self._slots[self._written % self.capacity] = record
+        self._written += 1
+
+    def snapshot(self) -> List[SpanRecord]:
+        records = [self._slots[seq % self.capacity] for seq in range(self._start, self._written)]
+        return [SpanRecord(*record) for record in records if record is not None]
+
+    def drain(self) -> List[SpanRecord]:
+        spans = self.snapshot()
+        self._start = self._written
+        return spans
+
+
+class Span:
+    """A sampled span; records itself into the tracer's buffer on exit."""
+
+    __slots__ = ("name", "span_id", "parent_id", "trace_id", "start_ns", "_tracer", "_token", "_trace_token")
+
+    def __init__(self, tracer: Tracer, name: str, parent: Optional[Span]) -> None:
+        self._tracer = tracer
+        self.name = name
+        self.span_id = tracer._next_id()
+        self.parent_id = parent.span_id if parent is not None else None
+        self.trace_id = ""
+        self.start_ns = 0
+
+    def __enter__(self) -> Span:
+        self._trace_token = None
+        self.trace_id = trace_id_var.get()
+        if not self.trace_id:
+            self.trace_id = f"{random.getrandbits(128):032x}"  # uuid4().hex without the UUID object
+            self._trace_token = trace_id_var.set(self.trace_id)
+        self._token = _current.set(self)
+        self.start_ns = time.monotonic_ns()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        end_ns = time.monotonic_ns()
+        _current.reset(self._token)
+        if self._trace_token is not None:
+            trace_id_var.reset(self._trace_token)
+        error = exc_type.__name__ if exc_type is not None else None
+        self._tracer.buffer.append((self.name, self.trace_id, self.span_id, self.parent_id, self.start_ns, end_ns, error))
+
+
+class _Unsampled:
+    """Stands in for a span the sampler skipped, so its children are skipped too."""
+
+    __slots__ = ("_token",)
+
+    def __enter__(self) -> None:
+        self._token = _current.set(_UNSAMPLED)
+
+    def __exit__(self, *exc_info: Any) -> None:
+        _current.reset(self._token)
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+
+_NOOP = _NoopSpan()
+_UNSAMPLED = object()
+_current: contextvars.ContextVar[Any] = contextvars.ContextVar("current_span", default=None)
+
+
+class Tracer:
+    """Creates spans for a fraction ``sample_rate`` of traces (0 disables tracing).
+
+    The decision is made once per root span and inherited by every span
+    opened inside it, so a trace is either recorded whole or not at all.
+    With ``sample_rate=0`` a span or traced call only checks ``enabled``.
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_rate: float = 0.0,
+        capacity: int = 8192,
+        sampler: Callable[[], float] = random.random,
+    ) -> None:
+        self.buffer = SpanBuffer(capacity)
+        self.sampler = sampler
+        self.sample_rate = 0.0
+        self.enabled = False
+        self._ids = 0
+        self.configure(sample_rate=sample_rate)
+
+    def configure(self, *, sample_rate: Optional[float] = None, capacity: Optional[int] = None) -> Tracer:
+        if sample_rate is not None:
+            if not 0.0 <= sample_rate <= 1.0:
+                raise ValueError("sample_rate must be between 0 and 1")
+            self.sample_rate = sample_rate
+            self.enabled = sample_rate > 0.0
+        if capacity is not None and capacity != self.buffer.capacity:
+            self.buffer = SpanBuffer(capacity)
+        return self
+
+    def span(self, name: str) -> Union[Span, _Unsampled, _NoopSpan]:
+        if not self.enabled:
+            return _NOOP
+        parent = _current.get()
+        if parent is _UNSAMPLED:
+            return _NOOP
+        if parent is None and self.sample_rate < 1.0 and self.sampler() >= self.sample_rate:
+            return _Unsampled()
+        return Span(self, name, parent)
+
+    def traced(self, name: Optional[str] = None) -> Callable[[F], F]:
+        """Decorator running each call of a function or coroutine function inside :meth:`span`."""
+
+        def decorate(fn: F) -> F:
+            label = name or fn.__qualname__
+            if inspect.iscoroutinefunction(fn):
+
+                @functools.wraps(fn)
+                async def traced_coroutine(*args: Any, **kwargs: Any) -> Any:
+                    if not self.enabled:
+                        return await fn(*args, **kwargs)
+                    with self.span(label):
+                        return await fn(*args, **kwargs)
+
+                return traced_coroutine  # type: ignore[return-value]
+
+            @functools.wraps(fn)
+            def traced_function(*args: Any, **kwargs: Any) -> Any:
+                if not self.enabled:
+                    return fn(*args, **kwargs)
+                with self.span(label):
+                    return fn(*args, **kwargs)
+
+            return traced_function  # type: ignore[return-value]
+
+        return decorate
+
+    def _next_id(self) -> int:
+        self._ids += 1
+        return self._ids
+
+
+# Process-wide tracer used by the instrumented hot paths; off until configured.
+tracer = Tracer()
+
+
+def configure_tracing(*, sample_rate: Optional[float] = None, capacity: Optional[int] = None) -> Tracer:
+    return tracer.configure(sample_rate=sample_rate, capacity=capacity)
+
+
+def span(name: str) -> Union[Span, _Unsampled, _NoopSpan]:
+    return tracer.span(name)
+
+
+def traced(name: Optional[str] = None) -> Callable[[F], F]:
+    return tracer.traced(name)
+
+
+__all__ = [
+    "generate_trace_id",
+    "get_trace_id",
+    "trace_id_var",
+    "Span",
+    "SpanBuffer",
+    "SpanRecord",
+    "Tracer",
+    "tracer",
+    "configure_tracing",
+    "span",
+    "traced",
+]
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, Iterable
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Optional
 
 from packages.scoring.engine import WalletScoringEngine
 from packages.scoring.models import WalletStats
+from packages.telemetry.tracing import traced
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from packages.archive import ArchiveReader
 
 
 @dataclass(slots=True)
@@ -21,9 +26,16 @@ class BiasResult:
 
 
 class BiasCalculator:
-    def __init__(self, scoring_engine: WalletScoringEngine | None = None) -> None:
+    def __init__(
+        self,
+        scoring_engine: WalletScoringEngine | None = None,
+        *,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
         self.scoring_engine = scoring_engine or WalletScoringEngine()
+        self.clock = clock
 
+    @traced("bias.calculate")
     def calculate(self, asset: str, timeframe: str, wallets: Iterable[WalletStats]) -> BiasResult:
         scores = [self.scoring_engine.score_wallet(stats) for stats in wallets]
         if not scores:
@@ -33,7 +45,7 @@ class BiasCalculator:
                 value=0.0,
                 confidence=0.0,
                 components={},
-                timestamp=datetime.now(timezone.utc),
+                timestamp=datetime.fromtimestamp(self.clock(), tz=timezone.utc),
             )
 
         weights = [max(0.1, result.credibility / 10) for result in scores]
@@ -48,8 +60,24 @@ class BiasCalculator:
             value=float(round(weighted_bias, 3)),
             confidence=float(round(confidence, 2)),
             components=components,
-            timestamp=datetime.now(timezone.utc),
+            timestamp=datetime.fromtimestamp(self.clock(), tz=timezone.utc),
         )
 
+    def calculate_from_archive(
+        self,
+        asset: str,
+        timeframe: str,
+        reader: ArchiveReader,
+        *,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> BiasResult:
+        """Bias for ``asset`` from wallets active in the archived window."""
+
+        from packages.archive import wallet_stats_from_archive
+
+        wallets = wallet_stats_from_archive(reader, start=start, end=end, assets=[asset])
+        return self.calculate(asset, timeframe, wallets)
+
 
 __all__ = ["BiasCalculator", "BiasResult"]
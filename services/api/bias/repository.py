@@ -3,20 +3,61 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Dict, List, Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence
 
-from sqlalchemy import insert, select
+from sqlalchemy import Select, bindparam, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from packages.db.migrations import partition_view
 from packages.db.models import BiasSnapshot
+from packages.db.routing import mark_write, read_session_for
 from services.api.bias.calculator import BiasResult
 
+# Reads go through ``bias_all`` so series whose last snapshot was rotated into a closed period still show up.
+_bias = partition_view(BiasSnapshot.__table__)
+_BIAS_COLUMNS = (
+    _bias.c.asset,
+    _bias.c.timeframe,
+    _bias.c.value,
+    _bias.c.confidence,
+    _bias.c.timestamp,
+)
+
+
+def _latest_statement(include_components: bool, filtered: bool) -> Select[Any]:
+    """Newest row per (asset, timeframe), picked in SQL with ``row_number()``."""
+
+    columns = _BIAS_COLUMNS + (_bias.c.components,) if include_components else _BIAS_COLUMNS
+    recency = (
+        func.row_number()
+        .over(partition_by=(_bias.c.asset, _bias.c.timeframe), order_by=_bias.c.timestamp.desc())
+        .label("recency")
+    )
+    ranked = select(*columns, recency)
+    if filtered:
+        ranked = ranked.where(_bias.c.asset.in_(bindparam("assets", expanding=True)))
+    newest = ranked.subquery("newest")
+    outer = [newest.c[column.name] for column in columns]
+    return select(*outer).where(newest.c.recency == 1).order_by(newest.c.asset, newest.c.timeframe)
+
+
+# (include_components, filtered by assets) -> prebuilt select; assets bind as an expanding IN.
+_LATEST = {
+    (include_components, filtered): _latest_statement(include_components, filtered)
+    for include_components in (False, True)
+    for filtered in (False, True)
+}
+
 
 class BiasRepository:
-    """Persist and retrieve bias snapshots."""
+    """Persist and retrieve bias snapshots.
 
-    def __init__(self, session: Optional[AsyncSession] = None) -> None:
+    ``read_session`` optionally points :meth:`latest` at a read replica.
+    """
+
+    def __init__(self, session: Optional[AsyncSession] = None, *, read_session: Optional[AsyncSession] = None) -> None:
         self.session = session
+        self.read_session = read_session
         self._memory: List[BiasResult] = [] if session is None else []
 
     async def store(self, result: BiasResult) -> None:
@@ -33,17 +74,29 @@ class BiasRepository:
             confidence=result.confidence,
         )
         await self.session.execute(stmt)
+        mark_write()
+
+    async def latest(
+        self,
+        assets: Optional[Sequence[str]] = None,
+        *,
+        include_components: bool = True,
+    ) -> List[BiasResult]:
+        """Latest result per (asset, timeframe).
+
+        Reads projected columns rather than hydrating ``BiasSnapshot`` entities;
+        pass ``include_components=False`` to skip the JSON ``components`` column.
+        """
 
-    async def latest(self, assets: Optional[Sequence[str]] = None) -> List[BiasResult]:
         if self.session is None:
             return list(_dedupe_results(self._memory, assets))
 
-        stmt = select(BiasSnapshot).order_by(BiasSnapshot.asset, BiasSnapshot.timeframe, BiasSnapshot.timestamp.desc())
+        reader = read_session_for(self.session, self.read_session)
         if assets:
-            stmt = stmt.where(BiasSnapshot.asset.in_(list(assets)))
-        result = await self.session.execute(stmt)
-        snapshots = result.scalars().all()
-        return list(_dedupe_results([_from_snapshot(s) for s in snapshots], assets))
+            result = await reader.execute(_LATEST[include_components, True], {"assets": list(assets)})
+        else:
+            result = await reader.execute(_LATEST[include_components, False])
+        return [_from_row(row) for row in result]
 
 
 def _dedupe_results(results: Sequence[BiasResult], assets: Optional[Sequence[str]]):
@@ -57,14 +110,15 @@ def _dedupe_results(results: Sequence[BiasResult], assets: Optional[Sequence[str
     return filtered.values()
 
 
-def _from_snapshot(snapshot: BiasSnapshot) -> BiasResult:
+def _from_row(row: Sequence[Any]) -> BiasResult:
+    components = row[5] if len(row) > 5 else None
     return BiasResult(
-        asset=snapshot.asset,
-        timeframe=snapshot.timeframe,
-        value=float(snapshot.value or 0.0),
-        confidence=float(snapshot.confidence or 0.0),
-        components=dict(snapshot.components or {}),
-        timestamp=snapshot.timestamp or datetime.utcnow(),
+        asset=row[0],
+        timeframe=row[1],
+        value=float(row[2] or 0.0),
+        confidence=float(row[3] or 0.0),
+        components=dict(components or {}),
+        timestamp=row[4] or datetime.utcnow(),
     )
 
 
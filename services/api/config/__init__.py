@@ -1,8 +1,9 @@
 """Configuration helpers for the API service."""
 
-from .database import database_healthcheck, get_session_factory
+from .database import database_healthcheck, get_read_session_factory, get_session_factory
 
 __all__ = [
     "database_healthcheck",
     "get_session_factory",
+    "get_read_session_factory",
 ]
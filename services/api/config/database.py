@@ -5,21 +5,33 @@ from __future__ import annotations
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from packages.db import (
+    PoolInstrumentation,
     check_database_health,
     get_database_settings,
     init_engine,
+    init_read_engine,
+    init_read_sessionmaker,
     init_sessionmaker,
 )
+from services.api.monitoring.metrics import registry
 
 _settings = get_database_settings()
-_engine = init_engine(_settings)
+_instrumentation = PoolInstrumentation(registry) if _settings.pool_instrumentation else None
+_engine = init_engine(_settings, instrumentation=_instrumentation)
 _session_factory = init_sessionmaker(_engine)
+_read_session_factory = init_read_sessionmaker(init_read_engine(_settings))
 
 
 def get_session_factory() -> async_sessionmaker[AsyncSession]:
     return _session_factory
 
 
+def get_read_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Sessions for dashboards/reports; the primary when no replica is configured."""
+
+    return _read_session_factory
+
+
 async def database_healthcheck() -> dict:
     healthy = await check_database_health(_engine)
     return {"healthy": healthy}
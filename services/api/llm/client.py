@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from packages.cache import TTLCache
+from services.api.monitoring.metrics import Counter, HDRHistogram, MetricsRegistry
 
 
 GROQ_MODEL_TIERS: Dict[str, Dict[str, Any]] = {
@@ -30,23 +32,47 @@ class LLMResponse:
 
 
 class GroqClient:
-    def __init__(self, cache: Optional[TTLCache] = None, *, daily_budget: float = 10.0) -> None:
+    def __init__(
+        self,
+        cache: Optional[TTLCache] = None,
+        *,
+        daily_budget: float = 10.0,
+        metrics: Optional[MetricsRegistry] = None,
+    ) -> None:
         self.cache = cache or TTLCache(default_ttl=3600)
         self.daily_budget = daily_budget
         self.spend = 0.0
+        # Model calls (cache hits excluded) feed llm_requests_total{model,purpose} and llm_latency_seconds{model}.
+        self.metrics = metrics
+        self._handles: Dict[str, Tuple[Counter, HDRHistogram]] = {}
 
     async def generate(self, request: LLMRequest) -> LLMResponse:
         cached = self.cache.get(request.prompt)
         if cached:
             return cached
+        started = time.perf_counter()
         tier = GROQ_MODEL_TIERS.get(request.tier, GROQ_MODEL_TIERS["standard"])
         mock_text = f"[mocked-{tier['model']}] {request.prompt[:50]}"
         response = LLMResponse(text=mock_text, tokens_used=tier["max_tokens"], model=tier["model"])
         self.cache.set(request.prompt, response)
+        if self.metrics is not None:
+            requests, latency = self._metric_handles(request.tier, tier["model"])
+            requests.inc()
+            latency.observe(time.perf_counter() - started)
         return response
 
     async def batch_generate(self, requests: Iterable[LLMRequest]) -> List[LLMResponse]:
         return [await self.generate(req) for req in requests]
 
+    def _metric_handles(self, purpose: str, model: str) -> Tuple[Counter, HDRHistogram]:
+        handles = self._handles.get(purpose)
+        if handles is None:
+            assert self.metrics is not None
+            handles = self._handles[purpose] = (
+                self.metrics.counter_family("llm_requests_total", ("model", "purpose")).labels(model, purpose),
+                self.metrics.hdr_histogram_family("llm_latency_seconds", ("model",)).labels(model),
+            )
+        return handles
+
 
 __all__ = ["GroqClient", "LLMRequest", "LLMResponse"]
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 
 from packages.cache import TTLCache
+from packages.telemetry.tracing import traced
 
 
 @dataclass(slots=True)
@@ -18,6 +19,17 @@ class EventContext:
     event_type: str
 
 
+@dataclass(slots=True)
+class TriggerThresholds:
+    """Cut-offs applied before an event is worth an LLM call."""
+
+    min_size_frac: float = 0.10
+    min_wallet_credibility: float = 3.0
+    min_notional_usd: float = 50_000
+    critical_size_frac: float = 0.30
+    min_expected_value: float = 0.05
+
+
 PATTERN_LIBRARY: Dict[str, Dict[str, object]] = {
     "whale_cex_deposit": {
         "conditions": {
@@ -32,26 +44,36 @@ PATTERN_LIBRARY: Dict[str, Dict[str, object]] = {
 
 
 class RateLimiter:
-    def __init__(self, limit_per_minute: int = 20) -> None:
+    def __init__(self, limit_per_minute: int = 20, *, clock: Callable[[], float] = time.time) -> None:
         self.limit_per_minute = limit_per_minute
+        self.clock = clock
         self.calls: list[float] = []
 
     def record(self) -> None:
-        now = time.time()
+        now = self.clock()
         self.calls.append(now)
         self.calls = [ts for ts in self.calls if now - ts < 60]
 
     def exceeds(self) -> bool:
-        now = time.time()
+        now = self.clock()
         self.calls = [ts for ts in self.calls if now - ts < 60]
         return len(self.calls) >= self.limit_per_minute
 
 
 class LLMTrigger:
-    def __init__(self, cache: Optional[TTLCache] = None, rate_limiter: Optional[RateLimiter] = None) -> None:
-        self.cache = cache or TTLCache()
-        self.rate_limiter = rate_limiter or RateLimiter()
-
+    def __init__(
+        self,
+        cache: Optional[TTLCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        *,
+        thresholds: Optional[TriggerThresholds] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.cache = cache or TTLCache(clock=clock)
+        self.rate_limiter = rate_limiter or RateLimiter(clock=clock)
+        self.thresholds = thresholds or TriggerThresholds()
+
+    @traced("llm.should_trigger")
     def should_trigger(self, event: EventContext) -> bool:
         if not self._passes_basic_filters(event):
             return False
@@ -62,18 +84,23 @@ class LLMTrigger:
         if pattern_hit is False:
             self.cache.set(event.tx_hash, False, ttl=300)
             return False
-        critical = event.size_frac > 0.30
+        critical = event.size_frac > self.thresholds.critical_size_frac
         if self.rate_limiter.exceeds() and not critical:
             return False
         expected_value = self._expected_value(event)
-        decision = expected_value > 0.05
+        decision = expected_value > self.thresholds.min_expected_value
         self.cache.set(event.tx_hash, decision, ttl=300)
         if decision:
             self.rate_limiter.record()
         return decision
 
     def _passes_basic_filters(self, event: EventContext) -> bool:
-        return event.size_frac >= 0.10 and event.wallet_credibility >= 3.0 and event.notional_usd >= 50_000
+        limits = self.thresholds
+        return (
+            event.size_frac >= limits.min_size_frac
+            and event.wallet_credibility >= limits.min_wallet_credibility
+            and event.notional_usd >= limits.min_notional_usd
+        )
 
     def _matches_pattern(self, event: EventContext) -> Optional[bool]:
         pattern = PATTERN_LIBRARY.get("whale_cex_deposit")
@@ -95,4 +122,4 @@ class LLMTrigger:
         return base
 
 
-__all__ = ["LLMTrigger", "EventContext", "RateLimiter"]
+__all__ = ["LLMTrigger", "EventContext", "RateLimiter", "TriggerThresholds"]
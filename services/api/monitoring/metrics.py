@@ -2,25 +2,439 @@
 
 from __future__ import annotations
 
-from typing import Dict
+import math
+import time
+from bisect import bisect_left
+from itertools import accumulate
+from math import frexp
+from types import MappingProxyType
+from typing import Callable, Dict, Generic, Iterator, List, Mapping, Optional, Protocol, Sequence, Tuple, TypeVar
+
+DEFAULT_BUCKETS: tuple[float, ...] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DEFAULT_QUANTILES: tuple[float, ...] = (0.5, 0.9, 0.95, 0.99, 0.999)
+
+_Sample = Tuple[str, float]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _key(name: str, labels: str, extra: str = "") -> str:
+    inner = ",".join(part for part in (labels, extra) if part)
+    return f"{name}{{{inner}}}" if inner else name
+
+
+class Counter:
+    """Monotonic counter."""
+
+    __slots__ = ("name", "labels", "key", "value")
+
+    def __init__(self, name: str, labels: str = "") -> None:
+        self.name = name
+        self.labels = labels
+        self.key = _key(name, labels)
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def samples(self) -> Iterator[_Sample]:
+        yield self.key, self.value
+
+
+class Gauge:
+    """Settable value; the labeled counterpart of :meth:`MetricsRegistry.gauge`."""
+
+    __slots__ = ("name", "labels", "key", "value")
+
+    def __init__(self, name: str, labels: str = "") -> None:
+        self.name = name
+        self.labels = labels
+        self.key = _key(name, labels)
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def samples(self) -> Iterator[_Sample]:
+        yield self.key, self.value
+
+
+class Histogram:
+    """Fixed-bucket histogram; bucket ``i`` counts observations ``<= bounds[i]``."""
+
+    __slots__ = ("name", "labels", "bounds", "counts", "sum", "count", "_keys")
+
+    def __init__(self, name: str, buckets: Sequence[float] = DEFAULT_BUCKETS, labels: str = "") -> None:
+        self.name = name
+        self.labels = labels
+        self.bounds = tuple(sorted(buckets))
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+        # Sample names are rendered once, so exporting only copies numbers.
+        self._keys = tuple(_key(f"{name}_bucket", labels, f'le="{bound}"') for bound in self.bounds) + (
+            _key(f"{name}_bucket", labels, 'le="+Inf"'),
+            _key(f"{name}_sum", labels),
+            _key(f"{name}_count", labels),
+        )
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Estimate the ``q`` quantile by interpolating inside its bucket, as ``histogram_quantile`` does."""
+
+        if not self.count:
+            return math.nan
+        rank = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and cumulative + bucket_count >= rank:
+                if index == len(self.bounds):
+                    return self.bounds[-1] if self.bounds else math.nan
+                lower = self.bounds[index - 1] if index else 0.0
+                return lower + (self.bounds[index] - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+        return self.bounds[-1]
+
+    def samples(self) -> Iterator[_Sample]:
+        keys = self._keys
+        cumulative = 0
+        for index in range(len(self.bounds)):
+            cumulative += self.counts[index]
+            yield keys[index], cumulative
+        yield keys[-3], self.count
+        yield keys[-2], self.sum
+        yield keys[-1], self.count
+
+    def export(self) -> Dict[str, float]:
+        return dict(self.samples())
+
+
+class HDRHistogram:
+    """Log-linear histogram with bounded relative error over a wide dynamic range.
+
+    Each power of two between ``lowest`` and ``highest`` is split into
+    ``2 ** ceil(log2(10 ** significant_figures))`` linear sub-buckets, so a
+    recorded value is off by at most about ``10 ** -significant_figures``
+    relative to the truth. Recording is ``frexp`` plus one list increment.
+    Values outside the range are clamped into the first or last bucket.
+    Exported as a Prometheus summary at ``quantiles``.
+    """
+
+    __slots__ = (
+        "name",
+        "labels",
+        "lowest",
+        "highest",
+        "counts",
+        "sum",
+        "count",
+        "min",
+        "max",
+        "quantiles",
+        "_sub_buckets",
+        "_min_exponent",
+        "_scale",
+        "_offset",
+        "_last",
+        "_keys",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        lowest: float = 1e-6,
+        highest: float = 3600.0,
+        significant_figures: int = 2,
+        quantiles: Sequence[float] = DEFAULT_QUANTILES,
+        labels: str = "",
+    ) -> None:
+        if not 0 < lowest < highest:
+            raise ValueError("need 0 < lowest < highest")
+        self.name = name
+        self.labels = labels
+        self.lowest = lowest
+        self.highest = highest
+        self.quantiles = tuple(sorted(quantiles))
+        self._sub_buckets = 1 << math.ceil(math.log2(10**significant_figures))
+        self._min_exponent = math.frexp(lowest)[1]
+        self._scale = 2 * self._sub_buckets
+        self._offset = (self._min_exponent + 1) * self._sub_buckets
+        exponents = math.frexp(highest)[1] - self._min_exponent + 1
+        self.counts: List[int] = [0] * (exponents * self._sub_buckets)
+        self._last = len(self.counts) - 1
+        self.sum = 0.0
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._keys = tuple(_key(name, labels, f'quantile="{q}"') for q in self.quantiles) + (
+            _key(f"{name}_sum", labels),
+            _key(f"{name}_count", labels),
+        )
+
+    def observe(self, value: float) -> None:
+        if value > self.lowest:
+            mantissa, exponent = frexp(value)
+            # (exponent - min_exponent) * sub_buckets + int((mantissa - 0.5) * 2 * sub_buckets), folded.
+            index = int(mantissa * self._scale) + exponent * self._sub_buckets - self._offset
+            if index > self._last:
+                index = self._last
+        else:
+            index = 0
+        self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+        if value > self.max:
+            self.max = value
+        if value < self.min:
+            self.min = value
+
+    def quantile(self, q: float) -> float:
+        """Upper edge of the bucket holding the ``q`` quantile, clamped to the observed range."""
+
+        return self.quantiles_at((q,))[0]
+
+    def quantiles_at(self, qs: Sequence[float]) -> List[float]:
+        """Several quantiles from one cumulative pass over the buckets."""
+
+        if not self.count:
+            return [math.nan] * len(qs)
+        cumulative = list(accumulate(self.counts))
+        results: List[float] = []
+        for q in qs:
+            index = bisect_left(cumulative, max(1, math.ceil(q * self.count)))
+            if index >= self._last:  # the last bucket holds everything clamped above ``highest``
+                results.append(self.max)
+                continue
+            exponent, sub_bucket = divmod(index, self._sub_buckets)
+            upper = math.ldexp(0.5 + (sub_bucket + 1) / self._scale, exponent + self._min_exponent)
+            results.append(min(max(upper, self.min), self.max))
+        return results
+
+    def samples(self) -> Iterator[_Sample]:
+        yield from zip(self._keys, self.quantiles_at(self.quantiles))
+        yield self._keys[-2], self.sum
+        yield self._keys[-1], self.count
+
+    def export(self) -> Dict[str, float]:
+        return dict(self.samples())
+
+
+M = TypeVar("M", Counter, Gauge, Histogram, HDRHistogram)
+
+
+class MetricFamily(Generic[M]):
+    """One metric name with a fixed label set; :meth:`labels` returns a child to record into.
+
+    Resolve children once and keep them (``latency = family.labels("GET", "/v1/bias")``);
+    recording into a child touches no dicts and allocates nothing.
+    """
+
+    def __init__(self, name: str, kind: str, labelnames: Sequence[str], factory: Callable[[str], M]) -> None:
+        self.name = name
+        self.kind = kind
+        self.labelnames = tuple(labelnames)
+        self.children: Dict[Tuple[str, ...], M] = {}
+        self._factory = factory
+
+    def labels(self, *values: str, **kwargs: str) -> M:
+        if kwargs:
+            values = tuple(kwargs[name] for name in self.labelnames)
+        child = self.children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values!r}")
+            rendered = ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(self.labelnames, values))
+            child = self.children[tuple(values)] = self._factory(rendered)
+        return child
+
+    def samples(self) -> Iterator[_Sample]:
+        for child in list(self.children.values()):
+            yield from child.samples()
+
+
+class CounterLike(Protocol):
+    def inc(self, amount: float = 1.0) -> None: ...
+
+
+class HistogramLike(Protocol):
+    def observe(self, value: float) -> None: ...
+
+
+class MetricsSink(Protocol):
+    """Subset of :class:`MetricsRegistry` that instrumented components publish to."""
+
+    def gauge(self, name: str, value: float) -> None: ...
+
+    def counter(self, name: str) -> CounterLike: ...
+
+    def histogram(self, name: str, buckets: Sequence[float] = ...) -> HistogramLike: ...
 
 
 class MetricsRegistry:
     def __init__(self) -> None:
         self.metrics: Dict[str, float] = {}
+        self.counters: Dict[str, Counter] = {}
+        self.histograms: Dict[str, Histogram] = {}
+        self.hdr_histograms: Dict[str, HDRHistogram] = {}
+        self.families: Dict[str, MetricFamily] = {}
+        self._kinds: Dict[str, str] = {}
+        self._snapshot: Optional[Mapping[str, float]] = None
+        self._snapshot_at = 0.0
 
     def gauge(self, name: str, value: float) -> None:
+        if name not in self.metrics:
+            self._claim(name, "gauge")
         self.metrics[name] = value
+        self._snapshot = None
+
+    def counter(self, name: str) -> Counter:
+        """Return the counter registered under ``name``, creating it on first use."""
+
+        counter = self.counters.get(name)
+        if counter is None:
+            self._claim(name, "counter")
+            counter = self.counters[name] = Counter(name)
+        return counter
+
+    def histogram(self, name: str, buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        """Return the histogram registered under ``name``, creating it on first use."""
+
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            self._claim(name, "histogram")
+            histogram = self.histograms[name] = Histogram(name, buckets)
+        return histogram
+
+    def hdr_histogram(self, name: str, **options: float) -> HDRHistogram:
+        """Return the :class:`HDRHistogram` registered under ``name``, creating it on first use."""
+
+        histogram = self.hdr_histograms.get(name)
+        if histogram is None:
+            self._claim(name, "summary")
+            histogram = self.hdr_histograms[name] = HDRHistogram(name, **options)  # type: ignore[arg-type]
+        return histogram
+
+    def counter_family(self, name: str, labelnames: Sequence[str]) -> MetricFamily[Counter]:
+        return self._family(name, "counter", labelnames, lambda labels: Counter(name, labels))
+
+    def gauge_family(self, name: str, labelnames: Sequence[str]) -> MetricFamily[Gauge]:
+        return self._family(name, "gauge", labelnames, lambda labels: Gauge(name, labels))
+
+    def histogram_family(
+        self, name: str, labelnames: Sequence[str], buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> MetricFamily[Histogram]:
+        return self._family(name, "histogram", labelnames, lambda labels: Histogram(name, buckets, labels))
+
+    def hdr_histogram_family(self, name: str, labelnames: Sequence[str], **options: float) -> MetricFamily[HDRHistogram]:
+        return self._family(
+            name, "summary", labelnames, lambda labels: HDRHistogram(name, labels=labels, **options)  # type: ignore[arg-type]
+        )
 
     def export(self) -> Dict[str, float]:
-        return dict(self.metrics)
+        data = dict(self.metrics)
+        for _, samples in self._collect():
+            data.update(samples)
+        return data
+
+    def snapshot(self, *, max_age: float = 1.0) -> Mapping[str, float]:
+        """Read-only :meth:`export`, reused for up to ``max_age`` seconds.
+
+        Setting a gauge or registering a metric invalidates it; counter and
+        histogram observations show up once the snapshot ages out.
+        """
+
+        now = time.monotonic()
+        if self._snapshot is None or now - self._snapshot_at > max_age:
+            self._snapshot = MappingProxyType(self.export())
+            self._snapshot_at = now
+        return self._snapshot
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+
+        lines: List[str] = []
+        gauges: Dict[str, List[str]] = {}
+        for key, value in list(self.metrics.items()):
+            gauges.setdefault(key.partition("{")[0], []).append(f"{key} {_format(value)}")
+        for name, samples in gauges.items():
+            lines.append(f"# TYPE {name} gauge")
+            lines.extend(samples)
+        for (name, kind), samples in self._collect():
+            rendered = [f"{key} {_format(value)}" for key, value in samples]
+            if rendered:
+                lines.append(f"# TYPE {name} {kind}")
+                lines.extend(rendered)
+        return "\n".join(lines) + "\n"
+
+    def _collect(self) -> Iterator[Tuple[Tuple[str, str], Iterator[_Sample]]]:
+        for counter in list(self.counters.values()):
+            yield (counter.name, "counter"), counter.samples()
+        for histogram in list(self.histograms.values()):
+            yield (histogram.name, "histogram"), histogram.samples()
+        for hdr in list(self.hdr_histograms.values()):
+            yield (hdr.name, "summary"), hdr.samples()
+        for family in list(self.families.values()):
+            yield (family.name, family.kind), family.samples()
+
+    def _family(self, name: str, kind: str, labelnames: Sequence[str], factory: Callable[[str], M]) -> MetricFamily[M]:
+        family = self.families.get(name)
+        if family is None:
+            self._claim(name, kind)
+            family = self.families[name] = MetricFamily(name, kind, labelnames, factory)
+        elif family.kind != kind or family.labelnames != tuple(labelnames):
+            raise ValueError(f"metric {name!r} is already registered as {family.kind}{family.labelnames}")
+        return family
+
+    def _claim(self, name: str, kind: str) -> None:
+        existing = self._kinds.setdefault(name, kind)
+        if existing != kind:
+            raise ValueError(f"metric {name!r} is already registered as a {existing}")
+        self._snapshot = None
+
+
+def _format(value: float) -> str:
+    if value != value:
+        return "NaN"
+    if value in (math.inf, -math.inf):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
 
 
 registry = MetricsRegistry()
 
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
 
-async def get_metrics() -> Dict[str, float]:
-    return registry.export()
+async def get_metrics(*, max_age: float = 1.0) -> Mapping[str, float]:
+    return registry.snapshot(max_age=max_age)
 
 
-__all__ = ["registry", "get_metrics"]
+__all__ = [
+    "registry",
+    "get_metrics",
+    "MetricsRegistry",
+    "MetricsSink",
+    "MetricFamily",
+    "CounterLike",
+    "HistogramLike",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "HDRHistogram",
+    "DEFAULT_BUCKETS",
+    "DEFAULT_QUANTILES",
+    "PROMETHEUS_CONTENT_TYPE",
+]
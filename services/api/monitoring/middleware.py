@@ -0,0 +1,52 @@
+"""ASGI middleware recording API request latency into the metrics registry."""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Awaitable, Callable, MutableMapping
+
+from services.api.monitoring.metrics import HDRHistogram, MetricFamily, MetricsRegistry, registry
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+API_LATENCY = "api_latency_seconds"
+UNMATCHED_ENDPOINT = "unmatched"
+
+
+class LatencyMiddleware:
+    """Observe ``api_latency_seconds{endpoint,method}`` for every HTTP request.
+
+    ``endpoint`` is the matched route template (``/v1/bias/{asset}``) rather
+    than the raw path, so the label set stays bounded; requests that match no
+    route share one ``unmatched`` series. Failed requests are timed as well.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        metrics: MetricsRegistry = registry,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.app = app
+        self.clock = clock
+        self._latency: MetricFamily[HDRHistogram] = metrics.hdr_histogram_family(API_LATENCY, ("endpoint", "method"))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start = self.clock()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            # The router stores the matched route in the shared scope while dispatching.
+            endpoint = getattr(scope.get("route"), "path", None) or UNMATCHED_ENDPOINT
+            self._latency.labels(endpoint, scope.get("method", "")).observe(self.clock() - start)
+
+
+__all__ = ["API_LATENCY", "LatencyMiddleware", "UNMATCHED_ENDPOINT"]
@@ -2,7 +2,9 @@
 
 from .base import BaseRepository
 from .events import EventRepository, OrderRepository
+from .rows import EventRow, WalletRow
 from .users import UserRepository
+from .wallet_index import WalletAddressIndex
 from .wallets import WalletRepository
 
 __all__ = [
@@ -11,4 +13,7 @@ __all__ = [
     "WalletRepository",
     "EventRepository",
     "OrderRepository",
+    "EventRow",
+    "WalletRow",
+    "WalletAddressIndex",
 ]
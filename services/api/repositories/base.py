@@ -2,26 +2,47 @@
 
 from __future__ import annotations
 
-from typing import Any, Generic, Iterable, Optional, Sequence, TypeVar
+from typing import Any, Callable, ClassVar, Dict, Generic, Iterable, List, Optional, Sequence, Tuple, TypeVar
 
-from sqlalchemy import Select, delete, select, update
+from sqlalchemy import Select, bindparam, delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import InstrumentedAttribute
 
+from packages.db.routing import mark_write, read_session_for
+
 T = TypeVar("T")
+R = TypeVar("R")
 
 
 class BaseRepository(Generic[T]):
-    """Generic repository providing CRUD helpers for a mapped model."""
+    """Generic repository providing CRUD helpers for a mapped model.
+
+    With ``read_session`` (a replica session) set, read-only helpers such as
+    :meth:`list`, :meth:`exists` and projected row queries go through
+    :attr:`reader`, which stays on the primary after recent writes.
+    :meth:`get` always uses the primary because callers mutate what it returns.
+    """
 
     model: type[T]
+    # Parameterised lookups shared by every repository, keyed by model and filter names.
+    _lookup_statements: ClassVar[Dict[Tuple[type, Tuple[str, ...], bool], Select[Any]]] = {}
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(self, session: AsyncSession, *, read_session: Optional[AsyncSession] = None) -> None:
         self.session = session
+        self.read_session = read_session
+
+    @property
+    def reader(self) -> AsyncSession:
+        """Session for read-only queries (replica unless read-your-writes applies)."""
+
+        return read_session_for(self.session, self.read_session)
 
     async def get(self, **filters: Any) -> Optional[T]:
-        stmt = select(self.model).filter_by(**filters)
-        result = await self.session.execute(stmt)
+        stmt = self._lookup_statement(filters)
+        if stmt is None:
+            result = await self.session.execute(select(self.model).filter_by(**filters))
+        else:
+            result = await self.session.execute(stmt, filters)
         return result.scalar_one_or_none()
 
     async def list(self, *, limit: Optional[int] = None, offset: int = 0, filters: Optional[dict[str, Any]] = None) -> Sequence[T]:
@@ -32,13 +53,14 @@ class BaseRepository(Generic[T]):
             stmt = stmt.limit(limit)
         if offset:
             stmt = stmt.offset(offset)
-        result = await self.session.execute(stmt)
+        result = await self.reader.execute(stmt)
         return result.scalars().all()
 
     async def create(self, **data: Any) -> T:
         instance = self.model(**data)  # type: ignore[call-arg]
         self.session.add(instance)
         await self.session.flush()
+        mark_write()
         return instance
 
     async def update(self, filters: dict[str, Any], values: dict[str, Any]) -> int:
@@ -49,17 +71,58 @@ class BaseRepository(Generic[T]):
             .execution_options(synchronize_session="fetch")
         )
         result = await self.session.execute(stmt)
+        mark_write()
         return result.rowcount or 0
 
     async def delete(self, **filters: Any) -> int:
         stmt = delete(self.model).filter_by(**filters)
         result = await self.session.execute(stmt)
+        mark_write()
         return result.rowcount or 0
 
     async def exists(self, **filters: Any) -> bool:
-        stmt = select(self.model).filter_by(**filters).limit(1)
-        result = await self.session.execute(stmt)
+        stmt = self._lookup_statement(filters, first_only=True)
+        reader = self.reader
+        if stmt is None:
+            result = await reader.execute(select(self.model).filter_by(**filters).limit(1))
+        else:
+            result = await reader.execute(stmt, filters)
         return result.scalar_one_or_none() is not None
 
     async def refresh(self, instance: T, attrs: Optional[Iterable[InstrumentedAttribute[Any]]] = None) -> None:
         await self.session.refresh(instance, attribute_names=list(attrs) if attrs else None)
+
+    def _lookup_statement(self, filters: dict[str, Any], *, first_only: bool = False) -> Optional[Select[Any]]:
+        """Prebuilt ``select(model)`` with one bind parameter per filter name.
+
+        Reusing the same construct skips rebuilding it and lets SQLAlchemy reuse
+        its memoised cache key and compiled form. ``None`` filter values need
+        ``IS NULL`` rather than ``= :param``, so those return ``None`` and the
+        caller falls back to ``filter_by``.
+        """
+
+        if not filters or any(value is None for value in filters.values()):
+            return None
+        key = (self.model, tuple(sorted(filters)), first_only)
+        stmt = self._lookup_statements.get(key)
+        if stmt is None:
+            stmt = select(self.model).where(*(getattr(self.model, name) == bindparam(name) for name in key[1]))
+            if first_only:
+                stmt = stmt.limit(1)
+            self._lookup_statements[key] = stmt
+        return stmt
+
+    async def _fetch_rows(
+        self,
+        stmt: Select[Any],
+        factory: Callable[..., R],
+        params: Optional[dict[str, Any]] = None,
+    ) -> List[R]:
+        """Execute a column-projected Core select and build rows positionally.
+
+        Skips ORM identity-map bookkeeping entirely; ``factory`` receives the
+        selected columns in order.
+        """
+
+        result = await self.reader.execute(stmt, params)
+        return [factory(*row) for row in result]
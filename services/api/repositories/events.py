@@ -3,38 +3,110 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from typing import Iterable, Optional
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Tuple
 
-from sqlalchemy import desc, select
+from sqlalchemy import bindparam, desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from packages.db.migrations import partition_view
 from packages.db.models import Event, Order, Wallet
+from packages.db.routing import mark_write
 
 from .base import BaseRepository
+from .rows import EventRow
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from services.order_manager.idempotency import IdempotencyIndex
+
+_events = Event.__table__
+_events_all = partition_view(_events)
+_orders = Order.__table__
+_EVENT_ROW_COLUMNS = (
+    _events.c.id,
+    _events.c.timestamp,
+    _events.c.wallet_id,
+    _events.c.tx_hash,
+    _events.c.event_type,
+    _events.c.asset,
+    _events.c.amount,
+    _events.c.notional_usd,
+    _events.c.size_fraction,
+    _events.c.venue,
+    _events.c.is_first_since_watch,
+)
+
+# Built once at import; executed with {"wallet_id": ..., "since": ...}.
+_RECENT_FOR_WALLET = (
+    select(Event)
+    .where(Event.wallet_id == bindparam("wallet_id"), Event.timestamp >= bindparam("since"))
+    .order_by(desc(Event.timestamp))
+)
+_RECENT_ROWS_FOR_WALLET = {
+    include_raw: (
+        select(*(_EVENT_ROW_COLUMNS + (_events.c.raw_data,) if include_raw else _EVENT_ROW_COLUMNS))
+        .where(_events.c.wallet_id == bindparam("wallet_id"), _events.c.timestamp >= bindparam("since"))
+        .order_by(desc(_events.c.timestamp))
+    )
+    for include_raw in (False, True)
+}
+# Rows rotated out of the base table into closed period partitions are only visible here.
+_STORED_BY_TX_HASH = select(*_events_all.c).where(_events_all.c.tx_hash == bindparam("tx_hash")).limit(1)
 
 
 class EventRepository(BaseRepository[Event]):
     model = Event
 
-    def __init__(self, session: AsyncSession) -> None:
-        super().__init__(session)
+    def __init__(self, session: AsyncSession, *, read_session: Optional[AsyncSession] = None) -> None:
+        super().__init__(session, read_session=read_session)
 
     async def recent_for_wallet(self, wallet_id: str, *, since_minutes: int = 60) -> Iterable[Event]:
         window = datetime.utcnow() - timedelta(minutes=since_minutes)
-        stmt = (
-            select(Event)
-            .where(Event.wallet_id == wallet_id, Event.timestamp >= window)
-            .order_by(desc(Event.timestamp))
-        )
-        result = await self.session.execute(stmt)
+        result = await self.reader.execute(_RECENT_FOR_WALLET, {"wallet_id": wallet_id, "since": window})
         return result.scalars().all()
 
+    async def recent_for_wallet_rows(
+        self,
+        wallet_id: str,
+        *,
+        since_minutes: int = 60,
+        include_raw: bool = False,
+    ) -> List[EventRow]:
+        """Column-projected variant of :meth:`recent_for_wallet` returning :class:`EventRow`."""
+
+        window = datetime.utcnow() - timedelta(minutes=since_minutes)
+        return await self._fetch_rows(
+            _RECENT_ROWS_FOR_WALLET[include_raw],
+            EventRow,
+            {"wallet_id": wallet_id, "since": window},
+        )
+
+    async def find_by_tx_hash(self, tx_hash: str) -> Optional[Event]:
+        """Event with ``tx_hash`` in any partition.
+
+        Events still in the base table come back attached to the session; ones
+        already rotated into a closed period are returned detached and read-only.
+        """
+
+        event = await self.get(tx_hash=tx_hash)
+        if event is not None:
+            return event
+        row = (await self.session.execute(_STORED_BY_TX_HASH, {"tx_hash": tx_hash})).first()
+        return Event(**row._mapping) if row is not None else None
+
     async def upsert(self, *, tx_hash: str, defaults: dict) -> Event:
-        existing = await self.get(tx_hash=tx_hash)
-        if existing:
+        """Update the event with ``tx_hash`` or create it.
+
+        Events in closed periods are not rewritten; the stored event is returned as is.
+        """
+
+        existing = await self.find_by_tx_hash(tx_hash)
+        if existing is not None and existing in self.session:
             for key, value in defaults.items():
                 setattr(existing, key, value)
             await self.session.flush()
+            mark_write()
+            return existing
+        if existing is not None:
             return existing
         return await self.create(tx_hash=tx_hash, **defaults)
 
@@ -42,8 +114,31 @@ class EventRepository(BaseRepository[Event]):
 class OrderRepository(BaseRepository[Order]):
     model = Order
 
-    def __init__(self, session: AsyncSession) -> None:
-        super().__init__(session)
+    def __init__(
+        self,
+        session: AsyncSession,
+        *,
+        order_index: Optional[IdempotencyIndex] = None,
+        read_session: Optional[AsyncSession] = None,
+    ) -> None:
+        super().__init__(session, read_session=read_session)
+        self.order_index = order_index
+
+    async def create(self, **data: Any) -> Order:
+        order = await super().create(**data)
+        if self.order_index is not None:
+            # created_at is a server default and not loaded here; refresh() tracks the watermark.
+            self.order_index.remember(order.client_order_id)
+        return order
+
+    async def client_order_ids_since(self, since: Optional[datetime]) -> List[Tuple[str, datetime]]:
+        """``(client_order_id, created_at)`` for orders created at or after ``since``."""
+
+        stmt = select(_orders.c.client_order_id, _orders.c.created_at).order_by(_orders.c.created_at)
+        if since is not None:
+            stmt = stmt.where(_orders.c.created_at >= since)
+        result = await self.reader.execute(stmt)
+        return [(row[0], row[1]) for row in result]
 
     async def for_wallet(self, wallet: Wallet) -> Iterable[Order]:
         stmt = (
@@ -51,7 +146,7 @@ class OrderRepository(BaseRepository[Order]):
             .join(Event, Order.signal_event_id == Event.id)
             .where(Event.wallet_id == wallet.id)
         )
-        result = await self.session.execute(stmt)
+        result = await self.reader.execute(stmt)
         return result.scalars().all()
 
 
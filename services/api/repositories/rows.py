@@ -0,0 +1,42 @@
+"""Lightweight row types returned by column-projected repository queries."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional
+
+
+@dataclass(slots=True)
+class EventRow:
+    """Event columns needed by hot read paths; ``raw_data`` only when requested."""
+
+    id: str
+    timestamp: datetime
+    wallet_id: Optional[str]
+    tx_hash: str
+    event_type: str
+    asset: Optional[str]
+    amount: Optional[float]
+    notional_usd: Optional[float]
+    size_fraction: Optional[float]
+    venue: Optional[str]
+    is_first_since_watch: bool
+    raw_data: Optional[Dict[str, object]] = None
+
+
+@dataclass(slots=True)
+class WalletRow:
+    """Wallet columns without the JSON ``metadata`` blob; ``tags`` only when requested."""
+
+    id: str
+    address: str
+    label: Optional[str]
+    chain: str
+    first_seen_at: Optional[datetime]
+    last_activity: Optional[datetime]
+    is_active: bool
+    tags: Optional[List[str]] = None
+
+
+__all__ = ["EventRow", "WalletRow"]
@@ -14,8 +14,8 @@ from .base import BaseRepository
 class UserRepository(BaseRepository[User]):
     model = User
 
-    def __init__(self, session: AsyncSession) -> None:
-        super().__init__(session)
+    def __init__(self, session: AsyncSession, *, read_session: Optional[AsyncSession] = None) -> None:
+        super().__init__(session, read_session=read_session)
 
     async def get_by_email(self, email: str) -> Optional[User]:
         return await self.get(email=email)
@@ -0,0 +1,105 @@
+"""Process-local wallet address to id index for the event persistence path."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Dict, Iterable, Optional
+
+from .rows import WalletRow
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .wallets import WalletRepository
+
+# server_default timestamps (CURRENT_TIMESTAMP) only have second resolution.
+REFRESH_OVERLAP = timedelta(seconds=1)
+
+
+class WalletAddressIndex:
+    """Maps lower-cased wallet addresses to ``wallets.id`` for active wallets.
+
+    Preload once from :meth:`WalletRepository.list_active_rows`, keep it current
+    with :meth:`refresh` (incremental on ``first_seen_at``/``last_activity``) and
+    let repositories constructed with ``address_index=`` evict entries they write.
+    """
+
+    def __init__(self) -> None:
+        self._ids: Dict[str, str] = {}
+        self._addresses: Dict[str, str] = {}
+        self._watermark: Optional[datetime] = None
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, address: str) -> bool:
+        return address.lower() in self._ids
+
+    @property
+    def watermark(self) -> Optional[datetime]:
+        return self._watermark
+
+    def lookup(self, address: str) -> Optional[str]:
+        return self._ids.get(address.lower())
+
+    async def preload(self, repo: WalletRepository) -> int:
+        """Replace the index contents with every active wallet."""
+
+        rows = await repo.list_active_rows()
+        self.clear()
+        for row in rows:
+            self._remember(row)
+        return len(rows)
+
+    async def refresh(self, repo: WalletRepository) -> int:
+        """Apply wallets created or active since the last load; returns rows applied."""
+
+        if self._watermark is None:
+            return await self.preload(repo)
+        rows = await repo.rows_changed_since(self._watermark - REFRESH_OVERLAP)
+        for row in rows:
+            if row.is_active:
+                self._remember(row)
+            else:
+                self.invalidate(row.id)
+        return len(rows)
+
+    async def resolve(self, repo: WalletRepository, addresses: Iterable[str]) -> Dict[str, str]:
+        """Resolve many addresses with dict hits and at most one query for the misses."""
+
+        resolved: Dict[str, str] = {}
+        missing: set[str] = set()
+        for address in addresses:
+            key = address.lower()
+            wallet_id = self._ids.get(key)
+            if wallet_id is None:
+                missing.add(key)
+            else:
+                resolved[key] = wallet_id
+        if missing:
+            for row in await repo.active_rows_for_addresses(missing):
+                self._remember(row)
+                resolved[row.address.lower()] = row.id
+        return resolved
+
+    def invalidate(self, wallet_id: str) -> None:
+        address = self._addresses.pop(wallet_id, None)
+        if address is not None:
+            self._ids.pop(address, None)
+
+    def clear(self) -> None:
+        self._ids.clear()
+        self._addresses.clear()
+        self._watermark = None
+
+    def _remember(self, row: WalletRow) -> None:
+        address = row.address.lower()
+        previous = self._addresses.get(row.id)
+        if previous is not None and previous != address:
+            self._ids.pop(previous, None)
+        self._ids[address] = row.id
+        self._addresses[row.id] = address
+        for seen in (row.first_seen_at, row.last_activity):
+            if seen is not None and (self._watermark is None or seen > self._watermark):
+                self._watermark = seen
+
+
+__all__ = ["WalletAddressIndex"]
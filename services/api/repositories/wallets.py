@@ -2,26 +2,79 @@
 
 from __future__ import annotations
 
-from typing import Iterable, Optional
+from datetime import datetime
+from typing import Iterable, List, Optional
 
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from packages.db.models import Wallet
+from packages.db.routing import mark_write
 
 from .base import BaseRepository
+from .rows import WalletRow
+from .wallet_index import WalletAddressIndex
+
+_wallets = Wallet.__table__
+_WALLET_ROW_COLUMNS = (
+    _wallets.c.id,
+    _wallets.c.address,
+    _wallets.c.label,
+    _wallets.c.chain,
+    _wallets.c.first_seen_at,
+    _wallets.c.last_activity,
+    _wallets.c.is_active,
+)
 
 
 class WalletRepository(BaseRepository[Wallet]):
     model = Wallet
 
-    def __init__(self, session: AsyncSession) -> None:
-        super().__init__(session)
+    def __init__(
+        self,
+        session: AsyncSession,
+        *,
+        address_index: Optional[WalletAddressIndex] = None,
+        read_session: Optional[AsyncSession] = None,
+    ) -> None:
+        super().__init__(session, read_session=read_session)
+        self.address_index = address_index
 
     async def list_active(self) -> Iterable[Wallet]:
         return await self.list(filters={"is_active": True})
 
+    async def list_active_rows(self, *, include_tags: bool = False) -> List[WalletRow]:
+        """Column-projected variant of :meth:`list_active` returning :class:`WalletRow`."""
+
+        columns = _WALLET_ROW_COLUMNS + (_wallets.c.tags,) if include_tags else _WALLET_ROW_COLUMNS
+        stmt = select(*columns).where(_wallets.c.is_active == True)  # noqa: E712
+        return await self._fetch_rows(stmt, WalletRow)
+
+    async def rows_changed_since(self, since: datetime) -> List[WalletRow]:
+        """Wallets first seen or active at/after ``since`` (active or not)."""
+
+        stmt = select(*_WALLET_ROW_COLUMNS).where(
+            or_(_wallets.c.first_seen_at >= since, _wallets.c.last_activity >= since)
+        )
+        return await self._fetch_rows(stmt, WalletRow)
+
+    async def active_rows_for_addresses(self, addresses: Iterable[str]) -> List[WalletRow]:
+        """Batched address lookup used for address-index misses.
+
+        Matches case-insensitively: :class:`Wallet` stores addresses lower-cased,
+        so lowering the inputs lets the comparison use the unique address index.
+        """
+
+        stmt = select(*_WALLET_ROW_COLUMNS).where(
+            _wallets.c.address.in_([address.lower() for address in addresses]),
+            _wallets.c.is_active == True,  # noqa: E712
+        )
+        return await self._fetch_rows(stmt, WalletRow)
+
     async def set_active(self, wallet_id: str, active: bool) -> int:
-        return await self.update({"id": wallet_id}, {"is_active": active})
+        updated = await self.update({"id": wallet_id}, {"is_active": active})
+        self._invalidate(wallet_id)
+        return updated
 
     async def add_tags(self, wallet_id: str, tags: list[str]) -> Optional[Wallet]:
         wallet = await self.get(id=wallet_id)
@@ -30,7 +83,13 @@ class WalletRepository(BaseRepository[Wallet]):
         current = set(wallet.tags or [])
         wallet.tags = sorted(current.union(tags))
         await self.session.flush()
+        mark_write()
+        self._invalidate(wallet_id)
         return wallet
 
+    def _invalidate(self, wallet_id: str) -> None:
+        if self.address_index is not None:
+            self.address_index.invalidate(wallet_id)
+
 
 __all__ = ["WalletRepository"]
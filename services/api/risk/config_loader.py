@@ -1,4 +1,4 @@
-"""Load risk configuration from YAML-like input."""
+"""Parse risk configuration from YAML-like input."""
 
 from __future__ import annotations
 
@@ -9,7 +9,9 @@ from typing import Any, Dict
 DEFAULT_RISK_CONFIG_PATH = Path("config/risk-limits.yaml")
 
 
-def _parse_raw(content: str) -> Dict[str, Any]:
+def parse_risk_config(content: str) -> Dict[str, Any]:
+    """Parse JSON, or the flat ``key: {a: 1}`` YAML subset the limits file uses."""
+
     try:
         return json.loads(content)
     except json.JSONDecodeError as json_err:
@@ -53,13 +55,19 @@ def _parse_simple_mapping(content: str) -> Dict[str, Any]:
     return result
 
 
+_parse_raw = parse_risk_config  # former private name, kept for existing imports
+
+
 def load_risk_config(path: Path | None = None) -> Dict[str, Any]:
-    target = path or DEFAULT_RISK_CONFIG_PATH
-    content = target.read_text(encoding="utf-8")
-    data = _parse_raw(content)
-    if not isinstance(data, dict):
-        raise ValueError("Risk configuration must be a mapping")
-    return data
+    """Current risk config for ``path`` as a plain dict, parsed once per file change.
+
+    Served by the shared :class:`~services.api.risk.provider.RiskConfigProvider`;
+    an invalid file raises ``ValueError``.
+    """
+
+    from .provider import load_risk_config as load  # provider imports this module
+
+    return load(path)
 
 
-__all__ = ["load_risk_config"]
+__all__ = ["DEFAULT_RISK_CONFIG_PATH", "load_risk_config", "parse_risk_config"]
@@ -0,0 +1,347 @@
+"""Rolling correlation model and correlation-aware exposure limits."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .monitor import PositionSnapshot, signed_exposure
+from .policy import PolicyLimits, PortfolioState, ProposedTrade
+
+_QUOTES = ("USDT", "USDC", "USD")
+
+
+def base_asset(symbol: str) -> str:
+    """``BTC-USDT-SWAP``, ``BTCUSDT`` and ``btc`` all map to ``BTC``."""
+
+    head = symbol.upper().split("-", 1)[0]
+    for quote in _QUOTES:
+        if head.endswith(quote) and len(head) > len(quote):
+            return head[: -len(quote)]
+    return head
+
+
+@dataclass(slots=True, frozen=True)
+class GroupLimit:
+    """Cap on the absolute net exposure of a set of assets (``btc_eth_combined``)."""
+
+    name: str
+    assets: FrozenSet[str]  # empty means every asset (``total_crypto``)
+    limit: float
+
+
+def group_limits(config: Mapping[str, Any]) -> Tuple[GroupLimit, ...]:
+    """``<a>_<b>_combined`` and ``total_crypto`` entries of ``correlation_limits``."""
+
+    limits = []
+    for name, value in config.get("correlation_limits", {}).items():
+        if name.endswith("_combined"):
+            assets = frozenset(part.upper() for part in name[: -len("_combined")].split("_") if part)
+            limits.append(GroupLimit(name, assets, float(value)))
+        elif name == "total_crypto":
+            limits.append(GroupLimit(name, frozenset(), float(value)))
+    return tuple(limits)
+
+
+class RollingCovariance:
+    """Covariance of per-asset returns over the last ``window`` observations.
+
+    Returns live in a ring buffer (one row per observation, one column per
+    asset); the running sum and cross-product matrix are updated with the new
+    row and the evicted one, so an update is O(k^2) for k assets regardless of
+    the window. The sums are rebuilt from the buffer once per window to stop
+    floating-point drift.
+    """
+
+    def __init__(self, assets: Sequence[str] = (), *, window: int = 240) -> None:
+        self.window = window
+        self.assets: List[str] = []
+        self.index: Dict[str, int] = {}
+        self._returns = np.zeros((window, 0))
+        self._sum = np.zeros(0)
+        self._cross = np.zeros((0, 0))
+        self._head = 0
+        self.count = 0
+        self._since_rebuild = 0
+        self._cov: Optional[np.ndarray] = None
+        self._corr: Optional[np.ndarray] = None
+        for asset in assets:
+            self.add_asset(asset)
+
+    def add_asset(self, asset: str) -> int:
+        """Column for ``asset``; new assets start with zero returns in the window."""
+
+        position = self.index.get(asset)
+        if position is not None:
+            return position
+        position = self.index[asset] = len(self.assets)
+        self.assets.append(asset)
+        self._returns = np.hstack([self._returns, np.zeros((self.window, 1))])
+        self._rebuild()
+        return position
+
+    def update(self, returns: Mapping[str, float]) -> None:
+        """Append one observation; assets missing from ``returns`` get 0.0."""
+
+        for asset in returns:
+            if asset not in self.index:
+                self.add_asset(asset)
+        row = np.zeros(len(self.assets))
+        for asset, value in returns.items():
+            row[self.index[asset]] = value
+        evicted = self._returns[self._head].copy()
+        self._returns[self._head] = row
+        self._head = (self._head + 1) % self.window
+        if self.count == self.window:
+            self._sum += row - evicted
+            self._cross += np.outer(row, row) - np.outer(evicted, evicted)
+        else:
+            self.count += 1
+            self._sum += row
+            self._cross += np.outer(row, row)
+        self._since_rebuild += 1
+        if self._since_rebuild >= self.window:
+            self._rebuild()
+        self._cov = self._corr = None
+
+    def covariance(self) -> np.ndarray:
+        if self._cov is None:
+            n = self.count
+            if n < 2:
+                self._cov = np.zeros_like(self._cross)
+            else:
+                self._cov = (self._cross - np.outer(self._sum, self._sum) / n) / (n - 1)
+        return self._cov
+
+    def correlation(self) -> np.ndarray:
+        if self._corr is None:
+            cov = self.covariance()
+            std = np.sqrt(np.clip(np.diag(cov), 0.0, None))
+            denom = np.outer(std, std)
+            corr = np.divide(cov, denom, out=np.zeros_like(cov), where=denom > 0)
+            np.clip(corr, -1.0, 1.0, out=corr)
+            np.fill_diagonal(corr, 1.0)
+            self._corr = corr
+        return self._corr
+
+    def _rebuild(self) -> None:
+        rows = self._returns if self.count == self.window else self._returns[: self.count]
+        # Before the buffer wraps, rows [0, count) are exactly the observations.
+        self._sum = rows.sum(axis=0)
+        self._cross = rows.T @ rows
+        self._since_rebuild = 0
+        self._cov = self._corr = None
+
+
+class CorrelationRiskEngine:
+    """Correlation-aware exposure checks run before every order.
+
+    Tracks signed exposure per base asset (long positive) alongside a
+    :class:`RollingCovariance` of returns. The book follows open positions:
+    replace it with :meth:`set_exposures` (see :func:`position_exposures`) or
+    let an :class:`~services.api.risk.monitor.IncrementalRiskMonitor` apply
+    opens and closes through :meth:`add_exposure`. Orders still in flight are
+    held with :meth:`reserve` until :meth:`release`. Until ``min_periods``
+    observations exist, every pair is treated as perfectly correlated, which
+    reduces to the old same-direction sum. :meth:`check` is read-only and
+    enforces, after adding the trade to the book and the reservations:
+
+    * each ``correlation_limits.<a>_<b>_combined`` / ``total_crypto`` cap,
+    * correlated exposure (existing exposure weighted by its correlation with
+      the traded asset, plus the trade) against ``portfolio.max_correlation_risk``,
+    * portfolio volatility against ``correlation_limits.max_portfolio_volatility``
+      when configured.
+    """
+
+    def __init__(
+        self,
+        config: Mapping[str, Any],
+        *,
+        window: int = 240,
+        min_periods: int = 30,
+    ) -> None:
+        self.min_periods = min_periods
+        self.returns = RollingCovariance(window=window)
+        self._exposure = np.zeros(0)
+        self._reserved = np.zeros(0)
+        self._last_prices: Dict[str, float] = {}
+        self._masks: Dict[str, np.ndarray] = {}
+        self.apply_config(config)
+
+    def apply_config(self, config: Mapping[str, Any]) -> None:
+        """Re-read group caps and thresholds; return history and the book are kept."""
+
+        groups = group_limits(config)
+        max_volatility = config.get("correlation_limits", {}).get("max_portfolio_volatility")
+        self._ensure_assets(sorted({asset for group in groups for asset in group.assets}))
+        self._masks.clear()
+        self.max_correlated = float(config.get("portfolio", {}).get("max_correlation_risk", 1.0))
+        self.max_volatility = float(max_volatility) if max_volatility is not None else None
+        self.groups = groups
+
+    # -- inputs -----------------------------------------------------------
+
+    def update_prices(self, prices: Mapping[str, float]) -> None:
+        """Record one price observation per asset as log returns."""
+
+        returns = {}
+        for symbol, price in prices.items():
+            asset = base_asset(symbol)
+            previous = self._last_prices.get(asset)
+            if previous and price > 0:
+                returns[asset] = math.log(price / previous)
+            self._last_prices[asset] = price
+        if returns:
+            self._ensure_assets(returns)
+            self.returns.update(returns)
+
+    def update_returns(self, returns: Mapping[str, float]) -> None:
+        normalized = {base_asset(symbol): value for symbol, value in returns.items()}
+        self._ensure_assets(normalized)
+        self.returns.update(normalized)
+
+    def set_exposures(self, exposures: Mapping[str, float]) -> None:
+        """Replace the book with signed exposures (fraction of equity, long positive)."""
+
+        normalized: Dict[str, float] = {}
+        for symbol, value in exposures.items():
+            asset = base_asset(symbol)
+            normalized[asset] = normalized.get(asset, 0.0) + value
+        self._ensure_assets(normalized)
+        self._exposure[:] = 0.0
+        for asset, value in normalized.items():
+            self._exposure[self.returns.index[asset]] = value
+
+    def add_exposure(self, symbol: str, signed_size: float) -> None:
+        asset = base_asset(symbol)
+        self._ensure_assets([asset])
+        self._exposure[self.returns.index[asset]] += signed_size
+
+    def reserve(self, symbol: str, signed_size: float) -> None:
+        """Count an order that was accepted but has not become a position yet."""
+
+        asset = base_asset(symbol)
+        self._ensure_assets([asset])
+        self._reserved[self.returns.index[asset]] += signed_size
+
+    def release(self, symbol: str, signed_size: float) -> None:
+        """Undo a :meth:`reserve` once the order has been placed or has failed."""
+
+        position = self.returns.index.get(base_asset(symbol))
+        if position is not None:
+            self._reserved[position] -= signed_size
+
+    # -- outputs ----------------------------------------------------------
+
+    def correlation(self) -> np.ndarray:
+        if self.returns.count < self.min_periods:
+            return np.ones((len(self.returns.assets), len(self.returns.assets)))
+        return self.returns.correlation()
+
+    def portfolio_variance(self, exposure: Optional[np.ndarray] = None) -> float:
+        weights = self._exposure if exposure is None else exposure
+        return float(weights @ self.returns.covariance() @ weights)
+
+    def correlated_exposure(self, symbol: str, signed_size: float) -> float:
+        """Exposure moving with ``symbol`` in the trade's direction once the trade is added."""
+
+        projected, row = self._projection(base_asset(symbol), signed_size)
+        direction = 1.0 if signed_size >= 0 else -1.0
+        return float(direction * (row @ projected))
+
+    def check(self, trade: ProposedTrade) -> Optional[str]:
+        """Failure reason for ``trade`` against the current book and reservations, or None."""
+
+        signed = trade.size_percent if _is_long(trade.side) else -trade.size_percent
+        asset = base_asset(trade.asset)
+        projected, row = self._projection(asset, signed)
+        known = len(self.returns.assets)
+
+        for group in self.groups:
+            if group.assets and asset not in group.assets:
+                continue
+            if group.assets:
+                mask = self._mask(group)
+                if len(projected) > known:  # the traded asset is new and, per the check above, in the group
+                    mask = np.append(mask, True)
+                combined = abs(float(projected[mask].sum()))
+            else:
+                combined = float(np.abs(projected).sum())
+            if combined > group.limit:
+                return group.name
+        direction = 1.0 if signed >= 0 else -1.0
+        if direction * float(row @ projected) > self.max_correlated:
+            return "correlated_exposure"
+        if self.max_volatility is not None and self.returns.count >= self.min_periods:
+            # An asset without return history adds no variance.
+            if math.sqrt(max(0.0, self.portfolio_variance(projected[:known]))) > self.max_volatility:
+                return "portfolio_volatility"
+        return None
+
+    def policy_check(
+        self, limits: PolicyLimits, trade: ProposedTrade, portfolio: PortfolioState, exposures: Mapping[str, float]
+    ) -> Optional[str]:
+        """:data:`~services.api.risk.policy.Check`-shaped adapter for :class:`PolicyEngine`."""
+
+        return self.check(trade)
+
+    def _projection(self, asset: str, signed_size: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Book plus reservations plus the trade, and the traded asset's correlation row.
+
+        An asset the engine has not seen yet gets an extra trailing column
+        instead of being registered, so checks never change the engine.
+        """
+
+        projected = self._exposure + self._reserved
+        position = self.returns.index.get(asset)
+        if position is not None:
+            projected[position] += signed_size
+            return projected, self.correlation()[position]
+        known = len(projected)
+        # A fresh column has zero returns: fully correlated before warm-up, uncorrelated after.
+        row = np.ones(known + 1) if self.returns.count < self.min_periods else np.eye(1, known + 1, known)[0]
+        return np.append(projected, signed_size), row
+
+    def _ensure_assets(self, assets: Iterable[str]) -> List[int]:
+        positions = []
+        for asset in assets:
+            if asset not in self.returns.index:
+                self.returns.add_asset(asset)
+                self._exposure = np.append(self._exposure, 0.0)
+                self._reserved = np.append(self._reserved, 0.0)
+                self._masks.clear()
+            positions.append(self.returns.index[asset])
+        return positions
+
+    def _mask(self, group: GroupLimit) -> np.ndarray:
+        mask = self._masks.get(group.name)
+        if mask is None:
+            mask = self._masks[group.name] = np.array([a in group.assets for a in self.returns.assets])
+        return mask
+
+
+def position_exposures(positions: Iterable[PositionSnapshot]) -> Dict[str, float]:
+    """Signed exposure per base asset (long positive) of ``positions``, for :meth:`CorrelationRiskEngine.set_exposures`."""
+
+    exposures: Dict[str, float] = {}
+    for position in positions:
+        asset = base_asset(position.asset)
+        exposures[asset] = exposures.get(asset, 0.0) + signed_exposure(position)
+    return exposures
+
+
+def _is_long(side: str) -> bool:
+    return side.lower() in {"buy", "long"}
+
+
+__all__ = [
+    "CorrelationRiskEngine",
+    "GroupLimit",
+    "RollingCovariance",
+    "base_asset",
+    "group_limits",
+    "position_exposures",
+]
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Iterable, List
+import heapq
+import math
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Protocol, Tuple
 
 
 @dataclass(slots=True)
@@ -33,9 +35,20 @@ class RiskMonitor:
         self.correlation_limit = correlation_limit
         self.risk_limit = risk_limit
 
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "RiskMonitor":
+        monitor = cls({}, 1.0, 1.0)
+        monitor.apply_config(config)
+        return monitor
+
+    def apply_config(self, config: Mapping[str, Any]) -> None:
+        portfolio = config.get("portfolio", {})
+        self.drawdown_limits = dict(config.get("drawdown_limits", {}))
+        self.correlation_limit = portfolio.get("max_correlation_risk", 1.0)
+        self.risk_limit = portfolio.get("max_total_risk", 1.0)
+
     def get_metrics(self, positions: Iterable[PositionSnapshot]) -> RiskMetrics:
         positions_list = list(positions)
-        open_positions = len(positions_list)
         total_exposure = sum(abs(pos.size) for pos in positions_list)
         current_drawdown = max((pos.drawdown for pos in positions_list), default=0.0)
         risk_consumed = sum(pos.risk for pos in positions_list)
@@ -45,8 +58,17 @@ class RiskMonitor:
             buckets[pos.correlation_bucket] = buckets.get(pos.correlation_bucket, 0.0) + abs(pos.size)
         correlation_risk = max(buckets.values(), default=0.0)
 
-        alerts = self.check_alerts(total_exposure, risk_consumed, current_drawdown, correlation_risk)
+        return self._build_metrics(len(positions_list), total_exposure, current_drawdown, risk_consumed, correlation_risk)
 
+    def _build_metrics(
+        self,
+        open_positions: int,
+        total_exposure: float,
+        current_drawdown: float,
+        risk_consumed: float,
+        correlation_risk: float,
+    ) -> RiskMetrics:
+        alerts = self.check_alerts(total_exposure, risk_consumed, current_drawdown, correlation_risk)
         return RiskMetrics(
             open_positions=open_positions,
             total_exposure=float(round(total_exposure, 4)),
@@ -75,4 +97,189 @@ class RiskMonitor:
         return alerts
 
 
-__all__ = ["RiskMonitor", "RiskMetrics", "PositionSnapshot"]
+class ExactSum:
+    """Running float sum kept as non-overlapping partials (Shewchuk), so values
+    can be added and removed in any order and :meth:`value` still equals
+    ``math.fsum`` over the current members."""
+
+    __slots__ = ("partials",)
+
+    def __init__(self) -> None:
+        self.partials: List[float] = []
+
+    def add(self, x: float) -> None:
+        partials = self.partials
+        i = 0
+        for y in partials:
+            if abs(x) < abs(y):
+                x, y = y, x
+            hi = x + y
+            lo = y - (hi - x)
+            if lo:
+                partials[i] = lo
+                i += 1
+            x = hi
+        partials[i:] = [x]
+
+    def remove(self, x: float) -> None:
+        self.add(-x)
+
+    def value(self) -> float:
+        return math.fsum(self.partials)
+
+
+def signed_exposure(position: PositionSnapshot) -> float:
+    """Position size signed by side, long positive."""
+
+    size = abs(position.size)
+    return size if position.side.lower() in {"buy", "long"} else -size
+
+
+class ExposureListener(Protocol):
+    """Receives each tracked position's signed exposure as it opens and closes."""
+
+    def add_exposure(self, symbol: str, signed_size: float) -> None: ...
+
+
+# (abs size, risk, correlation bucket, drawdown) a tracked position contributes.
+_Contribution = Tuple[float, float, str, float]
+
+
+def _contribution(position: PositionSnapshot) -> _Contribution:
+    return abs(position.size), position.risk, position.correlation_bucket, position.drawdown
+
+
+class IncrementalRiskMonitor(RiskMonitor):
+    """Risk monitor that tracks a live position book through deltas.
+
+    Exposure, risk and per-bucket totals are exact running sums; the largest
+    drawdown and the largest bucket come from max-heaps with lazy deletion.
+    Each open/update/close costs O(log n) and :meth:`metrics` reads the current
+    totals without touching the positions, matching :meth:`get_metrics` over
+    the same book exactly. ``positions`` holds copies of the snapshots passed
+    in, and removals subtract the values recorded at open time, so mutating a
+    snapshot after handing it over cannot skew the totals. ``exposures``
+    (typically a :class:`~services.api.risk.correlation.CorrelationRiskEngine`)
+    is told the signed size of every position as it opens and closes.
+    """
+
+    def __init__(
+        self,
+        drawdown_limits: dict[str, float],
+        correlation_limit: float,
+        risk_limit: float,
+        *,
+        exposures: Optional[ExposureListener] = None,
+    ) -> None:
+        super().__init__(drawdown_limits, correlation_limit, risk_limit)
+        self.exposures = exposures
+        self.positions: Dict[str, PositionSnapshot] = {}
+        self._contributions: Dict[str, _Contribution] = {}
+        self._exposure = ExactSum()
+        self._risk = ExactSum()
+        self._buckets: Dict[str, Tuple[ExactSum, int]] = {}
+        self._bucket_values: Dict[str, float] = {}
+        self._drawdowns: List[Tuple[float, str]] = []  # (-drawdown, position id)
+        self._bucket_heap: List[Tuple[float, str]] = []  # (-bucket total, bucket)
+
+    def open_position(self, position_id: str, position: PositionSnapshot) -> None:
+        if position_id in self._contributions:
+            self.close_position(position_id)
+        size, risk, bucket, drawdown = self._contributions[position_id] = _contribution(position)
+        self.positions[position_id] = replace(position)
+        if self.exposures is not None:
+            self.exposures.add_exposure(position.asset, signed_exposure(position))
+        self._exposure.add(size)
+        self._risk.add(risk)
+        self._adjust_bucket(bucket, size, 1)
+        heapq.heappush(self._drawdowns, (-drawdown, position_id))
+        self._maybe_compact()
+
+    def update_position(self, position_id: str, position: PositionSnapshot) -> None:
+        self.open_position(position_id, position)
+
+    def close_position(self, position_id: str) -> None:
+        stored = self.positions.pop(position_id, None)
+        if stored is not None and self.exposures is not None:
+            self.exposures.add_exposure(stored.asset, -signed_exposure(stored))
+        contribution = self._contributions.pop(position_id, None)
+        if contribution is None:
+            return
+        size, risk, bucket, _ = contribution
+        self._exposure.remove(size)
+        self._risk.remove(risk)
+        self._adjust_bucket(bucket, -size, -1)
+
+    def sync(self, positions: Mapping[str, PositionSnapshot]) -> None:
+        """Apply whatever changed between the tracked book and ``positions``."""
+
+        for position_id in [pid for pid in self._contributions if pid not in positions]:
+            self.close_position(position_id)
+        for position_id, position in positions.items():
+            if self.positions.get(position_id) != position:
+                self.open_position(position_id, position)
+
+    def bucket_totals(self) -> Dict[str, float]:
+        return dict(self._bucket_values)
+
+    def metrics(self) -> RiskMetrics:
+        return self._build_metrics(
+            len(self._contributions),
+            self._exposure.value(),
+            self._max_drawdown(),
+            self._risk.value(),
+            self._max_bucket(),
+        )
+
+    def _adjust_bucket(self, bucket: str, size: float, count: int) -> None:
+        total, members = self._buckets.get(bucket) or (ExactSum(), 0)
+        members += count
+        if members <= 0:
+            self._buckets.pop(bucket, None)
+            self._bucket_values.pop(bucket, None)
+            return
+        total.add(size)
+        self._buckets[bucket] = (total, members)
+        value = self._bucket_values[bucket] = total.value()
+        heapq.heappush(self._bucket_heap, (-value, bucket))
+
+    def _max_drawdown(self) -> float:
+        heap = self._drawdowns
+        while heap:
+            negative, position_id = heap[0]
+            contribution = self._contributions.get(position_id)
+            if contribution is not None and contribution[3] == -negative:
+                return contribution[3]
+            heapq.heappop(heap)
+        return 0.0
+
+    def _max_bucket(self) -> float:
+        heap = self._bucket_heap
+        while heap:
+            negative, bucket = heap[0]
+            if self._bucket_values.get(bucket) == -negative:
+                return -negative
+            heapq.heappop(heap)
+        return 0.0
+
+    def _maybe_compact(self) -> None:
+        # Stale heap entries are only dropped when they reach the top; rebuild
+        # once they clearly outnumber live ones so memory stays O(n).
+        limit = 2 * len(self._contributions) + 64
+        if len(self._drawdowns) > limit:
+            self._drawdowns = [(-contribution[3], pid) for pid, contribution in self._contributions.items()]
+            heapq.heapify(self._drawdowns)
+        if len(self._bucket_heap) > 2 * len(self._bucket_values) + 64:
+            self._bucket_heap = [(-value, bucket) for bucket, value in self._bucket_values.items()]
+            heapq.heapify(self._bucket_heap)
+
+
+__all__ = [
+    "ExactSum",
+    "ExposureListener",
+    "IncrementalRiskMonitor",
+    "RiskMonitor",
+    "RiskMetrics",
+    "PositionSnapshot",
+    "signed_exposure",
+]
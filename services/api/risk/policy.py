@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Mapping, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, Mapping, Optional, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .correlation import CorrelationRiskEngine
 
 
 @dataclass(slots=True)
@@ -28,88 +31,180 @@ class PortfolioState:
     drawdown_monthly: float
 
 
+@dataclass(slots=True, frozen=True)
+class PolicyLimits:
+    """Risk config flattened once; defaults match the permissive fallbacks."""
+
+    max_size_percent: float = 1.0
+    max_leverage: float = 10
+    min_rr_ratio: float = 1.0
+    drawdown_daily: float = 100.0
+    drawdown_weekly: float = 100.0
+    drawdown_monthly: float = 100.0
+    max_correlation_risk: float = 1.0
+    same_direction: float = 1.0
+    max_open_positions: float = 100
+    max_daily_trades: float = 100
+    max_total_risk: float = 1.0
+    min_wallet_credibility: float = 3.0
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "PolicyLimits":
+        single = config.get("single_position", {})
+        drawdown = config.get("drawdown_limits", {})
+        portfolio = config.get("portfolio", {})
+        correlation = config.get("correlation_limits", {})
+        return cls(
+            max_size_percent=single.get("max_size_percent", 1.0),
+            max_leverage=single.get("max_leverage", 10),
+            min_rr_ratio=single.get("min_rr_ratio", 1.0),
+            drawdown_daily=drawdown.get("daily", 100.0),
+            drawdown_weekly=drawdown.get("weekly", 100.0),
+            drawdown_monthly=drawdown.get("monthly", 100.0),
+            max_correlation_risk=portfolio.get("max_correlation_risk", 1.0),
+            same_direction=correlation.get("same_direction", 1.0),
+            max_open_positions=portfolio.get("max_open_positions", 100),
+            max_daily_trades=portfolio.get("max_daily_trades", 100),
+            max_total_risk=portfolio.get("max_total_risk", 1.0),
+        )
+
+
+# Each check returns the failure reason, or None when the trade passes it.
+Check = Callable[[PolicyLimits, ProposedTrade, PortfolioState, Mapping[str, float]], Optional[str]]
+
+
+def _check_risk_limit(
+    limits: PolicyLimits, trade: ProposedTrade, portfolio: PortfolioState, exposures: Mapping[str, float]
+) -> Optional[str]:
+    if trade.size_percent > limits.max_size_percent:
+        return "size_limit"
+    if trade.leverage > limits.max_leverage:
+        return "leverage_limit"
+    if trade.rr_ratio < limits.min_rr_ratio:
+        return "rr_ratio"
+    return None
+
+
+def _check_drawdown(
+    limits: PolicyLimits, trade: ProposedTrade, portfolio: PortfolioState, exposures: Mapping[str, float]
+) -> Optional[str]:
+    daily = portfolio.drawdown_daily > limits.drawdown_daily
+    weekly = portfolio.drawdown_weekly > limits.drawdown_weekly
+    monthly = portfolio.drawdown_monthly > limits.drawdown_monthly
+    if not (daily or weekly or monthly):
+        return None
+    return ",".join(name for name, hit in (("daily", daily), ("weekly", weekly), ("monthly", monthly)) if hit)
+
+
+def _check_correlation(
+    limits: PolicyLimits, trade: ProposedTrade, portfolio: PortfolioState, exposures: Mapping[str, float]
+) -> Optional[str]:
+    if portfolio.correlation_risk > limits.max_correlation_risk:
+        return "portfolio_correlation"
+    total_same_direction = sum(value for key, value in exposures.items() if key.endswith("_same")) if exposures else 0.0
+    if total_same_direction > limits.same_direction:
+        return "same_direction"
+    return None
+
+
+def _check_frequency(
+    limits: PolicyLimits, trade: ProposedTrade, portfolio: PortfolioState, exposures: Mapping[str, float]
+) -> Optional[str]:
+    if portfolio.open_positions >= limits.max_open_positions:
+        return "too_many_positions"
+    if portfolio.daily_trades >= limits.max_daily_trades:
+        return "trade_frequency"
+    if portfolio.total_risk > limits.max_total_risk:
+        return "total_risk"
+    return None
+
+
+def _check_wallet_credibility(
+    limits: PolicyLimits, trade: ProposedTrade, portfolio: PortfolioState, exposures: Mapping[str, float]
+) -> Optional[str]:
+    if trade.wallet_credibility < limits.min_wallet_credibility:
+        return "low_wallet_credibility"
+    return None
+
+
+CHECKS: Tuple[Tuple[str, Check], ...] = (
+    ("risk_limit", _check_risk_limit),
+    ("drawdown", _check_drawdown),
+    ("correlation", _check_correlation),
+    ("frequency", _check_frequency),
+    ("wallet_credibility", _check_wallet_credibility),
+)
+_EMPTY: Mapping[str, float] = {}
+
+
 class PolicyEngine:
-    def __init__(self, config: Dict[str, Any]) -> None:
+    """Validates trades against limits compiled once from the risk config.
+
+    Every check is a hard failure, so evaluation stops at the first one that
+    fails. :meth:`first_failure` is the allocation-free path; :meth:`validate`
+    also builds the per-check details for callers that report them.
+    """
+
+    def __init__(self, config: Dict[str, Any], *, correlation: Optional[CorrelationRiskEngine] = None) -> None:
         self.config = config
+        self.limits = PolicyLimits.from_config(config)
+        self.correlation = correlation
+        self.checks = CHECKS
+        if correlation is not None:
+            self.checks = CHECKS + (("correlation_matrix", correlation.policy_check),)
+
+    def apply_config(self, config: Mapping[str, Any]) -> None:
+        """Recompile limits from a new config (e.g. a :class:`RiskConfigProvider` snapshot)."""
+
+        limits = PolicyLimits.from_config(config)
+        if self.correlation is not None:
+            self.correlation.apply_config(config)
+        self.config, self.limits = config, limits  # type: ignore[assignment]
+
+    def first_failure(
+        self,
+        trade: ProposedTrade,
+        portfolio: PortfolioState,
+        exposures: Mapping[str, float] | None = None,
+    ) -> Optional[Tuple[str, str]]:
+        """``(check, reason)`` of the first failing check, or None when the trade passes."""
+
+        limits = self.limits
+        exposures = exposures or _EMPTY
+        for name, check in self.checks:
+            reason = check(limits, trade, portfolio, exposures)
+            if reason is not None:
+                return name, reason
+        return None
+
+    def allows(
+        self,
+        trade: ProposedTrade,
+        portfolio: PortfolioState,
+        exposures: Mapping[str, float] | None = None,
+    ) -> bool:
+        return self.first_failure(trade, portfolio, exposures) is None
 
     def validate(
         self,
         trade: ProposedTrade,
         portfolio: PortfolioState,
         exposures: Mapping[str, float] | None = None,
+        *,
+        details: bool = True,
     ) -> Tuple[bool, Dict[str, Dict[str, Any]]]:
-        checks = {
-            "risk_limit": lambda: self._check_risk_limit(trade),
-            "drawdown": lambda: self._check_drawdown(portfolio),
-            "correlation": lambda: self._check_correlation(portfolio, exposures or {}),
-            "frequency": lambda: self._check_frequency(portfolio),
-            "wallet_credibility": lambda: self._check_wallet_credibility(trade),
-        }
+        if not details:
+            return self.first_failure(trade, portfolio, exposures) is None, {}
+        limits = self.limits
+        exposures = exposures or _EMPTY
         results: Dict[str, Dict[str, Any]] = {}
-        hard_failures = {"risk_limit", "drawdown", "wallet_credibility", "correlation", "frequency"}
-        for name, check in checks.items():
-            passed, reason = check()
-            results[name] = {"passed": passed, "reason": reason}
-            if not passed and name in hard_failures:
+        for name, check in self.checks:
+            reason = check(limits, trade, portfolio, exposures)
+            if reason is not None:
+                results[name] = {"passed": False, "reason": reason}
                 return False, results
-        soft_failures = [name for name, result in results.items() if not result["passed"]]
-        if len(soft_failures) > 2:
-            return False, results
+            results[name] = {"passed": True, "reason": "ok"}
         return True, results
 
-    def _pass(self) -> Tuple[bool, str]:  # pragma: no cover - helper
-        return True, "not_implemented"
-
-    def _check_risk_limit(self, trade: ProposedTrade) -> Tuple[bool, str]:
-        limits = self.config.get("single_position", {})
-        if trade.size_percent > limits.get("max_size_percent", 1.0):
-            return False, "size_limit"
-        if trade.leverage > limits.get("max_leverage", 10):
-            return False, "leverage_limit"
-        if trade.rr_ratio < limits.get("min_rr_ratio", 1.0):
-            return False, "rr_ratio"
-        return True, "ok"
-
-    def _check_drawdown(self, portfolio: PortfolioState) -> Tuple[bool, str]:
-        limits = self.config.get("drawdown_limits", {})
-        breaches = []
-        if portfolio.drawdown_daily > limits.get("daily", 100.0):
-            breaches.append("daily")
-        if portfolio.drawdown_weekly > limits.get("weekly", 100.0):
-            breaches.append("weekly")
-        if portfolio.drawdown_monthly > limits.get("monthly", 100.0):
-            breaches.append("monthly")
-        if breaches:
-            return False, ",".join(breaches)
-        return True, "ok"
-
-    def _check_correlation(
-        self,
-        portfolio: PortfolioState,
-        exposures: Mapping[str, float],
-    ) -> Tuple[bool, str]:
-        limits = self.config.get("portfolio", {})
-        if portfolio.correlation_risk > limits.get("max_correlation_risk", 1.0):
-            return False, "portfolio_correlation"
-        total_same_direction = sum(value for key, value in exposures.items() if key.endswith("_same"))
-        if total_same_direction > self.config.get("correlation_limits", {}).get("same_direction", 1.0):
-            return False, "same_direction"
-        return True, "ok"
-
-    def _check_frequency(self, portfolio: PortfolioState) -> Tuple[bool, str]:
-        limits = self.config.get("portfolio", {})
-        if portfolio.open_positions >= limits.get("max_open_positions", 100):
-            return False, "too_many_positions"
-        if portfolio.daily_trades >= limits.get("max_daily_trades", 100):
-            return False, "trade_frequency"
-        if portfolio.total_risk > limits.get("max_total_risk", 1.0):
-            return False, "total_risk"
-        return True, "ok"
-
-    def _check_wallet_credibility(self, trade: ProposedTrade) -> Tuple[bool, str]:
-        if trade.wallet_credibility < 3.0:
-            return False, "low_wallet_credibility"
-        return True, "ok"
-
-
-__all__ = ["PolicyEngine", "ProposedTrade", "PortfolioState"]
+
+__all__ = ["PolicyEngine", "PolicyLimits", "ProposedTrade", "PortfolioState"]
@@ -0,0 +1,223 @@
+"""Cached, hot-reloadable risk configuration."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import math
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Protocol, Tuple
+
+from .config_loader import DEFAULT_RISK_CONFIG_PATH, parse_risk_config
+from .policy import PolicyLimits
+
+Subscriber = Callable[["RiskConfigSnapshot"], None]
+
+
+class ConfigAware(Protocol):
+    def apply_config(self, config: Mapping[str, Any]) -> None: ...
+
+
+# Sections whose values must be finite, non-negative numbers when present.
+NUMERIC_SECTIONS = ("single_position", "correlation_limits", "portfolio", "drawdown_limits")
+
+
+@dataclass(slots=True, frozen=True)
+class RiskConfigSnapshot:
+    """One validated version of the risk config; ``config`` is read-only all the way down."""
+
+    version: int
+    config: Mapping[str, Any]
+    digest: str
+    mtime_ns: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return _thaw(self.config)
+
+
+def validate_risk_config(config: Any) -> None:
+    """Raise ``ValueError`` unless ``config`` is a usable risk configuration."""
+
+    if not isinstance(config, Mapping):
+        raise ValueError("Risk configuration must be a mapping")
+    for section in NUMERIC_SECTIONS:
+        values = config.get(section, {})
+        if not isinstance(values, Mapping):
+            raise ValueError(f"Risk configuration section {section!r} must be a mapping")
+        for key, value in values.items():
+            if isinstance(value, Mapping):
+                continue  # e.g. drawdown_limits.actions_on_breach
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValueError(f"{section}.{key} must be a number, got {value!r}")
+            if not math.isfinite(value) or value < 0:
+                raise ValueError(f"{section}.{key} must be a finite, non-negative number")
+    PolicyLimits.from_config(config)
+
+
+class RiskConfigProvider:
+    """Parses the risk config once and swaps in new snapshots when the file changes.
+
+    Readers take :attr:`snapshot` (a single attribute read, so always a
+    consistent version) instead of touching the file. :meth:`reload` checks
+    the file's mtime and size, re-parses only when they move, validates, and
+    publishes the new snapshot to subscribers. An invalid edit keeps the
+    previous snapshot in place and is reported through :attr:`last_error`.
+    :meth:`watch` polls in the background; inotify would need a third-party
+    dependency and the stat call is cheap at a one-second interval.
+    """
+
+    def __init__(self, path: Optional[Path] = None, *, poll_interval: float = 1.0) -> None:
+        self.path = Path(path or DEFAULT_RISK_CONFIG_PATH)
+        self.poll_interval = poll_interval
+        self.last_error: Optional[str] = None
+        self._subscribers: List[Subscriber] = []
+        self._lock = threading.Lock()
+        self._stat: Optional[Tuple[int, int]] = None
+        self._snapshot: Optional[RiskConfigSnapshot] = None
+        self.reload(strict=True)
+
+    @property
+    def snapshot(self) -> RiskConfigSnapshot:
+        assert self._snapshot is not None  # loaded in __init__
+        return self._snapshot
+
+    @property
+    def config(self) -> Mapping[str, Any]:
+        return self.snapshot.config
+
+    def subscribe(self, callback: Subscriber, *, replay: bool = True) -> Callable[[], None]:
+        """Call ``callback`` with every new snapshot (and the current one when ``replay``)."""
+
+        self._subscribers.append(callback)
+        if replay:
+            callback(self.snapshot)
+
+        def unsubscribe() -> None:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def bind(self, *components: ConfigAware) -> Callable[[], None]:
+        """Subscribe components exposing ``apply_config(config)``; returns an unsubscribe-all."""
+
+        handles = [self.subscribe(lambda snapshot, c=component: c.apply_config(snapshot.config)) for component in components]
+
+        def unbind() -> None:
+            for handle in handles:
+                handle()
+
+        return unbind
+
+    def reload(self, *, force: bool = False, strict: bool = False) -> bool:
+        """Pick up file changes; True when a new snapshot was published.
+
+        With ``strict`` a missing or invalid file raises instead of keeping the
+        previous snapshot (used for the initial load).
+        """
+
+        with self._lock:
+            try:
+                stat = os.stat(self.path)
+                key = (stat.st_mtime_ns, stat.st_size)
+                if not force and key == self._stat:
+                    return False
+                content = self.path.read_bytes()
+                digest = hashlib.sha256(content).hexdigest()
+                if self._snapshot is not None and digest == self._snapshot.digest:
+                    self._stat = key
+                    return False
+                config = parse_risk_config(content.decode("utf-8"))
+                validate_risk_config(config)
+                self._stat = key  # an invalid file is read again on the next reload
+            except (OSError, ValueError) as exc:
+                if strict:
+                    raise
+                self.last_error = f"{type(exc).__name__}: {exc}"
+                return False
+            version = self._snapshot.version + 1 if self._snapshot is not None else 1
+            snapshot = RiskConfigSnapshot(version, _freeze(config), digest, stat.st_mtime_ns)
+            self._snapshot = snapshot
+            self.last_error = None
+            subscribers = list(self._subscribers)
+        self._notify(snapshot, subscribers)
+        return True
+
+    async def watch(self, stop: Optional[asyncio.Event] = None) -> None:
+        """Poll for changes until ``stop`` is set."""
+
+        while stop is None or not stop.is_set():
+            self.reload()
+            if stop is None:
+                await asyncio.sleep(self.poll_interval)
+                continue
+            try:
+                await asyncio.wait_for(stop.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def _notify(self, snapshot: RiskConfigSnapshot, subscribers: List[Subscriber]) -> None:
+        errors = []
+        for callback in subscribers:
+            try:
+                callback(snapshot)
+            except Exception as exc:  # noqa: BLE001 - one bad subscriber must not block the rest
+                errors.append(f"{getattr(callback, '__qualname__', callback)}: {exc}")
+        if errors:
+            self.last_error = "; ".join(errors)
+
+
+_shared: Dict[Path, RiskConfigProvider] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_risk_config_provider(path: Optional[Path] = None) -> RiskConfigProvider:
+    """The process-wide provider for ``path`` (the default limits file when omitted)."""
+
+    key = Path(path or DEFAULT_RISK_CONFIG_PATH).resolve()
+    with _shared_lock:
+        provider = _shared.get(key)
+        if provider is None:
+            provider = _shared[key] = RiskConfigProvider(key)
+    return provider
+
+
+def load_risk_config(path: Optional[Path] = None) -> Dict[str, Any]:
+    """Current config for ``path`` as a plain dict, served from the shared provider.
+
+    The file is only parsed again once its mtime or size moves; an invalid
+    file raises ``ValueError``.
+    """
+
+    provider = shared_risk_config_provider(path)
+    provider.reload(strict=True)
+    return provider.snapshot.to_dict()
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+__all__ = [
+    "RiskConfigProvider",
+    "RiskConfigSnapshot",
+    "load_risk_config",
+    "shared_risk_config_provider",
+    "validate_risk_config",
+]
@@ -0,0 +1,126 @@
+"""Reference policy engine and randomized cases for checking and benchmarking :class:`PolicyEngine`."""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Dict, List, Mapping, Tuple
+
+from .policy import PortfolioState, ProposedTrade
+
+Case = Tuple[ProposedTrade, PortfolioState, Dict[str, float]]
+
+
+class LegacyPolicyEngine:
+    """``PolicyEngine`` before limits were compiled; kept as the baseline."""
+
+    def __init__(self, config: Dict[str, Any]) -> None:
+        self.config = config
+
+    def validate(
+        self,
+        trade: ProposedTrade,
+        portfolio: PortfolioState,
+        exposures: Mapping[str, float] | None = None,
+    ) -> Tuple[bool, Dict[str, Dict[str, Any]]]:
+        checks = {
+            "risk_limit": lambda: self._check_risk_limit(trade),
+            "drawdown": lambda: self._check_drawdown(portfolio),
+            "correlation": lambda: self._check_correlation(portfolio, exposures or {}),
+            "frequency": lambda: self._check_frequency(portfolio),
+            "wallet_credibility": lambda: self._check_wallet_credibility(trade),
+        }
+        results: Dict[str, Dict[str, Any]] = {}
+        hard_failures = {"risk_limit", "drawdown", "wallet_credibility", "correlation", "frequency"}
+        for name, check in checks.items():
+            passed, reason = check()
+            results[name] = {"passed": passed, "reason": reason}
+            if not passed and name in hard_failures:
+                return False, results
+        soft_failures = [name for name, result in results.items() if not result["passed"]]
+        if len(soft_failures) > 2:
+            return False, results
+        return True, results
+
+    def _pass(self) -> Tuple[bool, str]:  # pragma: no cover - helper
+        return True, "not_implemented"
+
+    def _check_risk_limit(self, trade: ProposedTrade) -> Tuple[bool, str]:
+        limits = self.config.get("single_position", {})
+        if trade.size_percent > limits.get("max_size_percent", 1.0):
+            return False, "size_limit"
+        if trade.leverage > limits.get("max_leverage", 10):
+            return False, "leverage_limit"
+        if trade.rr_ratio < limits.get("min_rr_ratio", 1.0):
+            return False, "rr_ratio"
+        return True, "ok"
+
+    def _check_drawdown(self, portfolio: PortfolioState) -> Tuple[bool, str]:
+        limits = self.config.get("drawdown_limits", {})
+        breaches = []
+        if portfolio.drawdown_daily > limits.get("daily", 100.0):
+            breaches.append("daily")
+        if portfolio.drawdown_weekly > limits.get("weekly", 100.0):
+            breaches.append("weekly")
+        if portfolio.drawdown_monthly > limits.get("monthly", 100.0):
+            breaches.append("monthly")
+        if breaches:
+            return False, ",".join(breaches)
+        return True, "ok"
+
+    def _check_correlation(
+        self,
+        portfolio: PortfolioState,
+        exposures: Mapping[str, float],
+    ) -> Tuple[bool, str]:
+        limits = self.config.get("portfolio", {})
+        if portfolio.correlation_risk > limits.get("max_correlation_risk", 1.0):
+            return False, "portfolio_correlation"
+        total_same_direction = sum(value for key, value in exposures.items() if key.endswith("_same"))
+        if total_same_direction > self.config.get("correlation_limits", {}).get("same_direction", 1.0):
+            return False, "same_direction"
+        return True, "ok"
+
+    def _check_frequency(self, portfolio: PortfolioState) -> Tuple[bool, str]:
+        limits = self.config.get("portfolio", {})
+        if portfolio.open_positions >= limits.get("max_open_positions", 100):
+            return False, "too_many_positions"
+        if portfolio.daily_trades >= limits.get("max_daily_trades", 100):
+            return False, "trade_frequency"
+        if portfolio.total_risk > limits.get("max_total_risk", 1.0):
+            return False, "total_risk"
+        return True, "ok"
+
+    def _check_wallet_credibility(self, trade: ProposedTrade) -> Tuple[bool, str]:
+        if trade.wallet_credibility < 3.0:
+            return False, "low_wallet_credibility"
+        return True, "ok"
+
+
+def random_cases(count: int, seed: int = 11) -> List[Case]:
+    rng = random.Random(seed)
+    cases = []
+    for _ in range(count):
+        trade = ProposedTrade(
+            trading_mode="demo",
+            asset=rng.choice(["BTC", "ETH", "SOL"]),
+            side=rng.choice(["buy", "sell"]),
+            size_percent=rng.uniform(0.0, 0.27),
+            leverage=rng.choice([1, 2, 3, 4]),
+            rr_ratio=rng.uniform(1.2, 3.0),
+            wallet_credibility=rng.uniform(2.8, 10.0),
+        )
+        portfolio = PortfolioState(
+            open_positions=rng.randrange(0, 5),
+            daily_trades=rng.randrange(0, 10),
+            total_risk=rng.uniform(0.0, 1.02),
+            correlation_risk=rng.uniform(0.0, 0.72),
+            drawdown_daily=rng.uniform(0.0, 3.1),
+            drawdown_weekly=rng.uniform(0.0, 7.2),
+            drawdown_monthly=rng.uniform(0.0, 15.3),
+        )
+        exposures = {"btc_same": rng.uniform(0.0, 0.45), "eth_same": rng.uniform(0.0, 0.4), "btc_opposite": 0.2}
+        cases.append((trade, portfolio, exposures))
+    return cases
+
+
+__all__ = ["Case", "LegacyPolicyEngine", "random_cases"]
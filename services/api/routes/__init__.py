@@ -1,7 +1,26 @@
 """API routers."""
 
+from __future__ import annotations
+
+from typing import Any
+
+from services.api.monitoring.middleware import LatencyMiddleware
+
 from .bias import router as bias_router
 from .events import router as events_router
 from .internal_llm import router as internal_llm_router
+from .metrics import router as metrics_router
+
+ROUTERS = (bias_router, events_router, internal_llm_router, metrics_router)
+
+
+def include_routers(app: Any) -> Any:
+    """Mount every API router on ``app`` and time its requests into ``api_latency_seconds``."""
+
+    for router in ROUTERS:
+        app.include_router(router)
+    app.add_middleware(LatencyMiddleware)
+    return app
+
 
-__all__ = ["bias_router", "events_router", "internal_llm_router"]
+__all__ = ["ROUTERS", "bias_router", "events_router", "include_routers", "internal_llm_router", "metrics_router"]
@@ -0,0 +1,24 @@
+"""Prometheus scrape endpoint for the process-wide metrics registry."""
+
+from __future__ import annotations
+
+try:  # pragma: no cover - optional FastAPI dependency
+    from fastapi import APIRouter
+    from fastapi.responses import PlainTextResponse
+except ModuleNotFoundError:  # pragma: no cover - reuse the bias router's stub; the endpoint then returns plain text
+    from .bias import APIRouter  # type: ignore[assignment]
+
+    PlainTextResponse = str  # type: ignore[assignment,misc]
+
+from services.api.monitoring.metrics import registry
+
+router = APIRouter(tags=["monitoring"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics() -> str:
+    # text/plain without a version parameter is read as exposition format 0.0.4.
+    return registry.render_prometheus()
+
+
+__all__ = ["router"]
@@ -0,0 +1,21 @@
+"""Offline replay of archived events through scoring, trigger and policy."""
+
+from .clock import SimulatedClock
+from .events import BacktestEvent, events_from_archive, events_from_db
+from .runner import BacktestParams, BacktestReport, BacktestRunner
+from .stubs import FillTransport, StubGroqClient, stub_okx_client
+from .sweep import run_sweep
+
+__all__ = [
+    "BacktestEvent",
+    "BacktestParams",
+    "BacktestReport",
+    "BacktestRunner",
+    "FillTransport",
+    "SimulatedClock",
+    "StubGroqClient",
+    "events_from_archive",
+    "events_from_db",
+    "run_sweep",
+    "stub_okx_client",
+]
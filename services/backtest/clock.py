@@ -0,0 +1,29 @@
+"""Simulated clock shared by every component in a backtest."""
+
+from __future__ import annotations
+
+
+class SimulatedClock:
+    """Callable returning simulated epoch seconds; only moves when told to.
+
+    Pass the instance wherever a component accepts ``clock=`` (``TTLCache``,
+    ``RateLimiter``, ``LLMTrigger``, ``BiasCalculator``).
+    """
+
+    __slots__ = ("_now",)
+
+    def __init__(self, start: float = 0.0) -> None:
+        self._now = start
+
+    def __call__(self) -> float:
+        return self._now
+
+    def advance_to(self, timestamp: float) -> None:
+        if timestamp > self._now:
+            self._now = timestamp
+
+    def advance(self, seconds: float) -> None:
+        self._now += max(0.0, seconds)
+
+
+__all__ = ["SimulatedClock"]
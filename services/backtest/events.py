@@ -0,0 +1,107 @@
+"""Event streams feeding the backtest runner."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Iterable, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from packages.db.models import Event
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from packages.archive import ArchiveReader
+
+
+@dataclass(slots=True)
+class BacktestEvent:
+    timestamp: float
+    wallet_id: Optional[str]
+    tx_hash: str
+    event_type: str
+    asset: Optional[str]
+    notional_usd: float
+    size_fraction: float
+
+
+def events_from_archive(
+    reader: ArchiveReader,
+    *,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    assets: Optional[Iterable[str]] = None,
+) -> List[BacktestEvent]:
+    """Load archived events in timestamp order (ties broken by tx hash)."""
+
+    import numpy as np
+
+    columns = reader.read(
+        "events",
+        ["timestamp", "wallet_id", "tx_hash", "event_type", "asset", "notional_usd", "size_fraction"],
+        start=start,
+        end=end,
+        assets=assets,
+    )
+    seconds = columns["timestamp"].astype(np.int64) / 1_000_000
+    notional = np.nan_to_num(columns["notional_usd"])
+    fraction = np.nan_to_num(columns["size_fraction"])
+    order = np.lexsort((columns["tx_hash"], seconds))
+    return [
+        BacktestEvent(
+            timestamp=float(seconds[index]),
+            wallet_id=columns["wallet_id"][index],
+            tx_hash=str(columns["tx_hash"][index]),
+            event_type=columns["event_type"][index] or "",
+            asset=columns["asset"][index],
+            notional_usd=float(notional[index]),
+            size_fraction=float(fraction[index]),
+        )
+        for index in order
+    ]
+
+
+async def events_from_db(
+    session: AsyncSession,
+    *,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> List[BacktestEvent]:
+    """Load events from the database in timestamp order."""
+
+    stmt = select(
+        Event.timestamp,
+        Event.wallet_id,
+        Event.tx_hash,
+        Event.event_type,
+        Event.asset,
+        Event.notional_usd,
+        Event.size_fraction,
+    ).order_by(Event.timestamp, Event.tx_hash)
+    if since is not None:
+        stmt = stmt.where(Event.timestamp >= since)
+    if until is not None:
+        stmt = stmt.where(Event.timestamp < until)
+    result = await session.execute(stmt)
+    return [
+        BacktestEvent(
+            timestamp=_epoch(timestamp),
+            wallet_id=wallet_id,
+            tx_hash=tx_hash,
+            event_type=event_type,
+            asset=asset,
+            notional_usd=float(notional or 0.0),
+            size_fraction=float(fraction or 0.0),
+        )
+        for timestamp, wallet_id, tx_hash, event_type, asset, notional, fraction in result
+    ]
+
+
+def _epoch(value: datetime) -> float:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+__all__ = ["BacktestEvent", "events_from_archive", "events_from_db"]
@@ -0,0 +1,270 @@
+"""Deterministic replay of an event stream through scoring, trigger and policy."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from packages.scoring.engine import ScoringResult, WalletScoringEngine
+from packages.scoring.models import WalletStats
+from services.api.bias.calculator import BiasCalculator, BiasResult
+from services.api.llm.client import LLMRequest
+from services.api.llm.trigger import EventContext, LLMTrigger, RateLimiter, TriggerThresholds
+from services.api.risk.monitor import PositionSnapshot, RiskMonitor
+from services.api.risk.policy import PolicyEngine, PortfolioState
+from services.order_manager.killswitch import KillSwitch
+from services.order_manager.service import OrderManager, TradeSignal
+
+from .clock import SimulatedClock
+from .events import BacktestEvent
+from .stubs import StubGroqClient, stub_okx_client
+
+DEFAULT_CREDIBILITY = 5.0
+SECONDS_PER_DAY = 86_400
+
+
+@dataclass(slots=True)
+class BacktestParams:
+    """Tunable knobs for one backtest run; plain data so sweeps can pickle it."""
+
+    name: str = "baseline"
+    weights: Optional[Dict[str, float]] = None
+    thresholds: TriggerThresholds = field(default_factory=TriggerThresholds)
+    llm_rate_limit: int = 20
+    bias_timeframe: str = "1h"
+    bias_window_seconds: float = 3600.0
+    bias_refresh_seconds: float = 300.0
+    size_percent: float = 0.05
+    leverage: float = 1.0
+    rr_ratio: float = 2.0
+    holding_seconds: float = 4 * 3600.0
+    risk_overrides: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class BacktestReport:
+    name: str
+    events: int = 0
+    triggered: int = 0
+    llm_calls: int = 0
+    llm_tokens: int = 0
+    orders: int = 0
+    rejections: Dict[str, int] = field(default_factory=dict)
+    final_bias: Dict[str, float] = field(default_factory=dict)
+    simulated_seconds: float = 0.0
+    wall_seconds: float = 0.0
+
+
+@dataclass(slots=True)
+class _OpenPosition:
+    closes_at: float
+    asset: str
+    side: str
+    size_percent: float
+
+
+class _MemoScoringEngine(WalletScoringEngine):
+    """Scores each wallet once; stats are fixed for the length of a replay."""
+
+    def __init__(self, weights: Optional[Dict[str, float]] = None) -> None:
+        super().__init__(weights)
+        self._results: Dict[str, ScoringResult] = {}
+
+    def score_wallet(self, stats: WalletStats) -> ScoringResult:
+        result = self._results.get(stats.wallet_id)
+        if result is None:
+            result = self._results[stats.wallet_id] = WalletScoringEngine.score_wallet(self, stats)
+        return result
+
+
+class BacktestRunner:
+    """Replays events in timestamp order with every component on one simulated clock.
+
+    ``wallet_stats`` seeds wallet credibility (scored once with the run's
+    weights) and the per-asset bias, which is recomputed at most every
+    ``bias_refresh_seconds`` of simulated time from wallets active within
+    ``bias_window_seconds``. Triggered events call the stubbed LLM, then go
+    through :class:`OrderManager` (policy, risk monitor, stubbed OKX) with a
+    side taken from the current bias. Positions close after ``holding_seconds``.
+    """
+
+    def __init__(
+        self,
+        params: BacktestParams,
+        *,
+        wallet_stats: Mapping[str, WalletStats],
+        risk_config: Mapping[str, Any],
+    ) -> None:
+        self.params = params
+        self.clock = SimulatedClock()
+        self.wallet_stats = wallet_stats
+        self.scoring = _MemoScoringEngine(params.weights)
+        self.credibility = {
+            wallet_id: self.scoring.score_wallet(stats).credibility for wallet_id, stats in wallet_stats.items()
+        }
+        self.bias_calculator = BiasCalculator(self.scoring, clock=self.clock)
+        self.trigger = LLMTrigger(
+            rate_limiter=RateLimiter(params.llm_rate_limit, clock=self.clock),
+            thresholds=params.thresholds,
+            clock=self.clock,
+        )
+        config = _merge_config(risk_config, params.risk_overrides)
+        self.llm = StubGroqClient()
+        self.order_manager = OrderManager(
+            stub_okx_client(self.clock),
+            PolicyEngine(config),
+            RiskMonitor(
+                drawdown_limits=config.get("drawdown_limits", {}),
+                correlation_limit=config.get("portfolio", {}).get("max_correlation_risk", 1.0),
+                risk_limit=config.get("portfolio", {}).get("max_total_risk", 1.0),
+            ),
+            KillSwitch(),
+        )
+        self._activity: Dict[str, Deque[Tuple[float, str]]] = {}
+        self._bias: Dict[str, Tuple[float, BiasResult]] = {}
+        self._positions: List[_OpenPosition] = []
+        self._day = -1
+        self._daily_trades = 0
+
+    def run(self, events: Sequence[BacktestEvent]) -> BacktestReport:
+        return asyncio.run(self.replay(events))
+
+    async def replay(self, events: Sequence[BacktestEvent]) -> BacktestReport:
+        report = BacktestReport(name=self.params.name)
+        rejections: Counter[str] = Counter()
+        started = time.perf_counter()
+        first = events[0].timestamp if events else 0.0
+        for event in events:
+            self.clock.advance_to(event.timestamp)
+            report.events += 1
+            self._roll_day(event.timestamp)
+            self._close_expired(event.timestamp)
+            if event.asset is None:
+                continue
+            if event.wallet_id is not None:
+                self._activity.setdefault(event.asset, deque()).append((event.timestamp, event.wallet_id))
+
+            credibility = self.credibility.get(event.wallet_id or "", DEFAULT_CREDIBILITY)
+            context = EventContext(
+                tx_hash=event.tx_hash,
+                wallet_credibility=credibility,
+                size_frac=event.size_fraction,
+                notional_usd=event.notional_usd,
+                event_type=event.event_type,
+            )
+            if not self.trigger.should_trigger(context):
+                continue
+            report.triggered += 1
+            await self.llm.generate(LLMRequest(prompt=f"{event.event_type} {event.asset} {event.tx_hash}"))
+
+            result = await self._submit(event.asset, self._bias_for(event.asset), credibility)
+            if result["success"]:
+                report.orders += 1
+            else:
+                rejections[_rejection_reason(result)] += 1
+
+        report.llm_calls = self.llm.calls
+        report.llm_tokens = self.llm.tokens
+        report.rejections = dict(sorted(rejections.items()))
+        report.final_bias = {asset: bias.value for asset, (_, bias) in sorted(self._bias.items())}
+        report.simulated_seconds = (events[-1].timestamp - first) if events else 0.0
+        report.wall_seconds = time.perf_counter() - started
+        return report
+
+    async def _submit(self, asset: str, bias: BiasResult, credibility: float) -> Dict[str, Any]:
+        params = self.params
+        side = "buy" if bias.value >= 0 else "sell"
+        signal = TradeSignal(
+            trading_mode="demo",
+            asset=asset,
+            side=side,
+            size_percent=params.size_percent,
+            leverage=params.leverage,
+            rr_ratio=params.rr_ratio,
+            wallet_credibility=credibility,
+            quantity=params.size_percent,
+        )
+        snapshots = {
+            f"{index}": PositionSnapshot(
+                asset=position.asset,
+                side=position.side,
+                size=position.size_percent,
+                risk=position.size_percent,
+                pnl=0.0,
+                drawdown=0.0,
+                correlation_bucket=position.asset,
+            )
+            for index, position in enumerate(self._positions)
+        }
+        result = await self.order_manager.submit_order(
+            signal,
+            self._portfolio(),
+            snapshots,
+            {"portfolio_same": sum(p.size_percent for p in self._positions if p.side == side)},
+        )
+        if result["success"]:
+            self._daily_trades += 1
+            self._positions.append(
+                _OpenPosition(self.clock() + params.holding_seconds, asset, side, params.size_percent)
+            )
+        return result
+
+    def _portfolio(self) -> PortfolioState:
+        buckets: Dict[str, float] = {}
+        for position in self._positions:
+            buckets[position.asset] = buckets.get(position.asset, 0.0) + position.size_percent
+        return PortfolioState(
+            open_positions=len(self._positions),
+            daily_trades=self._daily_trades,
+            total_risk=sum(position.size_percent for position in self._positions),
+            correlation_risk=max(buckets.values(), default=0.0),
+            drawdown_daily=0.0,
+            drawdown_weekly=0.0,
+            drawdown_monthly=0.0,
+        )
+
+    def _bias_for(self, asset: str) -> BiasResult:
+        now = self.clock()
+        cached = self._bias.get(asset)
+        if cached is not None and now - cached[0] < self.params.bias_refresh_seconds:
+            return cached[1]
+        activity = self._activity.get(asset, deque())
+        horizon = now - self.params.bias_window_seconds
+        while activity and activity[0][0] < horizon:
+            activity.popleft()
+        active = sorted({wallet_id for _, wallet_id in activity})
+        wallets = [self.wallet_stats.get(wallet_id) or WalletStats(wallet_id=wallet_id) for wallet_id in active]
+        bias = self.bias_calculator.calculate(asset, self.params.bias_timeframe, wallets)
+        self._bias[asset] = (now, bias)
+        return bias
+
+    def _roll_day(self, timestamp: float) -> None:
+        day = int(timestamp // SECONDS_PER_DAY)
+        if day != self._day:
+            self._day = day
+            self._daily_trades = 0
+
+    def _close_expired(self, timestamp: float) -> None:
+        if self._positions and self._positions[0].closes_at <= timestamp:
+            self._positions = [position for position in self._positions if position.closes_at > timestamp]
+
+
+def _merge_config(base: Mapping[str, Any], overrides: Mapping[str, Mapping[str, Any]]) -> Dict[str, Any]:
+    merged = {key: dict(value) if isinstance(value, Mapping) else value for key, value in base.items()}
+    for section, values in overrides.items():
+        merged.setdefault(section, {}).update(values)
+    return merged
+
+
+def _rejection_reason(result: Mapping[str, Any]) -> str:
+    if result.get("reason") != "policy_rejected":
+        return str(result.get("reason"))
+    # PolicyEngine stops at the first hard failure, so the last failed check is the cause.
+    failed = [detail["reason"] for detail in result.get("details", {}).values() if not detail["passed"]]
+    return f"policy:{failed[-1]}" if failed else "policy"
+
+
+__all__ = ["BacktestParams", "BacktestReport", "BacktestRunner"]
@@ -0,0 +1,48 @@
+"""Deterministic stand-ins for external services during backtests."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from services.api.llm.client import GROQ_MODEL_TIERS, GroqClient, LLMRequest, LLMResponse
+from services.order_manager.okx_client import OKXClient, OKXCredentials
+
+from .clock import SimulatedClock
+
+
+class StubGroqClient(GroqClient):
+    """Answers instantly without caching or network; counts calls and tokens."""
+
+    def __init__(self) -> None:
+        super().__init__(cache=None)
+        self.calls = 0
+        self.tokens = 0
+
+    async def generate(self, request: LLMRequest) -> LLMResponse:
+        tier = GROQ_MODEL_TIERS.get(request.tier, GROQ_MODEL_TIERS["standard"])
+        self.calls += 1
+        self.tokens += tier["max_tokens"]
+        return LLMResponse(text=f"[backtest] {request.prompt[:50]}", tokens_used=tier["max_tokens"], model=tier["model"])
+
+
+class FillTransport:
+    """OKX transport that fills every order immediately at simulated time."""
+
+    def __init__(self, clock: SimulatedClock) -> None:
+        self.clock = clock
+        self.orders: List[Dict[str, Any]] = []
+
+    async def post(self, path: str, headers: Dict[str, str], body: str) -> Dict[str, Any]:
+        order_id = str(len(self.orders) + 1)
+        self.orders.append({"path": path, "body": body, "ts": self.clock()})
+        return {"code": "0", "data": [{"ordId": order_id, "sCode": "0", "ts": str(int(self.clock() * 1000))}]}
+
+
+def stub_okx_client(clock: SimulatedClock) -> OKXClient:
+    return OKXClient(
+        OKXCredentials(api_key="backtest", secret_key="backtest", passphrase="backtest"),
+        transport=FillTransport(clock),
+    )
+
+
+__all__ = ["FillTransport", "StubGroqClient", "stub_okx_client"]
@@ -0,0 +1,57 @@
+"""Run many backtest parameter sets in parallel worker processes."""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, List, Mapping, Optional, Sequence
+
+from packages.scoring.models import WalletStats
+
+from .events import BacktestEvent
+from .runner import BacktestParams, BacktestReport, BacktestRunner
+
+# Per-process replay inputs, installed once by the pool initializer so each
+# task only ships its (small) BacktestParams across the process boundary.
+_EVENTS: Sequence[BacktestEvent] = ()
+_WALLET_STATS: Mapping[str, WalletStats] = {}
+_RISK_CONFIG: Mapping[str, Any] = {}
+
+
+def _install(events: Sequence[BacktestEvent], wallet_stats: Mapping[str, WalletStats], risk_config: Mapping[str, Any]) -> None:
+    global _EVENTS, _WALLET_STATS, _RISK_CONFIG
+    _EVENTS, _WALLET_STATS, _RISK_CONFIG = events, wallet_stats, risk_config
+
+
+def _run_one(params: BacktestParams) -> BacktestReport:
+    return BacktestRunner(params, wallet_stats=_WALLET_STATS, risk_config=_RISK_CONFIG).run(_EVENTS)
+
+
+def run_sweep(
+    events: Sequence[BacktestEvent],
+    param_sets: Sequence[BacktestParams],
+    *,
+    wallet_stats: Mapping[str, WalletStats],
+    risk_config: Mapping[str, Any],
+    workers: Optional[int] = None,
+) -> List[BacktestReport]:
+    """Replay ``events`` once per parameter set; reports come back in input order.
+
+    ``workers=1`` runs in-process, which is easier to debug and profile.
+    Every run owns its clock and components, so results do not depend on
+    scheduling.
+    """
+
+    if workers == 1 or len(param_sets) <= 1:
+        return [
+            BacktestRunner(params, wallet_stats=wallet_stats, risk_config=risk_config).run(events)
+            for params in param_sets
+        ]
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_install,
+        initargs=(list(events), dict(wallet_stats), dict(risk_config)),
+    ) as pool:
+        return list(pool.map(_run_one, param_sets))
+
+
+__all__ = ["run_sweep"]
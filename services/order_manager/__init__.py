@@ -1,15 +1,27 @@
 """Order manager package."""
 
-from .killswitch import KillSwitch, KillSwitchState
+from .coalescer import OrderCoalescer
+from .http_transport import HTTPTransport, OKXLatencyMetrics
+from .idempotency import IdempotencyIndex, client_order_id
+from .killswitch import KillSwitch, KillSwitchState, SharedKillSwitchFlag
 from .okx_client import MemoryTransport, OKXClient, OKXCredentials
+from .pipeline import OrderPipeline, PipelineMetrics
 from .service import OrderManager, TradeSignal
 
 __all__ = [
     "KillSwitch",
     "KillSwitchState",
+    "SharedKillSwitchFlag",
     "OKXClient",
     "OKXCredentials",
     "MemoryTransport",
+    "HTTPTransport",
+    "OKXLatencyMetrics",
     "OrderManager",
+    "OrderCoalescer",
+    "OrderPipeline",
+    "IdempotencyIndex",
+    "client_order_id",
+    "PipelineMetrics",
     "TradeSignal",
 ]
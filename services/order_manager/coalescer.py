@@ -0,0 +1,79 @@
+"""Coalesce orders placed within a short window into one batch request."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+from services.order_manager.okx_client import BATCH_ORDER_LIMIT, OKXClient
+
+_Pending = Tuple[Dict[str, Any], "asyncio.Future[Dict[str, Any]]"]
+
+
+class OrderCoalescer:
+    """Merges ``create_order`` calls arriving within ``window`` seconds.
+
+    The first order opens a window; orders submitted before it closes (or
+    until ``max_batch`` accumulate) are sent as one signed ``batch-orders``
+    request and each caller gets its own order's response back. A lone order
+    still goes to the single-order endpoint. If the request fails, every
+    caller in the batch sees the exception.
+    """
+
+    def __init__(self, client: OKXClient, *, window: float = 0.002, max_batch: int = BATCH_ORDER_LIMIT) -> None:
+        self.client = client
+        self.window = window
+        self.max_batch = min(max_batch, BATCH_ORDER_LIMIT)
+        self.batches = 0
+        self.orders = 0
+        self._pending: List[_Pending] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._inflight: set[asyncio.Task[None]] = set()
+
+    async def submit(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Dict[str, Any]] = loop.create_future()
+        self._pending.append((payload, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    async def drain(self) -> None:
+        """Send whatever is pending now and wait for in-flight batches."""
+
+        self._flush()
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = asyncio.get_running_loop().create_task(self._send(batch))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _send(self, batch: List[_Pending]) -> None:
+        self.batches += 1
+        self.orders += len(batch)
+        try:
+            if len(batch) == 1:
+                responses = [await self.client.create_order(batch[0][0])]
+            else:
+                responses = await self.client.create_orders([payload for payload, _ in batch])
+        except Exception as exc:  # noqa: BLE001 - handed to every waiting caller
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), response in zip(batch, responses):
+            if not future.done():
+                future.set_result(response)
+
+
+__all__ = ["OrderCoalescer"]
@@ -0,0 +1,193 @@
+"""Pooled keep-alive HTTP transport for :class:`~services.order_manager.okx_client.OKXClient`."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+
+from services.api.monitoring.metrics import MetricsSink
+
+# Order round trips on a warm connection are sub-millisecond to tens of milliseconds.
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5,
+)
+PHASES = ("sign", "queue", "connect", "send", "receive", "total")
+WARM_PATH = "/api/v5/public/time"
+
+
+class OKXLatencyMetrics:
+    """Per-phase request latency histograms, ``<prefix>_<phase>_seconds``.
+
+    ``sign`` is observed by the client; ``queue`` (waiting for a pooled
+    connection), ``connect`` (TCP/TLS setup, zero on a reused connection),
+    ``send``, ``receive`` (first byte through the full body) and ``total``
+    come from the transport's connection trace.
+    """
+
+    def __init__(self, registry: MetricsSink, *, prefix: str = "okx_request") -> None:
+        self.phases = {phase: registry.histogram(f"{prefix}_{phase}_seconds", LATENCY_BUCKETS) for phase in PHASES}
+        self.errors = registry.counter(f"{prefix}_errors_total")
+        self.timeouts = registry.counter(f"{prefix}_timeouts_total")
+        self.new_connections = registry.counter(f"{prefix}_connections_opened_total")
+
+    def observe(self, phase: str, seconds: float) -> None:
+        self.phases[phase].observe(seconds)
+
+
+class _PhaseTrace:
+    """httpcore ``trace`` extension that timestamps the phases of one request."""
+
+    __slots__ = ("started", "first", "connect_start", "connect_end", "send_start", "send_end", "receive_start", "receive_end")
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.first: Optional[float] = None
+        self.connect_start: Optional[float] = None
+        self.connect_end: Optional[float] = None
+        self.send_start: Optional[float] = None
+        self.send_end: Optional[float] = None
+        self.receive_start: Optional[float] = None
+        self.receive_end: Optional[float] = None
+
+    async def __call__(self, name: str, info: Dict[str, Any]) -> None:
+        now = time.perf_counter()
+        if self.first is None:
+            self.first = now
+        # "http11.send_request_headers.started" -> "send_request_headers.started"; same for http2.
+        event = name.partition(".")[2]
+        if event == "connect_tcp.started":
+            self.connect_start = now
+        elif event in {"connect_tcp.complete", "start_tls.complete"}:
+            self.connect_end = now
+        elif event == "send_request_headers.started":
+            self.send_start = now
+        elif event == "send_request_body.complete":
+            self.send_end = now
+        elif event == "receive_response_headers.started":
+            self.receive_start = now
+        elif event == "receive_response_body.complete":
+            self.receive_end = now
+
+    def publish(self, metrics: OKXLatencyMetrics, finished: float) -> None:
+        first = self.first if self.first is not None else finished
+        metrics.observe("queue", first - self.started)
+        if self.connect_start is not None and self.connect_end is not None:
+            metrics.new_connections.inc()
+            metrics.observe("connect", self.connect_end - self.connect_start)
+        else:
+            metrics.observe("connect", 0.0)
+        if self.send_start is not None and self.send_end is not None:
+            metrics.observe("send", self.send_end - self.send_start)
+        if self.receive_start is not None:
+            metrics.observe("receive", (self.receive_end or finished) - self.receive_start)
+        metrics.observe("total", finished - self.started)
+
+
+class HTTPTransport:
+    """Async OKX transport over one persistent ``httpx`` connection pool.
+
+    Connections are kept alive and reused across orders, so only the first
+    request on each connection pays TCP/TLS setup; :meth:`warm` opens them up
+    front (``async with`` warms ``warm_connections``) so the first orders do
+    not either. Every request is bounded by ``timeout`` (an ``httpx.Timeout``
+    or seconds), overridable per call. ``http2=True`` multiplexes requests
+    over a single connection and needs the optional ``h2`` package.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        max_connections: int = 10,
+        max_keepalive: int = 10,
+        keepalive_expiry: float = 30.0,
+        timeout: httpx.Timeout | float = httpx.Timeout(5.0, connect=2.0, pool=1.0),
+        http2: bool = False,
+        warm_connections: int = 2,
+        metrics: Optional[OKXLatencyMetrics] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        self.timeout = timeout if isinstance(timeout, httpx.Timeout) else httpx.Timeout(timeout)
+        self.warm_connections = warm_connections
+        self.latency_metrics = metrics
+        self._client = client or httpx.AsyncClient(
+            base_url=base_url.rstrip("/"),
+            http2=http2,
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            headers={"Content-Type": "application/json"},
+        )
+
+    async def post(
+        self,
+        path: str,
+        headers: Dict[str, str],
+        body: str,
+        *,
+        timeout: httpx.Timeout | float | None = None,
+    ) -> Dict[str, Any]:
+        trace = _PhaseTrace()
+        try:
+            response = await self._client.post(
+                path,
+                content=body,
+                headers=headers,
+                timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout,
+                extensions={"trace": trace},
+            )
+            response.raise_for_status()
+        except httpx.TimeoutException:
+            if self.latency_metrics is not None:
+                self.latency_metrics.timeouts.inc()
+            raise
+        except httpx.HTTPError:
+            if self.latency_metrics is not None:
+                self.latency_metrics.errors.inc()
+            raise
+        if self.latency_metrics is not None:
+            trace.publish(self.latency_metrics, time.perf_counter())
+        return response.json()
+
+    async def warm(self, connections: Optional[int] = None, *, path: str = WARM_PATH) -> int:
+        """Open up to ``connections`` pooled connections with concurrent GETs; returns how many succeeded.
+
+        Failures are counted but not raised: a cold pool still works, it is
+        just slower for the first orders.
+        """
+
+        count = self.warm_connections if connections is None else connections
+
+        async def ping() -> bool:
+            trace = _PhaseTrace()
+            try:
+                response = await self._client.get(path, extensions={"trace": trace})
+            except httpx.HTTPError:
+                if self.latency_metrics is not None:
+                    self.latency_metrics.errors.inc()
+                return False
+            if self.latency_metrics is not None and trace.connect_end is not None:
+                self.latency_metrics.new_connections.inc()
+            return response.status_code < 500
+
+        results = await asyncio.gather(*(ping() for _ in range(count)))
+        return sum(results)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "HTTPTransport":
+        await self.warm()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+
+__all__ = ["HTTPTransport", "LATENCY_BUCKETS", "OKXLatencyMetrics", "PHASES"]
@@ -0,0 +1,104 @@
+"""Client order ids and a process-local duplicate-submission guard."""
+
+from __future__ import annotations
+
+import hashlib
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from services.api.repositories.events import OrderRepository
+    from services.order_manager.service import TradeSignal
+
+# server_default timestamps (CURRENT_TIMESTAMP) only have second resolution.
+REFRESH_OVERLAP = timedelta(seconds=1)
+
+
+def client_order_id(signal: "TradeSignal", *, prefix: str = "b") -> str:
+    """OKX ``clOrdId`` for ``signal``: a letter plus 31 hex digits.
+
+    With ``signal_id`` set, the id hashes it plus mode, instrument and side,
+    so every re-delivery of one upstream signal maps to one order. Without
+    it there is nothing to tell a retry from a new trade with the same
+    fields, so each call returns a fresh random id and nothing is deduplicated.
+    """
+
+    if not signal.signal_id:
+        return prefix + uuid.uuid4().hex[:31]
+    material = "|".join((signal.signal_id, signal.trading_mode, signal.asset, signal.side.lower()))
+    return prefix + hashlib.blake2b(material.encode(), digest_size=16).hexdigest()[:31]
+
+
+class IdempotencyIndex:
+    """Client order ids already sent or persisted, checked in O(1) before any network call.
+
+    Preload once from :meth:`OrderRepository.client_order_ids_since`, keep it
+    current with :meth:`refresh` (incremental on ``created_at``) and let an
+    ``OrderRepository`` constructed with ``order_index=`` remember the ids it
+    writes. The oldest entries are forgotten past ``max_entries``; the unique
+    ``orders.client_order_id`` constraint stays the backstop for those.
+    """
+
+    def __init__(self, *, max_entries: int = 100_000) -> None:
+        self.max_entries = max_entries
+        self._ids: OrderedDict[str, None] = OrderedDict()
+        self._watermark: Optional[datetime] = None
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, client_order_id: str) -> bool:
+        return client_order_id in self._ids
+
+    @property
+    def watermark(self) -> Optional[datetime]:
+        return self._watermark
+
+    def claim(self, client_order_id: str) -> bool:
+        """Record ``client_order_id``; False if it was already known (a duplicate)."""
+
+        if client_order_id in self._ids:
+            return False
+        self.remember(client_order_id)
+        return True
+
+    def release(self, client_order_id: str) -> None:
+        """Forget an id whose order is known not to have reached the exchange."""
+
+        self._ids.pop(client_order_id, None)
+
+    def remember(self, client_order_id: str, created_at: Optional[datetime] = None) -> None:
+        self._ids[client_order_id] = None
+        self._ids.move_to_end(client_order_id)
+        while len(self._ids) > self.max_entries:
+            self._ids.popitem(last=False)
+        if created_at is not None and (self._watermark is None or created_at > self._watermark):
+            self._watermark = created_at
+
+    async def preload(self, repo: OrderRepository, *, since: Optional[datetime] = None) -> int:
+        """Replace the index contents with orders created since ``since`` (all when None)."""
+
+        rows = await repo.client_order_ids_since(since)
+        self.clear()
+        for order_id, created_at in rows:
+            self.remember(order_id, created_at)
+        return len(rows)
+
+    async def refresh(self, repo: OrderRepository) -> int:
+        """Add orders written since the last load, including by other processes."""
+
+        if self._watermark is None:
+            return await self.preload(repo)
+        rows = await repo.client_order_ids_since(self._watermark - REFRESH_OVERLAP)
+        for order_id, created_at in rows:
+            self.remember(order_id, created_at)
+        return len(rows)
+
+    def clear(self) -> None:
+        self._ids.clear()
+        self._watermark = None
+
+
+__all__ = ["IdempotencyIndex", "client_order_id"]
@@ -2,43 +2,143 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
-from typing import Dict
+import fcntl
+import mmap
+import os
+import struct
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Optional
 
+REASONS = ("manual", "drawdown", "technical", "regulatory")
+_BITS = {reason: 1 << index for index, reason in enumerate(REASONS)}
 
-@dataclass(slots=True)
+# byte 0: reason mask, bytes 8-15: generation (bumped on every write).
+_LAYOUT = struct.Struct("<B7xQ")
+
+
+@dataclass(slots=True, frozen=True)
 class KillSwitchState:
+    """Read-only view of the reasons; change them through :class:`KillSwitch`."""
+
     manual: bool = False
     drawdown: bool = False
     technical: bool = False
     regulatory: bool = False
 
 
+class SharedKillSwitchFlag:
+    """Reason mask in a memory-mapped file shared by every process that opens it.
+
+    Readers index one byte of the mapping, so checking the flag on every
+    order costs no syscall and sees another process's write as soon as the
+    page is updated. Writers take an ``flock`` around read-modify-write so
+    concurrent activations from different workers do not lose bits.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = os.fspath(path)
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if os.fstat(self._fd).st_size < _LAYOUT.size:
+                os.ftruncate(self._fd, _LAYOUT.size)
+            self._map = mmap.mmap(self._fd, _LAYOUT.size)
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+    @property
+    def mask(self) -> int:
+        return self._map[0]
+
+    def is_set(self) -> bool:
+        """True while any reason bit is set; one byte read, no lock."""
+
+        return self._map[0] != 0
+
+    @property
+    def generation(self) -> int:
+        return _LAYOUT.unpack_from(self._map)[1]
+
+    def update(self, set_bits: int = 0, clear_bits: int = 0) -> int:
+        """Apply ``(mask | set_bits) & ~clear_bits`` under the file lock; returns the new mask."""
+
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            mask, generation = _LAYOUT.unpack_from(self._map)
+            mask = (mask | set_bits) & ~clear_bits & 0xFF
+            _LAYOUT.pack_into(self._map, 0, mask, generation + 1)
+            return mask
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        if not self._map.closed:
+            self._map.close()
+            os.close(self._fd)
+
+
 class KillSwitch:
-    def __init__(self) -> None:
-        self.state = KillSwitchState()
-        self.actions: list[str] = []
+    """Halt flags kept as a bitmask with a cached ``active`` boolean.
+
+    :meth:`is_active` runs before every order, so it reads a plain attribute
+    (or one byte of ``shared``'s mapping) instead of inspecting the state
+    dataclass. ``actions`` keeps the last ``history`` activations. With
+    ``shared`` set, the mask lives in the shared file and every
+    ``KillSwitch`` opened on it halts and resumes together.
+    """
+
+    def __init__(self, *, shared: Optional[SharedKillSwitchFlag] = None, history: int = 1024) -> None:
+        self.shared = shared
+        self.actions: Deque[str] = deque(maxlen=history)
+        self._mask = 0
+        self._active = False
+
+    @property
+    def mask(self) -> int:
+        return self.shared.mask if self.shared is not None else self._mask
+
+    @property
+    def state(self) -> KillSwitchState:
+        mask = self.mask
+        return KillSwitchState(*(bool(mask & _BITS[reason]) for reason in REASONS))
+
+    @state.setter
+    def state(self, state: KillSwitchState) -> None:
+        mask = sum(bit for reason, bit in _BITS.items() if getattr(state, reason))
+        self._write(mask, ~mask & 0xFF)
 
     def activate(self, reason: str) -> Dict[str, bool]:
-        if hasattr(self.state, reason):
-            setattr(self.state, reason, True)
+        bit = _BITS.get(reason)
+        if bit is not None:
+            self._write(bit, 0)
         self.actions.append(reason)
         return self.status()
 
     def deactivate(self, reason: str | None = None) -> Dict[str, bool]:
-        if reason and hasattr(self.state, reason):
-            setattr(self.state, reason, False)
-        elif reason is None:
-            self.state = KillSwitchState()
+        if reason is None:
+            self._write(0, 0xFF)
+        elif reason in _BITS:
+            self._write(0, _BITS[reason])
         return self.status()
 
     def status(self) -> Dict[str, bool]:
-        state_dict = asdict(self.state)
-        state_dict["active"] = any(state_dict.values())
-        return state_dict
+        mask = self.mask
+        status = {reason: bool(mask & bit) for reason, bit in _BITS.items()}
+        status["active"] = mask != 0
+        return status
 
     def is_active(self) -> bool:
-        return any(asdict(self.state).values())
+        if self.shared is not None:
+            return self.shared.is_set()
+        return self._active
+
+    def _write(self, set_bits: int, clear_bits: int) -> None:
+        if self.shared is not None:
+            self._mask = self.shared.update(set_bits, clear_bits)
+        else:
+            self._mask = (self._mask | set_bits) & ~clear_bits
+        self._active = self._mask != 0
 
 
-__all__ = ["KillSwitch", "KillSwitchState"]
+__all__ = ["KillSwitch", "KillSwitchState", "SharedKillSwitchFlag"]
@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
-import base64
-import hashlib
-import hmac
 import json
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Protocol
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Protocol, Sequence
+
+from .signing import MonotonicClock, SigningContext
+
+if TYPE_CHECKING:
+    from .http_transport import OKXLatencyMetrics
 
 
 DEFAULT_BASE_URL = "https://www.okx.com"
+ORDER_PATH = "/api/v5/trade/order"
+BATCH_ORDERS_PATH = "/api/v5/trade/batch-orders"
+BATCH_ORDER_LIMIT = 20  # OKX rejects batch-orders requests with more entries
 
 
 @dataclass(slots=True)
@@ -46,37 +51,109 @@ class OKXClient:
         base_url: str = DEFAULT_BASE_URL,
         simulated: bool = True,
         transport: Optional[Transport] = None,
+        latency: Optional["OKXLatencyMetrics"] = None,
     ) -> None:
-        self.credentials = credentials
+        self._credentials = credentials
+        self._simulated = simulated
+        self._signing = SigningContext(credentials, simulated=simulated)
+        self.clock = MonotonicClock()
         self.base_url = base_url.rstrip("/")
-        self.simulated = simulated
         self.transport = transport or MemoryTransport()
+        # Share the transport's histograms so signing lands next to the network phases.
+        self.latency = latency if latency is not None else getattr(self.transport, "latency_metrics", None)
+
+    @property
+    def credentials(self) -> OKXCredentials:
+        return self._credentials
+
+    @credentials.setter
+    def credentials(self, credentials: OKXCredentials) -> None:
+        self._credentials = credentials
+        self._signing = SigningContext(credentials, simulated=self._simulated)
+
+    @property
+    def simulated(self) -> bool:
+        return self._simulated
+
+    @simulated.setter
+    def simulated(self, simulated: bool) -> None:
+        self._simulated = simulated
+        self._signing = SigningContext(self._credentials, simulated=simulated)
 
     async def create_order(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        return await self._post("/api/v5/trade/order", payload)
+        return await self._post(ORDER_PATH, payload)
 
-    async def _post(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    async def create_orders(self, payloads: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Place several orders through ``batch-orders``, one signed request per 20.
+
+        Returns one response per payload, in order, shaped like a
+        :meth:`create_order` response for that order alone.
+        """
+
+        results: List[Dict[str, Any]] = []
+        for start in range(0, len(payloads), BATCH_ORDER_LIMIT):
+            chunk = list(payloads[start : start + BATCH_ORDER_LIMIT])
+            response = await self._post(BATCH_ORDERS_PATH, chunk)
+            results.extend(split_batch_response(response, len(chunk)))
+        return results
+
+    async def _post(self, path: str, payload: Any) -> Dict[str, Any]:
+        started = time.perf_counter()
         body = json.dumps(payload, separators=(",", ":"))
         timestamp = self._timestamp()
-        signature = self._sign(timestamp, "POST", path, body)
-        headers = {
-            "OK-ACCESS-KEY": self.credentials.api_key,
-            "OK-ACCESS-PASSPHRASE": self.credentials.passphrase,
-            "OK-ACCESS-SIGN": signature,
-            "OK-ACCESS-TIMESTAMP": timestamp,
-        }
-        if self.simulated:
-            headers["x-simulated-trading"] = "1"
+        headers = self._signing.headers(timestamp, self._sign(timestamp, "POST", path, body))
+        if self.latency is not None:
+            self.latency.observe("sign", time.perf_counter() - started)
         return await self.transport.post(path, headers, body)
 
     def _sign(self, timestamp: str, method: str, path: str, body: str) -> str:
-        message = f"{timestamp}{method.upper()}{path}{body}".encode()
-        secret = self.credentials.secret_key.encode()
-        hash_digest = hmac.new(secret, message, hashlib.sha256).digest()
-        return base64.b64encode(hash_digest).decode()
+        return self._signing.sign(timestamp, method, path, body)
 
     def _timestamp(self) -> str:
-        return f"{time.time():.0f}"
-
-
-__all__ = ["OKXClient", "OKXCredentials", "MemoryTransport"]
+        return self.clock.iso()
+
+
+def split_batch_response(response: Dict[str, Any], count: int) -> List[Dict[str, Any]]:
+    """Per-order responses from one ``batch-orders`` response.
+
+    OKX returns one ``data`` entry per order, in request order, each with its
+    own ``sCode``/``sMsg``; those become that order's ``code``/``msg``. A
+    response without per-order entries (a request-level error) applies to
+    every order.
+    """
+
+    data = response.get("data")
+    if not isinstance(data, list) or len(data) != count:
+        return [response] * count
+    return [
+        {"code": entry.get("sCode", response.get("code")), "msg": entry.get("sMsg", response.get("msg", "")), "data": [entry]}
+        for entry in data
+    ]
+
+
+def order_rejection(response: Dict[str, Any]) -> Optional[str]:
+    """``"<code>: <msg>"`` when ``response`` reports the order as rejected, else None.
+
+    OKX answers a rejected order with HTTP 200 and the reason in the order's
+    ``sCode``/``sMsg`` (e.g. ``51008``, insufficient balance), so the first
+    ``data`` entry decides when present and the top-level ``code`` otherwise.
+    A response without any code counts as accepted.
+    """
+
+    data = response.get("data")
+    entry = data[0] if isinstance(data, list) and data and isinstance(data[0], dict) else {}
+    code = entry.get("sCode", response.get("code"))
+    if code is None or str(code) == "0":
+        return None
+    message = entry.get("sMsg") or response.get("msg") or ""
+    return f"{code}: {message}" if message else str(code)
+
+
+__all__ = [
+    "OKXClient",
+    "OKXCredentials",
+    "MemoryTransport",
+    "BATCH_ORDER_LIMIT",
+    "order_rejection",
+    "split_batch_response",
+]
@@ -0,0 +1,170 @@
+"""Concurrent order submission with per-instrument ordering."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Mapping, Optional
+
+from services.api.monitoring.metrics import MetricsSink
+from services.api.risk.monitor import PositionSnapshot
+from services.api.risk.policy import PortfolioState
+from services.order_manager.service import OrderManager, TradeSignal
+
+# Signal-to-ack latency spans policy checks plus one exchange round trip.
+PIPELINE_BUCKETS: tuple[float, ...] = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class PipelineMetrics:
+    """End-to-end and queueing latency plus occupancy for an :class:`OrderPipeline`."""
+
+    def __init__(self, registry: MetricsSink, *, prefix: str = "order_pipeline") -> None:
+        self.registry = registry
+        self.prefix = prefix
+        self.latency = registry.histogram(f"{prefix}_signal_to_ack_seconds", PIPELINE_BUCKETS)
+        self.queue_wait = registry.histogram(f"{prefix}_queue_seconds", PIPELINE_BUCKETS)
+        self.submitted = registry.counter(f"{prefix}_submitted_total")
+        self.accepted = registry.counter(f"{prefix}_accepted_total")
+        self.rejected = registry.counter(f"{prefix}_rejected_total")
+        self.errors = registry.counter(f"{prefix}_errors_total")
+
+    def occupancy(self, *, queued: int, in_flight: int, partitions: int) -> None:
+        self.registry.gauge(f"{self.prefix}_queued", queued)
+        self.registry.gauge(f"{self.prefix}_in_flight", in_flight)
+        self.registry.gauge(f"{self.prefix}_partitions", partitions)
+
+
+@dataclass(slots=True)
+class _Job:
+    signal: TradeSignal
+    portfolio: PortfolioState
+    positions: Mapping[str, PositionSnapshot] | None
+    exposures: Mapping[str, float] | None
+    future: "asyncio.Future[Dict[str, Any]]"
+    enqueued: float = field(default_factory=time.perf_counter)
+
+
+class OrderPipeline:
+    """Runs :meth:`OrderManager.submit_order` concurrently across instruments.
+
+    Each ``instId`` gets its own FIFO queue and worker, so orders on one
+    instrument are checked and sent strictly in submission order while
+    different instruments proceed in parallel. At most ``max_in_flight``
+    orders are inside ``submit_order`` at once, and :meth:`submit` waits
+    for room once an instrument has ``max_queue`` orders waiting. Workers
+    only live while their instrument has orders queued. Parallel orders do
+    not share one stale snapshot: the manager checks each against the
+    portfolio plus every order still being placed.
+    """
+
+    def __init__(
+        self,
+        manager: OrderManager,
+        *,
+        max_in_flight: int = 32,
+        max_queue: int = 256,
+        metrics: Optional[PipelineMetrics] = None,
+    ) -> None:
+        self.manager = manager
+        self.max_queue = max_queue
+        self.metrics = metrics
+        self.in_flight = 0
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._queues: Dict[str, asyncio.Queue[_Job]] = {}
+        self._workers: Dict[str, asyncio.Task[None]] = {}
+        self._closed = False
+
+    @property
+    def queued(self) -> int:
+        return sum(queue.qsize() for queue in self._queues.values())
+
+    async def submit(
+        self,
+        signal: TradeSignal,
+        portfolio: PortfolioState,
+        positions: Mapping[str, PositionSnapshot] | None,
+        exposures: Mapping[str, float] | None = None,
+    ) -> Dict[str, Any]:
+        """Queue ``signal`` behind earlier orders on its instrument and wait for its result."""
+
+        if self._closed:
+            raise RuntimeError("OrderPipeline is closed")
+        job = _Job(signal, portfolio, positions, exposures, asyncio.get_running_loop().create_future())
+        queue = self._queues.get(signal.asset)
+        if queue is None:
+            queue = self._queues[signal.asset] = asyncio.Queue(self.max_queue)
+        await queue.put(job)
+        if signal.asset not in self._workers:
+            self._workers[signal.asset] = asyncio.create_task(self._work(signal.asset, queue))
+        if self.metrics is not None:
+            self.metrics.submitted.inc()
+            self._publish()
+        return await job.future
+
+    async def drain(self) -> None:
+        """Wait until every queued order has been processed."""
+
+        for queue in list(self._queues.values()):
+            await queue.join()
+
+    async def close(self) -> None:
+        """Finish queued orders, then stop the workers."""
+
+        self._closed = True
+        await self.drain()
+        workers = list(self._workers.values())
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._workers.clear()
+
+    async def __aenter__(self) -> "OrderPipeline":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def _work(self, instrument: str, queue: "asyncio.Queue[_Job]") -> None:
+        # Exits as soon as its queue is empty; the next submit starts a fresh worker.
+        try:
+            while not queue.empty():
+                job = queue.get_nowait()
+                try:
+                    await self._run(job)
+                finally:
+                    queue.task_done()
+        finally:
+            # The queue stays registered so a submit blocked on a full queue keeps its place.
+            del self._workers[instrument]
+
+    async def _run(self, job: _Job) -> None:
+        async with self._slots:
+            started = time.perf_counter()
+            self.in_flight += 1
+            try:
+                result = await self.manager.submit_order(job.signal, job.portfolio, job.positions, job.exposures)
+            except Exception as exc:  # noqa: BLE001 - delivered to the caller awaiting this order
+                if self.metrics is not None:
+                    self.metrics.errors.inc()
+                if not job.future.done():
+                    job.future.set_exception(exc)
+                return
+            finally:
+                self.in_flight -= 1
+        if self.metrics is not None:
+            self.metrics.queue_wait.observe(started - job.enqueued)
+            self.metrics.latency.observe(time.perf_counter() - job.enqueued)
+            (self.metrics.accepted if result.get("success") else self.metrics.rejected).inc()
+            self._publish()
+        if not job.future.done():
+            job.future.set_result(result)
+
+    def _publish(self) -> None:
+        metrics = self.metrics
+        if metrics is None:
+            raise RuntimeError("OrderPipeline was built without metrics to publish to")
+        metrics.occupancy(queued=self.queued, in_flight=self.in_flight, partitions=len(self._workers))
+
+
+__all__ = ["OrderPipeline", "PipelineMetrics"]
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, Mapping, Optional
+import asyncio
+import itertools
+from dataclasses import dataclass, replace
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Sequence, cast
 
-from services.api.risk.monitor import PositionSnapshot, RiskMonitor
+from packages.telemetry.tracing import traced
+from services.api.risk.correlation import position_exposures
+from services.api.risk.monitor import IncrementalRiskMonitor, PositionSnapshot, RiskMetrics, RiskMonitor
 from services.api.risk.policy import PolicyEngine, PortfolioState, ProposedTrade
+from services.order_manager.coalescer import OrderCoalescer
+from services.order_manager.idempotency import IdempotencyIndex, client_order_id
 from services.order_manager.killswitch import KillSwitch
-from services.order_manager.okx_client import OKXClient
+from services.order_manager.okx_client import OKXClient, order_rejection
 from services.order_manager.telemetry import TelemetryRecorder
 
 
@@ -22,6 +28,12 @@ class TradeSignal:
     rr_ratio: float
     wallet_credibility: float
     quantity: float
+    signal_id: Optional[str] = None  # upstream event id; keeps client order ids stable across re-deliveries
+    correlation_bucket: Optional[str] = None  # same key as ``PositionSnapshot.correlation_bucket``; defaults to asset
+
+    @property
+    def bucket(self) -> str:
+        return self.correlation_bucket or self.asset
 
 
 class OrderManager:
@@ -32,53 +44,243 @@ class OrderManager:
         risk_monitor: RiskMonitor,
         kill_switch: KillSwitch,
         telemetry: Optional[TelemetryRecorder] = None,
+        *,
+        coalesce_window: Optional[float] = None,
+        idempotency: Optional[IdempotencyIndex] = None,
     ) -> None:
         self.okx_client = okx_client
         self.policy_engine = policy_engine
         self.risk_monitor = risk_monitor
         self.kill_switch = kill_switch
-        self.telemetry = telemetry or TelemetryRecorder()
+        self.telemetry = telemetry if telemetry is not None else TelemetryRecorder()
+        # With a window (seconds), orders placed concurrently share one batch-orders request.
+        self.coalescer = OrderCoalescer(okx_client, window=coalesce_window) if coalesce_window is not None else None
+        # With an index, a signal whose client order id was already sent is rejected before any check or I/O.
+        self.idempotency = idempotency
+        # Accepted orders whose placement has not settled; later checks count them as filled.
+        self._in_flight: Dict[int, TradeSignal] = {}
+        self._tickets = itertools.count()
+        correlation = policy_engine.correlation
+        if correlation is not None and isinstance(risk_monitor, IncrementalRiskMonitor) and risk_monitor.exposures is None:
+            # The tracked book drives the correlation engine's exposures as positions open and close.
+            correlation.set_exposures(position_exposures(risk_monitor.positions.values()))
+            risk_monitor.exposures = correlation
 
+    @traced("order.submit_order")
     async def submit_order(
         self,
         signal: TradeSignal,
         portfolio: PortfolioState,
-        positions: Mapping[str, PositionSnapshot],
+        positions: Mapping[str, PositionSnapshot] | None,
         exposures: Mapping[str, float] | None = None,
     ) -> Dict[str, Any]:
         if self.kill_switch.is_active():
             return {"success": False, "reason": "kill_switch_active"}
 
-        trade = ProposedTrade(
-            trading_mode=signal.trading_mode,
-            asset=signal.asset,
-            side=signal.side,
-            size_percent=signal.size_percent,
-            leverage=signal.leverage,
-            rr_ratio=signal.rr_ratio,
-            wallet_credibility=signal.wallet_credibility,
-        )
-        passed, details = self.policy_engine.validate(trade, portfolio, exposures or {})
-        if not passed:
+        order_id = client_order_id(signal)
+        if self.idempotency is not None and order_id in self.idempotency:
+            return _duplicate(order_id)
+
+        self._sync_exposures(positions)
+        metrics = self._risk_metrics(positions)
+        alerts = metrics.alerts
+        if self._in_flight:  # orders other calls are still placing count as filled
+            book = self._projected_book(portfolio, positions, metrics, exposures)
+            portfolio, exposures = book.portfolio, book.exposures_for(signal.side)
+            alerts = self.risk_monitor.check_alerts(*book.metrics())
+        trade = _proposed_trade(signal)
+        if self.policy_engine.first_failure(trade, portfolio, exposures) is not None:
+            _, details = self.policy_engine.validate(trade, portfolio, exposures)
             return {"success": False, "reason": "policy_rejected", "details": details}
 
-        metrics = self.risk_monitor.get_metrics(positions.values())
-        if any(level == "CRITICAL" for level, _ in metrics.alerts):
-            return {"success": False, "reason": "risk_alert", "alerts": metrics.alerts}
+        if any(level == "CRITICAL" for level, _ in alerts):
+            return {"success": False, "reason": "risk_alert", "alerts": alerts}
 
-        payload = self._build_payload(signal)
+        if self.idempotency is not None and not self.idempotency.claim(order_id):
+            return _duplicate(order_id)  # a concurrent submission of the same signal got here first
+        payload = self._build_payload(signal, order_id)
+        ticket = self._hold(signal)
         try:
-            response = await self.okx_client.create_order(payload)
+            # The audit sink is behind and the recorder asked for backpressure; if it stays
+            # behind for block_timeout the order is refused rather than sent unaudited.
+            if self.telemetry.saturated and not await self.telemetry.wait_for_capacity():
+                if self.idempotency is not None:
+                    self.idempotency.release(order_id)
+                return _backpressure()
+            response = await self._place(payload)
+            rejection = order_rejection(response)
+            if rejection is not None:
+                self.telemetry.record_failure(payload, rejection)
+                return {"success": False, "reason": "order_failed", "error": rejection, "response": response}
             self.telemetry.record_success(payload, response)
             return {"success": True, "response": response}
         except Exception as exc:  # pragma: no cover
             self.telemetry.record_failure(payload, str(exc))
             raise
+        finally:
+            self._release(ticket)
+
+    async def submit_batch(
+        self,
+        signals: Sequence[TradeSignal],
+        portfolio: PortfolioState,
+        positions: Mapping[str, PositionSnapshot] | None,
+        exposures: Mapping[str, float] | None = None,
+        *,
+        priority: Callable[[TradeSignal], float] = lambda signal: signal.wallet_credibility,
+    ) -> List[Dict[str, Any]]:
+        """Validate and place several signals against one projected portfolio.
+
+        Risk metrics are computed once. Candidates are then checked in
+        descending ``priority`` (wallet credibility by default), and every
+        accepted trade is added to the projected portfolio, exposures and
+        risk budget before the next candidate is checked, so later signals
+        cannot spend risk that earlier ones already took. Orders other calls
+        are still placing count as filled too. A new trade counts
+        ``size_percent`` toward risk, exposure and its correlation bucket
+        (``TradeSignal.bucket``, keyed like the positions' buckets). Results
+        are returned in input order, shaped like :meth:`submit_order` results.
+        """
+
+        if not signals:
+            return []
+        if self.kill_switch.is_active():
+            return [{"success": False, "reason": "kill_switch_active"} for _ in signals]
+
+        self._sync_exposures(positions)
+        metrics = self._risk_metrics(positions)
+        if any(level == "CRITICAL" for level, _ in metrics.alerts):
+            return [{"success": False, "reason": "risk_alert", "alerts": metrics.alerts} for _ in signals]
+
+        book = self._projected_book(portfolio, positions, metrics, exposures)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(signals)
+        accepted: List[int] = []
+        order_ids: Dict[int, str] = {}
+        tickets: List[int] = []
+        for index in sorted(range(len(signals)), key=lambda i: (-priority(signals[i]), i)):
+            signal = signals[index]
+            order_id = client_order_id(signal)
+            if self.idempotency is not None and order_id in self.idempotency:
+                results[index] = _duplicate(order_id)
+                continue
+            trade = _proposed_trade(signal)
+            projected_exposures = book.exposures_for(signal.side)
+            if self.policy_engine.first_failure(trade, book.portfolio, projected_exposures) is not None:
+                _, details = self.policy_engine.validate(trade, book.portfolio, projected_exposures)
+                results[index] = {"success": False, "reason": "policy_rejected", "details": details}
+                continue
+            alerts = self.risk_monitor.check_alerts(*book.metrics_with(signal))
+            if any(level == "CRITICAL" for level, _ in alerts):
+                results[index] = {"success": False, "reason": "risk_alert", "alerts": alerts}
+                continue
+            if self.idempotency is not None:
+                self.idempotency.claim(order_id)
+            book.add(signal)
+            tickets.append(self._hold(signal))
+            accepted.append(index)
+            order_ids[index] = order_id
+
+        try:
+            payloads = [self._build_payload(signals[index], order_ids[index]) for index in accepted]
+            if payloads and self.telemetry.saturated and not await self.telemetry.wait_for_capacity():
+                for index in accepted:
+                    if self.idempotency is not None:
+                        self.idempotency.release(order_ids[index])
+                    results[index] = _backpressure()
+                accepted, payloads = [], []
+            if self.coalescer is not None:
+                outcomes = await asyncio.gather(*(self._place(payload) for payload in payloads), return_exceptions=True)
+            else:
+                outcomes = [await _settle(self._place(payload)) for payload in payloads]
+        finally:
+            for ticket in tickets:
+                self._release(ticket)
+        for index, payload, outcome in zip(accepted, payloads, outcomes):
+            if isinstance(outcome, BaseException):  # reported per signal; the rest of the batch still went out
+                self.telemetry.record_failure(payload, str(outcome))
+                results[index] = {"success": False, "reason": "order_failed", "error": str(outcome)}
+                continue
+            rejection = order_rejection(outcome)
+            if rejection is not None:
+                self.telemetry.record_failure(payload, rejection)
+                results[index] = {"success": False, "reason": "order_failed", "error": rejection, "response": outcome}
+                continue
+            self.telemetry.record_success(payload, outcome)
+            results[index] = {"success": True, "response": outcome}
+        missing = [index for index, result in enumerate(results) if result is None]
+        if missing:
+            raise RuntimeError(f"submit_batch produced no result for signals {missing}")
+        return cast(List[Dict[str, Any]], results)
+
+    async def _place(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        if self.coalescer is not None:
+            return await self.coalescer.submit(payload)
+        return await self.okx_client.create_order(payload)
+
+    def _sync_exposures(self, positions: Mapping[str, PositionSnapshot] | None) -> None:
+        """Point the correlation engine at ``positions``; a tracked book keeps it current by itself."""
+
+        correlation = self.policy_engine.correlation
+        if correlation is not None and positions is not None:
+            correlation.set_exposures(position_exposures(positions.values()))
+
+    def _hold(self, signal: TradeSignal) -> int:
+        """Count an accepted order as filled, here and in the correlation engine, until :meth:`_release`.
+
+        Filled orders come back through the positions, not from here.
+        """
+
+        ticket = next(self._tickets)
+        self._in_flight[ticket] = signal
+        correlation = self.policy_engine.correlation
+        if correlation is not None:
+            correlation.reserve(signal.asset, _signed_size(signal))
+        return ticket
+
+    def _release(self, ticket: int) -> None:
+        signal = self._in_flight.pop(ticket)
+        correlation = self.policy_engine.correlation
+        if correlation is not None:
+            correlation.release(signal.asset, _signed_size(signal))
+
+    def _projected_book(
+        self,
+        portfolio: PortfolioState,
+        positions: Mapping[str, PositionSnapshot] | None,
+        metrics: RiskMetrics,
+        exposures: Mapping[str, float] | None,
+    ) -> _ProjectedBook:
+        book = _ProjectedBook(portfolio, self._bucket_totals(positions), metrics, exposures or {})
+        for signal in self._in_flight.values():
+            book.add(signal)
+        return book
+
+    def _risk_metrics(self, positions: Mapping[str, PositionSnapshot] | None) -> RiskMetrics:
+        """Metrics for ``positions``, or for the monitor's own book when it tracks one."""
+
+        if positions is None:
+            return self._tracked_book().metrics()
+        return self.risk_monitor.get_metrics(positions.values())
 
-    def _build_payload(self, signal: TradeSignal) -> Dict[str, Any]:
+    def _bucket_totals(self, positions: Mapping[str, PositionSnapshot] | None) -> Dict[str, float]:
+        if positions is None:
+            return self._tracked_book().bucket_totals()
+        totals: Dict[str, float] = {}
+        for position in positions.values():
+            bucket = position.correlation_bucket
+            totals[bucket] = totals.get(bucket, 0.0) + abs(position.size)
+        return totals
+
+    def _tracked_book(self) -> IncrementalRiskMonitor:
+        if not isinstance(self.risk_monitor, IncrementalRiskMonitor):
+            raise ValueError("positions are required unless the risk monitor tracks them")
+        return self.risk_monitor
+
+    def _build_payload(self, signal: TradeSignal, order_id: str) -> Dict[str, Any]:
         side = signal.side.lower()
         ord_type = "market"
         return {
+            "clOrdId": order_id,
             "instId": signal.asset,
             "tdMode": "cross",
             "side": side,
@@ -87,4 +289,87 @@ class OrderManager:
         }
 
 
+class _ProjectedBook:
+    """Portfolio state, exposures and risk totals as if accepted and in-flight trades were filled."""
+
+    def __init__(
+        self,
+        portfolio: PortfolioState,
+        buckets: Mapping[str, float],
+        metrics: RiskMetrics,
+        exposures: Mapping[str, float],
+    ) -> None:
+        self.portfolio = replace(portfolio)
+        self.base_exposures = dict(exposures)
+        self.batch_same: Dict[str, float] = {}
+        self.exposure = metrics.total_exposure
+        self.risk = metrics.risk_consumed
+        self.drawdown = metrics.current_drawdown
+        self.buckets: Dict[str, float] = dict(buckets)
+
+    def exposures_for(self, side: str) -> Mapping[str, float]:
+        taken = self.batch_same.get(side.lower(), 0.0)
+        if not taken:
+            return self.base_exposures
+        return {**self.base_exposures, "batch_same": taken}
+
+    def metrics(self) -> tuple[float, float, float, float]:
+        """``check_alerts`` arguments for the projected book."""
+
+        return self.exposure, self.risk, self.drawdown, max(self.buckets.values(), default=0.0)
+
+    def metrics_with(self, signal: TradeSignal) -> tuple[float, float, float, float]:
+        """``check_alerts`` arguments after adding ``signal``."""
+
+        size = abs(signal.size_percent)
+        bucket = self.buckets.get(signal.bucket, 0.0) + size
+        correlation = max(max(self.buckets.values(), default=0.0), bucket)
+        return self.exposure + size, self.risk + size, self.drawdown, correlation
+
+    def add(self, signal: TradeSignal) -> None:
+        size = abs(signal.size_percent)
+        side = signal.side.lower()
+        self.batch_same[side] = self.batch_same.get(side, 0.0) + size
+        self.exposure += size
+        self.risk += size
+        bucket = signal.bucket
+        self.buckets[bucket] = self.buckets.get(bucket, 0.0) + size
+        portfolio = self.portfolio
+        portfolio.open_positions += 1
+        portfolio.daily_trades += 1
+        portfolio.total_risk += size
+        portfolio.correlation_risk = max(portfolio.correlation_risk, self.buckets[bucket])
+
+
+def _duplicate(order_id: str) -> Dict[str, Any]:
+    return {"success": False, "reason": "duplicate_order", "client_order_id": order_id}
+
+
+def _backpressure() -> Dict[str, Any]:
+    return {"success": False, "reason": "telemetry_backpressure"}
+
+
+async def _settle(call: Awaitable[Dict[str, Any]]) -> Dict[str, Any] | BaseException:
+    try:
+        return await call
+    except Exception as exc:  # noqa: BLE001 - returned like gather(return_exceptions=True)
+        return exc
+
+
+def _signed_size(signal: TradeSignal) -> float:
+    return signal.size_percent if signal.side.lower() in {"buy", "long"} else -signal.size_percent
+
+
+def _proposed_trade(signal: TradeSignal) -> ProposedTrade:
+    return ProposedTrade(
+        trading_mode=signal.trading_mode,
+        asset=signal.asset,
+        side=signal.side,
+        size_percent=signal.size_percent,
+        leverage=signal.leverage,
+        rr_ratio=signal.rr_ratio,
+        wallet_credibility=signal.wallet_credibility,
+    )
+
+
 __all__ = ["OrderManager", "TradeSignal"]
@@ -0,0 +1,106 @@
+"""Request signing state for OKX built once per credentials."""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import time
+from typing import TYPE_CHECKING, Callable, Dict
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .okx_client import OKXCredentials
+
+
+class MonotonicClock:
+    """Wall-clock milliseconds advanced by ``time.monotonic_ns`` from one anchor.
+
+    A wall-clock step (NTP correction, manual change) is only picked up when
+    the anchor is re-taken every ``reanchor_seconds``, so timestamps can move
+    backwards then, by the size of the step. OKX checks each timestamp against
+    its own clock (30 second window), so following a correction matters more
+    than never issuing an earlier value; re-anchoring also keeps slow drift
+    well inside that window.
+    :meth:`iso` caches the per-second ``strftime`` prefix and the string for
+    the current millisecond, so bursts of requests format nothing.
+    """
+
+    __slots__ = ("_reanchor_ns", "_wall", "_monotonic", "_wall_ns", "_mono_ns", "_second", "_prefix", "_ms", "_iso")
+
+    def __init__(
+        self,
+        *,
+        reanchor_seconds: float = 300.0,
+        wall: Callable[[], int] = time.time_ns,
+        monotonic: Callable[[], int] = time.monotonic_ns,
+    ) -> None:
+        self._reanchor_ns = int(reanchor_seconds * 1_000_000_000)
+        self._wall = wall
+        self._monotonic = monotonic
+        self._second = -1
+        self._prefix = ""
+        self._ms = -1
+        self._iso = ""
+        self.anchor()
+
+    def anchor(self) -> None:
+        self._wall_ns = self._wall()
+        self._mono_ns = self._monotonic()
+
+    def now_ms(self) -> int:
+        elapsed = self._monotonic() - self._mono_ns
+        if elapsed > self._reanchor_ns:
+            self.anchor()
+            elapsed = 0
+        return (self._wall_ns + elapsed) // 1_000_000
+
+    def iso(self) -> str:
+        """``2024-01-01T00:00:00.123Z``, the ``OK-ACCESS-TIMESTAMP`` format."""
+
+        ms = self.now_ms()
+        if ms == self._ms:
+            return self._iso
+        second = ms // 1000
+        if second != self._second:
+            self._second = second
+            self._prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        self._ms = ms
+        self._iso = f"{self._prefix}.{ms - second * 1000:03d}Z"
+        return self._iso
+
+
+class SigningContext:
+    """Keyed HMAC-SHA256 state and constant headers for one set of credentials.
+
+    The secret is keyed into one ``hmac`` object up front; a signature
+    copies it and hashes only the message, which skips the key schedule
+    ``hmac.new`` repeats on every call. The key, passphrase and
+    simulated-trading headers are built up front, so a request only adds
+    its signature and timestamp.
+    """
+
+    __slots__ = ("_mac", "_headers")
+
+    def __init__(self, credentials: OKXCredentials, *, simulated: bool = True) -> None:
+        self._mac = hmac.new(credentials.secret_key.encode(), digestmod=hashlib.sha256)
+        headers = {
+            "OK-ACCESS-KEY": credentials.api_key,
+            "OK-ACCESS-PASSPHRASE": credentials.passphrase,
+        }
+        if simulated:
+            headers["x-simulated-trading"] = "1"
+        self._headers = headers
+
+    def sign(self, timestamp: str, method: str, path: str, body: str) -> str:
+        mac = self._mac.copy()
+        mac.update(f"{timestamp}{method.upper()}{path}{body}".encode())
+        return base64.b64encode(mac.digest()).decode()
+
+    def headers(self, timestamp: str, signature: str) -> Dict[str, str]:
+        headers = self._headers.copy()
+        headers["OK-ACCESS-SIGN"] = signature
+        headers["OK-ACCESS-TIMESTAMP"] = timestamp
+        return headers
+
+
+__all__ = ["MonotonicClock", "SigningContext"]
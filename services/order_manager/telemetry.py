@@ -2,9 +2,27 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Literal, Optional, Protocol, Sequence, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from packages.db.models import AuditLog
+from packages.telemetry.tracing import trace_id_var
+from services.api.monitoring.metrics import MetricsSink
+
+OverflowPolicy = Literal["drop_oldest", "drop_newest", "block"]
+OVERFLOW_POLICIES: tuple[str, ...] = ("drop_oldest", "drop_newest", "block")
+
+# (unix seconds, status, payload, response, error, trace id); built into an ExecutionEvent off the hot path.
+_Record = Tuple[float, str, Dict[str, Any], Optional[Dict[str, Any]], Optional[str], str]
 
 
 @dataclass(slots=True)
@@ -14,40 +32,346 @@ class ExecutionEvent:
     payload: Dict[str, Any]
     response: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
+    trace_id: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "timestamp": self.timestamp.isoformat(),
+            "status": self.status,
+            "payload": self.payload,
+            "response": self.response,
+            "error": self.error,
+            "trace_id": self.trace_id,
+        }
+
+
+def _event(record: _Record) -> ExecutionEvent:
+    timestamp, status, payload, response, error, trace_id = record
+    return ExecutionEvent(
+        timestamp=datetime.fromtimestamp(timestamp, timezone.utc),
+        status=status,
+        payload=payload,
+        response=response,
+        error=error,
+        trace_id=trace_id or None,
+    )
+
+
+class TelemetrySink(Protocol):
+    async def write(self, events: Sequence[ExecutionEvent]) -> None: ...
 
 
 class TelemetryRecorder:
-    """Collects execution events for auditing and monitoring."""
+    """Collects execution events for auditing and monitoring.
 
-    def __init__(self) -> None:
-        self._events: List[ExecutionEvent] = []
+    Events land in a preallocated ring of ``capacity`` slots as plain tuples;
+    ``events`` returns the most recent ones, oldest first. With a ``sink``,
+    a background task started by :meth:`start` (or ``async with``) writes
+    unflushed events in batches of up to ``batch_size`` every
+    ``flush_interval`` seconds, or sooner once a batch has filled.
+
+    When the sink falls ``capacity`` events behind, ``overflow`` decides:
+    ``drop_oldest`` overwrites the oldest unflushed event, ``drop_newest``
+    discards the new one, and ``block`` holds up to ``max_overflow`` more
+    events (default ``capacity``) and sets ``saturated`` so producers can
+    ``await`` :meth:`wait_for_capacity`, which gives up after
+    ``block_timeout`` seconds; past ``max_overflow`` new events are discarded.
+    Lost events are counted in ``dropped``. A batch the sink fails to write
+    (see ``last_error``) is dropped under the ``drop_*`` policies; under
+    ``block`` it is kept and written again first, with the flusher backing
+    off from ``retry_delay`` doubling up to ``max_retry_delay`` seconds.
+    """
+
+    def __init__(
+        self,
+        *,
+        capacity: int = 10_000,
+        sink: Optional[TelemetrySink] = None,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        overflow: OverflowPolicy = "drop_oldest",
+        metrics: Optional[MetricsSink] = None,
+        prefix: str = "execution_telemetry",
+        retry_delay: float = 0.1,
+        max_retry_delay: float = 30.0,
+        max_overflow: Optional[int] = None,
+        block_timeout: float = 5.0,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}")
+        if overflow == "block" and sink is None:
+            raise ValueError("the block overflow policy needs a sink to drain the buffer")
+        if max_overflow is not None and max_overflow < 0:
+            raise ValueError("max_overflow must not be negative")
+        self.capacity = capacity
+        self.sink = sink
+        self.batch_size = min(batch_size, capacity)
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.max_overflow = capacity if max_overflow is None else max_overflow
+        self.block_timeout = block_timeout
+        self.dropped = 0
+        self.flushed = 0
+        self.saturated = False
+        self.capacity_timeouts = 0
+        self.last_error: Optional[str] = None
+        self._slots: List[Optional[_Record]] = [None] * capacity
+        self._written = 0  # sequence number of the next slot
+        self._start = 0  # oldest sequence still visible through ``events``
+        self._cursor = 0  # oldest sequence not yet handed to the sink
+        self._overflow: Deque[_Record] = deque()
+        self._retry: List[_Record] = []  # a failed batch held for rewriting under ``block``
+        self._failures = 0  # consecutive failed writes
+        self._wakeup: Optional[asyncio.Event] = None
+        self._space: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task[None]] = None
+        self._dropped_counter = metrics.counter(f"{prefix}_dropped_total") if metrics is not None else None
+        self._flushed_counter = metrics.counter(f"{prefix}_flushed_total") if metrics is not None else None
+
+    @property
+    def pending(self) -> int:
+        """Events recorded but not yet handed to the sink."""
+
+        if self.sink is None:
+            return 0
+        return self._written - self._cursor + len(self._overflow) + len(self._retry)
 
     def record_success(self, payload: Dict[str, Any], response: Dict[str, Any]) -> None:
-        self._events.append(
-            ExecutionEvent(
-                timestamp=datetime.now(timezone.utc),
-                status="success",
-                payload=payload,
-                response=response,
-            )
-        )
+        self._write((time.time(), "success", payload, response, None, trace_id_var.get()))
 
     def record_failure(self, payload: Dict[str, Any], error: str) -> None:
-        self._events.append(
-            ExecutionEvent(
-                timestamp=datetime.now(timezone.utc),
-                status="failure",
-                payload=payload,
-                error=error,
-            )
-        )
+        self._write((time.time(), "failure", payload, None, error, trace_id_var.get()))
 
     @property
     def events(self) -> List[ExecutionEvent]:
-        return list(self._events)
+        records = [self._slots[seq % self.capacity] for seq in range(self._start, self._written)]
+        records.extend(self._overflow)
+        return [_event(record) for record in records if record is not None]
 
     def clear(self) -> None:
-        self._events.clear()
+        """Forget the visible history; events still waiting for the sink are kept."""
+
+        self._start = self._written
+
+    async def flush(self) -> int:
+        """Write every pending event to the sink now; returns how many were written."""
+
+        written = 0
+        while self.sink is not None and self.pending:
+            batch, self._retry = self._retry or self._take(self.batch_size), []
+            events = [_event(record) for record in batch]
+            try:
+                await self.sink.write(events)
+            except asyncio.CancelledError:
+                self._retry = batch  # interrupted mid-write (close, a producer timing out); write it again next time
+                raise
+            except Exception as exc:  # noqa: BLE001 - recorded on the recorder, never raised into the flusher
+                self.last_error = f"{type(exc).__name__}: {exc}"
+                self._failures += 1
+                if self.overflow == "block":
+                    self._retry = batch  # keep it; the caller backs off before the next attempt
+                    break
+                self._drop(len(events))
+                continue
+            self._failures = 0
+            written += len(events)
+            self.flushed += len(events)
+            if self._flushed_counter is not None:
+                self._flushed_counter.inc(len(events))
+        return written
+
+    def start(self) -> None:
+        """Start the background flusher on the running loop (no-op without a sink)."""
+
+        if self.sink is None or self._task is not None:
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop the flusher and write whatever is still pending."""
+
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        await self.flush()
+
+    async def wait_for_capacity(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the sink has caught up below ``capacity`` (``block`` policy).
+
+        Returns False once ``timeout`` (default ``block_timeout``) seconds pass
+        without room freeing up, so a stalled sink cannot hold producers forever.
+        """
+
+        if not self.saturated:
+            return True
+        try:
+            await asyncio.wait_for(self._until_capacity(), self.block_timeout if timeout is None else timeout)
+        except asyncio.TimeoutError:
+            self.capacity_timeouts += 1
+            return False
+        return True
+
+    async def _until_capacity(self) -> None:
+        while self.saturated:
+            if self._task is None:
+                await self.flush()
+                if self._failures:
+                    await asyncio.sleep(self._backoff())
+                continue
+            if self._space is None:
+                self._space = asyncio.Event()
+            if self._wakeup is not None:
+                self._wakeup.set()
+            await self._space.wait()
+
+    async def __aenter__(self) -> "TelemetryRecorder":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    def _write(self, record: _Record) -> None:
+        if self.sink is not None:
+            pending = self._written - self._cursor
+            if pending >= self.capacity or self._overflow:
+                if self.overflow == "drop_newest":
+                    self._drop(1)
+                    return
+                if self.overflow == "block":
+                    self.saturated = True
+                    if len(self._overflow) >= self.max_overflow:
+                        self._drop(1)
+                        return
+                    self._overflow.append(record)
+                    return
+                self._cursor += 1
+                self._drop(1)
+            elif pending + 1 >= self.batch_size and self._wakeup is not None:
+                self._wakeup.set()
+        self._store(record)
+
+    def _store(self, record: _Record) -> None:
+        self._slots[self._written % self.capacity] = record
+        self._written += 1
+        if self._written - self._start > self.capacity:
+            self._start = self._written - self.capacity
+
+    def _take(self, limit: int) -> List[_Record]:
+        end = min(self._written, self._cursor + limit)
+        batch = [self._slots[seq % self.capacity] for seq in range(self._cursor, end)]
+        self._cursor = end
+        # Records held back under ``block`` move into the ring as room frees up.
+        while self._overflow and self._written - self._cursor < self.capacity:
+            self._store(self._overflow.popleft())
+        if self.saturated and not self._overflow and self._written - self._cursor < self.capacity:
+            self.saturated = False
+            if self._space is not None:
+                self._space.set()
+                self._space = None
+        return [record for record in batch if record is not None]
+
+    def _drop(self, count: int) -> None:
+        self.dropped += count
+        if self._dropped_counter is not None:
+            self._dropped_counter.inc(count)
+
+    async def _run(self) -> None:
+        wakeup = self._wakeup
+        if wakeup is None:
+            raise RuntimeError("the telemetry flusher must be started through start()")
+        while True:
+            if self._failures:
+                await asyncio.sleep(self._backoff())  # a failing sink is not retried on every wakeup
+            else:
+                try:
+                    await asyncio.wait_for(wakeup.wait(), self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+            wakeup.clear()
+            await self.flush()
+
+    def _backoff(self) -> float:
+        return min(self.max_retry_delay, self.retry_delay * 2 ** (self._failures - 1))
+
+
+class AuditLogSink:
+    """Writes execution events to ``audit_logs`` with one multi-row insert per batch."""
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession], *, entity_type: str = "order") -> None:
+        self.session_factory = session_factory
+        self.entity_type = entity_type
+
+    async def write(self, events: Sequence[ExecutionEvent]) -> None:
+        if not events:
+            return
+        rows = [
+            {
+                "timestamp": event.timestamp,
+                "action": f"{self.entity_type}_{event.status}",
+                "entity_type": self.entity_type,
+                "entity_id": _entity_id(event.payload),
+                "new_value": {"payload": event.payload, "response": event.response, "error": event.error},
+                "trace_id": event.trace_id,
+            }
+            for event in events
+        ]
+        async with self.session_factory() as session:
+            await session.execute(insert(AuditLog), rows)
+            await session.commit()
+
+
+def _entity_id(payload: Dict[str, Any]) -> Optional[str]:
+    value = payload.get("clOrdId")
+    return str(value)[:36] if value else None
+
+
+class RotatingFileSink:
+    """Appends events as JSON lines, rolling ``path`` to ``path.1`` … ``path.<backups>`` past ``max_bytes``."""
+
+    def __init__(self, path: str | os.PathLike[str], *, max_bytes: int = 64 * 1024 * 1024, backups: int = 5) -> None:
+        self.path = os.fspath(path)
+        self.max_bytes = max_bytes
+        self.backups = backups
+
+    async def write(self, events: Sequence[ExecutionEvent]) -> None:
+        if not events:
+            return
+        data = "".join(json.dumps(event.to_dict(), default=str) + "\n" for event in events)
+        await asyncio.to_thread(self._append, data.encode())
+
+    def _append(self, data: bytes) -> None:
+        try:
+            size = os.path.getsize(self.path)
+        except FileNotFoundError:
+            size = 0
+        if size and size + len(data) > self.max_bytes:
+            self._rotate()
+        with open(self.path, "ab") as handle:
+            handle.write(data)
+
+    def _rotate(self) -> None:
+        if self.backups < 1:
+            os.remove(self.path)
+            return
+        for index in range(self.backups - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        os.replace(self.path, f"{self.path}.1")
 
 
-__all__ = ["TelemetryRecorder", "ExecutionEvent"]
+__all__ = [
+    "TelemetryRecorder",
+    "ExecutionEvent",
+    "TelemetrySink",
+    "AuditLogSink",
+    "RotatingFileSink",
+    "OVERFLOW_POLICIES",
+]
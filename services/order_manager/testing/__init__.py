@@ -0,0 +1,13 @@
+"""OKX test doubles shared by the test suite and the benchmarks; not imported by the order manager itself."""
+
+from .simulator import OKXSimulator, OKXSimulatorError, SimOrder, SimulatorConfig
+from .stub_server import StubOKXServer, StubRequest
+
+__all__ = [
+    "OKXSimulator",
+    "OKXSimulatorError",
+    "SimOrder",
+    "SimulatorConfig",
+    "StubOKXServer",
+    "StubRequest",
+]
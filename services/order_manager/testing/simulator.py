@@ -0,0 +1,295 @@
+"""In-process and HTTP OKX exchange simulator for load and latency testing."""
+
+from __future__ import annotations
+
+import asyncio
+import hmac
+import itertools
+import json
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, Iterable, List, Mapping, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from ..okx_client import BATCH_ORDER_LIMIT, BATCH_ORDERS_PATH, ORDER_PATH, OKXCredentials
+from ..signing import SigningContext
+from .stub_server import StubOKXServer, StubRequest
+
+ORDER_TYPES = {"market", "limit", "post_only", "ioc", "fok"}
+
+
+@dataclass(slots=True)
+class SimulatorConfig:
+    """Behaviour knobs; the defaults answer instantly and never fail."""
+
+    latency: float = 0.0  # seconds added before every response
+    jitter: float = 0.0  # uniform extra latency in [0, jitter)
+    error_rate: float = 0.0  # fraction of requests answered 503 / code 50001
+    rate_limit: int = 60  # orders per instrument per rate_window (OKX place-order default)
+    rate_window: float = 2.0
+    max_clock_skew: float = 30.0  # OKX rejects timestamps further off than this
+    spread: float = 0.0005  # fraction of mid; market orders fill at mid +/- half of it
+    seed: Optional[int] = None
+
+
+class OKXSimulatorError(Exception):
+    """Non-2xx answer from the in-process simulator (the HTTP server sends it as a status)."""
+
+    def __init__(self, status: int, payload: Dict[str, Any]) -> None:
+        super().__init__(f"HTTP {status}: {payload.get('code')} {payload.get('msg')}")
+        self.status = status
+        self.payload = payload
+
+
+@dataclass(slots=True)
+class SimOrder:
+    ord_id: str
+    cl_ord_id: str
+    inst_id: str
+    side: str
+    ord_type: str
+    size: float
+    price: Optional[float]
+    state: str = "live"
+    filled: float = 0.0
+    avg_price: float = 0.0
+    created: float = field(default_factory=time.time)
+
+    def as_okx(self) -> Dict[str, Any]:
+        return {
+            "ordId": self.ord_id,
+            "clOrdId": self.cl_ord_id,
+            "instId": self.inst_id,
+            "side": self.side,
+            "ordType": self.ord_type,
+            "sz": str(self.size),
+            "px": "" if self.price is None else str(self.price),
+            "state": self.state,
+            "accFillSz": str(self.filled),
+            "avgPx": str(self.avg_price) if self.filled else "",
+        }
+
+
+class OKXSimulator:
+    """Simulated OKX trade API that is both a :class:`Transport` and an HTTP handler.
+
+    Requests are authenticated like OKX does it: the ``OK-ACCESS-KEY`` must
+    belong to one of ``credentials``, ``OK-ACCESS-SIGN`` must match the body
+    and ``OK-ACCESS-TIMESTAMP`` must be within ``max_clock_skew``. Orders go
+    through ``/api/v5/trade/order`` and ``/api/v5/trade/batch-orders`` with
+    per-order ``sCode`` results; duplicate ``clOrdId`` values are rejected.
+
+    Each instrument has a reference mid price (:meth:`set_price`). Market
+    orders and marketable limits fill immediately at mid plus or minus half
+    the spread; other limits rest and fill when the mid crosses them. IOC and
+    FOK orders that cannot fill are cancelled. ``latency``, ``jitter``,
+    per-instrument rate limits and random 503s come from
+    :class:`SimulatorConfig`; :meth:`serve` puts the same simulator behind a
+    local :class:`StubOKXServer`.
+    """
+
+    def __init__(
+        self,
+        credentials: OKXCredentials | Iterable[OKXCredentials],
+        *,
+        config: Optional[SimulatorConfig] = None,
+        prices: Optional[Mapping[str, float]] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if isinstance(credentials, OKXCredentials):
+            credentials = [credentials]
+        self._accounts: Dict[str, Tuple[str, SigningContext]] = {
+            creds.api_key: (creds.passphrase, SigningContext(creds, simulated=False)) for creds in credentials
+        }
+        self.config = config or SimulatorConfig()
+        self.clock = clock
+        self.prices: Dict[str, float] = dict(prices or {})
+        self.orders: Dict[str, SimOrder] = {}
+        self.fills: List[Tuple[str, float, float]] = []  # (ordId, size, price)
+        self.requests = 0
+        self._by_client_id: Dict[str, str] = {}
+        self._resting: Dict[str, List[SimOrder]] = {}
+        self._recent: Dict[str, Deque[float]] = {}
+        self._ids = itertools.count(1)
+        self._rng = random.Random(self.config.seed)
+
+    # -- transport / server ---------------------------------------------------
+
+    async def post(self, path: str, headers: Dict[str, str], body: str) -> Dict[str, Any]:
+        """:class:`Transport` entry point; non-2xx answers raise :class:`OKXSimulatorError`."""
+
+        status, payload = await self.respond("POST", path, {name.lower(): value for name, value in headers.items()}, body)
+        if status >= 400:
+            raise OKXSimulatorError(status, payload)
+        return payload
+
+    async def handle(self, request: StubRequest) -> Tuple[int, Dict[str, Any]]:
+        """:class:`StubOKXServer` handler."""
+
+        return await self.respond(request.method, request.path, request.headers, request.body)
+
+    def serve(self) -> StubOKXServer:
+        """An unstarted HTTP server answering with this simulator (use ``async with``)."""
+
+        return StubOKXServer(handler=self.handle)
+
+    async def respond(self, method: str, path: str, headers: Mapping[str, str], body: str) -> Tuple[int, Dict[str, Any]]:
+        self.requests += 1
+        delay = self.config.latency + (self._rng.random() * self.config.jitter if self.config.jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+        route = urlsplit(path)
+        if method == "GET" and route.path == "/api/v5/public/time":
+            return 200, _ok([{"ts": str(int(self.clock() * 1000))}])
+        failure = self._authenticate(method, path, headers, body)
+        if failure is not None:
+            return failure
+        if self.config.error_rate and self._rng.random() < self.config.error_rate:
+            return 503, {"code": "50001", "msg": "Service temporarily unavailable, please try again later", "data": []}
+        if method == "POST" and route.path == ORDER_PATH:
+            result = self._place(_loads(body))
+            return 200, {"code": "0" if result["sCode"] == "0" else "1", "msg": "", "data": [result]}
+        if method == "POST" and route.path == BATCH_ORDERS_PATH:
+            orders = _loads(body)
+            if not isinstance(orders, list) or not 0 < len(orders) <= BATCH_ORDER_LIMIT:
+                return 200, {"code": "51000", "msg": "Parameter batch size error", "data": []}
+            results = [self._place(order) for order in orders]
+            failed = sum(result["sCode"] != "0" for result in results)
+            code = "0" if not failed else ("1" if failed == len(results) else "2")
+            return 200, {"code": code, "msg": "", "data": results}
+        if method == "GET" and route.path == ORDER_PATH:
+            query = {key: values[0] for key, values in parse_qs(route.query).items()}
+            order = self.orders.get(query.get("ordId", "")) or self.orders.get(self._by_client_id.get(query.get("clOrdId", ""), ""))
+            if order is None:
+                return 200, {"code": "51603", "msg": "Order does not exist", "data": []}
+            return 200, _ok([order.as_okx()])
+        return 404, {"code": "50000", "msg": f"Unknown endpoint {method} {route.path}", "data": []}
+
+    # -- market -------------------------------------------------------------
+
+    def set_price(self, inst_id: str, price: float) -> None:
+        """Move the mid price and fill resting limits it crosses."""
+
+        self.prices[inst_id] = price
+        resting = self._resting.get(inst_id)
+        if not resting:
+            return
+        still: List[SimOrder] = []
+        for order in resting:
+            assert order.price is not None
+            if (order.side == "buy" and price <= order.price) or (order.side == "sell" and price >= order.price):
+                self._fill(order, order.price)
+            else:
+                still.append(order)
+        self._resting[inst_id] = still
+
+    def _place(self, order: Any) -> Dict[str, Any]:
+        if not isinstance(order, dict):
+            return _reject("", "51000", "Parameter error")
+        cl_ord_id = str(order.get("clOrdId", ""))
+        inst_id = order.get("instId")
+        side = order.get("side")
+        ord_type = order.get("ordType")
+        if not inst_id:
+            return _reject(cl_ord_id, "51000", "Parameter instId error")
+        if side not in {"buy", "sell"}:
+            return _reject(cl_ord_id, "51000", "Parameter side error")
+        if ord_type not in ORDER_TYPES:
+            return _reject(cl_ord_id, "51000", "Parameter ordType error")
+        size = _positive(order.get("sz"))
+        if size is None:
+            return _reject(cl_ord_id, "51000", "Parameter sz error")
+        price = _positive(order.get("px")) if ord_type != "market" else None
+        if ord_type != "market" and price is None:
+            return _reject(cl_ord_id, "51000", "Parameter px error")
+        if cl_ord_id and cl_ord_id in self._by_client_id:
+            return _reject(cl_ord_id, "51016", "Duplicated clOrdId")
+        if not self._admit(inst_id):
+            return _reject(cl_ord_id, "50011", "Rate limit reached. Please refer to API documentation and throttle requests accordingly")
+        mid = self.prices.get(inst_id)
+        if mid is None:
+            return _reject(cl_ord_id, "51001", "Instrument ID does not exist")
+
+        record = SimOrder(str(next(self._ids)), cl_ord_id, inst_id, side, ord_type, size, price, created=self.clock())
+        touch = mid * (1 + self.config.spread / 2) if side == "buy" else mid * (1 - self.config.spread / 2)
+        marketable = price is None or (price >= touch if side == "buy" else price <= touch)
+        if ord_type == "post_only" and marketable:
+            return _reject(cl_ord_id, "51006", "Order price is not within the price limit")  # would take liquidity
+        self.orders[record.ord_id] = record
+        if cl_ord_id:
+            self._by_client_id[cl_ord_id] = record.ord_id
+        if marketable:
+            self._fill(record, touch)
+        elif ord_type in {"ioc", "fok"}:
+            record.state = "canceled"
+        else:
+            self._resting.setdefault(inst_id, []).append(record)
+        return {"ordId": record.ord_id, "clOrdId": cl_ord_id, "tag": "", "sCode": "0", "sMsg": "Order placed"}
+
+    def _fill(self, order: SimOrder, price: float) -> None:
+        order.filled = order.size
+        order.avg_price = price
+        order.state = "filled"
+        self.fills.append((order.ord_id, order.size, price))
+
+    def _admit(self, inst_id: str) -> bool:
+        now = self.clock()
+        recent = self._recent.setdefault(inst_id, deque())
+        while recent and now - recent[0] >= self.config.rate_window:
+            recent.popleft()
+        if len(recent) >= self.config.rate_limit:
+            return False
+        recent.append(now)
+        return True
+
+    def _authenticate(
+        self, method: str, path: str, headers: Mapping[str, str], body: str
+    ) -> Optional[Tuple[int, Dict[str, Any]]]:
+        account = self._accounts.get(headers.get("ok-access-key", ""))
+        if account is None:
+            return 401, {"code": "50111", "msg": "Invalid OK-ACCESS-KEY", "data": []}
+        passphrase, signing = account
+        if headers.get("ok-access-passphrase") != passphrase:
+            return 401, {"code": "50105", "msg": "Invalid OK-ACCESS-PASSPHRASE", "data": []}
+        timestamp = headers.get("ok-access-timestamp", "")
+        try:
+            sent = datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            return 401, {"code": "50112", "msg": "Invalid OK-ACCESS-TIMESTAMP", "data": []}
+        if abs(self.clock() - sent) > self.config.max_clock_skew:
+            return 401, {"code": "50102", "msg": "Timestamp request expired", "data": []}
+        expected = signing.sign(timestamp, method, path, body if method == "POST" else "")
+        # Compared as bytes: compare_digest rejects str arguments with non-ASCII characters.
+        sent_sign = headers.get("ok-access-sign", "").encode("utf-8", "surrogatepass")
+        if not hmac.compare_digest(expected.encode(), sent_sign):
+            return 401, {"code": "50113", "msg": "Invalid Sign", "data": []}
+        return None
+
+
+def _ok(data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {"code": "0", "msg": "", "data": data}
+
+
+def _reject(cl_ord_id: str, code: str, message: str) -> Dict[str, Any]:
+    return {"ordId": "", "clOrdId": cl_ord_id, "tag": "", "sCode": code, "sMsg": message}
+
+
+def _loads(body: str) -> Any:
+    try:
+        return json.loads(body)
+    except json.JSONDecodeError:
+        return None
+
+
+def _positive(value: Any) -> Optional[float]:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if number > 0 else None
+
+
+__all__ = ["OKXSimulator", "OKXSimulatorError", "SimOrder", "SimulatorConfig"]
@@ -0,0 +1,132 @@
+"""Local keep-alive HTTP server standing in for OKX in tests and benchmarks."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+Handler = Callable[["StubRequest"], Awaitable[Tuple[int, Dict[str, Any]]]]
+
+
+@dataclass(slots=True)
+class StubRequest:
+    method: str
+    path: str
+    headers: Dict[str, str]  # lower-cased names
+    body: str
+
+
+class StubOKXServer:
+    """HTTP/1.1 server on localhost that keeps connections open like OKX does.
+
+    Every request is answered with ``response`` (after ``delay`` seconds)
+    unless a ``handler`` coroutine is given, which maps a :class:`StubRequest`
+    to ``(status, json_body)``. :attr:`connections` counts accepted TCP
+    connections so tests can assert on reuse; the last ``keep`` requests are
+    kept in :attr:`requests`.
+    """
+
+    def __init__(
+        self,
+        *,
+        response: Optional[Dict[str, Any]] = None,
+        handler: Optional[Handler] = None,
+        delay: float = 0.0,
+        host: str = "127.0.0.1",
+        keep: int = 1000,
+    ) -> None:
+        self.response = response or {"code": "0", "msg": "", "data": []}
+        self.handler = handler
+        self.delay = delay
+        self.host = host
+        self.connections = 0
+        self.request_count = 0
+        self.requests: Deque[StubRequest] = deque(maxlen=keep)
+        self._server: Optional[asyncio.base_events.Server] = None
+        self._handlers: set[asyncio.Task[None]] = set()
+
+    @property
+    def url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("StubOKXServer is not running")
+        port = self._server.sockets[0].getsockname()[1]
+        return f"http://{self.host}:{port}"
+
+    async def start(self) -> str:
+        self._server = await asyncio.start_server(self._serve, self.host, 0)
+        return self.url
+
+    async def close(self) -> None:
+        if self._server is None:
+            return
+        self._server.close()
+        handlers = list(self._handlers)
+        for task in handlers:
+            task.cancel()
+        await asyncio.gather(*handlers, return_exceptions=True)
+        await self._server.wait_closed()
+        self._server = None
+
+    async def __aenter__(self) -> "StubOKXServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        task = asyncio.current_task()
+        assert task is not None
+        self._handlers.add(task)
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    return
+                self.request_count += 1
+                self.requests.append(request)
+                if self.delay:
+                    await asyncio.sleep(self.delay)
+                if self.handler is not None:
+                    status, payload = await self.handler(request)
+                else:
+                    status, payload = 200, self.response
+                body = json.dumps(payload, separators=(",", ":")).encode()
+                keep_alive = request.headers.get("connection", "").lower() != "close"
+                writer.write(
+                    f"HTTP/1.1 {status} {'OK' if status < 400 else 'Error'}\r\n"
+                    "Content-Type: application/json\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode()
+                    + body
+                )
+                await writer.drain()
+                if not keep_alive:
+                    return
+        except asyncio.CancelledError:
+            pass  # close(); asyncio would otherwise log the cancelled handler
+        finally:
+            self._handlers.discard(task)
+            writer.close()
+
+
+async def _read_request(reader: asyncio.StreamReader) -> StubRequest:
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    method, path, _version = lines[0].split(" ", 2)
+    headers: Dict[str, str] = {}
+    for line in lines[1:]:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length", "0"))
+    body = (await reader.readexactly(length)).decode() if length else ""
+    return StubRequest(method, path, headers, body)
+
+
+__all__ = ["StubOKXServer", "StubRequest"]
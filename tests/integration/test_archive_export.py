@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import insert, update
+
+from packages.archive import ArchiveReader, ArchiveWriter
+from packages.db.models import BiasSnapshot, Event
+from workers.cron.archive_export import ArchiveExportConfig, run_archive_export
+
+from tests.fixtures.db import db_session  # noqa: F401
+
+
+@pytest.mark.asyncio
+async def test_export_streams_tables_into_day_asset_partitions(db_session, tmp_path):
+    start = datetime(2026, 9, 1, 23, 0)
+    await db_session.execute(
+        insert(Event.__table__),
+        [
+            {
+                "id": f"e{index}",
+                "timestamp": start + timedelta(minutes=30 * index),
+                "tx_hash": f"0x{index:064x}",
+                "event_type": "transfer",
+                "asset": "ETH" if index % 2 else "BTC",
+                "notional_usd": 100.0 * index,
+                "raw_data": {"ignored": True},
+            }
+            for index in range(6)
+        ],
+    )
+    await db_session.execute(
+        insert(BiasSnapshot.__table__),
+        [{"timestamp": start, "asset": "ETH", "timeframe": "1h", "value": 0.25, "confidence": 0.5}],
+    )
+    await db_session.commit()
+
+    config = ArchiveExportConfig(engine=db_session.bind, root=tmp_path, lookback_days=2, chunk_size=2)
+    exported = await run_archive_export(config, now=start + timedelta(days=1))
+    assert exported == {"events": 6, "bias": 1, "positions": 0}
+
+    reader = ArchiveReader(tmp_path)
+    days = {(p.day.isoformat(), p.asset) for p in reader.partitions("events")}
+    assert days == {("2026-09-01", "BTC"), ("2026-09-01", "ETH"), ("2026-09-02", "BTC"), ("2026-09-02", "ETH")}
+    eth = reader.read("events", ["id", "notional_usd"], assets=["ETH"])
+    assert sorted(eth["id"].tolist()) == ["e1", "e3", "e5"]
+    assert reader.read("bias", ["value"])["value"].tolist() == [0.25]
+
+    # Re-running rewrites partitions rather than appending.
+    await run_archive_export(config, now=start + timedelta(days=1))
+    assert reader.read("events", ["id"])["id"].size == 6
+
+
+@pytest.mark.asyncio
+async def test_export_keeps_whole_days_and_prunes_stale_assets(db_session, tmp_path):
+    start = datetime(2026, 9, 3, 0, 0)
+    await db_session.execute(
+        insert(Event.__table__),
+        [
+            {
+                "id": f"d{index}",
+                "timestamp": start + timedelta(hours=6 * index),
+                "tx_hash": f"0xd{index:063x}",
+                "event_type": "transfer",
+                "asset": "SOL" if index == 3 else "BTC",
+            }
+            for index in range(4)
+        ],
+    )
+    await db_session.commit()
+    writer = ArchiveWriter(tmp_path)
+    reader = ArchiveReader(tmp_path)
+
+    assert await writer.export(db_session.bind, "events", since=start) == 4
+    # A mid-day ``until`` must not replace the day with its first half.
+    assert await writer.export(db_session.bind, "events", since=start, until=start + timedelta(hours=13)) == 0
+    assert reader.read("events", ["id"])["id"].size == 4
+
+    await db_session.execute(update(Event.__table__).where(Event.__table__.c.id == "d3").values(asset="BTC"))
+    await db_session.commit()
+    await writer.export(db_session.bind, "events", since=start)
+    assert {p.asset for p in reader.partitions("events")} == {"BTC"}
+    assert reader.read("events", ["id"])["id"].size == 4
@@ -1,10 +1,22 @@
 import asyncio
+import random
 from datetime import datetime, timedelta, timezone
 
 import pytest
 
 from packages.queue import InMemoryQueueProducer
-from workers.cron.backfill import BackfillConfig, EventFetcher, run_backfill
+from services.api.monitoring.metrics import MetricsRegistry
+from workers.cron.backfill import (
+    AdaptiveBackfill,
+    BackfillConfig,
+    BackfillEngine,
+    BackfillMetrics,
+    EventFetcher,
+    FileCheckpointStore,
+    InMemoryCheckpointStore,
+    run_backfill,
+)
+from workers.cron.scheduler import AdaptiveSchedule, AdaptiveScheduler
 
 
 class DummyFetcher(EventFetcher):
@@ -44,3 +56,204 @@ async def test_run_backfill_handles_empty():
 
     assert result == {"fetched": 0, "success": True, "enqueued": 0}
     assert queue.items == []
+
+
+class PagedFetcher(EventFetcher):
+    """Sorted, strict-``since`` fetcher that tracks concurrent calls."""
+
+    def __init__(self, events, *, fail_between=None):
+        self.events = sorted(events, key=lambda event: event["timestamp"])
+        self.fail_between = fail_between
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+
+    async def fetch(self, *, since: datetime, limit: int):  # type: ignore[override]
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0)
+            if self.fail_between is not None and self.fail_between[0] <= since < self.fail_between[1]:
+                raise ConnectionError("upstream unavailable")
+            return [event for event in self.events if datetime.fromisoformat(event["timestamp"]) > since][:limit]
+        finally:
+            self.active -= 1
+
+
+def minute_events(now, minutes):
+    return [
+        {
+            "txHash": f"0x{index:04x}",
+            "wallet": "0x1",
+            "timestamp": (now - timedelta(minutes=minutes) + timedelta(minutes=index, seconds=30)).isoformat(),
+            "category": "transfer",
+        }
+        for index in range(minutes)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_backfill_pages_past_batch_size_with_bounded_concurrency():
+    now = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+    queue = InMemoryQueueProducer()
+    fetcher = PagedFetcher(minute_events(now, 120))
+    config = BackfillConfig(
+        queue=queue, fetcher=fetcher, lookback_minutes=120, batch_size=7, slice_minutes=20, concurrency=2
+    )
+
+    report = await BackfillEngine(config).run(now=now)
+
+    assert report.success
+    assert report.slices == 6
+    assert report.enqueued == 120
+    assert len({item.payload["tx_hash"] for item in queue.items}) == 120
+    assert report.pages > report.slices
+    assert fetcher.peak <= 2
+
+
+@pytest.mark.asyncio
+async def test_backfill_checkpoint_resumes_and_skips_failed_slices(tmp_path):
+    now = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+    store = FileCheckpointStore(tmp_path / "checkpoints.json")
+    events = minute_events(now, 60)
+
+    failing = PagedFetcher(events, fail_between=(now - timedelta(minutes=46), now - timedelta(minutes=31)))
+    config = BackfillConfig(
+        queue=InMemoryQueueProducer(), fetcher=failing, lookback_minutes=60, slice_minutes=15, checkpoints=store
+    )
+    report = await BackfillEngine(config).run(now=now)
+    assert not report.success
+    assert [start for start, _ in report.failed_slices] == [now - timedelta(minutes=45)]
+    assert await store.load("backfill") == now - timedelta(minutes=45)  # stops at the failed slice
+
+    queue = InMemoryQueueProducer()
+    config = BackfillConfig(
+        queue=queue, fetcher=PagedFetcher(events), lookback_minutes=60, slice_minutes=15, checkpoints=store
+    )
+    result = await run_backfill(config, now=now)
+    assert result == {"fetched": 45, "success": True, "enqueued": 45}
+    assert await FileCheckpointStore(store.path).load("backfill") == now
+
+    later = now + timedelta(minutes=10)
+    fetcher = PagedFetcher(events + minute_events(later, 10))
+    config = BackfillConfig(
+        queue=InMemoryQueueProducer(), fetcher=fetcher, lookback_minutes=60, slice_minutes=15, checkpoints=store
+    )
+    report = await BackfillEngine(config).run(now=later)
+    assert report.since == now
+    assert report.enqueued == 10
+
+
+@pytest.mark.asyncio
+async def test_backfill_dedupes_across_pages_and_runs():
+    now = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+    events = minute_events(now, 30)
+    events.append(dict(events[3], timestamp=events[20]["timestamp"]))  # same tx reported twice
+    queue = InMemoryQueueProducer()
+    engine = BackfillEngine(
+        BackfillConfig(queue=queue, fetcher=PagedFetcher(events), lookback_minutes=30, batch_size=4, slice_minutes=10)
+    )
+
+    first = await engine.run(now=now)
+    second = await engine.run(now=now)
+
+    assert first.enqueued == 30
+    assert first.duplicates >= 1
+    assert second.enqueued == 0
+    assert len(queue.items) == 30
+
+
+@pytest.mark.asyncio
+async def test_adaptive_backfill_backs_off_when_idle_and_speeds_up_when_saturated():
+    now = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+    registry = MetricsRegistry()
+    fetcher = PagedFetcher(minute_events(now, 30))
+    config = BackfillConfig(
+        queue=InMemoryQueueProducer(), fetcher=fetcher, lookback_minutes=30, batch_size=5, slice_minutes=30
+    )
+    schedule = AdaptiveSchedule(initial_seconds=120, min_seconds=30, max_seconds=600, jitter=0.0)
+    backfill = AdaptiveBackfill(config, schedule=schedule, metrics=BackfillMetrics(registry))
+
+    assert await backfill.step(now=now) == 60  # backlog paged past full pages
+    assert registry.metrics["backfill_lag_seconds"] == 0
+    calls = fetcher.calls
+
+    later = now + timedelta(minutes=2)
+    assert await backfill.step(now=later) == 120  # nothing new: back off
+    assert await backfill.step(now=later + timedelta(minutes=2)) == 240
+    assert fetcher.calls - calls == 2  # resumes from the checkpoint, one call per idle run
+
+    exported = registry.export()
+    assert exported["backfill_runs_total"] == 3
+    assert exported["backfill_idle_runs_total"] == 2
+    assert exported["backfill_events_enqueued_total"] == 30
+    assert exported["backfill_interval_seconds"] == 240
+
+
+@pytest.mark.asyncio
+async def test_backfill_pages_through_same_timestamp_bursts():
+    now = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+    burst = (now - timedelta(minutes=5)).isoformat()
+    events = [{"txHash": f"0xb{index:03x}", "wallet": "0x1", "timestamp": burst} for index in range(10)]
+    events.append({"txHash": "0xlate", "wallet": "0x1", "timestamp": (now - timedelta(minutes=1)).isoformat()})
+    config = BackfillConfig(
+        queue=InMemoryQueueProducer(), fetcher=PagedFetcher(events), lookback_minutes=10, batch_size=4
+    )
+
+    report = await BackfillEngine(config).run(now=now)
+
+    assert report.success
+    assert report.enqueued == 11
+
+    crowded = [dict(event, txHash=f"0xc{index:03x}") for index, event in enumerate(events[:1] * 100)]
+    config = BackfillConfig(queue=InMemoryQueueProducer(), fetcher=PagedFetcher(crowded), lookback_minutes=10, batch_size=4)
+    report = await BackfillEngine(config).run(now=now)
+    assert not report.success
+    assert "cannot page past" in report.failed_slices[0][1]
+
+
+@pytest.mark.asyncio
+async def test_backfill_checkpoints_inside_a_slice_that_runs_out_of_pages():
+    now = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+    events = minute_events(now, 30)
+    config = BackfillConfig(
+        queue=InMemoryQueueProducer(),
+        fetcher=PagedFetcher(events),
+        lookback_minutes=30,
+        batch_size=4,
+        slice_minutes=30,
+        max_pages_per_slice=3,
+        checkpoints=InMemoryCheckpointStore(),
+    )
+    engine = BackfillEngine(config)
+
+    first = await engine.run(now=now)
+    assert first.success
+    assert first.enqueued == 10  # three pages of four, each repeating the previous page's newest event
+    [(start, reached)] = first.truncated_slices
+    assert start == now - timedelta(minutes=30)
+    assert first.checkpoint == reached == datetime.fromisoformat(events[9]["timestamp"])
+
+    enqueued = first.enqueued
+    for _ in range(5):
+        report = await engine.run(now=now)
+        enqueued += report.enqueued
+        if not report.truncated_slices:
+            break
+    assert report.checkpoint == now
+    assert enqueued == 30
+
+
+def test_adaptive_scheduler_clamps_and_jitters():
+    scheduler = AdaptiveScheduler(
+        AdaptiveSchedule(initial_seconds=100, min_seconds=50, max_seconds=300, jitter=0.2), rng=random.Random(3)
+    )
+    for _ in range(5):
+        scheduler.observe(idle=True, saturated=False)
+    assert scheduler.interval == 300
+    assert all(240 <= scheduler.next_delay() <= 300 for _ in range(50))
+    for _ in range(5):
+        scheduler.observe(idle=False, saturated=True)
+    assert scheduler.interval == 50
+    assert scheduler.observe(idle=False, saturated=False) == 50
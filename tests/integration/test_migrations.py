@@ -2,7 +2,7 @@ import os
 from pathlib import Path
 
 import pytest
-from sqlalchemy import inspect
+from sqlalchemy import inspect, text
 
 SKIP_ASYNC_SQLITE = os.environ.get("SKIP_ASYNC_SQLITE", "1") != "0"
 
@@ -13,6 +13,7 @@ if SKIP_ASYNC_SQLITE:
     )
 
 from packages.db import (
+    MIGRATIONS,
     apply_migrations,
     dispose_engine,
     get_database_settings,
@@ -61,6 +62,7 @@ async def test_apply_migrations_creates_schema(tmp_path: Path, monkeypatch):
                 }
                 assert expected.issubset(tables)
                 assert "active_positions_view" in inspector.get_view_names()
+                assert {"events_all", "bias_all", "audit_logs_all"}.issubset(inspector.get_view_names())
 
             await conn.run_sync(check)
 
@@ -80,7 +82,8 @@ async def test_rollback_last_drops_schema(tmp_path: Path, monkeypatch):
 
     try:
         await apply_migrations(engine)
-        await rollback_last(engine)
+        for _ in MIGRATIONS:
+            await rollback_last(engine)
 
         async with engine.begin() as conn:
             def verify(connection):
@@ -89,3 +92,25 @@ async def test_rollback_last_drops_schema(tmp_path: Path, monkeypatch):
             await conn.run_sync(verify)
     finally:
         await dispose_engine()
+
+
+@pytest.mark.asyncio
+async def test_wallet_address_migration_lowercases_existing_rows(tmp_path: Path, monkeypatch):
+    db_file = tmp_path / "wallets.db"
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{db_file}")
+    settings = get_database_settings()
+    engine = init_engine(settings, force=True)
+    init_sessionmaker(engine, force=True)
+
+    try:
+        await apply_migrations(engine, target_ids=["0001_initial", "0002_time_partitions"])
+        async with engine.begin() as conn:
+            await conn.execute(text("INSERT INTO wallets (id, address, chain) VALUES ('w1', '0xAbCdEf', 'ethereum')"))
+
+        await apply_migrations(engine)
+
+        async with engine.begin() as conn:
+            address = (await conn.execute(text("SELECT address FROM wallets WHERE id = 'w1'"))).scalar_one()
+        assert address == "0xabcdef"
+    finally:
+        await dispose_engine()
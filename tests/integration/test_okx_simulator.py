@@ -0,0 +1,130 @@
+import asyncio
+
+import pytest
+
+from services.api.risk.monitor import RiskMonitor
+from services.api.risk.policy import PolicyEngine, PortfolioState
+from services.order_manager.http_transport import HTTPTransport
+from services.order_manager.killswitch import KillSwitch
+from services.order_manager.okx_client import OKXClient, OKXCredentials
+from services.order_manager.service import OrderManager, TradeSignal
+from services.order_manager.signing import MonotonicClock
+from services.order_manager.testing import OKXSimulator, OKXSimulatorError, SimulatorConfig
+
+CREDS = OKXCredentials(api_key="key", secret_key="secret", passphrase="pass")
+PRICES = {"BTC-USDT": 50_000.0, "ETH-USDT": 3_000.0}
+
+
+def make_client(simulator, **kwargs):
+    return OKXClient(CREDS, transport=simulator, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_simulator_fills_market_orders_and_rests_limits():
+    simulator = OKXSimulator(CREDS, prices=PRICES, config=SimulatorConfig(spread=0.001))
+    client = make_client(simulator)
+
+    market = await client.create_order({"clOrdId": "m1", "instId": "BTC-USDT", "tdMode": "cross", "side": "buy", "ordType": "market", "sz": "1"})
+    limit = await client.create_order(
+        {"clOrdId": "l1", "instId": "ETH-USDT", "tdMode": "cross", "side": "buy", "ordType": "limit", "sz": "2", "px": "2900"}
+    )
+
+    assert market["code"] == "0"
+    filled = simulator.orders[market["data"][0]["ordId"]]
+    assert (filled.state, filled.avg_price) == ("filled", pytest.approx(50_025.0))
+    resting = simulator.orders[limit["data"][0]["ordId"]]
+    assert resting.state == "live"
+
+    simulator.set_price("ETH-USDT", 2_950.0)
+    assert resting.state == "live"
+    simulator.set_price("ETH-USDT", 2_890.0)
+    assert (resting.state, resting.avg_price) == ("filled", 2_900.0)
+    assert len(simulator.fills) == 2
+
+
+@pytest.mark.asyncio
+async def test_simulator_rejects_bad_signatures_and_stale_timestamps():
+    simulator = OKXSimulator(CREDS, prices=PRICES)
+    forged = OKXClient(OKXCredentials(api_key="key", secret_key="wrong", passphrase="pass"), transport=simulator)
+    with pytest.raises(OKXSimulatorError) as excinfo:
+        await forged.create_order({"instId": "BTC-USDT", "side": "buy", "ordType": "market", "sz": "1"})
+    assert excinfo.value.payload["code"] == "50113"
+
+    stale = make_client(simulator)
+    stale._timestamp = lambda: "2020-01-01T00:00:00.000Z"
+    with pytest.raises(OKXSimulatorError) as excinfo:
+        await stale.create_order({"instId": "BTC-USDT", "side": "buy", "ordType": "market", "sz": "1"})
+    assert excinfo.value.payload["code"] == "50102"
+    assert simulator.orders == {}
+
+
+@pytest.mark.asyncio
+async def test_simulator_rejects_non_ascii_signatures():
+    simulator = OKXSimulator(CREDS, prices=PRICES)
+    client = make_client(simulator)
+    client._sign = lambda *args: "sïgnature"  # type: ignore[method-assign]
+    with pytest.raises(OKXSimulatorError) as excinfo:
+        await client.create_order({"instId": "BTC-USDT", "side": "buy", "ordType": "market", "sz": "1"})
+    assert excinfo.value.payload["code"] == "50113"
+
+
+@pytest.mark.asyncio
+async def test_simulator_rate_limit_follows_the_injected_clock():
+    now = [1_700_000_000.0]
+    simulator = OKXSimulator(CREDS, prices=PRICES, config=SimulatorConfig(rate_limit=1), clock=lambda: now[0])
+    client = make_client(simulator)
+    client.clock = MonotonicClock(wall=lambda: int(now[0] * 1e9))
+    order = {"instId": "BTC-USDT", "side": "buy", "ordType": "market", "sz": "1"}
+
+    assert (await client.create_order(order))["code"] == "0"
+    assert (await client.create_order(order))["data"][0]["sCode"] == "50011"
+    now[0] += simulator.config.rate_window
+    assert (await client.create_order(order))["code"] == "0"
+
+
+@pytest.mark.asyncio
+async def test_simulator_batch_reports_per_order_codes():
+    simulator = OKXSimulator(CREDS, prices=PRICES, config=SimulatorConfig(rate_limit=2))
+    client = make_client(simulator)
+    orders = [
+        {"clOrdId": "a", "instId": "BTC-USDT", "side": "buy", "ordType": "market", "sz": "1"},
+        {"clOrdId": "a", "instId": "BTC-USDT", "side": "buy", "ordType": "market", "sz": "1"},
+        {"clOrdId": "b", "instId": "BTC-USDT", "side": "sell", "ordType": "market", "sz": "0"},
+        {"clOrdId": "c", "instId": "BTC-USDT", "side": "sell", "ordType": "market", "sz": "1"},
+        {"clOrdId": "d", "instId": "BTC-USDT", "side": "sell", "ordType": "market", "sz": "1"},
+        {"clOrdId": "e", "instId": "DOGE-USDT", "side": "buy", "ordType": "market", "sz": "1"},
+    ]
+
+    results = await client.create_orders(orders)
+
+    assert [result["code"] for result in results] == ["0", "51016", "51000", "0", "50011", "51001"]
+
+
+@pytest.mark.asyncio
+async def test_simulator_injects_errors_and_latency():
+    simulator = OKXSimulator(CREDS, prices=PRICES, config=SimulatorConfig(error_rate=1.0, latency=0.01))
+    client = make_client(simulator)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    with pytest.raises(OKXSimulatorError) as excinfo:
+        await client.create_order({"instId": "BTC-USDT", "side": "buy", "ordType": "market", "sz": "1"})
+    assert excinfo.value.status == 503
+    assert loop.time() - started >= 0.01
+
+
+@pytest.mark.asyncio
+async def test_order_manager_against_simulator_over_http():
+    simulator = OKXSimulator(CREDS, prices=PRICES)
+    policy = PolicyEngine({"single_position": {"max_size_percent": 0.25, "max_leverage": 3, "min_rr_ratio": 1.5}})
+    async with simulator.serve() as server:
+        async with HTTPTransport(server.url, warm_connections=1) as transport:
+            manager = OrderManager(OKXClient(CREDS, transport=transport), policy, RiskMonitor({}, 1.0, 1.0), KillSwitch())
+            portfolio = PortfolioState(0, 0, 0.0, 0.0, 0.0, 0.0, 0.0)
+            signals = [TradeSignal("demo", asset, "buy", 0.1, 2.0, 2.0, 6.0, 0.5) for asset in PRICES]
+            results = await manager.submit_batch(signals, portfolio, {})
+
+            assert [result["success"] for result in results] == [True, True]
+            assert [result["response"]["code"] for result in results] == ["0", "0"]
+            order_id = results[0]["response"]["data"][0]["ordId"]
+            assert simulator.orders[order_id].state == "filled"
+    assert server.connections == 1
@@ -0,0 +1,71 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from services.api.monitoring.metrics import MetricsRegistry
+from services.order_manager.http_transport import HTTPTransport, OKXLatencyMetrics
+from services.order_manager.okx_client import OKXClient, OKXCredentials
+from services.order_manager.testing import StubOKXServer
+
+CREDS = OKXCredentials(api_key="key", secret_key="secret", passphrase="pass")
+
+
+@pytest.mark.asyncio
+async def test_http_transport_reuses_warm_connections():
+    registry = MetricsRegistry()
+    metrics = OKXLatencyMetrics(registry)
+    async with StubOKXServer(response={"code": "0", "data": [{"ordId": "1"}]}) as server:
+        async with HTTPTransport(server.url, warm_connections=2, metrics=metrics) as transport:
+            assert server.connections == 2
+            client = OKXClient(CREDS, transport=transport)
+            for _ in range(20):
+                response = await client.create_order({"instId": "BTC-USDT", "sz": "1"})
+                assert response["data"][0]["ordId"] == "1"
+
+    assert server.connections == 2
+    request = server.requests[-1]
+    assert request.method == "POST"
+    assert request.path == "/api/v5/trade/order"
+    assert request.headers["ok-access-key"] == "key"
+    assert json.loads(request.body) == {"instId": "BTC-USDT", "sz": "1"}
+
+    exported = registry.export()
+    for phase in ("sign", "queue", "connect", "send", "receive", "total"):
+        assert exported[f"okx_request_{phase}_seconds_count"] == 20
+    assert exported["okx_request_connections_opened_total"] == 2
+
+
+@pytest.mark.asyncio
+async def test_http_transport_per_request_timeout():
+    registry = MetricsRegistry()
+    metrics = OKXLatencyMetrics(registry)
+    async with StubOKXServer(delay=0.2) as server:
+        async with HTTPTransport(server.url, warm_connections=0, metrics=metrics) as transport:
+            with pytest.raises(httpx.TimeoutException):
+                await transport.post("/api/v5/trade/order", {}, "{}", timeout=0.02)
+            server.delay = 0.0
+            assert await transport.post("/api/v5/trade/order", {}, "{}") == server.response
+    assert registry.export()["okx_request_timeouts_total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_http_transport_raises_on_server_error():
+    async def failing(request):
+        return 503, {"code": "50001", "msg": "busy"}
+
+    async with StubOKXServer(handler=failing) as server:
+        async with HTTPTransport(server.url, warm_connections=1) as transport:
+            with pytest.raises(httpx.HTTPStatusError):
+                await transport.post("/api/v5/trade/order", {}, "{}")
+
+
+@pytest.mark.asyncio
+async def test_http_transport_pool_serves_concurrent_orders():
+    async with StubOKXServer(delay=0.01) as server:
+        async with HTTPTransport(server.url, max_connections=4, warm_connections=4) as transport:
+            client = OKXClient(CREDS, transport=transport)
+            await asyncio.gather(*(client.create_order({"instId": "ETH-USDT"}) for _ in range(32)))
+    assert server.request_count == 36
+    assert server.connections == 4
@@ -1,10 +1,25 @@
+import asyncio
+import json
+from dataclasses import replace
+
 import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
-from services.api.risk.monitor import PositionSnapshot, RiskMonitor
+from packages.db.models import AuditLog
+from services.api.monitoring.metrics import MetricsRegistry
+from services.api.risk.correlation import CorrelationRiskEngine
+from services.api.risk.monitor import IncrementalRiskMonitor, PositionSnapshot, RiskMonitor
 from services.api.risk.policy import PolicyEngine, PortfolioState
+from services.order_manager.idempotency import IdempotencyIndex, client_order_id
 from services.order_manager.killswitch import KillSwitch
 from services.order_manager.okx_client import MemoryTransport, OKXClient, OKXCredentials
+from services.order_manager.pipeline import OrderPipeline, PipelineMetrics
 from services.order_manager.service import OrderManager, TradeSignal
+from services.order_manager.telemetry import AuditLogSink, TelemetryRecorder
+
+from tests.fixtures.db import db_session  # noqa: F401
+
 
 def make_signal(**kwargs):
     data = {
@@ -130,3 +145,382 @@ async def test_order_manager_risk_alert():
     assert result["success"] is False
     assert result["reason"] == "risk_alert"
     assert manager.telemetry.events == []
+
+
+class CountingTransport(MemoryTransport):
+    def __init__(self):
+        super().__init__(response={"state": "ok"})
+        self.calls = []
+
+    async def post(self, path, headers, body):
+        self.calls.append(body)
+        return await super().post(path, headers, body)
+
+
+@pytest.mark.asyncio
+async def test_submit_batch_accepts_in_priority_order_without_overcommitting():
+    manager, _transport, _kill_switch = build_dependencies()
+    transport = CountingTransport()
+    manager.okx_client.transport = transport
+    signals = [
+        make_signal(asset="SOL-USDT", wallet_credibility=4.0),
+        make_signal(asset="ETH-USDT", wallet_credibility=9.0),
+        make_signal(asset="BTC-USDT", wallet_credibility=7.0),
+        make_signal(asset="OP-USDT", wallet_credibility=5.0),
+    ]
+    portfolio = make_portfolio(open_positions=2, total_risk=0.6)
+
+    results = await manager.submit_batch(signals, portfolio, make_positions(), {"btc_same": 0.4})
+
+    # 0.4 of existing same-direction exposure leaves room for three 0.1 trades under the 0.7 cap.
+    assert [result["success"] for result in results] == [False, True, True, True]
+    assert results[0]["reason"] == "policy_rejected"
+    assert results[0]["details"]["correlation"]["reason"] == "same_direction"
+    assert [call.split('"instId":"')[1].split('"')[0] for call in transport.calls] == ["ETH-USDT", "BTC-USDT", "OP-USDT"]
+    assert portfolio.open_positions == 2  # caller state is left untouched
+
+
+@pytest.mark.asyncio
+async def test_submit_batch_stops_at_risk_budget():
+    manager, _transport, _kill_switch = build_dependencies()
+    positions = {
+        "btc": PositionSnapshot(
+            asset="BTC-USDT", side="long", size=0.2, risk=0.8, pnl=0, drawdown=0.5, correlation_bucket="btc"
+        )
+    }
+    signals = [make_signal(asset=f"A{index}-USDT", wallet_credibility=9 - index) for index in range(4)]
+
+    results = await manager.submit_batch(signals, make_portfolio(total_risk=0.1), positions)
+
+    assert [result["success"] for result in results] == [True, True, False, False]
+    assert results[2]["reason"] == "risk_alert"
+    assert len(manager.telemetry.events) == 2
+
+
+@pytest.mark.asyncio
+async def test_submit_batch_counts_signals_in_their_positions_bucket():
+    manager, _transport, _kill_switch = build_dependencies()
+    positions = {"btc": replace(make_positions()["btc"], size=0.3)}
+
+    def batch(**kwargs):
+        return [make_signal(size_percent=0.25, wallet_credibility=9 - index, **kwargs) for index in range(3)]
+
+    # Keyed like the position, the 0.3 "btc" bucket reaches 0.8 after two trades and the third is rejected.
+    results = await manager.submit_batch(batch(correlation_bucket="btc"), make_portfolio(total_risk=0.1), positions)
+    assert [result["success"] for result in results] == [True, True, False]
+    assert results[2]["details"]["correlation"]["reason"] == "portfolio_correlation"
+
+    # Without a bucket the signals share their own "BTC-USDT" bucket and stay under the cap.
+    results = await manager.submit_batch(batch(), make_portfolio(total_risk=0.1), positions)
+    assert [result["success"] for result in results] == [True, True, True]
+
+
+@pytest.mark.asyncio
+async def test_submit_batch_respects_kill_switch():
+    manager, transport, kill_switch = build_dependencies()
+    kill_switch.activate("manual")
+    results = await manager.submit_batch([make_signal(), make_signal()], make_portfolio(), make_positions())
+    assert results == [{"success": False, "reason": "kill_switch_active"}] * 2
+    assert transport.last_call is None
+
+
+@pytest.mark.asyncio
+async def test_order_manager_uses_incremental_monitor_book():
+    manager, transport, _kill_switch = build_dependencies()
+    monitor = IncrementalRiskMonitor(drawdown_limits={"daily": 3.0}, correlation_limit=0.7, risk_limit=1.0)
+    manager.risk_monitor = monitor
+    for position_id, position in make_positions().items():
+        monitor.open_position(position_id, position)
+
+    assert (await manager.submit_order(make_signal(), make_portfolio(), None))["success"] is True
+
+    monitor.update_position("btc", replace(monitor.positions["btc"], drawdown=4.0))
+    result = await manager.submit_order(make_signal(), make_portfolio(), None)
+    assert result["reason"] == "risk_alert"
+
+
+@pytest.mark.asyncio
+async def test_correlation_exposure_follows_positions_not_orders():
+    manager, _transport, kill_switch = build_dependencies()
+    config = {"portfolio": {"max_correlation_risk": 0.5}, "correlation_limits": {}}
+    correlation = CorrelationRiskEngine(config)
+    policy = PolicyEngine(dict(config, single_position={"max_size_percent": 0.5}), correlation=correlation)
+    monitor = IncrementalRiskMonitor(drawdown_limits={"daily": 3.0}, correlation_limit=0.7, risk_limit=1.0)
+    manager = OrderManager(manager.okx_client, policy, monitor, kill_switch)
+    assert monitor.exposures is correlation
+
+    signal = make_signal(size_percent=0.3)
+    for _ in range(3):  # placed orders alone never accumulate exposure
+        assert (await manager.submit_order(signal, make_portfolio(), None))["success"] is True
+    assert correlation.correlated_exposure("BTC", 0.0) == 0.0
+
+    monitor.open_position("btc", replace(make_positions()["btc"], size=0.3))
+    result = await manager.submit_order(signal, make_portfolio(), None)
+    assert result["details"]["correlation_matrix"]["reason"] == "correlated_exposure"
+    monitor.close_position("btc")
+    assert (await manager.submit_order(signal, make_portfolio(), None))["success"] is True
+
+    # Within a batch, accepted orders are held until placement settles, then released.
+    results = await manager.submit_batch([signal, signal], make_portfolio(), None)
+    assert [result["success"] for result in results] == [True, False]
+    assert correlation.correlated_exposure("BTC", 0.0) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_coalescing_window_merges_concurrent_submissions():
+    manager, _transport, kill_switch = build_dependencies()
+    transport = CountingTransport()
+    manager.okx_client.transport = transport
+    manager = OrderManager(manager.okx_client, manager.policy_engine, manager.risk_monitor, kill_switch, coalesce_window=0.01)
+    signals = [make_signal(asset=asset) for asset in ("BTC-USDT", "ETH-USDT", "SOL-USDT")]
+
+    results = await asyncio.gather(
+        *(manager.submit_order(signal, make_portfolio(), make_positions()) for signal in signals)
+    )
+
+    assert [result["success"] for result in results] == [True, True, True]
+    assert len(transport.calls) == 1
+    assert [order["instId"] for order in json.loads(transport.calls[0])] == ["BTC-USDT", "ETH-USDT", "SOL-USDT"]
+
+    batch = await manager.submit_batch(signals, make_portfolio(open_positions=0, total_risk=0.0), make_positions())
+    assert [result["success"] for result in batch] == [True, True, True]
+    assert len(transport.calls) == 2
+    assert len(manager.telemetry.events) == 6
+
+
+class RejectingTransport(MemoryTransport):
+    """Rejects every BTC order with OKX's per-order insufficient-balance code."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    async def post(self, path, headers, body):
+        self.calls.append(path)
+        orders = json.loads(body)
+        entries = [
+            {"ordId": "", "clOrdId": order.get("clOrdId", ""), "sCode": "51008", "sMsg": "Insufficient balance"}
+            if order["instId"].startswith("BTC")
+            else {"ordId": "1", "clOrdId": order.get("clOrdId", ""), "sCode": "0", "sMsg": "Order placed"}
+            for order in (orders if isinstance(orders, list) else [orders])
+        ]
+        return {"code": "0" if all(entry["sCode"] == "0" for entry in entries) else "1", "msg": "", "data": entries}
+
+
+@pytest.mark.asyncio
+async def test_per_order_rejections_are_reported_as_failures():
+    manager, _transport, kill_switch = build_dependencies()
+    transport = RejectingTransport()
+    manager.okx_client.transport = transport
+
+    result = await manager.submit_order(make_signal(), make_portfolio(), make_positions())
+    assert result["success"] is False
+    assert result["reason"] == "order_failed"
+    assert result["error"] == "51008: Insufficient balance"
+    assert manager.telemetry.events[-1].status == "failure"
+
+    signals = [make_signal(asset="BTC-USDT"), make_signal(asset="ETH-USDT")]
+    for window in (None, 0.01):
+        manager = OrderManager(manager.okx_client, manager.policy_engine, manager.risk_monitor, kill_switch, coalesce_window=window)
+        results = await manager.submit_batch(signals, make_portfolio(open_positions=0, total_risk=0.0), make_positions())
+        assert [result["success"] for result in results] == [False, True]
+        assert results[0]["error"] == "51008: Insufficient balance"
+        assert [event.status for event in manager.telemetry.events] == ["failure", "success"]
+    assert transport.calls[-1].endswith("batch-orders")
+
+
+class SlowTransport(MemoryTransport):
+    """Answers after a per-instrument delay and records send order."""
+
+    def __init__(self, delays):
+        super().__init__(response={"state": "ok"})
+        self.delays = delays
+        self.sent = []
+        self.active = 0
+        self.peak = 0
+
+    async def post(self, path, headers, body):
+        order = json.loads(body)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delays.get(order["instId"], 0.0))
+        self.active -= 1
+        self.sent.append((order["instId"], order["sz"]))
+        return self.response
+
+
+@pytest.mark.asyncio
+async def test_pipeline_keeps_per_instrument_order_and_runs_instruments_in_parallel():
+    manager, _transport, _kill_switch = build_dependencies()
+    transport = SlowTransport({"BTC-USDT": 0.02, "ETH-USDT": 0.001})
+    manager.okx_client.transport = transport
+    registry = MetricsRegistry()
+
+    async with OrderPipeline(manager, metrics=PipelineMetrics(registry)) as pipeline:
+        submissions = [
+            pipeline.submit(make_signal(asset=asset, quantity=index), make_portfolio(), make_positions())
+            for index in range(5)
+            for asset in ("BTC-USDT", "ETH-USDT")
+        ]
+        results = await asyncio.gather(*submissions)
+
+    assert all(result["success"] for result in results)
+    for asset in ("BTC-USDT", "ETH-USDT"):
+        assert [size for inst, size in transport.sent if inst == asset] == [str(index) for index in range(5)]
+    # ETH is not held up behind the slower BTC orders.
+    assert [inst for inst, _ in transport.sent[:5]] == ["ETH-USDT"] * 5
+    assert transport.peak == 2
+    exported = registry.export()
+    assert exported["order_pipeline_signal_to_ack_seconds_count"] == 10
+    assert exported["order_pipeline_accepted_total"] == 10
+    assert exported["order_pipeline_in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_pipeline_checks_parallel_orders_against_each_other():
+    manager, _transport, _kill_switch = build_dependencies()
+    assets = ("BTC-USDT", "ETH-USDT", "SOL-USDT", "OP-USDT")
+    manager.okx_client.transport = SlowTransport({asset: 0.02 for asset in assets})
+    portfolio = make_portfolio(total_risk=0.75)
+
+    async with OrderPipeline(manager) as pipeline:
+        results = await asyncio.gather(
+            *(pipeline.submit(make_signal(asset=asset, size_percent=0.15), portfolio, make_positions()) for asset in assets)
+        )
+
+    # Each order alone passes the 1.0 risk budget; once two are in flight the book is over it.
+    assert [result["success"] for result in results] == [True, True, False, False]
+    assert {result["reason"] for result in results[2:]} == {"policy_rejected"}
+    # Settled orders stop counting once placement is done.
+    assert (await manager.submit_order(make_signal(size_percent=0.15), portfolio, make_positions()))["success"] is True
+
+
+@pytest.mark.asyncio
+async def test_pipeline_bounds_in_flight_orders():
+    manager, _transport, _kill_switch = build_dependencies()
+    transport = SlowTransport({f"A{index}-USDT": 0.01 for index in range(8)})
+    manager.okx_client.transport = transport
+
+    async with OrderPipeline(manager, max_in_flight=3) as pipeline:
+        results = await asyncio.gather(
+            *(pipeline.submit(make_signal(asset=f"A{index}-USDT"), make_portfolio(), make_positions()) for index in range(8))
+        )
+
+    assert len(results) == 8
+    assert transport.peak == 3
+
+
+@pytest.mark.asyncio
+async def test_pipeline_delivers_errors_and_rejects_after_close():
+    manager, _transport, kill_switch = build_dependencies()
+
+    class FailingTransport(MemoryTransport):
+        async def post(self, path, headers, body):
+            raise RuntimeError("exchange down")
+
+    manager.okx_client.transport = FailingTransport()
+    pipeline = OrderPipeline(manager)
+    with pytest.raises(RuntimeError, match="exchange down"):
+        await pipeline.submit(make_signal(), make_portfolio(), make_positions())
+    kill_switch.activate("manual")
+    assert (await pipeline.submit(make_signal(), make_portfolio(), make_positions()))["reason"] == "kill_switch_active"
+    await pipeline.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        await pipeline.submit(make_signal(), make_portfolio(), make_positions())
+
+
+@pytest.mark.asyncio
+async def test_duplicate_signals_are_rejected_before_the_network():
+    manager, _transport, kill_switch = build_dependencies()
+    transport = CountingTransport()
+    manager.okx_client.transport = transport
+    manager = OrderManager(
+        manager.okx_client, manager.policy_engine, manager.risk_monitor, kill_switch, idempotency=IdempotencyIndex()
+    )
+    signal = make_signal(signal_id="evt-1")
+
+    first = await manager.submit_order(signal, make_portfolio(), make_positions())
+    retry = await manager.submit_order(signal, make_portfolio(), make_positions())
+    concurrent = await asyncio.gather(
+        *(manager.submit_order(make_signal(signal_id="evt-2"), make_portfolio(), make_positions()) for _ in range(3))
+    )
+    batch = await manager.submit_batch(
+        [make_signal(signal_id="evt-3"), make_signal(signal_id="evt-3"), signal], make_portfolio(), make_positions()
+    )
+
+    assert first["success"] is True
+    assert retry == {"success": False, "reason": "duplicate_order", "client_order_id": client_order_id(signal)}
+    assert sorted(result["success"] for result in concurrent) == [False, False, True]
+    assert [result.get("reason") for result in batch] == [None, "duplicate_order", "duplicate_order"]
+    sent = [json.loads(body)["clOrdId"] for body in transport.calls]
+    assert len(sent) == len(set(sent)) == 3
+
+
+@pytest.mark.asyncio
+async def test_orders_are_refused_while_the_audit_sink_stays_behind():
+    class StalledSink:
+        async def write(self, events):
+            await asyncio.Event().wait()
+
+    manager, _transport, kill_switch = build_dependencies()
+    transport = CountingTransport()
+    manager.okx_client.transport = transport
+    telemetry = TelemetryRecorder(capacity=1, sink=StalledSink(), overflow="block", block_timeout=0.01)
+    manager = OrderManager(
+        manager.okx_client,
+        manager.policy_engine,
+        manager.risk_monitor,
+        kill_switch,
+        telemetry,
+        idempotency=IdempotencyIndex(),
+    )
+    telemetry.record_success({"clOrdId": "earlier"}, {})
+    telemetry.record_success({"clOrdId": "later"}, {})
+    signal = make_signal(signal_id="evt-1")
+
+    single = await manager.submit_order(signal, make_portfolio(), make_positions())
+    batch = await manager.submit_batch([make_signal(signal_id="evt-2")], make_portfolio(), make_positions())
+
+    assert single == {"success": False, "reason": "telemetry_backpressure"}
+    assert batch == [{"success": False, "reason": "telemetry_backpressure"}]
+    assert transport.calls == []
+    assert client_order_id(signal) not in manager.idempotency
+    assert not manager._in_flight
+
+
+@pytest.mark.asyncio
+async def test_identical_signals_without_signal_id_are_separate_orders():
+    manager, _transport, kill_switch = build_dependencies()
+    transport = CountingTransport()
+    manager.okx_client.transport = transport
+    manager = OrderManager(
+        manager.okx_client, manager.policy_engine, manager.risk_monitor, kill_switch, idempotency=IdempotencyIndex()
+    )
+
+    first = await manager.submit_order(make_signal(), make_portfolio(), make_positions())
+    second = await manager.submit_order(make_signal(), make_portfolio(), make_positions())
+    batch = await manager.submit_batch([make_signal(), make_signal()], make_portfolio(), make_positions())
+
+    assert [result["success"] for result in (first, second, *batch)] == [True] * 4
+    sent = [json.loads(body)["clOrdId"] for body in transport.calls]
+    assert len(set(sent)) == 4
+
+
+@pytest.mark.asyncio
+async def test_order_manager_flushes_telemetry_to_audit_logs(db_session):
+    manager, _transport, _kill_switch = build_dependencies()
+    sink = AuditLogSink(async_sessionmaker(db_session.bind, expire_on_commit=False))
+    manager.telemetry = TelemetryRecorder(capacity=1, sink=sink, overflow="block")
+    async with manager.telemetry:
+        first = await manager.submit_order(make_signal(signal_id="a"), make_portfolio(), make_positions())
+        second = await manager.submit_order(make_signal(signal_id="b"), make_portfolio(), make_positions())
+    assert first["success"] and second["success"]
+    assert manager.telemetry.dropped == 0
+
+    rows = (await db_session.execute(select(AuditLog).order_by(AuditLog.timestamp))).scalars().all()
+    assert [row.action for row in rows] == ["order_success", "order_success"]
+    assert {row.entity_id for row in rows} == {
+        client_order_id(make_signal(signal_id="a")),
+        client_order_id(make_signal(signal_id="b")),
+    }
+    assert rows[0].new_value["response"] == {"state": "ok"}
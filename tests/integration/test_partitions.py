@@ -0,0 +1,139 @@
+from dataclasses import replace
+from datetime import datetime
+
+import pytest
+from sqlalchemy import insert, text
+from sqlalchemy.exc import IntegrityError
+
+from packages.db.migrations import PARTITIONED_TABLES, PartitionManager, PartitionSpec, rollback_last
+from packages.db.migrations.partitioning import period_start, shift_period
+from packages.db.models import BiasSnapshot, Event
+from services.api.bias.repository import BiasRepository
+from services.api.repositories import EventRepository
+from workers.cron.partitions import PartitionMaintenanceConfig, run_partition_maintenance
+
+from tests.fixtures.db import db_session  # noqa: F401
+
+NOW = datetime(2026, 10, 19, 12, 0)
+
+
+async def _count(session, table: str) -> int:
+    return (await session.execute(text(f"SELECT COUNT(*) FROM {table}"))).scalar()
+
+
+async def _seed_events(session, months_back: int) -> None:
+    rows = []
+    for offset in range(months_back + 1):
+        when = shift_period(period_start(NOW, "month"), "month", -offset).replace(day=15)
+        rows.append(
+            {
+                "id": f"e{offset}",
+                "timestamp": when,
+                "tx_hash": f"0x{offset:064x}",
+                "event_type": "transfer",
+            }
+        )
+    await session.execute(insert(Event.__table__), rows)
+    await session.commit()
+
+
+def test_period_arithmetic():
+    assert shift_period(datetime(2026, 12, 1), "month", 1) == datetime(2027, 1, 1)
+    assert shift_period(datetime(2026, 1, 1), "month", -1) == datetime(2025, 12, 1)
+    assert shift_period(datetime(2026, 2, 28), "day", 1) == datetime(2026, 3, 1)
+    assert PartitionSpec("events", "timestamp").parse_partition("events_p202610") == datetime(2026, 10, 1)
+    assert PartitionSpec("events", "timestamp").parse_partition("events_p202610_archived") is None
+    with pytest.raises(ValueError):
+        PartitionSpec("events", "timestamp", retention=1, hot_periods=1)
+    with pytest.raises(ValueError):
+        PartitionSpec("events", "timestamp", unique_key="tx_hash")
+
+
+@pytest.mark.asyncio
+async def test_rotation_moves_closed_periods_and_retention_drops_them(db_session):
+    engine = db_session.bind
+    await _seed_events(db_session, months_back=4)
+    manager = PartitionManager(engine, [PartitionSpec("events", "timestamp", retention=3)])
+
+    await manager.ensure_partitions(now=NOW)
+    assert {"events_p202610", "events_p202612"}.issubset(await manager.list_partitions(manager.specs[0]))
+
+    # Current (Oct) and one hot period (Sep) stay in the base table.
+    assert await manager.rotate(now=NOW) == 3
+    assert await _count(db_session, "events") == 2
+    assert await _count(db_session, "events_all") == 5
+    assert await _count(db_session, "events_p202606") == 1
+    assert await manager.rotate(now=NOW) == 0
+
+    retired = await manager.apply_retention(now=NOW)
+    assert retired == ["events_p202606"]
+    assert await _count(db_session, "events_all") == 4
+
+
+@pytest.mark.asyncio
+async def test_maintenance_job_and_downgrade_fold_partitions_back(db_session):
+    engine = db_session.bind
+    await _seed_events(db_session, months_back=2)
+
+    summary = await run_partition_maintenance(PartitionMaintenanceConfig(engine=engine), now=NOW)
+    assert summary["moved"] == 1
+    assert summary["retired"] == []
+    assert await _count(db_session, "events") == 2
+
+    await rollback_last(engine)  # 0003_wallet_address_case
+    await rollback_last(engine)  # 0002_time_partitions
+    assert await _count(db_session, "events") == 3
+    names = await PartitionManager(engine).list_partitions(PARTITIONED_TABLES[0])
+    assert names == []
+
+
+@pytest.mark.asyncio
+async def test_rotated_rows_keep_constraints_and_global_keys(db_session):
+    engine = db_session.bind
+    await _seed_events(db_session, months_back=4)
+    spec = PARTITIONED_TABLES[0]
+    manager = PartitionManager(engine, [spec])
+    await manager.rotate(now=NOW)
+
+    indexes = await db_session.execute(
+        text("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'events_p202606'")
+    )
+    names = {name for (name,) in indexes}
+    assert {"idx_events_wallet_p202606", "idx_events_type_p202606"}.issubset(names)
+    assert any(name.startswith("sqlite_autoindex_events_p202606") for name in names)
+
+    # e4 now lives in events_p202606; its tx_hash is still taken.
+    repo = EventRepository(db_session)
+    stored = await repo.find_by_tx_hash(f"0x{4:064x}")
+    assert stored is not None and stored.id == "e4" and stored not in db_session
+    assert (await repo.upsert(tx_hash=f"0x{4:064x}", defaults={"event_type": "swap"})).event_type == "transfer"
+    with pytest.raises(IntegrityError):
+        await db_session.execute(
+            insert(Event.__table__),
+            {"id": "dup", "timestamp": NOW, "tx_hash": f"0x{4:064x}", "event_type": "transfer"},
+        )
+    await db_session.rollback()
+
+    assert await _count(db_session, "event_tx_hashes") == 5
+    assert await manager.apply_retention(now=NOW) == []
+    retired = await PartitionManager(engine, [replace(spec, retention=3)]).apply_retention(now=NOW)
+    assert retired == ["events_p202606"]
+    assert await _count(db_session, "event_tx_hashes") == 4
+
+
+@pytest.mark.asyncio
+async def test_latest_bias_reads_rotated_periods(db_session):
+    old = shift_period(period_start(NOW, "month"), "month", -3).replace(day=2)
+    await db_session.execute(
+        insert(BiasSnapshot.__table__),
+        [
+            {"timestamp": old, "asset": "ETH", "timeframe": "4h", "value": 0.4, "confidence": 0.5},
+            {"timestamp": NOW, "asset": "BTC", "timeframe": "4h", "value": -0.2, "confidence": 0.6},
+        ],
+    )
+    await db_session.commit()
+    await PartitionManager(db_session.bind, [PARTITIONED_TABLES[1]]).rotate(now=NOW)
+    assert await _count(db_session, "bias") == 1
+
+    latest = await BiasRepository(db_session).latest(include_components=False)
+    assert {(result.asset, result.value) for result in latest} == {("ETH", 0.4), ("BTC", -0.2)}
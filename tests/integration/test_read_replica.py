@@ -0,0 +1,78 @@
+import os
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+
+from packages.db import (
+    DatabaseSettings,
+    apply_migrations,
+    dispose_engine,
+    get_read_session,
+    get_session,
+    has_read_replica,
+    init_engine,
+    init_read_engine,
+    init_read_sessionmaker,
+    init_sessionmaker,
+)
+from packages.db.routing import clear_write_marker, configure_staleness
+from services.api.repositories import WalletRepository
+
+SKIP_ASYNC_SQLITE = os.environ.get("SKIP_ASYNC_SQLITE", "1") != "0"
+
+pytestmark = pytest.mark.skipif(SKIP_ASYNC_SQLITE, reason="Async sqlite blocked in sandbox")
+
+
+@pytest_asyncio.fixture
+async def primary_and_replica(tmp_path: Path):
+    settings = DatabaseSettings(
+        DATABASE_URL=f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}",
+        DATABASE_READ_REPLICA_URL=f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}",
+        DATABASE_REPLICA_STALENESS_SECONDS=60,
+    )
+    primary = init_engine(settings, force=True)
+    replica = init_read_engine(settings, force=True)
+    await apply_migrations(primary)
+    await apply_migrations(replica)
+    clear_write_marker()
+    try:
+        yield init_sessionmaker(primary, force=True), init_read_sessionmaker(replica, force=True)
+    finally:
+        configure_staleness(settings.replica_staleness_seconds)
+        await dispose_engine()
+
+
+@pytest.mark.asyncio
+async def test_reads_route_to_replica_until_a_write(primary_and_replica):
+    primary_factory, replica_factory = primary_and_replica
+    assert has_read_replica()
+    async with get_read_session(replica_factory) as replica:
+        await replica.execute(
+            text("INSERT INTO wallets (id, address, chain, is_active) VALUES ('r1', '0xreplica', 'ethereum', 1)")
+        )
+        await replica.commit()
+
+    async with get_session(primary_factory) as session, get_read_session(replica_factory) as replica:
+        repo = WalletRepository(session, read_session=replica)
+        assert [row.address for row in await repo.list_active_rows()] == ["0xreplica"]
+        assert await repo.get(id="r1") is None
+
+        await repo.create(address="0xprimary", chain="ethereum")
+        # Read-your-writes: the replica has not seen the insert yet.
+        assert [row.address for row in await repo.list_active_rows()] == ["0xprimary"]
+
+        configure_staleness(0)
+        assert [row.address for row in await repo.list_active_rows()] == ["0xreplica"]
+
+
+@pytest.mark.asyncio
+async def test_without_replica_reads_use_primary(tmp_path: Path):
+    settings = DatabaseSettings(DATABASE_URL=f"sqlite+aiosqlite:///{tmp_path / 'only.db'}")
+    try:
+        engine = init_engine(settings, force=True)
+        assert init_read_engine(settings, force=True) is engine
+        assert not has_read_replica()
+    finally:
+        await dispose_engine()
@@ -1,9 +1,19 @@
 import pytest
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 from packages.db.models import Event
-from services.api.repositories import EventRepository, UserRepository, WalletRepository
+from services.api.bias.calculator import BiasResult
+from services.api.bias.repository import BiasRepository
+from services.api.repositories import (
+    EventRepository,
+    EventRow,
+    OrderRepository,
+    UserRepository,
+    WalletRepository,
+    WalletRow,
+)
+from services.order_manager.idempotency import IdempotencyIndex
 
 from tests.fixtures.db import db_session  # noqa: F401
 
@@ -46,3 +56,136 @@ async def test_event_repository_upsert(db_session):
     assert event.tx_hash == "0x123"
     second = await repo.upsert(tx_hash="0x123", defaults={"event_type": "swap"})
     assert second.event_type == "swap"
+
+
+@pytest.mark.asyncio
+async def test_event_repository_rows_skip_raw_data(db_session):
+    wallet = await WalletRepository(db_session).create(address="0xrow", chain="ethereum")
+    repo = EventRepository(db_session)
+    now = datetime.utcnow()
+    for index in range(3):
+        await repo.create(
+            tx_hash=f"0xrow{index}",
+            wallet_id=wallet.id,
+            timestamp=now - timedelta(minutes=index),
+            event_type="transfer",
+            raw_data={"blob": "x" * 64},
+        )
+
+    rows = await repo.recent_for_wallet_rows(wallet.id)
+    assert [row.tx_hash for row in rows] == ["0xrow0", "0xrow1", "0xrow2"]
+    assert all(isinstance(row, EventRow) and row.raw_data is None for row in rows)
+    assert not hasattr(rows[0], "__dict__")
+
+    with_raw = await repo.recent_for_wallet_rows(wallet.id, include_raw=True)
+    assert with_raw[0].raw_data == {"blob": "x" * 64}
+
+    orm_events = await repo.recent_for_wallet(wallet.id)
+    assert [event.id for event in orm_events] == [row.id for row in rows]
+
+
+@pytest.mark.asyncio
+async def test_wallet_repository_active_rows(db_session):
+    repo = WalletRepository(db_session)
+    active = await repo.create(address="0xactive", chain="ethereum", tags=["smart"])
+    inactive = await repo.create(address="0xinactive", chain="ethereum")
+    await repo.set_active(inactive.id, False)
+
+    rows = await repo.list_active_rows()
+    assert [row.id for row in rows] == [active.id]
+    assert isinstance(rows[0], WalletRow)
+    assert rows[0].tags is None
+
+    tagged = await repo.list_active_rows(include_tags=True)
+    assert tagged[0].tags == ["smart"]
+
+
+@pytest.mark.asyncio
+async def test_bias_repository_latest_projection(db_session):
+    repo = BiasRepository(db_session)
+    older = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    for timestamp, value in ((older, 0.1), (older + timedelta(hours=1), 0.4)):
+        await repo.store(
+            BiasResult(
+                asset="BTC",
+                timeframe="1h",
+                value=value,
+                confidence=0.5,
+                components={"wallet-a": 7.0},
+                timestamp=timestamp,
+            )
+        )
+
+    results = await repo.latest()
+    assert len(results) == 1
+    assert results[0].value == 0.4
+    assert results[0].components == {"wallet-a": 7.0}
+
+    light = await repo.latest(["BTC"], include_components=False)
+    assert light[0].value == 0.4
+    assert light[0].components == {}
+
+
+@pytest.mark.asyncio
+async def test_bias_repository_latest_picks_newest_per_series(db_session):
+    repo = BiasRepository(db_session)
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    for hours, asset, timeframe, value in (
+        (0, "BTC", "1h", 0.1),
+        (2, "BTC", "1h", 0.2),
+        (1, "BTC", "4h", 0.3),
+        (3, "ETH", "1h", 0.4),
+        (1, "ETH", "1h", 0.5),
+    ):
+        await repo.store(
+            BiasResult(
+                asset=asset,
+                timeframe=timeframe,
+                value=value,
+                confidence=0.5,
+                components={},
+                timestamp=start + timedelta(hours=hours),
+            )
+        )
+
+    latest = await repo.latest(include_components=False)
+    assert [(result.asset, result.timeframe, result.value) for result in latest] == [
+        ("BTC", "1h", 0.2),
+        ("BTC", "4h", 0.3),
+        ("ETH", "1h", 0.4),
+    ]
+    assert [result.value for result in await repo.latest(["ETH"])] == [0.4]
+
+
+@pytest.mark.asyncio
+async def test_lookup_statements_are_reused(db_session):
+    repo = WalletRepository(db_session)
+    first = await repo.create(address="0xa1", chain="ethereum", label=None)
+    await repo.create(address="0xa2", chain="ethereum", label="desk")
+
+    assert (await repo.get(address="0xa1", chain="ethereum")).id == first.id
+    stmt = repo._lookup_statement({"chain": "ethereum", "address": "0xa2"})
+    assert stmt is repo._lookup_statement({"address": "0xa1", "chain": "ethereum"})
+    assert await repo.exists(address="0xa2")
+    assert not await repo.exists(address="0xa3")
+
+    # None filters fall back to IS NULL semantics rather than "= NULL".
+    assert repo._lookup_statement({"label": None}) is None
+    assert (await repo.get(label=None)).id == first.id
+
+
+@pytest.mark.asyncio
+async def test_order_repository_syncs_idempotency_index(db_session):
+    index = IdempotencyIndex()
+    repo = OrderRepository(db_session, order_index=index)
+    await repo.create(trading_mode="demo", client_order_id="b1", asset="BTC-USDT", side="buy", order_type="market")
+    assert "b1" in index
+
+    other = OrderRepository(db_session)
+    await other.create(trading_mode="demo", client_order_id="b2", asset="ETH-USDT", side="buy", order_type="market")
+    assert "b2" not in index
+
+    fresh = IdempotencyIndex()
+    assert await fresh.preload(other) == 2
+    assert {"b1", "b2"} <= set(fresh._ids)
+    assert fresh.watermark is not None
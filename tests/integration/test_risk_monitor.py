@@ -1,6 +1,13 @@
-from services.api.risk.monitor import PositionSnapshot, RiskMonitor
+import math
+import random
+
+import pytest
+
+from services.api.risk.monitor import ExactSum, IncrementalRiskMonitor, PositionSnapshot, RiskMonitor
 from services.order_manager.killswitch import KillSwitch
 
+LIMITS = {"drawdown_limits": {"daily": 3.0}, "correlation_limit": 0.7, "risk_limit": 1.0}
+
 
 def make_position(**kwargs):
     data = {
@@ -16,6 +23,15 @@ def make_position(**kwargs):
     return PositionSnapshot(**data)
 
 
+def assert_same_metrics(actual, expected):
+    # RiskMonitor sums left to right, IncrementalRiskMonitor exactly; the
+    # rounded totals may differ by one unit in the last place.
+    assert actual.open_positions == expected.open_positions
+    for name in ("total_exposure", "current_drawdown", "risk_consumed", "correlation_risk"):
+        assert getattr(actual, name) == pytest.approx(getattr(expected, name), abs=2e-4), name
+    assert actual.alerts == expected.alerts
+
+
 def test_risk_monitor_alerts():
     monitor = RiskMonitor(drawdown_limits={"daily": 2.0}, correlation_limit=0.5, risk_limit=0.1)
     positions = [
@@ -34,3 +50,90 @@ def test_kill_switch_activation():
     assert killswitch.is_active() is True
     killswitch.deactivate("manual")
     assert killswitch.is_active() is False
+
+
+def random_position(rng):
+    return PositionSnapshot(
+        asset=rng.choice(["BTC", "ETH", "SOL"]),
+        side=rng.choice(["long", "short"]),
+        size=rng.uniform(-0.3, 0.3),
+        risk=rng.uniform(0.0, 0.2),
+        pnl=rng.uniform(-100, 100),
+        drawdown=rng.choice([rng.uniform(-1.0, 4.0), 1.5]),
+        correlation_bucket=rng.choice(["btc", "eth", "alts"]),
+    )
+
+
+def test_exact_sum_matches_fsum_after_removals():
+    rng = random.Random(1)
+    values = [rng.uniform(-1e6, 1e6) * 10 ** rng.randint(-8, 8) for _ in range(500)]
+    total = ExactSum()
+    for value in values:
+        total.add(value)
+    for value in values[::2]:
+        total.remove(value)
+    assert total.value() == math.fsum(values[1::2])
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_incremental_monitor_matches_batch_metrics(seed):
+    rng = random.Random(seed)
+    batch = RiskMonitor(**LIMITS)
+    monitor = IncrementalRiskMonitor(**LIMITS)
+    book = {}
+    for step in range(600):
+        action = rng.random()
+        if book and action < 0.3:
+            position_id = rng.choice(sorted(book))
+            del book[position_id]
+            monitor.close_position(position_id)
+        elif book and action < 0.6:
+            position_id = rng.choice(sorted(book))
+            book[position_id] = random_position(rng)
+            monitor.update_position(position_id, book[position_id])
+        else:
+            position_id = f"p{step}"
+            book[position_id] = random_position(rng)
+            monitor.open_position(position_id, book[position_id])
+        assert_same_metrics(monitor.metrics(), batch.get_metrics(book.values()))
+
+    for position_id in list(book):
+        monitor.close_position(position_id)
+    assert_same_metrics(monitor.metrics(), batch.get_metrics([]))
+
+
+def test_heaps_stay_bounded_under_repeated_updates():
+    rng = random.Random(4)
+    monitor = IncrementalRiskMonitor(**LIMITS)
+    for _ in range(5000):
+        monitor.update_position("only", random_position(rng))
+    assert len(monitor._drawdowns) <= 2 * 1 + 64 + 1
+    assert len(monitor._bucket_heap) <= 2 * 1 + 64 + 1
+
+
+def test_sync_applies_only_changes():
+    rng = random.Random(9)
+    monitor = IncrementalRiskMonitor(**LIMITS)
+    book = {f"p{index}": random_position(rng) for index in range(20)}
+    monitor.sync(book)
+    del book["p3"]
+    book["p4"] = random_position(rng)
+    book["new"] = random_position(rng)
+    monitor.sync(book)
+    assert set(monitor.positions) == set(book)
+    assert_same_metrics(monitor.metrics(), RiskMonitor(**LIMITS).get_metrics(book.values()))
+
+
+def test_mutating_a_snapshot_after_opening_it_does_not_skew_totals():
+    monitor = IncrementalRiskMonitor(**LIMITS)
+    position = make_position(size=0.3, risk=0.1, drawdown=2.0)
+    monitor.open_position("p", position)
+
+    position.size, position.risk, position.drawdown = 0.9, 0.4, 0.5
+    original = make_position(size=0.3, risk=0.1, drawdown=2.0)
+    assert_same_metrics(monitor.metrics(), RiskMonitor(**LIMITS).get_metrics([original]))
+
+    monitor.sync({"p": position})  # the in-place change is picked up as an update
+    assert_same_metrics(monitor.metrics(), RiskMonitor(**LIMITS).get_metrics([position]))
+    monitor.close_position("p")
+    assert_same_metrics(monitor.metrics(), RiskMonitor(**LIMITS).get_metrics([]))
@@ -0,0 +1,78 @@
+import pytest
+
+from services.api.repositories import WalletAddressIndex, WalletRepository
+
+from tests.fixtures.db import db_session  # noqa: F401
+
+
+class CountingWalletRepository(WalletRepository):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.batched_lookups = 0
+
+    async def active_rows_for_addresses(self, addresses):
+        self.batched_lookups += 1
+        return await super().active_rows_for_addresses(addresses)
+
+
+@pytest.mark.asyncio
+async def test_index_preload_and_batched_misses(db_session):
+    index = WalletAddressIndex()
+    repo = CountingWalletRepository(db_session, address_index=index)
+    known = await repo.create(address="0xaaa", chain="ethereum")
+
+    assert await index.preload(repo) == 1
+    assert index.lookup("0xAAA") == known.id
+
+    late = await repo.create(address="0xbbb", chain="ethereum")
+    resolved = await index.resolve(repo, ["0xaaa", "0xbbb", "0xccc", "0xbbb"])
+
+    assert resolved == {"0xaaa": known.id, "0xbbb": late.id}
+    assert repo.batched_lookups == 1
+    assert index.lookup("0xbbb") == late.id
+
+    await index.resolve(repo, ["0xaaa", "0xbbb"])
+    assert repo.batched_lookups == 1
+
+
+@pytest.mark.asyncio
+async def test_index_invalidated_by_repository_writes(db_session):
+    index = WalletAddressIndex()
+    repo = WalletRepository(db_session, address_index=index)
+    wallet = await repo.create(address="0xddd", chain="ethereum")
+    await index.preload(repo)
+
+    await repo.add_tags(wallet.id, ["fund"])
+    assert index.lookup("0xddd") is None
+    assert await index.resolve(repo, ["0xddd"]) == {"0xddd": wallet.id}
+
+    await repo.set_active(wallet.id, False)
+    assert index.lookup("0xddd") is None
+    assert await index.resolve(repo, ["0xddd"]) == {}
+
+
+@pytest.mark.asyncio
+async def test_index_refresh_is_incremental(db_session):
+    index = WalletAddressIndex()
+    repo = WalletRepository(db_session)
+    await repo.create(address="0xeee", chain="ethereum")
+    await index.preload(repo)
+    watermark = index.watermark
+
+    newcomer = await repo.create(address="0xfff", chain="ethereum")
+    await db_session.refresh(newcomer)
+    assert await index.refresh(repo) >= 1
+    assert index.lookup("0xfff") == newcomer.id
+    assert index.watermark >= watermark
+    assert len(index) == 2
+
+
+@pytest.mark.asyncio
+async def test_index_resolves_checksummed_addresses(db_session):
+    index = WalletAddressIndex()
+    repo = WalletRepository(db_session, address_index=index)
+    wallet = await repo.create(address="0xAbCdEf", chain="ethereum")
+    assert wallet.address == "0xabcdef"
+
+    assert await index.resolve(repo, ["0xABCDEF"]) == {"0xabcdef": wallet.id}
+    assert index.lookup("0xabcdef") == wallet.id
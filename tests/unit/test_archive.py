@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from packages.archive import ARCHIVE_TABLES, ArchiveReader, wallet_stats_from_archive
+from packages.archive.writer import partition_path, write_partition
+from packages.scoring import WalletScoringEngine
+from services.api.bias.calculator import BiasCalculator
+
+DAY = datetime(2026, 9, 1, 12, 0)
+
+
+def _position(pid, wallet, pnl, minutes, asset="ETH"):
+    opened = DAY + timedelta(minutes=len(pid))
+    return (pid, opened, opened + timedelta(minutes=minutes), "demo", asset, "long",
+            100.0, 101.0, 1.0, 1.0, pnl, 0.1, minutes * 60, wallet)
+
+
+def _event(eid, wallet, notional, fraction, asset="ETH"):
+    return (eid, DAY, wallet, f"0x{eid}", "transfer", asset, 1.0, notional, fraction, None, False)
+
+
+@pytest.fixture
+def archive(tmp_path):
+    positions = ARCHIVE_TABLES["positions"]
+    events = ARCHIVE_TABLES["events"]
+    write_partition(
+        partition_path(tmp_path, "positions", DAY.date(), "ETH"),
+        positions,
+        [_position("p1", "w1", 50.0, 30), _position("p22", "w1", -10.0, 90), _position("p333", None, 5.0, 10)],
+    )
+    write_partition(
+        partition_path(tmp_path, "events", DAY.date(), "ETH"),
+        events,
+        [_event("e1", "w1", 1000.0, 0.2), _event("e2", "w2", None, 0.6), _event("e3", "w1", 3000.0, None)],
+        compress=True,
+    )
+    return ArchiveReader(tmp_path)
+
+
+def test_partitions_roundtrip_and_mmap(archive):
+    (partition,) = archive.partitions("positions", assets=["ETH"])
+    assert isinstance(partition.column("realized_pnl"), np.memmap)
+    assert partition.values("signal_wallet_id").tolist() == ["w1", "w1", None]
+    assert partition.values("opened_at")[0] == np.datetime64(DAY + timedelta(minutes=2), "us")
+    assert archive.partitions("positions", assets=["BTC"]) == []
+
+    events = archive.read("events", ["id", "notional_usd"], start=DAY, end=DAY + timedelta(seconds=1))
+    assert events["id"].tolist() == ["e1", "e2", "e3"]
+    assert np.isnan(events["notional_usd"][1])
+    assert archive.read("events", ["id"], start=DAY + timedelta(days=1))["id"].size == 0
+
+
+def test_wallet_stats_and_offline_scoring(archive):
+    stats = {entry.wallet_id: entry for entry in wallet_stats_from_archive(archive)}
+    assert sorted(stats) == ["w1", "w2"]
+    w1 = stats["w1"]
+    assert [trade.pnl for trade in w1.trades] == [50.0, -10.0]
+    assert w1.trades[1].duration_minutes == pytest.approx(90)
+    assert w1.false_signal_rate == pytest.approx(0.5)
+    assert w1.recent_events == 2
+    assert w1.avg_size_usd == pytest.approx(2000.0)
+    assert w1.liquidity_utilization == pytest.approx(0.2)
+    assert stats["w2"].trades == []
+
+    scores = WalletScoringEngine().score_archive(archive)
+    assert [result.wallet_id for result in scores] == ["w1", "w2"]
+    bias = BiasCalculator().calculate_from_archive("ETH", "1h", archive)
+    assert set(bias.components) == {"w1", "w2"}
+    assert BiasCalculator().calculate_from_archive("BTC", "1h", archive).confidence == 0.0
@@ -0,0 +1,100 @@
+import random
+
+from packages.scoring.models import TradeSnapshot, WalletStats
+from services.api.llm.trigger import TriggerThresholds
+from services.api.risk.config_loader import load_risk_config
+from services.backtest import BacktestEvent, BacktestParams, BacktestRunner, SimulatedClock, run_sweep
+
+
+def make_events(count=400, seed=7):
+    rng = random.Random(seed)
+    start = 1_700_000_000.0
+    events = []
+    for index in range(count):
+        events.append(
+            BacktestEvent(
+                timestamp=start + index * 90,
+                wallet_id=f"w{rng.randrange(6)}",
+                tx_hash=f"0x{index:08x}",
+                event_type=rng.choice(["transfer", "swap", "deposit_cex", "withdraw_cex"]),
+                asset=rng.choice(["BTC", "ETH", "SOL"]),
+                notional_usd=rng.uniform(10_000, 500_000),
+                size_fraction=rng.uniform(0.0, 0.5),
+            )
+        )
+    return events
+
+
+def make_wallets():
+    wallets = {}
+    for index in range(6):
+        trades = [
+            TradeSnapshot(
+                pnl=(-1) ** n * (index + 1) * 10.0 + index,
+                entry_timestamp=n * 3600.0,
+                exit_timestamp=n * 3600.0 + 1800,
+                duration_minutes=30,
+            )
+            for n in range(5)
+        ]
+        wallets[f"w{index}"] = WalletStats(
+            wallet_id=f"w{index}",
+            trades=trades,
+            recent_events=index + 1,
+            avg_size_usd=50_000,
+            liquidity_utilization=0.3,
+        )
+    return wallets
+
+
+def test_simulated_clock_only_moves_forward():
+    clock = SimulatedClock(10.0)
+    clock.advance_to(5.0)
+    assert clock() == 10.0
+    clock.advance(2.5)
+    clock.advance_to(20.0)
+    assert clock() == 20.0
+
+
+def test_backtest_replay_is_deterministic():
+    events = make_events()
+    config = load_risk_config()
+    first = BacktestRunner(BacktestParams(), wallet_stats=make_wallets(), risk_config=config).run(events)
+    second = BacktestRunner(BacktestParams(), wallet_stats=make_wallets(), risk_config=config).run(events)
+
+    assert first.events == len(events)
+    assert first.triggered > 0
+    assert first.llm_calls == first.triggered
+    assert first.orders + sum(first.rejections.values()) == first.triggered
+    assert first.simulated_seconds == events[-1].timestamp - events[0].timestamp
+    for field in ("triggered", "llm_calls", "llm_tokens", "orders", "rejections", "final_bias"):
+        assert getattr(first, field) == getattr(second, field)
+
+
+def test_stricter_thresholds_trigger_less():
+    events = make_events()
+    config = load_risk_config()
+    loose = BacktestRunner(BacktestParams(), wallet_stats=make_wallets(), risk_config=config).run(events)
+    strict = BacktestRunner(
+        BacktestParams(thresholds=TriggerThresholds(min_size_frac=0.3, min_notional_usd=300_000)),
+        wallet_stats=make_wallets(),
+        risk_config=config,
+    ).run(events)
+    assert strict.triggered < loose.triggered
+
+
+def test_sweep_matches_serial_runs():
+    events = make_events(200)
+    config = load_risk_config()
+    wallets = make_wallets()
+    params = [
+        BacktestParams(name="base"),
+        BacktestParams(name="tight", risk_overrides={"portfolio": {"max_open_positions": 1}}),
+    ]
+    parallel = run_sweep(events, params, wallet_stats=wallets, risk_config=config, workers=2)
+    serial = run_sweep(events, params, wallet_stats=wallets, risk_config=config, workers=1)
+
+    assert [report.name for report in parallel] == ["base", "tight"]
+    for left, right in zip(parallel, serial):
+        assert (left.triggered, left.orders, left.rejections) == (right.triggered, right.orders, right.rejections)
+    assert parallel[1].orders <= parallel[0].orders
@@ -0,0 +1,220 @@
+import asyncio
+import json
+
+import pytest
+
+from packages.telemetry.tracing import trace_id_var
+from services.api.monitoring.metrics import MetricsRegistry
+from services.order_manager.telemetry import RotatingFileSink, TelemetryRecorder
+
+
+class ListSink:
+    def __init__(self, *, fail=False, gate=None):
+        self.batches = []
+        self.fail = fail
+        self.gate = gate
+
+    async def write(self, events):
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.fail:
+            raise RuntimeError("sink down")
+        self.batches.append([event.payload["n"] for event in events])
+
+
+def test_recorder_keeps_most_recent_events_in_order():
+    recorder = TelemetryRecorder(capacity=3)
+    for n in range(5):
+        recorder.record_success({"n": n}, {"code": "0"})
+    recorder.record_failure({"n": 5}, "boom")
+    events = recorder.events
+    assert [event.payload["n"] for event in events] == [3, 4, 5]
+    assert events[-1].status == "failure" and events[-1].error == "boom"
+    assert events[0].timestamp.tzinfo is not None
+    assert recorder.dropped == 0
+    recorder.clear()
+    assert recorder.events == []
+
+
+def test_recorder_captures_trace_id():
+    recorder = TelemetryRecorder()
+    token = trace_id_var.set("trace-1")
+    try:
+        recorder.record_success({"n": 0}, {})
+    finally:
+        trace_id_var.reset(token)
+    recorder.record_success({"n": 1}, {})
+    assert [event.trace_id for event in recorder.events] == ["trace-1", None]
+
+
+def test_recorder_rejects_bad_configuration():
+    with pytest.raises(ValueError):
+        TelemetryRecorder(capacity=0)
+    with pytest.raises(ValueError):
+        TelemetryRecorder(overflow="spill")
+    with pytest.raises(ValueError):
+        TelemetryRecorder(overflow="block")
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_pending_events_in_batches():
+    sink = ListSink()
+    registry = MetricsRegistry()
+    recorder = TelemetryRecorder(capacity=10, sink=sink, batch_size=4, metrics=registry)
+    for n in range(6):
+        recorder.record_success({"n": n}, {})
+    assert recorder.pending == 6
+    assert await recorder.flush() == 6
+    assert sink.batches == [[0, 1, 2, 3], [4, 5]]
+    assert recorder.pending == 0 and recorder.flushed == 6
+    assert registry.export()["execution_telemetry_flushed_total"] == 6
+    assert [event.payload["n"] for event in recorder.events] == list(range(6))
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_overwrites_unflushed_events():
+    sink = ListSink()
+    recorder = TelemetryRecorder(capacity=3, sink=sink, overflow="drop_oldest")
+    for n in range(5):
+        recorder.record_success({"n": n}, {})
+    assert recorder.dropped == 2
+    await recorder.flush()
+    assert sink.batches == [[2, 3, 4]]
+
+
+@pytest.mark.asyncio
+async def test_drop_newest_discards_incoming_events():
+    sink = ListSink()
+    registry = MetricsRegistry()
+    recorder = TelemetryRecorder(capacity=3, sink=sink, overflow="drop_newest", metrics=registry)
+    for n in range(5):
+        recorder.record_success({"n": n}, {})
+    assert recorder.dropped == 2
+    assert registry.export()["execution_telemetry_dropped_total"] == 2
+    await recorder.flush()
+    assert sink.batches == [[0, 1, 2]]
+
+
+@pytest.mark.asyncio
+async def test_block_policy_keeps_events_and_applies_backpressure():
+    sink = ListSink()
+    recorder = TelemetryRecorder(capacity=2, sink=sink, batch_size=2, overflow="block", max_overflow=3)
+    for n in range(5):
+        recorder.record_success({"n": n}, {})
+    assert recorder.saturated is True
+    assert recorder.dropped == 0
+    assert recorder.pending == 5
+    assert await recorder.wait_for_capacity() is True
+    assert recorder.saturated is False
+    await recorder.flush()
+    assert [n for batch in sink.batches for n in batch] == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_block_policy_drops_past_max_overflow():
+    metrics = MetricsRegistry()
+    recorder = TelemetryRecorder(capacity=2, sink=ListSink(), overflow="block", max_overflow=1, metrics=metrics)
+    for n in range(5):
+        recorder.record_success({"n": n}, {})
+    assert recorder.pending == 3
+    assert recorder.dropped == 2
+    assert metrics.export()["execution_telemetry_dropped_total"] == 2
+
+
+@pytest.mark.asyncio
+async def test_wait_for_capacity_times_out_without_losing_the_batch():
+    gate = asyncio.Event()
+    sink = ListSink(gate=gate)
+    recorder = TelemetryRecorder(capacity=2, sink=sink, batch_size=2, overflow="block", block_timeout=0.01)
+    for n in range(3):
+        recorder.record_success({"n": n}, {})
+
+    assert await recorder.wait_for_capacity() is False
+    assert recorder.capacity_timeouts == 1
+    assert recorder.pending == 3
+
+    gate.set()
+    assert await recorder.flush() == 3
+    assert [n for batch in sink.batches for n in batch] == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_background_flusher_drains_full_batches_and_on_close():
+    sink = ListSink()
+    async with TelemetryRecorder(capacity=100, sink=sink, batch_size=3, flush_interval=60) as recorder:
+        for n in range(3):
+            recorder.record_success({"n": n}, {})
+        for _ in range(20):
+            if sink.batches:
+                break
+            await asyncio.sleep(0)
+        assert sink.batches == [[0, 1, 2]]
+        recorder.record_success({"n": 3}, {})
+    assert sink.batches == [[0, 1, 2], [3]]
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_counts_dropped_events():
+    recorder = TelemetryRecorder(capacity=10, sink=ListSink(fail=True))
+    recorder.record_failure({"n": 0}, "rejected")
+    assert await recorder.flush() == 0
+    assert recorder.dropped == 1
+    assert recorder.last_error == "RuntimeError: sink down"
+
+
+@pytest.mark.asyncio
+async def test_block_policy_retries_failed_batches_in_order():
+    sink = ListSink(fail=True)
+    recorder = TelemetryRecorder(capacity=2, sink=sink, batch_size=2, overflow="block", max_overflow=3)
+    for n in range(5):
+        recorder.record_success({"n": n}, {})
+    assert await recorder.flush() == 0
+    assert await recorder.flush() == 0
+    assert recorder.dropped == 0
+    assert recorder.pending == 5
+    assert recorder.last_error == "RuntimeError: sink down"
+
+    sink.fail = False
+    assert await recorder.flush() == 5
+    assert [n for batch in sink.batches for n in batch] == [0, 1, 2, 3, 4]
+    assert recorder.saturated is False
+
+
+@pytest.mark.asyncio
+async def test_background_flusher_backs_off_until_the_sink_recovers():
+    class FlakySink(ListSink):
+        attempts = 0
+
+        async def write(self, events):
+            self.attempts += 1
+            self.fail = self.attempts <= 3
+            await super().write(events)
+
+    sink = FlakySink()
+    async with TelemetryRecorder(
+        capacity=10, sink=sink, batch_size=2, flush_interval=60, overflow="block", retry_delay=0.001
+    ) as recorder:
+        for n in range(2):
+            recorder.record_success({"n": n}, {})
+        for _ in range(200):
+            if sink.batches:
+                break
+            await asyncio.sleep(0.001)
+    assert sink.batches == [[0, 1]]
+    assert sink.attempts == 4
+    assert recorder.dropped == 0
+
+
+@pytest.mark.asyncio
+async def test_rotating_file_sink_rolls_files(tmp_path):
+    path = tmp_path / "telemetry.jsonl"
+    sink = RotatingFileSink(path, max_bytes=200, backups=2)
+    recorder = TelemetryRecorder(sink=sink, batch_size=1)
+    for n in range(6):
+        recorder.record_success({"n": n, "pad": "x" * 40}, {})
+    await recorder.flush()
+    assert path.exists() and (tmp_path / "telemetry.jsonl.1").exists()
+    assert not (tmp_path / "telemetry.jsonl.3").exists()
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert lines[-1]["payload"]["n"] == 5
+    assert lines[-1]["status"] == "success"
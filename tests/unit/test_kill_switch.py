@@ -0,0 +1,98 @@
+import multiprocessing
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from services.order_manager.killswitch import KillSwitch, KillSwitchState, SharedKillSwitchFlag
+
+
+def test_kill_switch_status_tracks_reasons():
+    killswitch = KillSwitch()
+    assert killswitch.status() == {
+        "manual": False,
+        "drawdown": False,
+        "technical": False,
+        "regulatory": False,
+        "active": False,
+    }
+    killswitch.activate("drawdown")
+    killswitch.activate("technical")
+    assert killswitch.is_active() is True
+    assert killswitch.state == KillSwitchState(drawdown=True, technical=True)
+    killswitch.deactivate("drawdown")
+    assert killswitch.is_active() is True
+    assert killswitch.deactivate()["active"] is False
+    assert killswitch.is_active() is False
+
+
+def test_kill_switch_unknown_reason_is_recorded_but_does_not_halt():
+    killswitch = KillSwitch()
+    status = killswitch.activate("unknown")
+    assert status["active"] is False
+    assert list(killswitch.actions) == ["unknown"]
+
+
+def test_kill_switch_action_history_is_bounded():
+    killswitch = KillSwitch(history=3)
+    for reason in ("manual", "drawdown", "technical", "regulatory", "manual"):
+        killswitch.activate(reason)
+    assert list(killswitch.actions) == ["technical", "regulatory", "manual"]
+
+
+def test_kill_switch_state_setter_replaces_mask():
+    killswitch = KillSwitch()
+    killswitch.activate("manual")
+    killswitch.state = KillSwitchState(regulatory=True)
+    assert killswitch.status()["manual"] is False
+    assert killswitch.status()["regulatory"] is True
+    killswitch.state = KillSwitchState()
+    assert killswitch.is_active() is False
+
+
+def test_kill_switch_state_is_read_only():
+    killswitch = KillSwitch()
+    with pytest.raises(FrozenInstanceError):
+        killswitch.state.manual = True  # type: ignore[misc]
+    assert killswitch.is_active() is False
+
+
+def test_shared_flag_is_visible_to_other_switches(tmp_path):
+    path = tmp_path / "halt.flag"
+    first, second = SharedKillSwitchFlag(path), SharedKillSwitchFlag(path)
+    try:
+        worker_a, worker_b = KillSwitch(shared=first), KillSwitch(shared=second)
+        generation = first.generation
+        worker_a.activate("manual")
+        assert worker_b.is_active() is True and second.is_set() is True
+        assert worker_b.status()["manual"] is True
+        assert second.generation == generation + 1
+        worker_b.activate("regulatory")
+        worker_a.deactivate("manual")
+        assert worker_a.status()["regulatory"] is True
+        worker_b.deactivate()
+        assert worker_a.is_active() is False
+    finally:
+        first.close()
+        second.close()
+
+
+def _halt(path):
+    flag = SharedKillSwitchFlag(path)
+    KillSwitch(shared=flag).activate("technical")
+    flag.close()
+
+
+def test_shared_flag_crosses_processes(tmp_path):
+    path = tmp_path / "halt.flag"
+    flag = SharedKillSwitchFlag(path)
+    try:
+        killswitch = KillSwitch(shared=flag)
+        assert killswitch.is_active() is False
+        process = multiprocessing.get_context("spawn").Process(target=_halt, args=(str(path),))
+        process.start()
+        process.join(timeout=30)
+        assert process.exitcode == 0
+        assert killswitch.is_active() is True
+        assert killswitch.status()["technical"] is True
+    finally:
+        flag.close()
@@ -1,6 +1,7 @@
 import pytest
 
 from services.api.llm.client import GroqClient, LLMRequest
+from services.api.monitoring.metrics import MetricsRegistry
 
 
 @pytest.mark.asyncio
@@ -22,3 +23,17 @@ async def test_llm_client_batch_generation():
     responses = await client.batch_generate(requests)
     assert len(responses) == 3
     assert all(resp.model == "llama-3.3-70b-versatile" for resp in responses)
+
+
+@pytest.mark.asyncio
+async def test_llm_client_records_model_call_metrics():
+    registry = MetricsRegistry()
+    client = GroqClient(metrics=registry)
+    await client.generate(LLMRequest(prompt="Event", tier="critical"))
+    await client.generate(LLMRequest(prompt="Event", tier="critical"))  # cache hit
+    await client.generate(LLMRequest(prompt="Other", tier="simple"))
+
+    exported = registry.export()
+    assert exported['llm_requests_total{model="llama-4-maverick-17b-128e-instruct",purpose="critical"}'] == 1
+    assert exported['llm_requests_total{model="llama-3.2-3b-preview",purpose="simple"}'] == 1
+    assert exported['llm_latency_seconds_count{model="llama-3.2-3b-preview"}'] == 1
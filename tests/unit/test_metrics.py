@@ -1,6 +1,9 @@
+from types import SimpleNamespace
+
 import pytest
 
-from services.api.monitoring.metrics import registry, get_metrics
+from services.api.monitoring.metrics import MetricsRegistry, registry, get_metrics
+from services.api.monitoring.middleware import LatencyMiddleware
 
 
 def test_registry_gauge_and_export():
@@ -16,3 +19,124 @@ async def test_get_metrics_async():
     registry.gauge("dummy", 1)
     metrics = await get_metrics()
     assert "dummy" in metrics
+
+
+def test_counter_and_histogram_export():
+    local = MetricsRegistry()
+    local.counter("orders_total").inc()
+    local.counter("orders_total").inc(2)
+    latency = local.histogram("latency_seconds", buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        latency.observe(value)
+
+    exported = local.export()
+    assert exported["orders_total"] == 3
+    assert exported['latency_seconds_bucket{le="0.1"}'] == 2
+    assert exported['latency_seconds_bucket{le="1.0"}'] == 3
+    assert exported['latency_seconds_bucket{le="+Inf"}'] == 4
+    assert exported["latency_seconds_count"] == 4
+    assert exported["latency_seconds_sum"] == pytest.approx(3.65)
+
+
+def test_labeled_families_export_with_labels():
+    local = MetricsRegistry()
+    requests = local.counter_family("llm_requests_total", ("model", "purpose"))
+    handle = requests.labels("llama", "analysis")
+    assert requests.labels(model="llama", purpose="analysis") is handle
+    handle.inc()
+    handle.inc()
+    local.gauge_family("bias_value", ("asset", "timeframe")).labels("BTC", "1h").set(0.4)
+    latency = local.histogram_family("api_latency_seconds", ("endpoint",), buckets=(0.1, 1.0))
+    latency.labels('/v1/"bias"').observe(0.5)
+
+    exported = local.export()
+    assert exported['llm_requests_total{model="llama",purpose="analysis"}'] == 2
+    assert exported['bias_value{asset="BTC",timeframe="1h"}'] == 0.4
+    assert exported['api_latency_seconds_bucket{endpoint="/v1/\\"bias\\"",le="1.0"}'] == 1
+    with pytest.raises(ValueError):
+        requests.labels("llama")
+    with pytest.raises(ValueError):
+        local.counter_family("llm_requests_total", ("model",))
+    with pytest.raises(ValueError):
+        local.histogram("llm_requests_total")
+
+
+def test_histogram_quantile_interpolates_within_bucket():
+    local = MetricsRegistry()
+    latency = local.histogram("latency_seconds", buckets=(0.1, 0.2, 0.4))
+    for value in [0.05] * 50 + [0.15] * 45 + [0.3] * 5:
+        latency.observe(value)
+    assert latency.quantile(0.5) == pytest.approx(0.1)
+    assert latency.quantile(0.95) == pytest.approx(0.2)
+    assert latency.quantile(0.99) == pytest.approx(0.36)
+
+
+def test_hdr_histogram_quantiles_within_relative_error():
+    local = MetricsRegistry()
+    latency = local.hdr_histogram("llm_latency_seconds")
+    values = [index / 1000 for index in range(1, 10_001)]  # 1ms .. 10s
+    for value in values:
+        latency.observe(value)
+    for q, expected in ((0.5, 5.0), (0.95, 9.5), (0.99, 9.9)):
+        assert latency.quantile(q) == pytest.approx(expected, rel=0.01)
+    exported = local.export()
+    assert exported['llm_latency_seconds{quantile="0.95"}'] == pytest.approx(9.5, rel=0.01)
+    assert exported["llm_latency_seconds_count"] == 10_000
+    latency.observe(1e9)
+    latency.observe(0.0)
+    assert latency.quantile(1.0) == 1e9
+    assert latency.quantile(0.0) <= 1e-6
+
+
+def test_render_prometheus_groups_samples_by_metric():
+    local = MetricsRegistry()
+    local.gauge("positions_open", 2)
+    local.counter("orders_total").inc(3)
+    local.histogram("latency_seconds", buckets=(0.1,)).observe(0.05)
+    family = local.hdr_histogram_family("llm_latency_seconds", ("model",))
+    family.labels("a").observe(0.2)
+    family.labels("b").observe(0.4)
+    text = local.render_prometheus()
+    lines = text.splitlines()
+    assert "# TYPE positions_open gauge" in lines
+    assert "positions_open 2.0" in lines
+    assert "# TYPE orders_total counter" in lines
+    assert 'latency_seconds_bucket{le="+Inf"} 1.0' in lines
+    assert lines.count("# TYPE llm_latency_seconds summary") == 1
+    assert 'llm_latency_seconds_count{model="b"} 1.0' in lines
+    assert text.endswith("\n")
+
+
+def test_snapshot_is_reused_until_gauges_change():
+    local = MetricsRegistry()
+    counter = local.counter("orders_total")
+    first = local.snapshot()
+    counter.inc()
+    assert local.snapshot() is first
+    assert local.snapshot(max_age=0.0)["orders_total"] == 1
+    local.gauge("positions_open", 1)
+    assert local.snapshot()["positions_open"] == 1
+    with pytest.raises(TypeError):
+        local.snapshot()["positions_open"] = 2
+
+
+@pytest.mark.asyncio
+async def test_latency_middleware_labels_by_route_template():
+    local = MetricsRegistry()
+    ticks = iter([1.0, 1.25, 2.0, 2.5])
+
+    async def app(scope, receive, send):
+        if scope["path"] == "/v1/bias/BTC":
+            scope["route"] = SimpleNamespace(path="/v1/bias/{asset}")
+            return
+        raise RuntimeError("boom")
+
+    middleware = LatencyMiddleware(app, metrics=local, clock=lambda: next(ticks))
+    await middleware({"type": "http", "method": "GET", "path": "/v1/bias/BTC"}, None, None)
+    with pytest.raises(RuntimeError):
+        await middleware({"type": "http", "method": "POST", "path": "/nope"}, None, None)
+
+    exported = local.export()
+    assert exported['api_latency_seconds_count{endpoint="/v1/bias/{asset}",method="GET"}'] == 1
+    assert exported['api_latency_seconds_sum{endpoint="/v1/bias/{asset}",method="GET"}'] == pytest.approx(0.25)
+    assert exported['api_latency_seconds_count{endpoint="unmatched",method="POST"}'] == 1
@@ -1,10 +1,15 @@
+import asyncio
 import base64
 import hashlib
 import hmac
+import json
+import re
 
 import pytest
 
-from services.order_manager.okx_client import MemoryTransport, OKXClient, OKXCredentials
+from services.order_manager.coalescer import OrderCoalescer
+from services.order_manager.okx_client import MemoryTransport, OKXClient, OKXCredentials, split_batch_response
+from services.order_manager.signing import MonotonicClock, SigningContext
 
 
 @pytest.mark.asyncio
@@ -33,3 +38,117 @@ async def test_create_order_records_request(monkeypatch):
     headers = transport.last_call["headers"]
     assert headers["OK-ACCESS-KEY"] == "key"
     assert headers["x-simulated-trading"] == "1"
+
+
+class BatchTransport(MemoryTransport):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    async def post(self, path, headers, body):
+        self.calls.append((path, json.loads(body)))
+        if path == "/api/v5/trade/batch-orders":
+            orders = json.loads(body)
+            data = [{"ordId": str(index), "sCode": "0", "sMsg": "", "instId": order["instId"]} for index, order in enumerate(orders)]
+            data[-1].update(sCode="51008", sMsg="insufficient balance")
+            return {"code": "2", "msg": "partial", "data": data}
+        return {"code": "0", "msg": "", "data": [{"ordId": "single", "sCode": "0"}]}
+
+
+@pytest.mark.asyncio
+async def test_create_orders_chunks_to_batch_limit():
+    transport = BatchTransport()
+    client = OKXClient(OKXCredentials(api_key="key", secret_key="secret", passphrase="pass"), transport=transport)
+    payloads = [{"instId": f"A{index}-USDT"} for index in range(45)]
+
+    results = await client.create_orders(payloads)
+
+    assert [path for path, _ in transport.calls] == ["/api/v5/trade/batch-orders"] * 3
+    assert [len(body) for _, body in transport.calls] == [20, 20, 5]
+    assert [result["data"][0]["instId"] for result in results] == [payload["instId"] for payload in payloads]
+    assert results[0]["code"] == "0"
+    assert (results[19]["code"], results[19]["msg"]) == ("51008", "insufficient balance")
+
+
+def test_split_batch_response_applies_request_errors_to_every_order():
+    response = {"code": "50011", "msg": "rate limited", "data": []}
+    assert split_batch_response(response, 3) == [response] * 3
+
+
+@pytest.mark.asyncio
+async def test_coalescer_merges_concurrent_orders():
+    transport = BatchTransport()
+    client = OKXClient(OKXCredentials(api_key="key", secret_key="secret", passphrase="pass"), transport=transport)
+    coalescer = OrderCoalescer(client, window=0.01)
+
+    results = await asyncio.gather(*(coalescer.submit({"instId": f"A{index}-USDT"}) for index in range(5)))
+    single = await coalescer.submit({"instId": "BTC-USDT"})
+
+    assert [path for path, _ in transport.calls] == ["/api/v5/trade/batch-orders", "/api/v5/trade/order"]
+    assert [result["data"][0]["instId"] for result in results] == [f"A{index}-USDT" for index in range(5)]
+    assert results[-1]["code"] == "51008"
+    assert single["data"][0]["ordId"] == "single"
+    assert (coalescer.batches, coalescer.orders) == (2, 6)
+
+
+@pytest.mark.asyncio
+async def test_coalescer_flushes_at_max_batch_and_propagates_errors():
+    class FailingTransport(BatchTransport):
+        async def post(self, path, headers, body):
+            await super().post(path, headers, body)
+            raise RuntimeError("connection reset")
+
+    transport = FailingTransport()
+    client = OKXClient(OKXCredentials(api_key="key", secret_key="secret", passphrase="pass"), transport=transport)
+    coalescer = OrderCoalescer(client, window=60.0, max_batch=3)
+
+    results = await asyncio.gather(*(coalescer.submit({"instId": "ETH-USDT"}) for _ in range(3)), return_exceptions=True)
+
+    assert len(transport.calls) == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_signing_context_matches_fresh_hmac():
+    creds = OKXCredentials(api_key="key", secret_key="secret", passphrase="pass")
+    context = SigningContext(creds, simulated=False)
+    for body in ("{}", '{"instId":"BTC-USDT"}', "[]"):
+        expected = base64.b64encode(
+            hmac.new(b"secret", f"2024-01-01T00:00:00.000ZPOST/api/v5/trade/order{body}".encode(), hashlib.sha256).digest()
+        ).decode()
+        assert context.sign("2024-01-01T00:00:00.000Z", "post", "/api/v5/trade/order", body) == expected
+    headers = context.headers("ts", "sig")
+    assert headers == {"OK-ACCESS-KEY": "key", "OK-ACCESS-PASSPHRASE": "pass", "OK-ACCESS-SIGN": "sig", "OK-ACCESS-TIMESTAMP": "ts"}
+    assert context.headers("ts2", "sig2")["OK-ACCESS-SIGN"] == "sig2"
+    assert headers["OK-ACCESS-SIGN"] == "sig"  # each request gets its own copy
+
+
+def test_client_rebuilds_signing_context_when_credentials_change():
+    client = OKXClient(OKXCredentials(api_key="key", secret_key="secret", passphrase="pass"))
+    before = client._sign("t", "POST", "/p", "{}")
+    client.credentials = OKXCredentials(api_key="key", secret_key="other", passphrase="pass")
+    assert client._sign("t", "POST", "/p", "{}") != before
+
+
+def test_monotonic_clock_formats_okx_timestamps_and_ignores_wall_steps():
+    wall = [1_700_000_000_123_000_000]
+    mono = [5_000_000_000]
+    clock = MonotonicClock(wall=lambda: wall[0], monotonic=lambda: mono[0])
+    assert clock.iso() == "2023-11-14T22:13:20.123Z"
+
+    wall[0] -= 3_600 * 10**9  # wall clock stepped back an hour
+    mono[0] += 1_500_000_000
+    assert clock.iso() == "2023-11-14T22:13:21.623Z"
+
+    mono[0] += 301 * 10**9  # past reanchor_seconds: picks up the corrected wall clock, moving back an hour
+    assert clock.iso() == "2023-11-14T21:13:20.123Z"
+    assert clock.now_ms() < 1_700_000_000_123 + 1_500
+
+
+@pytest.mark.asyncio
+async def test_create_order_sends_iso_timestamp():
+    transport = MemoryTransport()
+    client = OKXClient(OKXCredentials(api_key="key", secret_key="secret", passphrase="pass"), transport=transport)
+    await client.create_order({"instId": "BTC-USDT"})
+    headers = transport.last_call["headers"]
+    assert re.fullmatch(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\.\d{3}Z", headers["OK-ACCESS-TIMESTAMP"])
+    assert headers["OK-ACCESS-SIGN"] == client._sign(headers["OK-ACCESS-TIMESTAMP"], "POST", "/api/v5/trade/order", transport.last_call["body"])
@@ -0,0 +1,72 @@
+import re
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from services.order_manager.idempotency import IdempotencyIndex, client_order_id
+from services.order_manager.service import TradeSignal
+
+
+def make_signal(**kwargs):
+    data = {
+        "trading_mode": "demo",
+        "asset": "BTC-USDT",
+        "side": "buy",
+        "size_percent": 0.1,
+        "leverage": 2.0,
+        "rr_ratio": 2.0,
+        "wallet_credibility": 6.0,
+        "quantity": 0.01,
+    }
+    data.update(kwargs)
+    return TradeSignal(**data)
+
+
+def test_client_order_id_is_random_without_signal_id():
+    order_id = client_order_id(make_signal())
+    assert re.fullmatch(r"[a-z][0-9a-f]{31}", order_id)
+    assert order_id != client_order_id(make_signal())  # identical trades are still distinct orders
+
+
+def test_client_order_id_follows_signal_id():
+    first = make_signal(signal_id="evt-1", quantity=0.01)
+    redelivered = make_signal(signal_id="evt-1", quantity=0.011, wallet_credibility=7.0)
+    assert client_order_id(first) == client_order_id(redelivered)
+    assert re.fullmatch(r"[a-z][0-9a-f]{31}", client_order_id(first))
+    assert client_order_id(first) != client_order_id(make_signal(signal_id="evt-2"))
+
+
+def test_index_claims_once_and_stays_bounded():
+    index = IdempotencyIndex(max_entries=3)
+    assert index.claim("a") is True
+    assert index.claim("a") is False
+    for order_id in ("b", "c", "d"):
+        index.claim(order_id)
+    assert "a" not in index
+    assert len(index) == 3
+    index.release("d")
+    assert index.claim("d") is True
+
+
+class FakeOrderRepository:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    async def client_order_ids_since(self, since):
+        self.calls.append(since)
+        return [row for row in self.rows if since is None or row[1] >= since]
+
+
+@pytest.mark.asyncio
+async def test_index_refresh_is_incremental():
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    repo = FakeOrderRepository([("b1", now - timedelta(minutes=5)), ("b2", now)])
+    index = IdempotencyIndex()
+
+    assert await index.refresh(repo) == 2
+    assert index.watermark == now
+    repo.rows.append(("b3", now + timedelta(seconds=30)))
+    assert await index.refresh(repo) == 2  # the overlap re-reads b2
+    assert repo.calls[-1] == now - timedelta(seconds=1)
+    assert {"b1", "b2", "b3"} <= set(index._ids)
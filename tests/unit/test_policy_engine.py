@@ -1,4 +1,5 @@
 from services.api.risk.policy import PolicyEngine, PortfolioState, ProposedTrade
+from services.api.risk.testing import LegacyPolicyEngine, random_cases
 
 
 CONFIG = {
@@ -94,3 +95,25 @@ def test_policy_engine_correlation_limits():
     passed, results = engine.validate(trade, portfolio, exposures=exposures)
     assert passed is False
     assert results["correlation"]["passed"] is False
+
+
+def test_compiled_limits_match_legacy_decisions():
+    for config in (CONFIG, {}, {"portfolio": {"max_open_positions": 1}, "correlation_limits": {"same_direction": 0.2}}):
+        legacy = LegacyPolicyEngine(config)
+        compiled = PolicyEngine(config)
+        for trade, portfolio, exposures in random_cases(2000, seed=5):
+            expected = legacy.validate(trade, portfolio, exposures)
+            assert compiled.validate(trade, portfolio, exposures) == expected
+            failure = compiled.first_failure(trade, portfolio, exposures)
+            assert (failure is None) is expected[0]
+            if failure is not None:
+                name, reason = failure
+                assert expected[1][name] == {"passed": False, "reason": reason}
+
+
+def test_policy_engine_without_details():
+    engine = PolicyEngine(CONFIG)
+    assert engine.validate(make_trade(), make_portfolio(), details=False) == (True, {})
+    assert engine.validate(make_trade(leverage=5), make_portfolio(), details=False) == (False, {})
+    assert engine.first_failure(make_trade(leverage=5), make_portfolio()) == ("risk_limit", "leverage_limit")
+    assert engine.limits.max_leverage == 3
@@ -1,8 +1,37 @@
+import asyncio
+import json
+import os
 from pathlib import Path
 
 import pytest
 
 from services.api.risk.config_loader import load_risk_config
+from services.api.risk.correlation import CorrelationRiskEngine
+from services.api.risk.monitor import RiskMonitor
+from services.api.risk.policy import PolicyEngine
+from services.api.risk.provider import RiskConfigProvider, shared_risk_config_provider
+
+
+BASE_CONFIG = {
+    "single_position": {"max_size_percent": 0.25, "max_leverage": 3, "min_rr_ratio": 1.5},
+    "correlation_limits": {"btc_eth_combined": 0.7, "same_direction": 0.8},
+    "portfolio": {"max_total_risk": 1.0, "max_correlation_risk": 0.7},
+    "drawdown_limits": {"daily": 3.0, "actions_on_breach": {"daily_3pct": "halt_new_trades"}},
+}
+
+
+def write_config(path: Path, config, *, bump: int = 0):
+    path.write_text(json.dumps(config))
+    if bump:
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + bump))
+
+
+def edited(**sections):
+    config = json.loads(json.dumps(BASE_CONFIG))
+    for section, values in sections.items():
+        config[section].update(values)
+    return config
 
 
 def test_load_risk_config(tmp_path: Path):
@@ -12,8 +41,126 @@ def test_load_risk_config(tmp_path: Path):
     assert config["single_position"]["max_size_percent"] == 0.5
 
 
+def test_load_risk_config_serves_the_shared_snapshot(tmp_path: Path, monkeypatch):
+    path = tmp_path / "risk.yaml"
+    write_config(path, BASE_CONFIG)
+    assert load_risk_config(path) == BASE_CONFIG
+    reads = []
+    original = Path.read_bytes
+    monkeypatch.setattr(Path, "read_bytes", lambda self: reads.append(self) or original(self))
+
+    config = load_risk_config(path)
+    config["portfolio"]["max_total_risk"] = 9.0  # callers get their own copy
+    assert load_risk_config(path) == BASE_CONFIG
+    assert reads == []
+
+    write_config(path, edited(portfolio={"max_total_risk": 0.5}), bump=10**9)
+    assert load_risk_config(path)["portfolio"]["max_total_risk"] == 0.5
+    assert shared_risk_config_provider(path).snapshot.version == 2
+
+    write_config(path, "[]", bump=2 * 10**9)
+    with pytest.raises(ValueError):
+        load_risk_config(path)
+    with pytest.raises(ValueError):
+        load_risk_config(path)  # still invalid, still an error rather than the stale snapshot
+
+
 def test_load_risk_config_invalid(tmp_path: Path):
     sample = tmp_path / "risk.yaml"
     sample.write_text("[]")
     with pytest.raises(ValueError):
         load_risk_config(sample)
+
+
+def test_provider_parses_once_until_the_file_changes(tmp_path: Path, monkeypatch):
+    path = tmp_path / "risk.yaml"
+    write_config(path, BASE_CONFIG)
+    provider = RiskConfigProvider(path)
+    reads = []
+    original = Path.read_bytes
+    monkeypatch.setattr(Path, "read_bytes", lambda self: reads.append(self) or original(self))
+
+    assert provider.reload() is False
+    assert reads == []
+
+    write_config(path, edited(single_position={"max_leverage": 5}), bump=10**9)
+    assert provider.reload() is True
+    assert provider.snapshot.version == 2
+    assert provider.config["single_position"]["max_leverage"] == 5
+
+
+def test_provider_snapshot_is_read_only(tmp_path: Path):
+    path = tmp_path / "risk.yaml"
+    write_config(path, BASE_CONFIG)
+    snapshot = RiskConfigProvider(path).snapshot
+    with pytest.raises(TypeError):
+        snapshot.config["portfolio"]["max_total_risk"] = 9.0  # type: ignore[index]
+    assert snapshot.to_dict() == BASE_CONFIG
+
+
+def test_provider_keeps_previous_snapshot_on_invalid_edit(tmp_path: Path):
+    path = tmp_path / "risk.yaml"
+    write_config(path, BASE_CONFIG)
+    provider = RiskConfigProvider(path)
+    seen = []
+    provider.subscribe(lambda snapshot: seen.append(snapshot.version), replay=False)
+
+    write_config(path, edited(single_position={"max_leverage": -1}), bump=10**9)
+    assert provider.reload() is False
+    assert provider.snapshot.version == 1
+    assert "max_leverage" in provider.last_error
+    assert seen == []
+
+    write_config(path, edited(single_position={"max_leverage": 4}), bump=2 * 10**9)
+    assert provider.reload() is True
+    assert provider.last_error is None
+    assert seen == [2]
+
+
+def test_provider_rejects_invalid_initial_config(tmp_path: Path):
+    path = tmp_path / "risk.yaml"
+    write_config(path, edited(portfolio={"max_total_risk": "lots"}))
+    with pytest.raises(ValueError):
+        RiskConfigProvider(path)
+
+
+def test_bound_components_recompile_on_reload(tmp_path: Path):
+    path = tmp_path / "risk.yaml"
+    write_config(path, BASE_CONFIG)
+    provider = RiskConfigProvider(path)
+    correlation = CorrelationRiskEngine(BASE_CONFIG)
+    policy = PolicyEngine(BASE_CONFIG, correlation=correlation)
+    monitor = RiskMonitor.from_config(BASE_CONFIG)
+    unbind = provider.bind(policy, monitor)
+
+    write_config(
+        path,
+        edited(single_position={"max_leverage": 10}, portfolio={"max_total_risk": 0.5}, correlation_limits={"btc_eth_combined": 0.4}),
+        bump=10**9,
+    )
+    provider.reload()
+    assert policy.limits.max_leverage == 10
+    assert monitor.risk_limit == 0.5
+    assert [group.limit for group in correlation.groups if group.name == "btc_eth_combined"] == [0.4]
+
+    unbind()
+    write_config(path, BASE_CONFIG, bump=2 * 10**9)
+    provider.reload()
+    assert policy.limits.max_leverage == 10
+
+
+@pytest.mark.asyncio
+async def test_provider_watch_stops_on_event(tmp_path: Path):
+    path = tmp_path / "risk.yaml"
+    write_config(path, BASE_CONFIG)
+    provider = RiskConfigProvider(path, poll_interval=0.01)
+    stop = asyncio.Event()
+    task = asyncio.create_task(provider.watch(stop))
+    write_config(path, edited(portfolio={"max_total_risk": 0.9}), bump=10**9)
+    for _ in range(100):
+        if provider.snapshot.version == 2:
+            break
+        await asyncio.sleep(0.01)
+    stop.set()
+    await asyncio.wait_for(task, 1.0)
+    assert provider.config["portfolio"]["max_total_risk"] == 0.9
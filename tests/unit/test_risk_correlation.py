@@ -0,0 +1,144 @@
+import numpy as np
+import pytest
+
+from services.api.risk.config_loader import load_risk_config
+from services.api.risk.correlation import (
+    CorrelationRiskEngine,
+    RollingCovariance,
+    base_asset,
+    group_limits,
+    position_exposures,
+)
+from services.api.risk.monitor import IncrementalRiskMonitor, PositionSnapshot
+from services.api.risk.policy import PolicyEngine, PortfolioState, ProposedTrade
+
+
+def make_trade(**kwargs):
+    data = {
+        "trading_mode": "demo",
+        "asset": "BTC-USDT",
+        "side": "buy",
+        "size_percent": 0.1,
+        "leverage": 2,
+        "rr_ratio": 2.0,
+        "wallet_credibility": 6.0,
+    }
+    data.update(kwargs)
+    return ProposedTrade(**data)
+
+
+def make_portfolio():
+    return PortfolioState(
+        open_positions=1,
+        daily_trades=1,
+        total_risk=0.2,
+        correlation_risk=0.1,
+        drawdown_daily=0.0,
+        drawdown_weekly=0.0,
+        drawdown_monthly=0.0,
+    )
+
+
+def correlated_returns(rng, count):
+    common = rng.normal(0, 0.01, count)
+    return {
+        "BTC": common + rng.normal(0, 0.002, count),
+        "ETH": common + rng.normal(0, 0.002, count),
+        "SOL": rng.normal(0, 0.01, count),
+    }
+
+
+def test_base_asset_and_group_parsing():
+    assert [base_asset(s) for s in ("BTC-USDT-SWAP", "ethusdt", "SOL", "USDT")] == ["BTC", "ETH", "SOL", "USDT"]
+    groups = {group.name: group for group in group_limits(load_risk_config())}
+    assert groups["btc_eth_combined"].assets == {"BTC", "ETH"}
+    assert groups["btc_eth_combined"].limit == 0.70
+    assert groups["total_crypto"].assets == frozenset()
+
+
+def test_rolling_covariance_matches_numpy_window():
+    rng = np.random.default_rng(0)
+    series = correlated_returns(rng, 500)
+    window = 64
+    rolling = RollingCovariance(["BTC", "ETH", "SOL"], window=window)
+    for index in range(500):
+        rolling.update({asset: values[index] for asset, values in series.items()})
+        if index in (10, 63, 64, 200, 499):
+            start = max(0, index + 1 - window)
+            rows = np.column_stack([series[a][start : index + 1] for a in rolling.assets])
+            np.testing.assert_allclose(rolling.covariance(), np.cov(rows, rowvar=False), rtol=1e-9, atol=1e-15)
+    np.testing.assert_allclose(
+        rolling.correlation(),
+        np.corrcoef(np.column_stack([series[a][-window:] for a in rolling.assets]), rowvar=False),
+        rtol=1e-9,
+    )
+
+
+def test_btc_eth_combined_limit_is_enforced():
+    engine = CorrelationRiskEngine(load_risk_config(), min_periods=5)
+    engine.set_exposures({"BTC-USDT": 0.4, "ETH-USDT": 0.25})
+    assert engine.check(make_trade(asset="ETH-USDT", size_percent=0.1)) == "btc_eth_combined"
+    assert engine.check(make_trade(asset="ETH-USDT", side="sell", size_percent=0.1)) is None
+    assert engine.check(make_trade(asset="SOL-USDT", size_percent=0.04)) is None
+
+
+def test_correlated_exposure_uses_measured_correlation():
+    config = {"portfolio": {"max_correlation_risk": 0.5}, "correlation_limits": {}}
+    engine = CorrelationRiskEngine(config, window=200, min_periods=30)
+    engine.set_exposures({"BTC": 0.4})
+    trade = make_trade(asset="SOL-USDT", size_percent=0.2)
+    assert engine.check(trade) == "correlated_exposure"  # before warm-up every pair counts as correlated
+
+    rng = np.random.default_rng(1)
+    series = correlated_returns(rng, 200)
+    for index in range(200):
+        engine.update_returns({asset: values[index] for asset, values in series.items()})
+    assert engine.check(trade) is None  # SOL is uncorrelated with BTC
+    assert engine.check(make_trade(asset="ETH-USDT", size_percent=0.2)) == "correlated_exposure"
+    assert engine.correlated_exposure("ETH", 0.2) == pytest.approx(0.6, abs=0.05)
+
+
+def test_policy_engine_runs_correlation_check():
+    config = load_risk_config()
+    correlation = CorrelationRiskEngine(config)
+    policy = PolicyEngine(config, correlation=correlation)
+    correlation.set_exposures({"BTC-USDT": 0.65})
+    assert policy.first_failure(make_trade(), make_portfolio()) == ("correlation_matrix", "btc_eth_combined")
+    passed, details = policy.validate(make_trade(side="sell"), make_portfolio())
+    assert passed and details["correlation_matrix"] == {"passed": True, "reason": "ok"}
+
+
+def test_check_does_not_register_unknown_assets():
+    engine = CorrelationRiskEngine(load_risk_config(), min_periods=5)
+    engine.set_exposures({"BTC-USDT": 0.4})
+    known = list(engine.returns.assets)
+    assert engine.check(make_trade(asset="DOGE-USDT", size_percent=0.35)) == "correlated_exposure"
+    assert engine.check(make_trade(asset="DOGE-USDT", size_percent=0.05)) is None
+    assert engine.correlated_exposure("XRP", 0.1) == pytest.approx(0.5)
+    assert engine.returns.assets == known and "DOGE" not in known
+
+
+def test_reservations_count_until_released():
+    engine = CorrelationRiskEngine(load_risk_config(), min_periods=5)
+    engine.set_exposures({"BTC-USDT": 0.4})
+    trade = make_trade(asset="ETH-USDT", size_percent=0.2)
+    assert engine.check(trade) is None
+    engine.reserve("ETH-USDT", 0.2)
+    assert engine.check(trade) == "btc_eth_combined"
+    engine.release("ETH-USDT", 0.2)
+    assert engine.check(trade) is None
+
+
+def test_monitor_feeds_exposure_from_position_lifecycle():
+    engine = CorrelationRiskEngine(load_risk_config(), min_periods=5)
+    monitor = IncrementalRiskMonitor({"daily": 0.05}, 0.8, 0.9, exposures=engine)
+    long = PositionSnapshot("BTC-USDT", "long", 0.4, 0.01, 0.0, 0.0, "BTC")
+    short = PositionSnapshot("ETH-USDT", "sell", -0.1, 0.01, 0.0, 0.0, "ETH")
+    monitor.sync({"p1": long, "p2": short})
+    assert position_exposures([long, short]) == {"BTC": 0.4, "ETH": -0.1}
+    assert engine.correlated_exposure("BTC", 0.0) == pytest.approx(0.3)
+
+    monitor.close_position("p1")
+    monitor.close_position("p2")
+    assert engine.correlated_exposure("BTC", 0.0) == pytest.approx(0.0)
+    assert engine.check(make_trade(asset="ETH-USDT", size_percent=0.6)) is None
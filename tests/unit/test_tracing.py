@@ -1,4 +1,20 @@
-from packages.telemetry.tracing import generate_trace_id, get_trace_id
+import asyncio
+
+import pytest
+
+from packages.queue import InMemoryQueueProducer
+from packages.scoring.models import WalletStats
+from packages.telemetry.tracing import (
+    SpanBuffer,
+    Tracer,
+    configure_tracing,
+    generate_trace_id,
+    get_trace_id,
+    trace_id_var,
+    tracer,
+)
+from services.api.bias.calculator import BiasCalculator
+from workers.ingest.handler import IngestHandler
 
 
 def test_trace_id_generation():
@@ -12,3 +28,94 @@ def test_trace_id_generation():
 def test_trace_id_context():
     trace = generate_trace_id()
     assert get_trace_id() == trace
+
+
+@pytest.fixture
+def global_tracer():
+    configure_tracing(sample_rate=1.0)
+    tracer.buffer.drain()
+    try:
+        yield tracer
+    finally:
+        configure_tracing(sample_rate=0.0)
+        tracer.buffer.drain()
+
+
+def test_disabled_tracer_records_nothing():
+    local = Tracer()
+    calls = local.traced("work")(lambda value: value * 2)
+    with local.span("outer"):
+        assert calls(2) == 4
+    assert len(local.buffer) == 0
+
+
+def test_spans_nest_and_share_a_trace():
+    local = Tracer(sample_rate=1.0)
+    token = trace_id_var.set("")
+    try:
+        with local.span("outer") as outer:
+            with local.span("inner"):
+                pass
+        assert trace_id_var.get() == ""  # the root's generated trace id does not leak
+    finally:
+        trace_id_var.reset(token)
+    inner, recorded_outer = local.buffer.drain()
+    assert (inner.name, recorded_outer.name) == ("inner", "outer")
+    assert inner.parent_id == outer.span_id and recorded_outer.parent_id is None
+    assert inner.trace_id == recorded_outer.trace_id == outer.trace_id
+    assert recorded_outer.start_ns <= inner.start_ns <= inner.end_ns <= recorded_outer.end_ns
+    assert len(local.buffer) == 0
+
+
+def test_span_records_error_and_reuses_existing_trace_id():
+    local = Tracer(sample_rate=1.0)
+    token = trace_id_var.set("request-trace")
+    try:
+        with pytest.raises(KeyError):
+            with local.span("failing"):
+                raise KeyError("x")
+    finally:
+        trace_id_var.reset(token)
+    (record,) = local.buffer.snapshot()
+    assert record.error == "KeyError"
+    assert record.trace_id == "request-trace"
+    assert record.duration >= 0
+
+
+def test_sampling_decision_is_inherited_by_children():
+    decisions = iter([0.9, 0.1])
+    local = Tracer(sample_rate=0.5, sampler=lambda: next(decisions))
+    for _ in range(2):
+        with local.span("root"):
+            with local.span("child"):
+                pass
+    assert [record.name for record in local.buffer.drain()] == ["child", "root"]
+
+
+def test_span_buffer_overwrites_oldest():
+    buffer = SpanBuffer(2)
+    for index in range(3):
+        buffer.append((f"s{index}", "t", index, None, 0, 1, None))
+    assert [record.name for record in buffer.snapshot()] == ["s1", "s2"]
+    assert buffer.dropped == 1
+    with pytest.raises(ValueError):
+        Tracer(sample_rate=2.0)
+
+
+def test_bias_calculation_spans_cover_wallet_scoring(global_tracer):
+    wallets = [WalletStats(wallet_id=f"w{index}", trades=[]) for index in range(3)]
+    BiasCalculator().calculate("BTC", "1h", wallets)
+    records = global_tracer.buffer.drain()
+    assert [record.name for record in records] == ["scoring.score_wallet"] * 3 + ["bias.calculate"]
+    root = records[-1]
+    assert all(record.parent_id == root.span_id for record in records[:-1])
+
+
+def test_ingest_handler_is_traced(global_tracer):
+    handler = IngestHandler(InMemoryQueueProducer())
+    payload = {"events": [{"txHash": "0x1", "wallet": "0xa", "timestamp": "2025-01-01T00:00:00Z"}]}
+    result = asyncio.run(handler.handle(payload))
+    assert result["enqueued"] == 1
+    (record,) = global_tracer.buffer.drain()
+    assert record.name == "ingest.handle"
+    assert handler.handle.__name__ == "handle"
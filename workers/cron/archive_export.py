@@ -0,0 +1,45 @@
+"""Nightly export of historical tables into the columnar archive."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from packages.archive import ARCHIVE_TABLES, ArchiveWriter
+
+
+@dataclass(slots=True)
+class ArchiveExportConfig:
+    engine: AsyncEngine
+    root: Path
+    tables: Sequence[str] = field(default_factory=lambda: tuple(ARCHIVE_TABLES))
+    lookback_days: int = 1
+    compress: bool = False
+    chunk_size: int = 10_000
+
+
+async def run_archive_export(config: ArchiveExportConfig, *, now: Optional[datetime] = None) -> Dict[str, int]:
+    """Re-export the last ``lookback_days`` whole days (plus today so far) per table."""
+
+    now = now or datetime.now(timezone.utc)
+    writer = ArchiveWriter(config.root, compress=config.compress)
+    return await writer.export_all(
+        config.engine,
+        config.tables,
+        since=now - timedelta(days=config.lookback_days),
+        chunk_size=config.chunk_size,
+    )
+
+
+async def periodic_archive_export(config: ArchiveExportConfig, interval_minutes: int = 24 * 60) -> None:
+    while True:  # pragma: no cover - scheduling loop
+        await run_archive_export(config)
+        await asyncio.sleep(interval_minutes * 60)
+
+
+__all__ = ["ArchiveExportConfig", "run_archive_export", "periodic_archive_export"]
@@ -3,13 +3,115 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
+import json
+import random
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Iterable, List, Optional
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Protocol, Tuple, Union
 
-from packages.queue import QueueEnvelope, QueueProducer
+from packages.queue import QueueProducer
+from services.api.monitoring.metrics import MetricsSink
+from workers.cron.scheduler import AdaptiveSchedule, AdaptiveScheduler
 from workers.ingest.handler import IngestHandler
 
+_BOUNDARY = timedelta(microseconds=1)
+# How far the default pager widens a request before giving up on a same-timestamp burst.
+_MAX_PAGE_GROWTH = 16
+
+
+@dataclass(slots=True)
+class EventPage:
+    events: List[Dict[str, Any]]
+    cursor: Optional[str] = None  # None marks the last page of a slice
+
+
+class EventFetcher:
+    """Protocol for fetching historical events."""
+
+    async def fetch(self, *, since: datetime, limit: int) -> Iterable[Dict[str, Any]]:  # pragma: no cover - interface
+        raise NotImplementedError
+
+    async def fetch_page(
+        self,
+        *,
+        since: datetime,
+        until: datetime,
+        limit: int,
+        cursor: Optional[str] = None,
+    ) -> EventPage:
+        """One page of events in ``[since, until)``.
+
+        The default pages over :meth:`fetch` (assumed to return oldest first)
+        using the newest timestamp seen as the cursor. Each call reaches one
+        microsecond back so strict and inclusive ``since`` semantics both see
+        boundary events; the resulting repeats are dropped by the engine's
+        dedupe window. A full page whose events all share the cursor timestamp
+        cannot advance it, so the request is widened until it gets past that
+        timestamp, and ``RuntimeError`` is raised past ``_MAX_PAGE_GROWTH`` times
+        ``limit``. Sources with native cursors should override this.
+        """
+
+        start = datetime.fromisoformat(cursor) if cursor is not None else since
+        request = limit
+        while True:
+            raw = list(await self.fetch(since=start - _BOUNDARY, limit=request))
+            events = [event for event in raw if since <= _event_time(event, since) < until]
+            if len(raw) < request or any(_event_time(event, since) >= until for event in raw):
+                return EventPage(events)
+            newest = max((_event_time(event, since) for event in events), default=start)
+            if newest > start:
+                return EventPage(events, cursor=newest.isoformat())
+            if request >= limit * _MAX_PAGE_GROWTH:
+                raise RuntimeError(f"more than {request} events at {start.isoformat()}; cannot page past them")
+            request *= 2
+
+
+class CheckpointStore(Protocol):
+    """Persists the per-source watermark below which backfill is complete."""
+
+    async def load(self, source: str) -> Optional[datetime]:  # pragma: no cover - interface only
+        ...
+
+    async def save(self, source: str, watermark: datetime) -> None:  # pragma: no cover - interface only
+        ...
+
+
+class InMemoryCheckpointStore(CheckpointStore):
+    def __init__(self) -> None:
+        self.watermarks: Dict[str, datetime] = {}
+
+    async def load(self, source: str) -> Optional[datetime]:
+        return self.watermarks.get(source)
+
+    async def save(self, source: str, watermark: datetime) -> None:
+        self.watermarks[source] = watermark
+
+
+class FileCheckpointStore(CheckpointStore):
+    """JSON file mapping source name to ISO watermark; rewritten atomically."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+
+    async def load(self, source: str) -> Optional[datetime]:
+        value = self._read().get(source)
+        return datetime.fromisoformat(value) if value else None
+
+    async def save(self, source: str, watermark: datetime) -> None:
+        data = self._read()
+        data[source] = watermark.isoformat()
+        staging = self.path.with_name(self.path.name + ".tmp")
+        staging.parent.mkdir(parents=True, exist_ok=True)
+        staging.write_text(json.dumps(data, sort_keys=True))
+        staging.replace(self.path)
+
+    def _read(self) -> Dict[str, str]:
+        if not self.path.exists():
+            return {}
+        return json.loads(self.path.read_text() or "{}")
+
 
 @dataclass(slots=True)
 class BackfillConfig:
@@ -18,35 +120,269 @@ class BackfillConfig:
     batch_size: int = 100
     lookback_minutes: int = 60
     dedupe_window: int = 500
+    source: str = "backfill"
+    slice_minutes: int = 15
+    concurrency: int = 4
+    max_pages_per_slice: int = 1_000
+    checkpoints: Optional[CheckpointStore] = None
+    overlap_seconds: float = 0.0  # re-read before the checkpoint for late-indexed events
 
 
-class EventFetcher:
-    """Protocol for fetching historical events."""
+@dataclass(slots=True)
+class BackfillReport:
+    since: datetime
+    until: datetime
+    slices: int = 0
+    pages: int = 0
+    full_pages: int = 0
+    fetched: int = 0
+    enqueued: int = 0
+    duplicates: int = 0
+    failed_slices: List[Tuple[datetime, str]] = field(default_factory=list)
+    truncated_slices: List[Tuple[datetime, datetime]] = field(default_factory=list)  # (slice start, reached)
+    checkpoint: Optional[datetime] = None
 
-    async def fetch(self, *, since: datetime, limit: int) -> Iterable[Dict[str, Any]]:  # pragma: no cover - interface
-        raise NotImplementedError
+    @property
+    def success(self) -> bool:
+        return not self.failed_slices
+
+    def as_result(self) -> Dict[str, Any]:
+        return {"fetched": self.fetched, "success": self.success, "enqueued": self.enqueued}
+
+
+class RecentKeys:
+    """Bounded set of recently seen tx hashes (oldest evicted first)."""
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = max(1, capacity)
+        self._keys: "OrderedDict[str, None]" = OrderedDict()
+
+    def add(self, key: str) -> bool:
+        """Record ``key``; False when it was already present."""
+
+        if key in self._keys:
+            self._keys.move_to_end(key)
+            return False
+        self._keys[key] = None
+        if len(self._keys) > self.capacity:
+            self._keys.popitem(last=False)
+        return True
+
+
+class BackfillEngine:
+    """Backfills ``[checkpoint - overlap, now)`` in concurrent time slices.
+
+    Without a stored checkpoint the window starts ``lookback_minutes`` ago; with
+    one, it resumes from the checkpoint however far behind it is.
+
+    Each slice pages through the fetcher and hands every page to the ingest
+    handler as soon as it arrives, so at most ``concurrency`` pages are held
+    in memory. Events already seen within the last ``dedupe_window`` hashes
+    are dropped across slices. The checkpoint only advances over the
+    contiguous run of completed slices, so a failed slice is retried next run.
+    A slice that runs out of ``max_pages_per_slice`` stops there; the
+    checkpoint advances to the newest event it reached and the next run
+    resumes from that point.
+    """
+
+    def __init__(self, config: BackfillConfig) -> None:
+        self.config = config
+        self.handler = IngestHandler(config.queue, source=config.source)
+        self.seen = RecentKeys(config.dedupe_window)
+
+    async def run(self, *, now: Optional[datetime] = None) -> BackfillReport:
+        config = self.config
+        until = now or datetime.now(timezone.utc)
+        since = until - timedelta(minutes=config.lookback_minutes)
+        previous = await config.checkpoints.load(config.source) if config.checkpoints is not None else None
+        if previous is not None:
+            since = min(previous, until) - timedelta(seconds=config.overlap_seconds)
+
+        report = BackfillReport(since=since, until=until)
+        slices = _slices(since, until, timedelta(minutes=max(1, config.slice_minutes)))
+        report.slices = len(slices)
+        semaphore = asyncio.Semaphore(max(1, config.concurrency))
+
+        async def run_slice(start: datetime, end: datetime) -> Tuple[Optional[str], datetime]:
+            async with semaphore:
+                try:
+                    return None, await self._backfill_slice(start, end, report)
+                except Exception as exc:  # noqa: BLE001 - recorded and retried next run
+                    return f"{type(exc).__name__}: {exc}", start
+
+        outcomes = await asyncio.gather(*(run_slice(start, end) for start, end in slices))
+
+        watermark = since
+        blocked = False  # the checkpoint only covers the contiguous prefix of finished slices
+        for (start, end), (error, reached) in zip(slices, outcomes):
+            if error is not None:
+                report.failed_slices.append((start, error))
+                blocked = True
+                continue
+            if reached < end:
+                report.truncated_slices.append((start, reached))
+            if not blocked:
+                watermark = reached
+                blocked = reached < end
+        if config.checkpoints is not None and watermark > (previous or since):
+            await config.checkpoints.save(config.source, watermark)
+            report.checkpoint = watermark
+        return report
+
+    async def _backfill_slice(self, since: datetime, until: datetime, report: BackfillReport) -> datetime:
+        """Page through ``[since, until)``; returns ``until``, or the newest event time reached if cut short."""
+
+        cursor: Optional[str] = None
+        reached = since
+        for _ in range(self.config.max_pages_per_slice):
+            page = await self.config.fetcher.fetch_page(
+                since=since, until=until, limit=self.config.batch_size, cursor=cursor
+            )
+            report.pages += 1
+            report.fetched += len(page.events)
+            reached = max((_event_time(event, reached) for event in page.events), default=reached)
+            fresh = [event for event in page.events if self.seen.add(_tx_key(event))]
+            report.duplicates += len(page.events) - len(fresh)
+            if fresh:
+                result = await self.handler.handle({"events": fresh})
+                report.enqueued += result["enqueued"]
+            if page.cursor is None:
+                return until
+            if page.cursor == cursor:
+                raise RuntimeError(f"fetcher cursor did not advance past {cursor}")
+            report.full_pages += 1
+            cursor = page.cursor
+        # Events at ``reached`` may continue on the next page; resuming there re-reads them.
+        return reached
+
+
+async def run_backfill(config: BackfillConfig, *, now: Optional[datetime] = None) -> Dict[str, Any]:
+    report = await BackfillEngine(config).run(now=now)
+    return report.as_result()
+
+
+class BackfillMetrics:
+    """Lag and fetch-efficiency series for one backfill source."""
+
+    def __init__(self, registry: MetricsSink, *, prefix: str = "backfill") -> None:
+        self.registry = registry
+        self.prefix = prefix
+        self.runs = registry.counter(f"{prefix}_runs_total")
+        self.idle_runs = registry.counter(f"{prefix}_idle_runs_total")
+        self.fetch_calls = registry.counter(f"{prefix}_fetch_calls_total")
+        self.fetched = registry.counter(f"{prefix}_events_fetched_total")
+        self.enqueued = registry.counter(f"{prefix}_events_enqueued_total")
+        self.failed_slices = registry.counter(f"{prefix}_failed_slices_total")
+
+    def publish(self, report: BackfillReport, *, interval: float) -> None:
+        self.runs.inc()
+        if not report.enqueued:
+            self.idle_runs.inc()
+        self.fetch_calls.inc(report.pages)
+        self.fetched.inc(report.fetched)
+        self.enqueued.inc(report.enqueued)
+        self.failed_slices.inc(len(report.failed_slices))
+        watermark = report.checkpoint or report.since
+        self.registry.gauge(f"{self.prefix}_lag_seconds", max(0.0, (report.until - watermark).total_seconds()))
+        # New events per upstream call; falls as polling wastes requests.
+        self.registry.gauge(f"{self.prefix}_events_per_fetch", report.enqueued / report.pages if report.pages else 0.0)
+        self.registry.gauge(f"{self.prefix}_interval_seconds", interval)
+
+
+class AdaptiveBackfill:
+    """Runs the engine on an :class:`AdaptiveScheduler` instead of a fixed interval.
+
+    Runs resume from the checkpoint (an in-memory store is used when the
+    config has none), back off while nothing new arrives and speed up while
+    slices need more than one page.
+    """
+
+    def __init__(
+        self,
+        config: BackfillConfig,
+        *,
+        schedule: Optional[AdaptiveSchedule] = None,
+        metrics: Optional[BackfillMetrics] = None,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        if config.checkpoints is None:
+            config = replace(config, checkpoints=InMemoryCheckpointStore())
+        self.engine = BackfillEngine(config)  # keeps the dedupe window warm between runs
+        self.scheduler = AdaptiveScheduler(schedule, rng=rng)
+        self.metrics = metrics
+
+    async def step(self, *, now: Optional[datetime] = None) -> float:
+        """Run once and return the delay before the next run, in seconds."""
+
+        report = await self.engine.run(now=now)
+        interval = self.scheduler.observe(
+            idle=report.success and not report.enqueued,
+            saturated=report.full_pages > 0,
+        )
+        if self.metrics is not None:
+            self.metrics.publish(report, interval=interval)
+        return self.scheduler.next_delay()
+
+    async def run_forever(self) -> None:  # pragma: no cover - scheduling loop
+        while True:
+            await asyncio.sleep(await self.step())
+
+
+async def periodic_backfill(
+    config: BackfillConfig,
+    interval_minutes: int = 5,
+    *,
+    schedule: Optional[AdaptiveSchedule] = None,
+    metrics: Optional[BackfillMetrics] = None,
+) -> None:
+    """Adaptive polling loop; ``interval_minutes`` seeds the starting interval."""
 
+    schedule = schedule or AdaptiveSchedule(initial_seconds=interval_minutes * 60)
+    await AdaptiveBackfill(config, schedule=schedule, metrics=metrics).run_forever()
 
-async def run_backfill(config: BackfillConfig) -> Dict[str, Any]:
-    now = datetime.now(timezone.utc)
-    since = now - timedelta(minutes=config.lookback_minutes)
 
-    raw_events = await config.fetcher.fetch(since=since, limit=config.batch_size)
-    events = list(raw_events)
-    if not events:
-        return {"fetched": 0, "success": True, "enqueued": 0}
+def _slices(since: datetime, until: datetime, width: timedelta) -> List[Tuple[datetime, datetime]]:
+    bounds = []
+    start = since
+    while start < until:
+        end = min(start + width, until)
+        bounds.append((start, end))
+        start = end
+    return bounds
 
-    handler = IngestHandler(config.queue, source="backfill")
-    payload = {"events": events}
-    result = await handler.handle(payload)
 
-    return {"fetched": len(events), **result}
+def _tx_key(event: Dict[str, Any]) -> str:
+    return str(event.get("txHash") or event.get("tx_hash") or "").lower()
 
 
-async def periodic_backfill(config: BackfillConfig, interval_minutes: int = 5) -> None:
-    while True:  # pragma: no cover - scheduling loop
-        await run_backfill(config)
-        await asyncio.sleep(interval_minutes * 60)
+def _event_time(event: Dict[str, Any], default: datetime) -> datetime:
+    value = event.get("timestamp")
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, (int, float)):
+        parsed = datetime.fromtimestamp(float(value), tz=timezone.utc)
+    elif isinstance(value, str) and value:
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return default
+    else:
+        return default
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
 
 
-__all__ = ["BackfillConfig", "EventFetcher", "run_backfill", "periodic_backfill"]
+__all__ = [
+    "AdaptiveBackfill",
+    "BackfillConfig",
+    "BackfillEngine",
+    "BackfillMetrics",
+    "BackfillReport",
+    "CheckpointStore",
+    "EventFetcher",
+    "EventPage",
+    "FileCheckpointStore",
+    "InMemoryCheckpointStore",
+    "RecentKeys",
+    "run_backfill",
+    "periodic_backfill",
+]
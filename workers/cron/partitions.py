@@ -0,0 +1,39 @@
+"""Partition maintenance job: premake, rotate and expire time partitions."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from packages.db.migrations import PARTITIONED_TABLES, PartitionManager, PartitionSpec
+
+
+@dataclass(slots=True)
+class PartitionMaintenanceConfig:
+    engine: AsyncEngine
+    specs: Sequence[PartitionSpec] = PARTITIONED_TABLES
+
+
+async def run_partition_maintenance(
+    config: PartitionMaintenanceConfig,
+    *,
+    now: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    manager = PartitionManager(config.engine, config.specs)
+    created = await manager.ensure_partitions(now=now)
+    moved = await manager.rotate(now=now)
+    retired = await manager.apply_retention(now=now)
+    return {"created": created, "moved": moved, "retired": retired}
+
+
+async def periodic_partition_maintenance(config: PartitionMaintenanceConfig, interval_minutes: int = 60) -> None:
+    while True:  # pragma: no cover - scheduling loop
+        await run_partition_maintenance(config)
+        await asyncio.sleep(interval_minutes * 60)
+
+
+__all__ = ["PartitionMaintenanceConfig", "run_partition_maintenance", "periodic_partition_maintenance"]
@@ -0,0 +1,52 @@
+"""Adaptive intervals for polling cron jobs."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(slots=True, frozen=True)
+class AdaptiveSchedule:
+    """Bounds and step sizes for :class:`AdaptiveScheduler` (all in seconds)."""
+
+    initial_seconds: float = 300.0
+    min_seconds: float = 30.0
+    max_seconds: float = 1800.0
+    backoff: float = 2.0  # multiplier after an idle run
+    speedup: float = 0.5  # multiplier after a run that hit full pages
+    jitter: float = 0.1  # +/- fraction applied to each delay
+
+
+class AdaptiveScheduler:
+    """Multiplicative increase while idle, multiplicative decrease while saturated.
+
+    Callers report each run through :meth:`observe`; a run that found nothing
+    new stretches the interval, one that had to page past a full page shrinks
+    it, anything in between keeps it. :meth:`next_delay` adds jitter so
+    replicas polling the same source drift apart.
+    """
+
+    def __init__(self, schedule: Optional[AdaptiveSchedule] = None, *, rng: Optional[random.Random] = None) -> None:
+        self.schedule = schedule or AdaptiveSchedule()
+        self.rng = rng or random.Random()
+        self.interval = self._clamp(self.schedule.initial_seconds)
+
+    def observe(self, *, idle: bool, saturated: bool) -> float:
+        if saturated:
+            self.interval = self._clamp(self.interval * self.schedule.speedup)
+        elif idle:
+            self.interval = self._clamp(self.interval * self.schedule.backoff)
+        return self.interval
+
+    def next_delay(self) -> float:
+        spread = self.schedule.jitter
+        factor = 1.0 + self.rng.uniform(-spread, spread) if spread else 1.0
+        return self._clamp(self.interval * factor)
+
+    def _clamp(self, seconds: float) -> float:
+        return min(self.schedule.max_seconds, max(self.schedule.min_seconds, seconds))
+
+
+__all__ = ["AdaptiveSchedule", "AdaptiveScheduler"]
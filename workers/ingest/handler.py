@@ -8,6 +8,7 @@ from decimal import Decimal
 from typing import Any, Dict, Iterable, List, Sequence
 
 from packages.queue import QueueEnvelope, QueueProducer
+from packages.telemetry.tracing import traced
 
 
 @dataclass(slots=True)
@@ -43,6 +44,7 @@ class IngestHandler:
         self.queue = queue
         self.source = source
 
+    @traced("ingest.handle")
     async def handle(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         events = list(_extract_events(payload))
         if not events: